@@ -0,0 +1,306 @@
+#!/usr/bin/python
+
+#============================ adjust path =====================================
+
+import sys
+import os
+if __name__ == "__main__":
+    here = sys.path[0]
+    sys.path.insert(0, os.path.join(here, '..', '..','libs'))
+    sys.path.insert(0, os.path.join(here, '..', '..','external_libs'))
+
+#============================ imports =========================================
+
+import time
+import types
+
+from   SmartMeshSDK.ApiDefinition   import ApiDefinition,                    \
+                                           IpMgrDefinition
+from   SmartMeshSDK.ApiException    import CommandError
+
+#============================ defines =========================================
+
+MIN_DURATION     = 0.5 # seconds spent measuring each case
+
+#============================ helpers =========================================
+
+class LegacyField(ApiDefinition.Field):
+    '''
+    \brief A Field before its validator was precomputed, computing its limits
+           for each value checked.
+    '''
+
+    def _compileValidator(self):
+        return None
+
+    def isValidValue(self,val):
+        if   self.format==ApiDefinition.FieldFormats.STRING:
+            if ( (type(val) not in [types.StringType,types.UnicodeType]) or
+                 len(val)>self.length
+               ):
+                return False
+        elif self.format==ApiDefinition.FieldFormats.BOOL:
+            if type(val)!=types.BooleanType:
+                return False
+        elif self.format==ApiDefinition.FieldFormats.INT:
+            if ( (type(val)!=types.IntType and  type(val)!=types.LongType)  or
+                 val>pow(2,8*self.length)
+               ):
+                return False
+        elif self.format==ApiDefinition.FieldFormats.INTS:
+            if ( (type(val)!=types.IntType and  type(val)!=types.LongType)  or
+                 val>(pow(2,8*self.length)/2) or
+                 val<(-pow(2,8*self.length)/2)
+               ):
+                return False
+        elif self.format==ApiDefinition.FieldFormats.HEXDATA:
+            if type(val) in [types.StringType,bytearray,memoryview]:
+                if self.length and len(val)>self.length:
+                    return False
+                return self.options.validOptions is None or val in self.options.validOptions
+            if type(val)!=types.ListType and type(val)!=types.TupleType:
+                return False
+            if self.length and len(val)>self.length:
+                return False
+            for i in val:
+                if type(i)!=types.IntType:
+                    return False
+                if i>=pow(2,8):
+                    return False
+        elif self.format==ApiDefinition.FieldFormats.FLOAT:
+            if ( (type(val)!=types.IntType and type(val)!=types.FloatType) ):
+                return False
+        else:
+            raise SystemError('unknown field format='+self.format)
+        if self.options.validOptions and val not in self.options.validOptions:
+            return False
+        return True
+
+class LegacyValidation(IpMgrDefinition.IpMgrDefinition):
+    '''
+    \brief The request validation of ApiDefinition before it was precomputed,
+           looking up each field by name and checking it against limits
+           computed for each value.
+    '''
+
+    def getRequestFields(self,commandArray):
+        commandDef = self.getDefinition(self.COMMAND,commandArray)
+        return [LegacyField(fieldRaw,self.fieldOptions)
+                             for fieldRaw in commandDef['request']]
+
+    def validateRequest(self,commandArray,fields):
+        definition = self.getDefinition(self.COMMAND,commandArray)
+        if 'request' not in definition:
+            raise CommandError(CommandError.NO_REQUEST,
+                                            '.'.join(commandArray))
+        self.areSameFieldNames(definition['request'],fields)
+        requestFields = self.getLegacyFields(commandArray)
+        for fieldName,fieldValue in fields.items():
+            for field in requestFields:
+                if field.name==fieldName:
+                    break
+            if field.isValidValue(fieldValue)==False:
+                raise CommandError(CommandError.MALFORMED_FIELD,fieldName)
+
+    def getLegacyFields(self,commandArray):
+        # the Field lists were cached already, only the checks were not
+        key = tuple(commandArray)
+        if key not in self.__dict__.setdefault('legacyFields',{}):
+            self.legacyFields[key] = self.getRequestFields(commandArray)
+        return self.legacyFields[key]
+
+class LegacyApiDefinition(IpMgrDefinition.IpMgrDefinition):
+    '''
+    \brief The lookups of ApiDefinition before they were indexed, scanning the
+           lists of definitions.
+    '''
+
+    def idToName(self,type,id):
+        list = self._getList(type)
+        for item in list:
+            if item['id']==id:
+               return item['name']
+        raise CommandError(CommandError.INVALID_COMMAND,
+                           'id=%s' % str(id))
+
+    def nameToId(self,type,nameArray):
+        list = self._getList(type)
+        for item in list:
+            if item['name']==nameArray[0]:
+               return item['id']
+        raise CommandError(CommandError.INVALID_COMMAND,
+                                        nameArray[0])
+
+    def rcToLabel(self,rc):
+        rcLabel       = None
+        for r in self.fieldOptions[self.RC]:
+            if r[0]==rc:
+                rcLabel           = r[1]
+                break
+        if not rcLabel:
+            raise CommandError(CommandError.VALUE_NOT_IN_OPTIONS,
+                               'rc={0} does not exist'.format(rc))
+        return rcLabel
+
+    def subcommandIdToName(self,type,nameArray,id):
+        subcommands = self.getSubcommands(type,nameArray)
+        for subcommand in subcommands:
+            if subcommand['id']==id:
+                return subcommand['name']
+        raise CommandError(CommandError.UNKNOWN_SUBCOMMAND,
+                                            str(id))
+
+    def subcommandNameToId(self,type,nameArray,name):
+        subcommands = self.getSubcommands(type,nameArray)
+        for subcommand in subcommands:
+            if subcommand['name']==name:
+                return subcommand['id']
+        raise CommandError(CommandError.UNKNOWN_SUBCOMMAND,
+                                            str(name))
+
+    def getDefinition(self,type,nameArray):
+        list = self._getList(type)
+        definition,list = self._commandIterator(nameArray,list)
+        return definition
+
+    def _commandIterator(self,nameArray,list):
+        for commandName in nameArray:
+            if not list:
+                raise CommandError(CommandError.INVALID_COMMAND,
+                                            '.'.join(nameArray))
+            found = False
+            for elem in list:
+                if elem['name']==commandName:
+                    found       = True
+                    definition  = elem
+                    if 'subCommands' in elem:
+                        list = definition['subCommands']
+                    else:
+                        list = None
+                    break
+            if found==False:
+                raise CommandError(CommandError.INVALID_COMMAND,
+                                            '.'.join(nameArray))
+        return definition,list
+
+    def getRequestFields(self,commandArray):
+        commandDef = self.getDefinition(self.COMMAND,commandArray)
+        return [LegacyField(fieldRaw,self.fieldOptions)
+                             for fieldRaw in commandDef['request']]
+
+    def getResponseFields(self,type,nameArray):
+        commandDef = self.getDefinition(type,nameArray)
+        keys          = commandDef['response'].keys()
+        return [LegacyField(fieldRaw,self.fieldOptions)
+                             for fieldRaw in commandDef['response'][keys[0]]]
+
+def measure(func):
+    '''
+    \brief Call func() repeatedly, return the duration of one call.
+    '''
+    numCalls             = 0
+    startTime            = time.time()
+    while True:
+        for _ in xrange(100):
+            func()
+        numCalls        += 100
+        duration         = time.time()-startTime
+        if duration>MIN_DURATION:
+            return duration/numCalls
+
+#============================ main ============================================
+
+def main():
+
+    legacy               = LegacyApiDefinition()
+    indexed              = IpMgrDefinition.IpMgrDefinition()
+
+    CMD                  = ApiDefinition.ApiDefinition.COMMAND
+    NOTIF                = ApiDefinition.ApiDefinition.NOTIFICATION
+
+    # the lookups done for each packet, on the last entries of the lists
+    cmdName              = indexed.commands[-1]['name']
+    cmdId                = indexed.commands[-1]['id']
+    notifName            = indexed.notifications[-1]['name']
+    notifId              = indexed.notifications[-1]['id']
+    notifType            = indexed.getSubcommands(NOTIF,['notification'])[-1]['name']
+    notifTypeId          = indexed.getSubcommands(NOTIF,['notification'])[-1]['id']
+    rc                   = indexed.fieldOptions[indexed.RC][-1][0]
+    cases = [
+        ('idToName (command)',          lambda a: a.idToName(CMD,cmdId)),
+        ('idToName (notification)',     lambda a: a.idToName(NOTIF,notifId)),
+        ('nameToId',                    lambda a: a.nameToId(CMD,[cmdName])),
+        ('getDefinition',               lambda a: a.getDefinition(NOTIF,['notification',notifType])),
+        ('subcommandIdToName',          lambda a: a.subcommandIdToName(NOTIF,['notification'],notifTypeId)),
+        ('subcommandNameToId',          lambda a: a.subcommandNameToId(NOTIF,['notification'],notifType)),
+        ('hasSubcommands',              lambda a: a.hasSubcommands(NOTIF,[notifName])),
+        ('rcToLabel',                   lambda a: a.rcToLabel(rc)),
+        ('getRequestFields',            lambda a: a.getRequestFields([cmdName])),
+        ('getResponseFields',           lambda a: a.getResponseFields(NOTIF,['notification',notifType])),
+    ]
+
+    print 'ApiDefinition lookups on IpMgrDefinition ({0} commands, {1} notifications)\n'.format(
+        len(indexed.commands),
+        len(indexed.notifications),
+    )
+    print '{0:<26} {1:>12} {2:>12} {3:>8}'.format('lookup','legacy(us)','indexed(us)','speedup')
+    for (name,lookup) in cases:
+        if not name.endswith('Fields'):
+            assert lookup(legacy)==lookup(indexed)
+        tLegacy          = measure(lambda: lookup(legacy))
+        tIndexed         = measure(lambda: lookup(indexed))
+        print '{0:<26} {1:>12.3f} {2:>12.3f} {3:>7.1f}x'.format(
+            name,
+            tLegacy*1e6,
+            tIndexed*1e6,
+            tLegacy/tIndexed,
+        )
+
+    # request validation, of the commands sent most, and of the one with the
+    # most fields
+    legacy               = LegacyValidation()
+    requests = [
+        (['sendData'],         {
+            'macAddress':       [0x00,0x17,0x0d,0x00,0x00,0x38,0x00,0x63],
+            'priority':         1,
+            'srcPort':          0xf0b8,
+            'dstPort':          0xf0b8,
+            'options':          0,
+            'data':             range(80),
+        }),
+        (['sendIP'],           {
+            'macAddress':       [0x00,0x17,0x0d,0x00,0x00,0x38,0x00,0x63],
+            'priority':         1,
+            'options':          0,
+            'encryptedOffset':  0,
+            'data':             range(80),
+        }),
+        (['setNetworkConfig'], dict([
+            (field.name,field.options.validOptions[0] if field.options.validOptions else (field.format=='bool' or 1))
+            for field in indexed.getRequestFields(['setNetworkConfig'])
+        ])),
+    ]
+
+    print '\n{0:<26} {1:>12} {2:>12} {3:>8} {4:>12}'.format('validateRequest','per-call(us)','precomp(us)','speedup','serialize(us)')
+    for (commandArray,fields) in requests:
+        legacy.validateRequest(commandArray,fields)
+        indexed.validateRequest(commandArray,fields)
+        assert indexed.serialize(commandArray,fields)==indexed.serialize(commandArray,fields,trusted=True)
+        tLegacy          = measure(lambda: legacy.validateRequest(commandArray,fields))
+        tPrecomputed     = measure(lambda: indexed.validateRequest(commandArray,fields))
+        tSerialize       = measure(lambda: indexed.serialize(commandArray,fields))
+        tTrusted         = measure(lambda: indexed.serialize(commandArray,fields,trusted=True))
+        print '{0:<26} {1:>12.3f} {2:>12.3f} {3:>7.1f}x {4:>12.3f}'.format(
+            commandArray[0],
+            tLegacy*1e6,
+            tPrecomputed*1e6,
+            tLegacy/tPrecomputed,
+            tSerialize*1e6,
+        )
+        print '{0:<26} {1:>12} {2:>12} {3:>8} {4:>12.3f}'.format(
+            '  trusted','','','',
+            tTrusted*1e6,
+        )
+
+if __name__=="__main__":
+    main()
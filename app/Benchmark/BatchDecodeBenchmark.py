@@ -0,0 +1,144 @@
+#!/usr/bin/python
+
+#============================ adjust path =====================================
+
+import sys
+import os
+if __name__ == "__main__":
+    here = sys.path[0]
+    sys.path.insert(0, os.path.join(here, '..', '..','libs'))
+    sys.path.insert(0, os.path.join(here, '..', '..','external_libs'))
+
+#============================ imports =========================================
+
+import time
+from   optparse                          import OptionParser
+
+import numpy
+
+from   SmartMeshSDK.ApiDefinition        import IpMgrDefinition
+from   SmartMeshSDK.IpMgrEmulator        import IpMgrEmulator,            \
+                                                NetworkModel
+from   SmartMeshSDK.protocols.Hr         import HrParser
+
+#============================ defines =========================================
+
+NUM_NOTIFS       = 20000
+NUM_MOTES        = 100
+
+#============================ helpers =========================================
+
+class RecordingSession(IpMgrEmulator.EmulatorSession):
+    '''
+    \brief Emulator session keeping the payloads of the notifications it is
+           sent.
+    '''
+
+    def __init__(self,emulator):
+        IpMgrEmulator.EmulatorSession.__init__(self,emulator)
+        self.subscribe(filter=0xffffffff,unackFilter=0xffffffff)
+        self.payloads    = []
+
+    def sendNotification(self,cmdId,payload,reliable):
+        self.payloads   += [payload]
+        return True
+
+    def close(self):
+        pass
+
+def buildPayloads(numNotifs,numMotes):
+    '''
+    \brief Generate notification payloads with the manager emulator.
+
+    \returns A dictionary of lists of payloads, indexed by nameArray.
+    '''
+    emulator             = IpMgrEmulator.IpMgrEmulator(
+        network          = NetworkModel.NetworkModel(numMotes=numMotes),
+    )
+    motes                = emulator.network.getOperationalMotes()
+    returnVal            = {}
+    for nameArray in [
+            ('notification','notifData'),
+            ('notification','notifHealthReport'),
+            ('notification','notifEvent','eventPathCreate'),
+        ]:
+        session          = RecordingSession(emulator)
+        emulator.addSession(session)
+        while len(session.payloads)<numNotifs:
+            if   nameArray[1]=='notifData':
+                emulator.generate('data')
+            elif nameArray[1]=='notifHealthReport':
+                emulator.generate('healthReport')
+            else:
+                mote     = motes[len(session.payloads)%len(motes)]
+                path     = emulator.network.getPathsOf(mote)[0]
+                emulator.notifyEvent('eventPathCreate',{
+                    'source':    path.source.macAddress,
+                    'dest':      path.dest.macAddress,
+                    'direction': path.direction,
+                })
+        emulator.removeSession(session)
+        returnVal[nameArray] = [str(bytearray(p)) for p in session.payloads[:numNotifs]]
+    return returnVal
+
+def timeIt(func):
+    startTime            = time.time()
+    returnVal            = func()
+    return (time.time()-startTime,returnVal)
+
+def printResult(name,numRecords,tLoop,tBatch):
+    print '{0:<34} {1:>12.2f} {2:>12.3f} {3:>8.1f}x'.format(
+        name,
+        tLoop/numRecords*1e6,
+        tBatch/numRecords*1e6,
+        tLoop/tBatch,
+    )
+
+#============================ main ============================================
+
+def main(numNotifs,numMotes):
+    apiDef               = IpMgrDefinition.IpMgrDefinition()
+    hrParser             = HrParser.HrParser()
+    allPayloads          = buildPayloads(numNotifs,numMotes)
+
+    print 'Batch decoding of {0} notifications of each kind from {1} motes\n'.format(numNotifs,numMotes)
+    print '{0:<34} {1:>12} {2:>12} {3:>9}'.format('','loop(us)','batch(us)','speedup')
+
+    # fixed-layout notifications: deserialize() in a loop vs. decodeBatch()
+    for (nameArray,payloads) in sorted(allPayloads.items()):
+        cmdId            = apiDef.nameToId(apiDef.NOTIFICATION,[nameArray[0]])
+        (tLoop,dicts)    = timeIt(lambda: [
+            apiDef.deserialize(apiDef.NOTIFICATION,cmdId,p)[1] for p in payloads
+        ])
+        (tBatch,columns) = timeIt(lambda: apiDef.decodeBatch(apiDef.NOTIFICATION,list(nameArray),payloads))
+        for (name,column) in columns.items():
+            expected     = numpy.array([bytearray(d[name]) if isinstance(d[name],str) else d[name] for d in dicts])
+            assert (column==expected).all(), name
+        printResult(nameArray[-1]+' header',len(payloads),tLoop,tBatch)
+
+    # health reports: parseHr() in a loop vs. parseHrBatch()
+    hrs                  = [p[9:] for p in allPayloads[('notification','notifHealthReport')]]
+    (tLoop,parsed)       = timeIt(lambda: [hrParser.parseHr(hr) for hr in hrs])
+    (tBatch,columns)     = timeIt(lambda: hrParser.parseHrBatch(hrs))
+    for (name,column) in columns['Device'].items():
+        if name!='hrIndex':
+            assert (column==numpy.array([p['Device'][name] for p in parsed if 'Device' in p])).all(), name
+    numNeighbors         = sum([len(p['Neighbors']['neighbors']) for p in parsed if 'Neighbors' in p])
+    assert len(columns['Neighbors']['hrIndex'])==numNeighbors
+    printResult('health reports',len(hrs),tLoop,tBatch)
+    print '\n{0} device blocks, {1} neighbors, {2} discovered neighbors'.format(
+        len(columns['Device']['hrIndex']),
+        len(columns['Neighbors']['hrIndex']),
+        len(columns['Discovered']['hrIndex']),
+    )
+
+if __name__=="__main__":
+    parser = OptionParser("usage: %prog [options]")
+    parser.add_option("-n", "--notifs", dest="numNotifs", type="int",
+                      default=NUM_NOTIFS,
+                      help="number of notifications of each kind")
+    parser.add_option("-m", "--motes", dest="numMotes", type="int",
+                      default=NUM_MOTES,
+                      help="number of motes publishing them")
+    (options, args) = parser.parse_args()
+    main(options.numNotifs,options.numMotes)
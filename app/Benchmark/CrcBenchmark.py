@@ -0,0 +1,109 @@
+#!/usr/bin/python
+
+#============================ adjust path =====================================
+
+import sys
+import os
+if __name__ == "__main__":
+    here = sys.path[0]
+    sys.path.insert(0, os.path.join(here, '..', '..','libs'))
+    sys.path.insert(0, os.path.join(here, '..', '..','external_libs'))
+
+#============================ imports =========================================
+
+import random
+import struct
+import time
+
+from   SmartMeshSDK.SerialConnector import Crc
+
+#============================ defines =========================================
+
+FRAME_LENGTHS    = [3,8,16,32,64,128]
+IMAGE_LENGTHS    = [256*1024,512*1024]
+MIN_DURATION     = 0.5 # seconds spent measuring each case
+
+#============================ helpers =========================================
+
+def legacyHdlcFcs(data):
+    '''
+    \brief Crc.calculate() before the shared Crc module.
+    '''
+    if Crc.log.isEnabledFor(Crc.logging.DEBUG):
+        Crc.log.debug('calculating for data={0}'.format(data))
+    ptr = 0
+    tempfcs = 0xffff
+    while ptr<len(data):
+        tempfcs = (tempfcs >> 8) ^ Crc.FCS16_TABLE[(tempfcs ^ data[ptr]) & 0xff]
+        ptr += 1
+    tempfcs ^= 0xffff
+    fcs  = [(tempfcs>>0) & 0xff, (tempfcs>>8) & 0xff]
+    if Crc.log.isEnabledFor(Crc.logging.DEBUG):
+        Crc.log.debug('fcs=0x%2x%2x',fcs[0],fcs[1])
+    return fcs
+
+def legacyOtapFcs(msg):
+    '''
+    \brief FCS loop of the OTAP module before the shared Crc module.
+    '''
+    fcs = 0xffff
+    for b in msg:
+        c = struct.unpack('B', b)[0]
+        fcs = (fcs >> 8) ^ Crc.FCS16_TABLE[(fcs ^ c) & 0xff]
+    return ~fcs & 0xFFFF
+
+def measure(func,data):
+    '''
+    \brief Call func(data) repeatedly, return the duration of one call.
+    '''
+    numCalls             = 0
+    startTime            = time.time()
+    while True:
+        func(data)
+        numCalls        += 1
+        duration         = time.time()-startTime
+        if duration>MIN_DURATION:
+            return duration/numCalls
+
+#============================ main ============================================
+
+def main():
+    random.seed(0)
+
+    # make sure the 2-byte table is built before measuring
+    Crc.calculate('\x00'*64)
+
+    crc                  = Crc.Crc()
+
+    print 'FCS-16 over HDLC frames (list of ints, as passed by the connectors)\n'
+    print '{0:>8} {1:>12} {2:>12} {3:>12} {4:>8}'.format('bytes','legacy(us)','calc(us)','verify(us)','speedup')
+    for length in FRAME_LENGTHS:
+        frame            = [random.randint(0x00,0xff) for _ in range(length)]
+        frameWithFcs     = frame+crc.calculate(frame)
+        tLegacy          = measure(legacyHdlcFcs,frame)
+        tNew             = measure(crc.calculate,frame)
+        tVerify          = measure(crc.verify,frameWithFcs)
+        print '{0:>8} {1:>12.2f} {2:>12.2f} {3:>12.2f} {4:>7.1f}x'.format(
+            length,
+            tLegacy*1e6,
+            tNew*1e6,
+            tVerify*1e6,
+            tLegacy/tNew,
+        )
+
+    print '\nFCS-16 over firmware images (str, as read by OTAP)\n'
+    print '{0:>8} {1:>12} {2:>12} {3:>12} {4:>8}'.format('kB','legacy(ms)','calc(ms)','MB/s','speedup')
+    for length in IMAGE_LENGTHS:
+        image            = ''.join([chr(random.randint(0x00,0xff)) for _ in range(length)])
+        tLegacy          = measure(legacyOtapFcs,image)
+        tNew             = measure(Crc.calculate,image)
+        print '{0:>8} {1:>12.1f} {2:>12.1f} {3:>12.2f} {4:>7.1f}x'.format(
+            length/1024,
+            tLegacy*1e3,
+            tNew*1e3,
+            length/tNew/1e6,
+            tLegacy/tNew,
+        )
+
+if __name__=="__main__":
+    main()
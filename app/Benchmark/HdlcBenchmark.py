@@ -0,0 +1,170 @@
+#!/usr/bin/python
+
+#============================ adjust path =====================================
+
+import sys
+import os
+if __name__ == "__main__":
+    here = sys.path[0]
+    sys.path.insert(0, os.path.join(here, '..', '..','libs'))
+    sys.path.insert(0, os.path.join(here, '..', '..','external_libs'))
+
+#============================ imports =========================================
+
+import random
+import time
+
+from   SmartMeshSDK.SerialConnector import Hdlc
+
+#============================ defines =========================================
+
+NUM_FRAMES       = 2000
+PAYLOAD_LENGTHS  = [10,50,120]
+
+#============================ helpers =========================================
+
+class MemorySerial(object):
+    '''
+    \brief Replaces the pyserial handler, serving bytes from memory.
+    '''
+
+    def __init__(self,rxBytes=''):
+        self.rxBytes     = rxBytes
+        self.index       = 0
+        self.txBytes     = []
+
+    @property
+    def in_waiting(self):
+        return len(self.rxBytes)-self.index
+
+    def read(self,numBytes):
+        returnVal        = self.rxBytes[self.index:self.index+numBytes]
+        self.index      += len(returnVal)
+        return returnVal
+
+    def write(self,data):
+        self.txBytes    += [data]
+        return len(data)
+
+    def close(self):
+        pass
+
+def buildStream(numFrames,payloadLength):
+    '''
+    \brief Build a serial byte stream containing numFrames HDLC frames.
+    '''
+    random.seed(payloadLength)
+
+    serialHandler        = MemorySerial()
+    hdlc                 = Hdlc.Hdlc(None,None)
+    hdlc.pyserialHandler = serialHandler
+    hdlc.connected       = True
+    for _ in range(numFrames):
+        hdlc.send([random.randint(0x00,0xff) for _ in range(payloadLength)])
+
+    return ''.join(serialHandler.txBytes)
+
+def runReceive(rxMode,stream):
+    '''
+    \brief Receive all frames in the stream, return (numFrames,duration).
+    '''
+
+    numFrames            = [0]
+    def _rxcallback(payload):
+        numFrames[0]    += 1
+    def _connectcallback(state):
+        pass
+
+    hdlc                 = Hdlc.Hdlc(_rxcallback,_connectcallback,rxMode=rxMode)
+    hdlc.pyserialHandler = MemorySerial(stream)
+    hdlc.connected       = True
+
+    # run() returns when the stream is exhausted
+    startTime            = time.time()
+    hdlc.run()
+    duration             = time.time()-startTime
+
+    return numFrames[0],duration
+
+def legacySend(hdlc,message):
+    '''
+    \brief Transmit path of the SDK before the bytearray encoder, kept as the
+           baseline of the transmit benchmark.
+    '''
+    packetBytes          = message+hdlc.crc.calculate(message)
+    index = 0
+    while index<len(packetBytes):
+        if packetBytes[index]==hdlc._HDLC_FLAG or packetBytes[index]==hdlc._HDLC_ESCAPE:
+            packetBytes.insert(index,hdlc._HDLC_ESCAPE)
+            index += 1
+            packetBytes[index] = packetBytes[index]^hdlc._HDLC_MASK
+        index += 1
+    packetBytes.insert(0,hdlc._HDLC_FLAG)
+    packetBytes.insert(len(packetBytes),hdlc._HDLC_FLAG)
+    hdlc.pyserialHandler.write(''.join([chr(byte) for byte in packetBytes]))
+
+def runSend(method,numFrames,payloadLength):
+    '''
+    \brief Send numFrames frames using one of the transmit paths, return the
+           duration.
+    '''
+    random.seed(payloadLength)
+    message              = [random.randint(0x00,0xff) for _ in range(payloadLength)]
+
+    hdlc                 = Hdlc.Hdlc(None,None)
+    hdlc.pyserialHandler = MemorySerial()
+    hdlc.connected       = True
+
+    startTime            = time.time()
+    if   method=='legacy':
+        for _ in xrange(numFrames):
+            legacySend(hdlc,message)
+    elif method=='send':
+        for _ in xrange(numFrames):
+            hdlc.send(message)
+    elif method=='sendFrame':
+        frame            = hdlc.encode(message)
+        for _ in xrange(numFrames):
+            hdlc.sendFrame(frame)
+    duration             = time.time()-startTime
+
+    return duration
+
+#============================ main ============================================
+
+def main():
+    print 'HDLC transmit throughput, {0} frames per run\n'.format(NUM_FRAMES)
+    print '{0:>8} {1:>10} {2:>12} {3:>8}'.format('payload','path','frames/s','speedup')
+    for payloadLength in PAYLOAD_LENGTHS:
+        reference        = None
+        for method in ['legacy','send','sendFrame']:
+            duration     = runSend(method,NUM_FRAMES,payloadLength)
+            if reference is None:
+                reference = duration
+            print '{0:>8} {1:>10} {2:>12.0f} {3:>7.1f}x'.format(
+                payloadLength,
+                method,
+                NUM_FRAMES/duration,
+                reference/duration,
+            )
+
+    print '\nHDLC receive throughput, {0} frames per run\n'.format(NUM_FRAMES)
+    print '{0:>8} {1:>8} {2:>12} {3:>12} {4:>8}'.format('payload','mode','frames/s','kB/s','speedup')
+    for payloadLength in PAYLOAD_LENGTHS:
+        stream           = buildStream(NUM_FRAMES,payloadLength)
+        reference        = None
+        for rxMode in [Hdlc.Hdlc.RXMODE_BYTE,Hdlc.Hdlc.RXMODE_CHUNK]:
+            (numFrames,duration) = runReceive(rxMode,stream)
+            assert numFrames==NUM_FRAMES
+            if reference is None:
+                reference = duration
+            print '{0:>8} {1:>8} {2:>12.0f} {3:>12.1f} {4:>7.1f}x'.format(
+                payloadLength,
+                rxMode,
+                numFrames/duration,
+                len(stream)/duration/1000.0,
+                reference/duration,
+            )
+
+if __name__=="__main__":
+    main()
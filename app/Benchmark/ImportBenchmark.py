@@ -0,0 +1,92 @@
+#!/usr/bin/python
+
+#============================ adjust path =====================================
+
+import sys
+import os
+if __name__ == "__main__":
+    here = sys.path[0]
+    sys.path.insert(0, os.path.join(here, '..', '..','libs'))
+    sys.path.insert(0, os.path.join(here, '..', '..','external_libs'))
+
+#============================ imports =========================================
+
+import subprocess
+from   optparse                 import OptionParser
+
+#============================ defines =========================================
+
+NUM_RUNS         = 10 # fresh interpreters per module
+MODULES          = [
+    'SmartMeshSDK.IpMgrConnectorMux.IpMgrConnectorMux',
+    'SmartMeshSDK.IpMgrConnectorSerial.IpMgrConnectorSerial',
+    'SmartMeshSDK.IpMoteConnector.IpMoteConnector',
+    'SmartMeshSDK.HartMoteConnector.HartMoteConnector',
+    'SmartMeshSDK.HartMgrConnector.HartMgrConnector',
+]
+
+# run in a fresh interpreter: import the module, then create all its named
+# tuples, as importing it did before they were created lazily
+MEASURE = '''
+import sys
+import time
+sys.path                  = {path!r}+sys.path
+startTime                 = time.time()
+import {module} as module
+importTime                = time.time()
+connector                 = getattr(module,'{module}'.split('.')[-1])
+numTuples                 = 0
+for name in dir(connector):
+    if name.startswith('Tuple_'):
+        getattr(connector,name)
+        numTuples        += 1
+print numTuples,importTime-startTime,time.time()-importTime
+'''
+
+#============================ helpers =========================================
+
+def measure(module,numRuns):
+    '''
+    \brief Import module in numRuns fresh interpreters.
+
+    \returns A tuple (numTuples,importTime,tuplesTime), the times being the
+             median over the runs.
+    '''
+    path                 = list(sys.path[:2])  # libs and external_libs
+    code                 = MEASURE.format(path=path,module=module)
+    results              = []
+    for _ in range(numRuns+1):
+        output           = subprocess.check_output([sys.executable,'-c',code])
+        (numTuples,importTime,tuplesTime) = output.split()
+        results         += [(float(importTime),float(tuplesTime))]
+    results              = results[1:] # the first run may compile the modules
+    importTimes          = sorted([r[0] for r in results])
+    tuplesTimes          = sorted([r[1] for r in results])
+    return (
+        int(numTuples),
+        importTimes[len(importTimes)/2],
+        tuplesTimes[len(tuplesTimes)/2],
+    )
+
+#============================ main ============================================
+
+def main(numRuns):
+    print 'Import time of the connector modules, median of {0} fresh interpreters\n'.format(numRuns)
+    print '{0:<54} {1:>7} {2:>11} {3:>12}'.format('module','tuples','import(ms)','+tuples(ms)')
+    for module in MODULES:
+        (numTuples,importTime,tuplesTime) = measure(module,numRuns)
+        print '{0:<54} {1:>7} {2:>11.1f} {3:>12.1f}'.format(
+            module,
+            numTuples,
+            importTime*1e3,
+            tuplesTime*1e3,
+        )
+    print '\n+tuples: creating all the named tuples after the import, what importing cost before they were created lazily'
+
+if __name__=="__main__":
+    parser = OptionParser("usage: %prog [options]")
+    parser.add_option("-r", "--runs", dest="numRuns", type="int",
+                      default=NUM_RUNS,
+                      help="number of fresh interpreters per module")
+    (options, args) = parser.parse_args()
+    main(options.numRuns)
@@ -0,0 +1,143 @@
+#!/usr/bin/python
+
+#============================ adjust path =====================================
+
+import sys
+import os
+if __name__ == "__main__":
+    here = sys.path[0]
+    sys.path.insert(0, os.path.join(here, '..', '..','libs'))
+    sys.path.insert(0, os.path.join(here, '..', '..','external_libs'))
+
+#============================ imports =========================================
+
+import random
+import socket
+import struct
+import threading
+import time
+
+from   SmartMeshSDK.IpMgrConnectorMux import MuxMsg
+
+#============================ defines =========================================
+
+NUM_MSGS         = 50000
+PAYLOAD_LENGTHS  = [10,50,120]
+RECV_SIZES       = [4096,65536]
+
+#============================ helpers =========================================
+
+class LegacyMuxMsg(MuxMsg.MuxMsg):
+    '''
+    \brief Parser of the SDK before the input buffer was preallocated,
+           appending to a str and reslicing it for each message, kept as the
+           baseline of the benchmark.
+    '''
+
+    def __init__(self,cb):
+        MuxMsg.MuxMsg.__init__(self,cb)
+        self.legacyBuffer = ''
+
+    def parse(self,data):
+        if not data:
+            return
+        self.legacyBuffer += data
+        while self.parse_one():
+            pass
+
+    def parse_one(self):
+        msg_start = self.legacyBuffer.find(self.magic)
+        if msg_start >= 0:
+            self.legacyBuffer = self.legacyBuffer[msg_start:]
+            if len(self.legacyBuffer) < 6:
+                return False
+            bin_len = self.legacyBuffer[4:6]
+            msg_len = struct.unpack('!H', bin_len)[0]
+            index_end = 6 + msg_len
+            if len(self.legacyBuffer) < index_end:
+                return False
+            msg = self.legacyBuffer[6:index_end]
+            (cmd_id, cmd_type) = struct.unpack('!HB', msg[0:3])
+            data = msg[3:]
+            if self.callback:
+                self.callback(cmd_id, cmd_type, data)
+            self.legacyBuffer = self.legacyBuffer[index_end:]
+            return True
+        else:
+            self.legacyBuffer = self.legacyBuffer[-3:]
+            return False
+
+def buildStream(numMsgs,payloadLength):
+    '''
+    \brief Build a Serial Mux byte stream containing numMsgs notifications.
+    '''
+    random.seed(payloadLength)
+    muxMsg               = MuxMsg.MuxMsg(None)
+    payload              = ''.join([chr(random.randint(0x00,0xff)) for _ in range(payloadLength)])
+    return ''.join([muxMsg.build_message(20,payload) for _ in xrange(numMsgs)])
+
+def runReceive(method,stream,recvSize):
+    '''
+    \brief Receive the stream from a socket, up to recvSize bytes at a time,
+           return (numMsgs,duration).
+    '''
+    numMsgs              = [0]
+    def _callback(cmd_id,cmd_type,data):
+        numMsgs[0]      += 1
+
+    if   method=='legacy':
+        muxMsg           = LegacyMuxMsg(_callback)
+    elif method=='parse':
+        muxMsg           = MuxMsg.MuxMsg(_callback)
+    else:
+        muxMsg           = MuxMsg.MuxMsg(_callback,views=True)
+
+    (rxSock,txSock)      = socket.socketpair()
+    def _sender():
+        txSock.sendall(stream)
+        txSock.close()
+    sender               = threading.Thread(target=_sender)
+    sender.daemon        = True
+
+    startTime            = time.time()
+    sender.start()
+    if method=='recv_into':
+        while muxMsg.recv_into(rxSock,recvSize):
+            pass
+    else:
+        while True:
+            buf          = rxSock.recv(recvSize)
+            if not buf:
+                break
+            muxMsg.parse(buf)
+    duration             = time.time()-startTime
+
+    sender.join()
+    rxSock.close()
+    return numMsgs[0],duration
+
+#============================ main ============================================
+
+def main():
+    print 'Serial Mux receive throughput, {0} notifications per run\n'.format(NUM_MSGS)
+    print '{0:>8} {1:>8} {2:>10} {3:>12} {4:>12} {5:>8}'.format('recv','payload','path','msgs/s','kB/s','speedup')
+    for recvSize in RECV_SIZES:
+        for payloadLength in PAYLOAD_LENGTHS:
+            stream       = buildStream(NUM_MSGS,payloadLength)
+            reference    = None
+            for method in ['legacy','parse','recv_into']:
+                (numMsgs,duration) = runReceive(method,stream,recvSize)
+                assert numMsgs==NUM_MSGS
+                if reference is None:
+                    reference = duration
+                print '{0:>8} {1:>8} {2:>10} {3:>12.0f} {4:>12.1f} {5:>7.1f}x'.format(
+                    recvSize,
+                    payloadLength,
+                    method,
+                    numMsgs/duration,
+                    len(stream)/duration/1000.0,
+                    reference/duration,
+                )
+
+if __name__=="__main__":
+    main()
@@ -0,0 +1,570 @@
+#!/usr/bin/python
+
+#============================ adjust path =====================================
+
+import sys
+import os
+if __name__ == "__main__":
+    here = sys.path[0]
+    sys.path.insert(0, os.path.join(here, '..', '..','libs'))
+    sys.path.insert(0, os.path.join(here, '..', '..','external_libs'))
+
+#============================ imports =========================================
+
+import gc
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from   optparse                          import OptionParser
+
+from   SmartMeshSDK                      import ApiConnector,             \
+                                                DurableNotifQueue,        \
+                                                NotifFilter
+from   SmartMeshSDK.ApiDefinition        import ApiDefinition,            \
+                                                IpMgrDefinition
+from   SmartMeshSDK.SerialConnector      import Crc,                      \
+                                                Hdlc
+from   SmartMeshSDK.IpMgrConnectorMux    import IpMgrConnectorMux,        \
+                                                IpMgrSubscribe
+from   SmartMeshSDK.IpMgrConnectorSerial import IpMgrConnectorSerial
+from   SmartMeshSDK.IpMgrEmulator        import IpMgrEmulator,            \
+                                                NetworkModel
+from   SmartMeshSDK.protocols.oap        import OAPDispatcher
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+#============================ defines =========================================
+
+NUM_NOTIFS       = 5000
+NUM_MOTES        = 100
+BATCH_SIZE       = 64                    # notifications read at once by the batch stages
+FANOUT_SUBSCRIBERS = 4                   # subscribers to the IpMgrSubscribe bus, besides a slow one
+FILTER_MOTES     = 10                    # percentage of the motes whitelisted by the filter stages
+NOTIF_MIX        = [                     # out of 20 notifications
+    ('data',         16),
+    ('healthReport', 2),
+    ('event',        2),
+]
+
+#============================ helpers =========================================
+
+class MemorySerial(object):
+    '''
+    \brief Replaces the pyserial handler, serving bytes from memory.
+    '''
+
+    def __init__(self,rxBytes=''):
+        self.rxBytes     = rxBytes
+        self.index       = 0
+
+    @property
+    def in_waiting(self):
+        return len(self.rxBytes)-self.index
+
+    def read(self,numBytes):
+        returnVal        = self.rxBytes[self.index:self.index+numBytes]
+        self.index      += len(returnVal)
+        return returnVal
+
+    def write(self,data):
+        return len(data)
+
+    def close(self):
+        pass
+
+class RecordingSession(IpMgrEmulator.EmulatorSession):
+    '''
+    \brief Emulator session keeping the notifications it is sent.
+    '''
+
+    def __init__(self,emulator):
+        IpMgrEmulator.EmulatorSession.__init__(self,emulator)
+        self.subscribe(filter=0xffffffff,unackFilter=0xffffffff)
+        self.notifs      = []
+
+    def sendNotification(self,cmdId,payload,reliable):
+        self.notifs     += [(cmdId,payload)]
+        return True
+
+    def close(self):
+        pass
+
+class BenchMuxConnector(IpMgrConnectorMux.IpMgrConnectorMux):
+    '''
+    \brief Mux connector fed from memory, without a Serial Mux to subscribe to.
+    '''
+
+    def dn_subscribe(self,filter,unackFilter):
+        pass
+
+class BenchSerialConnector(IpMgrConnectorSerial.IpMgrConnectorSerial):
+    '''
+    \brief Serial connector fed from memory, without a manager to subscribe to.
+    '''
+
+    def dn_subscribe(self,filter,unackFilter):
+        pass
+
+class Meter(object):
+    '''
+    \brief Measure the wall-clock time, CPU time and object allocations of a
+           stage.
+
+    Allocations are counted with tracemalloc when available (number of memory
+    blocks allocated). Otherwise, the garbage collector is disabled while
+    measuring, and the count is the number of container objects created and
+    still alive at the end of the stage, i.e. the objects the stage passes to
+    the next one.
+    '''
+
+    def __enter__(self):
+        gc.collect()
+        if tracemalloc:
+            tracemalloc.start()
+            self.startAllocs = self._numBlocks()
+        else:
+            gc.disable()
+            self.startAllocs = gc.get_count()[0]
+        self.startCpu    = sum(os.times()[:2])
+        self.startTime   = time.time()
+        return self
+
+    def __exit__(self,type,value,tb):
+        self.duration    = time.time()-self.startTime
+        self.cpu         = sum(os.times()[:2])-self.startCpu
+        if tracemalloc:
+            self.allocs  = self._numBlocks()-self.startAllocs
+            tracemalloc.stop()
+        else:
+            self.allocs  = gc.get_count()[0]-self.startAllocs
+            gc.enable()
+
+    def _numBlocks(self):
+        return sum([s.count for s in tracemalloc.take_snapshot().statistics('filename')])
+
+def buildNotifs(numNotifs,numMotes):
+    '''
+    \brief Generate notifications with the manager emulator.
+
+    \returns A list of (cmdId,payload) tuples.
+    '''
+    emulator             = IpMgrEmulator.IpMgrEmulator(
+        network          = NetworkModel.NetworkModel(numMotes=numMotes),
+    )
+    session              = RecordingSession(emulator)
+    emulator.addSession(session)
+
+    motes                = emulator.network.getOperationalMotes()
+    numEvents            = 0
+    while len(session.notifs)<numNotifs:
+        for (stream,weight) in NOTIF_MIX:
+            for _ in range(weight):
+                if stream=='event':
+                    # joins and path changes, leaving the network as is
+                    mote = motes[numEvents%len(motes)]
+                    path = emulator.network.getPathsOf(mote)[0]
+                    if numEvents%2:
+                        emulator.notifyEvent('eventMoteJoin',{'macAddress': mote.macAddress})
+                    else:
+                        emulator.notifyEvent('eventPathCreate',{
+                            'source':    path.source.macAddress,
+                            'dest':      path.dest.macAddress,
+                            'direction': path.direction,
+                        })
+                    numEvents += 1
+                else:
+                    emulator.generate(stream)
+    return session.notifs[:numNotifs]
+
+def buildPackets(notifs):
+    '''
+    \brief Add the serial API header, unacknowledged notifications.
+    '''
+    return [[0x00,cmdId,0x00,len(payload)]+payload for (cmdId,payload) in notifs]
+
+def buildStream(packets):
+    '''
+    \brief Frame all packets into a serial byte stream.
+    '''
+    hdlc                 = Hdlc.Hdlc(None,None)
+    return ''.join([hdlc.encode(packet) for packet in packets])
+
+def notifMemory(apiDef,notifs):
+    '''
+    \brief Memory held by deserialized notifications, in bytes per
+           notification.
+
+    \returns A tuple (total,binary), binary being the part held by the binary
+             (HEXDATA) fields. A memoryview is counted with the payload it
+             points into. The fields are a dictionary or a named tuple.
+    '''
+    total                = 0
+    binary               = 0
+    for (nameArray,fields) in notifs:
+        total           += sys.getsizeof(fields)
+        if isinstance(fields,dict):
+            items        = fields.items()
+        else:
+            items        = zip(fields._fields,fields)
+        for (name,value) in items:
+            if value is None or isinstance(value,bool) or (isinstance(value,int) and -5<=value<=256):
+                continue # shared objects
+            size         = sys.getsizeof(value)
+            if isinstance(value,memoryview):
+                size    += sys.getsizeof(value.tobytes())
+            total       += size
+            if apiDef.getResponseFieldFormat(apiDef.NOTIFICATION,nameArray,name)==ApiDefinition.FieldFormats.HEXDATA:
+                binary  += size
+    return (float(total)/len(notifs),float(binary)/len(notifs))
+
+def buildNotifFilter(notifs,percentage):
+    '''
+    \brief A NotifFilter whitelisting the MAC addresses of percentage % of the
+           motes of notifs.
+    '''
+    macs                 = set()
+    for (nameArray,fields) in notifs:
+        if getattr(fields,'macAddress',None) is not None:
+            macs.add(str(bytearray(fields.macAddress)))
+    notifFilter          = NotifFilter.NotifFilter()
+    for mac in sorted(macs)[:max(1,len(macs)*percentage/100)]:
+        notifFilter.whitelist_mac(mac)
+    return notifFilter
+
+def printResult(stage,meter,numNotifs):
+    print '{0:<30} {1:>10.0f} {2:>10.2f} {3:>10.2f} {4:>8.1f}'.format(
+        stage,
+        numNotifs/meter.duration,
+        meter.duration/numNotifs*1e6,
+        meter.cpu/numNotifs*1e6,
+        float(meter.allocs)/numNotifs,
+    )
+
+#============================ stages ==========================================
+
+def stageCrc(packets):
+    crc                  = Crc.Crc()
+    with Meter() as meter:
+        for packet in packets:
+            crc.calculate(packet)
+    return (meter,None)
+
+def stageHdlc(stream,numPackets):
+    packets              = []
+    hdlc                 = Hdlc.Hdlc(packets.append,lambda state: None,rxMode=Hdlc.Hdlc.RXMODE_CHUNK)
+    hdlc.pyserialHandler = MemorySerial(stream)
+    hdlc.connected       = True
+    with Meter() as meter:
+        # run() returns when the stream is exhausted
+        hdlc.run()
+    assert len(packets)==numPackets
+    return (meter,packets)
+
+def stageDeserialize(packets,binaryFields,recordTypes=None):
+    apiDef               = IpMgrDefinition.IpMgrDefinition()
+    connector            = ApiConnector.ApiConnector()
+    connector.setBinaryFields(binaryFields)
+    notifs               = []
+    with Meter() as meter:
+        for packet in packets:
+            payload      = connector._toBinaryFields(packet[4:])
+            if recordTypes:
+                notifs  += [apiDef.deserializeRecord(apiDef.NOTIFICATION,packet[1],payload,recordTypes)]
+            else:
+                notifs  += [apiDef.deserialize(apiDef.NOTIFICATION,packet[1],payload)]
+    return (meter,notifs)
+
+def stageNotifFilter(packets,binaryFields,notifFilter,isPushedDown):
+    '''
+    \brief Deserialize the notifications into records and drop those
+           notifFilter filters out, once deserialized, or before, from their
+           raw header, as the connectors do.
+    '''
+    apiDef               = IpMgrDefinition.IpMgrDefinition()
+    connector            = ApiConnector.ApiConnector()
+    connector.setBinaryFields(binaryFields)
+    recordTypes          = IpMgrConnectorMux.IpMgrConnectorMux.notifTupleTable
+    rawFilter            = notifFilter.compile(apiDef)
+    notifs               = []
+    with Meter() as meter:
+        for packet in packets:
+            if isPushedDown and not rawFilter.accept(packet[1],packet[4:]):
+                continue
+            payload      = connector._toBinaryFields(packet[4:])
+            (nameArray,record) = apiDef.deserializeRecord(apiDef.NOTIFICATION,packet[1],payload,recordTypes)
+            if isPushedDown or notifFilter.filter(nameArray[-1],record,nameArray[:-1]):
+                notifs  += [(nameArray,record)]
+    return (meter,notifs)
+
+def stageNotifQueue(notifs):
+    queue                = ApiConnector.NotifQueue(len(notifs))
+    with Meter() as meter:
+        for notif in notifs:
+            queue.put(notif)
+        notifs           = [queue.get(0) for _ in xrange(len(notifs))]
+    return (meter,notifs)
+
+def stageNotifOverflow(notifs,overflow):
+    '''
+    \brief Queue the notifications in a burst, into a queue holding a tenth of
+           them, return (meter,stats).
+    '''
+    queue                = ApiConnector.NotifQueue(max(1,len(notifs)/10),overflow)
+    with Meter() as meter:
+        for notif in notifs:
+            queue.put(notif)
+    return (meter,queue.getStats())
+
+def stageDurableQueue(notifs,memSize):
+    '''
+    \brief Queue the notifications in a log on disk keeping memSize of them in
+           memory, read them back, and flush the log to disk.
+    '''
+    path                 = tempfile.mkdtemp()
+    queue                = DurableNotifQueue.DurableNotifQueue(path,memSize=memSize)
+    try:
+        with Meter() as meter:
+            for notif in notifs:
+                queue.put(notif)
+            notifs       = []
+            while len(notifs)<queue.stats['numQueued']:
+                notifs  += queue.getBatch(BATCH_SIZE,0)
+            queue.ack()
+            queue.sync()
+    finally:
+        queue.close()
+        shutil.rmtree(path)
+    return (meter,notifs)
+
+def stageGetNotification(notifs):
+    connector            = IpMgrConnectorMux.IpMgrConnectorMux(len(notifs))
+    ApiConnector.ApiConnector.connect(connector)
+    with Meter() as meter:
+        for notif in notifs:
+            connector.putNotification(notif)
+        tuples           = [connector.getNotification(0) for _ in xrange(len(notifs))]
+    return (meter,tuples)
+
+def stageGetNotifications(notifs,batchSize):
+    connector            = IpMgrConnectorMux.IpMgrConnectorMux(len(notifs))
+    ApiConnector.ApiConnector.connect(connector)
+    with Meter() as meter:
+        for notif in notifs:
+            connector.putNotification(notif)
+        tuples           = []
+        while len(tuples)<len(notifs):
+            tuples      += connector.getNotifications(batchSize,0)
+    return (meter,tuples)
+
+def stageSubscribe(notifs,batchSize=1):
+    connector            = BenchMuxConnector(len(notifs))
+    ApiConnector.ApiConnector.connect(connector)
+
+    tuples               = []
+    finished             = threading.Event()
+    def _notifCb(notifName,notifParams):
+        tuples.append((notifName,notifParams))
+    def _finishCb(notifName,notifParams):
+        finished.set()
+
+    def _batchCb(batch):
+        tuples.extend(batch)
+
+    subscriber           = IpMgrSubscribe.IpMgrSubscribe(connector,batchSize)
+    subscriber.start()
+    if batchSize>1:
+        subscriber.subscribe(IpMgrSubscribe.IpMgrSubscribe.ALLNOTIF,_batchCb,isRlbl=True,isBatch=True)
+    else:
+        subscriber.subscribe(IpMgrSubscribe.IpMgrSubscribe.ALLNOTIF,_notifCb,isRlbl=True)
+    subscriber.subscribe(IpMgrSubscribe.IpMgrSubscribe.FINISH,_finishCb,isRlbl=True)
+    with Meter() as meter:
+        for notif in notifs:
+            connector.putNotification(notif)
+        ApiConnector.ApiConnector.disconnect(connector,'end of benchmark')
+        finished.wait()
+    assert len(tuples)==len(notifs)
+    return (meter,tuples)
+
+def stageFanOut(notifs,numSubscribers):
+    '''
+    \brief Publish the notifications to numSubscribers subscribers of the
+           IpMgrSubscribe bus, and to a slow one, return once the others have
+           received them all.
+    '''
+    connector            = BenchMuxConnector(len(notifs))
+    ApiConnector.ApiConnector.connect(connector)
+
+    numDelivered         = [0]*numSubscribers
+    allDelivered         = threading.Event()
+    def _makeCb(index):
+        def _notifCb(notifName,notifParams):
+            numDelivered[index] += 1
+            if numDelivered[index]==len(notifs) and sum(numDelivered)==numSubscribers*len(notifs):
+                allDelivered.set()
+        return _notifCb
+    def _slowCb(notifName,notifParams):
+        time.sleep(0.001)
+
+    subscriber           = IpMgrSubscribe.IpMgrSubscribe(connector)
+    subscriber.start()
+    for index in range(numSubscribers):
+        subscriber.addSubscriber(IpMgrSubscribe.IpMgrSubscribe.ALLNOTIF,_makeCb(index),queueSize=len(notifs))
+    slow                 = subscriber.addSubscriber(IpMgrSubscribe.IpMgrSubscribe.ALLNOTIF,_slowCb,name='slow')
+    with Meter() as meter:
+        for notif in notifs:
+            connector.putNotification(notif)
+        allDelivered.wait()
+    numDropped           = slow.getStats()['numDropped']
+    ApiConnector.ApiConnector.disconnect(connector,'end of benchmark')
+    return (meter,numDropped)
+
+def stageOap(tuples):
+    dispatcher           = OAPDispatcher.OAPDispatcher()
+    samples              = []
+    dispatcher.register_notif_handler(lambda mac,notif: samples.append(notif))
+    with Meter() as meter:
+        for (notifName,notifParams) in tuples:
+            if notifName==IpMgrSubscribe.IpMgrSubscribe.NOTIFDATA:
+                dispatcher.dispatch_pkt(notifName,notifParams)
+    return (meter,samples)
+
+def endToEnd(stream,numNotifs,binaryFields):
+    '''
+    \brief HDLC frames in, OAP samples and other notifications out, through
+           the threads of a serial connector and a subscriber.
+    '''
+    connector            = BenchSerialConnector(numNotifs)
+    connector.setBinaryFields(binaryFields)
+    ApiConnector.ApiConnector.connect(connector)
+    connector._resetRxStats()
+    connector._resetPacketIds()
+
+    dispatcher           = OAPDispatcher.OAPDispatcher()
+    numDelivered         = [0]
+    finished             = threading.Event()
+    def _notifCb(notifName,notifParams):
+        numDelivered[0] += 1
+    def _dataCb(notifName,notifParams):
+        dispatcher.dispatch_pkt(notifName,notifParams)
+    def _finishCb(notifName,notifParams):
+        finished.set()
+    dispatcher.register_notif_handler(_notifCb)
+    subscriber           = IpMgrSubscribe.IpMgrSubscribe(connector)
+
+    hdlc                 = Hdlc.Hdlc(connector._hdlcRxCb,lambda state: None,rxMode=Hdlc.Hdlc.RXMODE_CHUNK)
+    hdlc.pyserialHandler = MemorySerial(stream)
+    hdlc.connected       = True
+
+    subscriber.start()
+    subscriber.subscribe(IpMgrSubscribe.IpMgrSubscribe.ALLNOTIF,_notifCb,isRlbl=True)
+    subscriber.subscribe(IpMgrSubscribe.IpMgrSubscribe.NOTIFDATA,_dataCb,isRlbl=True)
+    subscriber.subscribe(IpMgrSubscribe.IpMgrSubscribe.FINISH,_finishCb,isRlbl=True)
+    with Meter() as meter:
+        hdlc.run()
+        ApiConnector.ApiConnector.disconnect(connector,'end of benchmark')
+        finished.wait()
+    assert numDelivered[0]==numNotifs
+    return meter
+
+#============================ main ============================================
+
+def main(numNotifs,numMotes,binaryFields):
+    notifs               = buildNotifs(numNotifs,numMotes)
+    packets              = buildPackets(notifs)
+    stream               = buildStream(packets)
+
+    print 'Notification pipeline, {0} notifications from {1} motes, {2} bytes'.format(
+        numNotifs,
+        numMotes,
+        len(stream),
+    )
+    print 'allocations: {0}'.format(
+        'memory blocks (tracemalloc)' if tracemalloc else 'objects passed to the next stage (gc)',
+    )
+    print 'binary fields: {0}\n'.format(binaryFields)
+    print '{0:<30} {1:>10} {2:>10} {3:>10} {4:>8}'.format('stage','notifs/s','us/notif','cpu us','allocs')
+
+    (meter,_)            = stageCrc(packets)
+    printResult('Crc.calculate',meter,numNotifs)
+    (meter,rxPackets)    = stageHdlc(stream,len(packets))
+    printResult('Hdlc (chunk mode, with FCS)',meter,numNotifs)
+    (meter,rxDicts)      = stageDeserialize(rxPackets,binaryFields)
+    printResult('deserialize into dict',meter,numNotifs)
+    (meter,rxNotifs)     = stageDeserialize(rxPackets,binaryFields,IpMgrConnectorMux.IpMgrConnectorMux.notifTupleTable)
+    printResult('deserialize into record',meter,numNotifs)
+    notifFilter          = buildNotifFilter(rxNotifs,FILTER_MOTES)
+    (meter,kept)         = stageNotifFilter(rxPackets,binaryFields,notifFilter,False)
+    printResult('filter {0}% of motes, decoded'.format(FILTER_MOTES),meter,numNotifs)
+    (meter,keptRaw)      = stageNotifFilter(rxPackets,binaryFields,notifFilter,True)
+    printResult('filter {0}% of motes, raw'.format(FILTER_MOTES),meter,numNotifs)
+    assert len(keptRaw)==len(kept)
+    memoryDicts          = notifMemory(IpMgrDefinition.IpMgrDefinition(),rxDicts)
+    memory               = notifMemory(IpMgrDefinition.IpMgrDefinition(),rxNotifs)
+    (meter,rxNotifs)     = stageNotifQueue(rxNotifs)
+    printResult('NotifQueue put/get',meter,numNotifs)
+    overflowStats        = []
+    for overflow in [ApiConnector.NotifQueue.OVERFLOW_DROP_OLDEST,
+                     ApiConnector.NotifQueue.OVERFLOW_DROP_NEWEST,
+                     ApiConnector.NotifQueue.OVERFLOW_COALESCE]:
+        (meter,stats)    = stageNotifOverflow(rxNotifs,overflow)
+        printResult('NotifQueue burst, {0}'.format(overflow),meter,numNotifs)
+        overflowStats   += [stats]
+    (meter,_)            = stageDurableQueue(rxNotifs,numNotifs)
+    printResult('DurableNotifQueue, in memory',meter,numNotifs)
+    (meter,_)            = stageDurableQueue(rxNotifs,numNotifs/10)
+    printResult('DurableNotifQueue, spilled',meter,numNotifs)
+    (meter,_)            = stageGetNotification(rxDicts)
+    printResult('getNotification from dict',meter,numNotifs)
+    (meter,_)            = stageGetNotification(rxNotifs)
+    printResult('getNotification from record',meter,numNotifs)
+    (meter,_)            = stageGetNotifications(rxNotifs,BATCH_SIZE)
+    printResult('getNotifications, {0} at once'.format(BATCH_SIZE),meter,numNotifs)
+    (meter,tuples)       = stageSubscribe(rxNotifs)
+    printResult('IpMgrSubscribe',meter,numNotifs)
+    (meter,_)            = stageSubscribe(rxNotifs,BATCH_SIZE)
+    printResult('IpMgrSubscribe, batches',meter,numNotifs)
+    (meter,numDropped)   = stageFanOut(rxNotifs,FANOUT_SUBSCRIBERS)
+    printResult('IpMgrSubscribe bus, {0}+slow'.format(FANOUT_SUBSCRIBERS),meter,numNotifs)
+    (meter,samples)      = stageOap(tuples)
+    printResult('OAPDispatcher',meter,numNotifs)
+
+    print ''
+    meter                = endToEnd(stream,numNotifs,binaryFields)
+    printResult('end-to-end',meter,numNotifs)
+
+    print '\nmemory per deserialized notification, of which binary fields:'
+    print '- dict:   {0:>6.0f} bytes {1:>6.0f} bytes'.format(*memoryDicts)
+    print '- record: {0:>6.0f} bytes {1:>6.0f} bytes'.format(*memory)
+
+    print '\nburst of {0} notifications into a queue of {1}:'.format(numNotifs,overflowStats[0]['size'])
+    for stats in overflowStats:
+        print '- {0:<12} {1:>6} dropped ({2} coalesced), per type: {3}'.format(
+            stats['overflow'],
+            stats['numDropped'],
+            stats['numCoalesced'],
+            ', '.join(['{0} {1}'.format(t,n) for (t,n) in sorted(stats['droppedPerType'].items())]),
+        )
+
+if __name__=="__main__":
+    parser = OptionParser("usage: %prog [options]")
+    parser.add_option("-n", "--notifs", dest="numNotifs", type="int",
+                      default=NUM_NOTIFS,
+                      help="number of notifications")
+    parser.add_option("-m", "--motes", dest="numMotes", type="int",
+                      default=NUM_MOTES,
+                      help="number of motes publishing them")
+    parser.add_option("-b", "--binaryFields", dest="binaryFields",
+                      default=ApiConnector.ApiConnector.BINARY_LIST,
+                      choices=[
+                          ApiConnector.ApiConnector.BINARY_LIST,
+                          ApiConnector.ApiConnector.BINARY_BYTES,
+                          ApiConnector.ApiConnector.BINARY_MEMORYVIEW,
+                      ],
+                      help="how binary fields are delivered: list, bytes or memoryview")
+    (options, args) = parser.parse_args()
+    main(options.numNotifs,options.numMotes,options.binaryFields)
@@ -0,0 +1,122 @@
+#!/usr/bin/python
+
+#============================ adjust path =====================================
+
+import sys
+import os
+if __name__ == "__main__":
+    here = sys.path[0]
+    sys.path.insert(0, os.path.join(here, '..', '..','libs'))
+    sys.path.insert(0, os.path.join(here, '..', '..','external_libs'))
+
+#============================ verify installation =============================
+
+from SmartMeshSDK.utils import SmsdkInstallVerifier
+(goodToGo,reason) = SmsdkInstallVerifier.verifyComponents(
+    [
+        SmsdkInstallVerifier.PYTHON,
+        SmsdkInstallVerifier.PYSERIAL,
+    ]
+)
+if not goodToGo:
+    print "Your installation does not allow this application to run:\n"
+    print reason
+    raw_input("Press any button to exit")
+    sys.exit(1)
+
+#============================ imports =========================================
+
+import time
+from   optparse                        import OptionParser
+
+from   SmartMeshSDK.IpMgrEmulator      import IpMgrEmulator,              \
+                                              NetworkModel,               \
+                                              MuxSession
+from   SmartMeshSDK.utils              import AppUtils
+
+#============================ defines =========================================
+
+DEFAULT_MUX_PORT = MuxSession.MuxServer.DEFAULT_PORT
+STATS_PERIOD     = 10 # seconds between printing statistics
+
+#============================ setup/teardown ==================================
+
+AppUtils.configureLogging()
+
+#============================ main ============================================
+
+def main(options):
+
+    emulator = IpMgrEmulator.IpMgrEmulator(
+        network          = NetworkModel.NetworkModel(
+            numMotes     = options.numMotes,
+            fanout       = options.fanout,
+            seed         = options.seed,
+        ),
+        dataRate         = options.dataRate,
+        healthReportRate = options.hrRate,
+        eventRate        = options.eventRate,
+        dataLength       = options.dataLength,
+        seed             = options.seed,
+    )
+    emulator.start()
+
+    servers = []
+    if not options.noSerial:
+        # imported here, as ptys only exist on POSIX systems
+        from SmartMeshSDK.IpMgrEmulator import SerialSession
+        session = SerialSession.SerialSession(emulator)
+        print 'serial API on {0}'.format(session.portName)
+    if options.muxPort:
+        servers += [MuxSession.MuxServer(emulator,options.host,options.muxPort)]
+        print 'Serial Mux on {0}:{1}'.format(options.host,options.muxPort)
+
+    print 'emulating {0} motes, Ctrl+C to exit'.format(options.numMotes)
+    try:
+        while True:
+            time.sleep(STATS_PERIOD)
+            print emulator.getStats()
+    except KeyboardInterrupt:
+        pass
+
+    for server in servers:
+        server.close()
+    emulator.close()
+
+if __name__ == '__main__':
+
+    # Parse the command line
+    parser = OptionParser("usage: %prog [options]", version="%prog 1.0")
+    parser.add_option("-n", "--motes", dest="numMotes", type="int",
+                      default=10,
+                      help="number of motes, not counting the access point")
+    parser.add_option("--fanout", dest="fanout", type="int",
+                      default=3,
+                      help="number of children of each routing mote")
+    parser.add_option("--data", dest="dataRate", type="float",
+                      default=1.0,
+                      help="notifData per second, over the whole network")
+    parser.add_option("--hr", dest="hrRate", type="float",
+                      default=0.1,
+                      help="notifHealthReport per second")
+    parser.add_option("--events", dest="eventRate", type="float",
+                      default=0.1,
+                      help="notifEvent per second")
+    parser.add_option("--dataLength", dest="dataLength", type="int",
+                      default=None,
+                      help="length of the notifData payload (OAP temperature if not set)")
+    parser.add_option("--seed", dest="seed", type="int",
+                      default=0,
+                      help="seed of the network model and notifications")
+    parser.add_option("--host", dest="host",
+                      default='127.0.0.1',
+                      help="address to serve the Serial Mux on")
+    parser.add_option("-p", "--port", dest="muxPort", type="int",
+                      default=DEFAULT_MUX_PORT,
+                      help="port to serve the Serial Mux on, 0 to disable")
+    parser.add_option("--noSerial", dest="noSerial", action="store_true",
+                      default=False,
+                      help="do not serve the serial API on a pty")
+    (options, args) = parser.parse_args()
+
+    main(options)
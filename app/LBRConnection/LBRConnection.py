@@ -186,12 +186,8 @@ class LBRConnectionGui(object):
             raise AttributeError("Should only receive notifIpData notifications, not "+notifName)
         
         # build the string to send to the LBR
-        stringToSend = ''
-        
-        for c in notifParams.macAddress:
-            stringToSend += chr(c)
-        for c in notifParams.data:
-            stringToSend += chr(c)
+        stringToSend = FormatUtils.toByteString(notifParams.macAddress) + \
+                       FormatUtils.toByteString(notifParams.data)
         
         # send to the LBR
         self.lbrconnector.send(stringToSend)
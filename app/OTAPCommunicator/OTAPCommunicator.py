@@ -135,7 +135,7 @@ def send_data(mac, msg, port):
     rc = -1
     cbid = -1
     try:
-        resp = mgr.dn_sendData(mac, 2, port, port, 0, msg_hex)
+        resp = mgr.dn_sendData_trusted(mac, 2, port, port, 0, msg_hex)
         rc = resp.RC
         cbid = resp.callbackId
     except ApiException.APIError as ex:
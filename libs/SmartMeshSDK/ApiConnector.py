@@ -5,7 +5,8 @@ The base ApiConnector class contains common methods for managing the notificatio
 '''
 
 import logging
-from Queue import Empty  
+import threading
+import time
 from Queue import Queue
 
 import ApiException
@@ -43,6 +44,15 @@ class ApiConnector(object):
     \brief Base class for all connector objects.
     '''
     
+    # how binary (HEXDATA) fields are delivered, see setBinaryFields()
+    BINARY_LIST       = 'list'        # list or tuple of ints (default)
+    BINARY_BYTES      = 'bytes'       # str
+    BINARY_MEMORYVIEW = 'memoryview'  # memoryview into the received packet
+    
+    # record type of each notification, by name, overridden by the connectors
+    # whose notifications are deserialized directly into named tuples
+    notifTupleTable   = None
+    
     def __init__(self, maxQSize = DEFAULT_Q_SIZE):
         self.maxQSize = maxQSize
         self.queue = NotifQueue(self.maxQSize)
@@ -51,6 +61,12 @@ class ApiConnector(object):
         self.pendingNotification = None
         self.disconnectReason = ''
         self.traceFile = None
+        self.dispatchLock = threading.Lock()
+        self.dispatchQueue = None
+        self.dispatchThread = None
+        self.binaryFields = self.BINARY_LIST
+        self.notifFilter = None
+        self.trustedCalls = threading.local()
                 
     def connect(self) :
         self.queue.clear()
@@ -64,10 +80,247 @@ class ApiConnector(object):
         self.disconnectReason = reason
         self.isConnected = False
         self.putDisconnectNotification(reason)
+        self._stopDispatcher()
         
     def send(self, cmdName, params):
         raise NotImplementedError("ApiConnector.send is not implemented")
 
+    def setBinaryFields(self, binaryFields):
+        '''
+        \brief Choose how the binary fields of the responses and notifications
+               received are delivered, e.g. macAddress or the data of a
+               notifData.
+        
+        Binary fields are lists or tuples of ints by default. As bytes (str),
+        they take about a tenth of the memory, and can be passed to struct or
+        array without conversion. As memoryviews, they are not even copied out
+        of the packet received. In both cases, indexing a field returns a
+        character, not an int.
+        
+        Commands accept binary fields in any of these types.
+        
+        \param binaryFields BINARY_LIST, BINARY_BYTES or BINARY_MEMORYVIEW.
+        '''
+        if binaryFields not in [self.BINARY_LIST, self.BINARY_BYTES, self.BINARY_MEMORYVIEW] :
+            raise ValueError("unsupported binaryFields {0}".format(binaryFields))
+        self.binaryFields = binaryFields
+
+    def setNotifOverflow(self, overflow, blockTimeout = None, coalesceKey = None):
+        '''
+        \brief Choose what happens to the notifications received while the
+               notification queue is full.
+        
+        By default (NotifQueue.OVERFLOW_DISCONNECT), the connector disconnects.
+        It can instead drop the oldest or the newest notification, hold back
+        the receiving thread until there is room, or replace the queued
+        notification of the same type about the same mote. See NotifQueue.
+        
+        \param overflow     One of NotifQueue.OVERFLOW_POLICIES.
+        \param blockTimeout For OVERFLOW_BLOCK, the maximum time to wait for
+                            room, in seconds. None waits forever.
+        \param coalesceKey  For OVERFLOW_COALESCE, a function returning the
+                            key of a notification.
+        '''
+        self.queue.setOverflow(overflow, blockTimeout, coalesceKey)
+    
+    def getNotifQueueStats(self):
+        '''
+        \brief Get the depth, high-water mark and drop counts of the
+               notification queue since connecting, see NotifQueue.getStats().
+        '''
+        return self.queue.getStats()
+
+    def setNotifFilter(self, notifFilter):
+        '''
+        \brief Drop the notifications received which do not match a filter,
+               before they are deserialized.
+        
+        The filter is compiled into the offsets of the fields it compares in
+        the payload of each type of notification, see NotifFilter. It replaces
+        the previous one, and its statistics.
+        
+        \param notifFilter A NotifFilter or NotifFilterSet, None to keep all
+                           the notifications.
+        
+        \exception NotImplementedError The connector does not filter the
+                   notifications it receives.
+        '''
+        if notifFilter is not None :
+            notifFilter = notifFilter.compile(self._getApiDefinition())
+        self.notifFilter = notifFilter
+    
+    def getNotifFilterStats(self):
+        '''
+        \brief Get the number of notifications accepted and filtered out by
+               the filter set with setNotifFilter(), see
+               RawNotifFilter.getStats().
+        
+        \returns None without filter.
+        '''
+        notifFilter = self.notifFilter
+        if notifFilter is None :
+            return None
+        return notifFilter.getStats()
+
+    def openNotifLog(self, path, **kwargs):
+        '''
+        \brief Queue the notifications in a log on disk, rather than in memory
+               only, see DurableNotifQueue.
+        
+        The notifications not acknowledged with ackNotifications() when the
+        log was last closed are queued again, and read first.
+        
+        \param path   Directory of the log.
+        \param kwargs Parameters of DurableNotifQueue. memSize defaults to
+                      the maximum size of the notification queue.
+        
+        \exception ConnectionError Called while connected.
+        '''
+        import DurableNotifQueue
+        if isinstance(self.queue, DurableNotifQueue.DurableNotifQueue) and self.queue.path == path :
+            return
+        if self.isConnected :
+            raise ApiException.ConnectionError("Already connected")
+        kwargs.setdefault('memSize', self.maxQSize)
+        queue = DurableNotifQueue.DurableNotifQueue(path, **kwargs)
+        (oldQueue, self.queue) = (self.queue, queue)
+        oldQueue.close()
+    
+    def closeNotifLog(self):
+        '''
+        \brief Flush the notification log to disk, close it, and go back to
+               queuing the notifications in memory.
+        '''
+        (oldQueue, self.queue) = (self.queue, NotifQueue(self.maxQSize))
+        oldQueue.close()
+    
+    def ackNotifications(self, offset = None):
+        '''
+        \brief Acknowledge the notifications read, which are not replayed by
+               the notification log anymore, see openNotifLog().
+        
+        \param offset Offset of the first notification not acknowledged, see
+                      getNotifQueueStats(). None to acknowledge all the
+                      notifications read.
+        '''
+        self.queue.ack(offset)
+    
+    def _getApiDefinition(self):
+        '''
+        \brief The API definition of the packets received, overridden by the
+               connectors which filter their notifications.
+        '''
+        raise NotImplementedError("{0} does not filter notifications".format(self.__class__.__name__))
+    
+    def _toBinaryFields(self, payload):
+        '''
+        \brief Convert a received payload into the type its binary fields are
+               delivered as, the deserializer slicing them out of it.
+        
+        \param payload the payload, a list or tuple of ints, or a str.
+        '''
+        if self.binaryFields == self.BINARY_LIST :
+            return payload
+        if not isinstance(payload, str) :
+            payload = str(bytearray(payload))
+        if self.binaryFields == self.BINARY_MEMORYVIEW :
+            payload = memoryview(payload)
+        return payload
+
+    def send_async(self, cmdName, params):
+        '''
+        \brief Send a command without blocking the calling thread.
+        
+        The command is queued to the dispatcher of this connector, a single
+        thread which calls send() for each queued command, in order.
+        
+        \param cmdName command name, as passed to send()
+        \param params  command fields, as passed to send()
+        
+        \returns A CommandFuture, completed with the return value of send(),
+                 or with the exception it raised.
+        '''
+        return self.submit(self.send, cmdName, params)
+
+    def submit(self, func, *args, **kwargs):
+        '''
+        \brief Call func(*args, **kwargs) from the dispatcher of this connector.
+        
+        \returns A CommandFuture completed with the outcome of the call.
+        '''
+        future = CommandFuture()
+        with self.dispatchLock :
+            if not self.dispatchThread :
+                self.dispatchQueue = Queue()
+                self.dispatchThread = threading.Thread(target = self._dispatch,
+                                                       args = (self.dispatchQueue,))
+                self.dispatchThread.name = "{0}_dispatcher".format(self.__class__.__name__)
+                self.dispatchThread.daemon = True
+                self.dispatchThread.start()
+            self.dispatchQueue.put((future, func, args, kwargs))
+        return future
+
+    def isTrustedCall(self):
+        '''
+        \brief Whether the command being sent from this thread was called
+               through a dn_<command>_trusted() method.
+        '''
+        return getattr(self.trustedCalls, 'active', False)
+
+    def __getattr__(self, name):
+        '''
+        \brief Provide an asynchronous variant dn_<command>_async() of each
+               dn_<command>() method, returning a CommandFuture, and a trusted
+               variant dn_<command>_trusted().
+        
+        The trusted variant sends the command without validating its fields
+        first, for callers which build them from the API definition, such as
+        the OAP and OTAP protocols. Fields which are not valid are not
+        reported as a CommandError, and may be sent as a malformed command.
+        Both variants combine, as dn_<command>_trusted_async().
+        '''
+        if name.startswith('dn_') and name.endswith('_async') :
+            func = getattr(self, name[:-len('_async')])
+            def _async(*args, **kwargs):
+                return self.submit(func, *args, **kwargs)
+            _async.__name__ = name
+            return _async
+        if name.startswith('dn_') and name.endswith('_trusted') :
+            func = getattr(self, name[:-len('_trusted')])
+            def _trusted(*args, **kwargs):
+                wasActive = self.isTrustedCall()
+                self.trustedCalls.active = True
+                try :
+                    return func(*args, **kwargs)
+                finally :
+                    self.trustedCalls.active = wasActive
+            _trusted.__name__ = name
+            return _trusted
+        raise AttributeError("'{0}' object has no attribute '{1}'".format(self.__class__.__name__, name))
+
+    def _dispatch(self, dispatchQueue):
+        while True :
+            item = dispatchQueue.get()
+            if item is None :
+                return
+            (future, func, args, kwargs) = item
+            try :
+                result = func(*args, **kwargs)
+            except Exception as err :
+                future.set_exception(err)
+            else :
+                future.set_result(result)
+
+    def _stopDispatcher(self):
+        '''
+        \brief Stop the dispatcher once it has completed the queued commands.
+        '''
+        with self.dispatchLock :
+            if self.dispatchThread :
+                self.dispatchQueue.put(None)
+                self.dispatchQueue = None
+                self.dispatchThread = None
+
     def getNotificationInternal(self, timeoutSec=-1):
         '''
         \brief get notification from queue
@@ -77,7 +330,49 @@ class ApiConnector(object):
          
         \exception ConnectionError disconnected from device
         \exception QueueError reading from empty 'offline' queue
-        \returns   Notification object or None if queue is empty.
+        \returns   Notification object or None if queue is empty. The fields of
+                   the notification are a dictionary.
+        '''
+        res = self._getNotificationRecord(timeoutSec)
+        if not res :
+            return res
+        return ApiConnector._formatNotification(self, res)
+    
+    def getNotifications(self, maxItems, timeoutSec=-1):
+        '''
+        \brief Get up to maxItems notifications from queue, in one operation.
+        
+        Waits as getNotification() does for the first notification, then
+        returns it with those queued after it, without waiting for more. This
+        saves a lock and a wakeup per notification, for consumers working on
+        batches of notifications.
+        
+        \param maxItems  maximum number of notifications returned
+        \param timeoutSec timeout for waiting if queue is empty.
+               <0 wait infinity (blocked), >=0 wait up to 'timeout' seconds
+        
+        \exception ConnectionError disconnected from device
+        \exception QueueError reading from empty 'offline' queue
+        \returns   List of notifications, formatted as getNotification()
+                   returns them, empty if queue is empty.
+        '''
+        return [self._formatNotification(res) for res in self._getNotificationRecords(maxItems, timeoutSec)]
+    
+    def _formatNotification(self, res):
+        '''
+        \brief Format a notification, as queued, the way getNotification()
+               returns it. Overridden by the connectors: the fields are a
+               dictionary by default.
+        '''
+        if self.notifTupleTable and isinstance(res[1], tuple) :
+            res = (res[0], dict(zip(res[1]._fields, res[1])))
+        return res
+    
+    def _getNotificationRecord(self, timeoutSec=-1):
+        '''
+        \brief get notification from queue, as queued: the fields of the
+               notification are a record of notifTupleTable if it has one,
+               a dictionary otherwise.
         '''
         
         if self.pendingNotification :
@@ -96,6 +391,31 @@ class ApiConnector(object):
             raise ApiException.QueueError() # Send exception: Reading from empty queue
         return res
     
+    def _getNotificationRecords(self, maxItems, timeoutSec=-1):
+        '''
+        \brief get up to maxItems notifications from queue, as queued.
+        
+        Once disconnected, the notifications still queued are returned
+        before ConnectionError is raised, and then QueueError.
+        '''
+        
+        res = []
+        if self.pendingNotification :
+            res.append(self.pendingNotification)
+            self.pendingNotification = None
+            timeoutSec = 0
+        
+        if not self.isConnected :
+            timeoutSec = 0   # for 'offline' queue use get without timeout 
+        
+        if len(res) < maxItems :
+            res += self.queue.getBatch(maxItems - len(res), timeoutSec)
+        
+        if not self.isConnected and not res :
+            self.oneTimeRaiseDisconnectException(None)
+            raise ApiException.QueueError() # Send exception: Reading from empty queue
+        return res
+    
     def oneTimeRaiseDisconnectException(self, notif):
         '''
         \brief raise exception only one time for one session and save current
@@ -111,7 +431,9 @@ class ApiConnector(object):
         '''
         \brief Put notification to queue
          
-        Insert notification to queue. If queue is full raise ConnectionError exception
+        Insert notification to queue. If queue is full, apply its overflow
+        policy, see setNotifOverflow(): by default, raise ConnectionError
+        exception
        
         \param item notification to insert
        
@@ -120,10 +442,7 @@ class ApiConnector(object):
         
         if not self.isConnected :
             raise ApiException.ConnectionError("Disconnected")
-        if self.queue.qsize() < self.maxQSize :
-            self.queue.put(item)
-        else :
-            raise ApiException.ConnectionError("Queue overflowed")
+        self.queue.put(item)
 
     def putDisconnectNotification(self, reason):
         '''
@@ -134,18 +453,188 @@ class ApiConnector(object):
         # used by HartMgr where notifications are separate from control messages
         self.queue.putDisconnectNotification(reason)
         
-     
-class NotifQueue(Queue):
-    class _DisconnectNotification:
+
+class CommandFuture(object):
+    '''
+    \ingroup ApiConnector
+    
+    \brief Result of a command sent with ApiConnector.send_async().
+    '''
+    
+    def __init__(self):
+        self.doneEvent = threading.Event()
+        self.dataLock = threading.Lock()
+        self.resultValue = None
+        self.exceptionValue = None
+        self.callbacks = []
+    
+    def done(self):
         '''
-        \brief Special internal notification - connection is broken
+        \brief Whether the command has completed.
         '''
-        def __init__(self, reason):
-            self.reason = reason
+        return self.doneEvent.isSet()
+    
+    def result(self, timeout = None):
+        '''
+        \brief Wait for the command to complete and return its response.
+        
+        \param timeout maximum time to wait, in seconds. None waits forever.
+        
+        \exception FutureTimeoutError the command did not complete in time
+        \exception Any exception raised by the command.
+        \returns   The response of the command.
+        '''
+        self._wait(timeout)
+        if self.exceptionValue is not None :
+            raise self.exceptionValue
+        return self.resultValue
+    
+    def exception(self, timeout = None):
+        '''
+        \brief Wait for the command to complete and return the exception it
+               raised, or None.
+        '''
+        self._wait(timeout)
+        return self.exceptionValue
+    
+    def add_done_callback(self, fn):
+        '''
+        \brief Call fn(future) when the command completes.
         
-    def __init__(self, maxSize):
+        Called from the dispatcher thread, or immediately if the command has
+        already completed.
+        '''
+        with self.dataLock :
+            if not self.done() :
+                self.callbacks.append(fn)
+                return
+        self._invoke(fn)
+    
+    def set_result(self, result):
+        self.resultValue = result
+        self._complete()
+    
+    def set_exception(self, exception):
+        self.exceptionValue = exception
+        self._complete()
+    
+    def _wait(self, timeout):
+        if not self.doneEvent.wait(timeout) :
+            raise ApiException.FutureTimeoutError(timeout)
+    
+    def _complete(self):
+        with self.dataLock :
+            self.doneEvent.set()
+            callbacks, self.callbacks = self.callbacks, []
+        for fn in callbacks :
+            self._invoke(fn)
+    
+    def _invoke(self, fn):
+        try :
+            fn(self)
+        except Exception :
+            log.exception("Exception in CommandFuture callback")
+     
+class NotifQueue(object):
+    '''
+    \ingroup ApiConnector
+    
+    \brief Bounded queue of the notifications received by a connector.
+    
+    The notifications are held in a ring buffer of maxSize slots, guarded by
+    a single lock. What happens to a notification received while the queue
+    is full depends on the overflow policy:
+    - OVERFLOW_DISCONNECT: put() raises ConnectionError, which disconnects
+      the connector (default).
+    - OVERFLOW_DROP_OLDEST: the oldest queued notification is dropped.
+    - OVERFLOW_DROP_NEWEST: the notification received is dropped.
+    - OVERFLOW_BLOCK: put() waits up to blockTimeout seconds (forever if
+      None) for a notification to be read, then drops the one received. This
+      holds back the thread receiving the notifications.
+    - OVERFLOW_COALESCE: the notification received replaces the queued one
+      with the same coalesce key, by default the same notification type and
+      MAC address, keeping its place in the queue. If there is none, the
+      oldest queued notification is dropped.
+    
+    The notifications dropped are counted per notification type, see
+    getStats().
+    '''
+    
+    OVERFLOW_DISCONNECT  = 'disconnect'
+    OVERFLOW_DROP_OLDEST = 'dropOldest'
+    OVERFLOW_DROP_NEWEST = 'dropNewest'
+    OVERFLOW_BLOCK       = 'block'
+    OVERFLOW_COALESCE    = 'coalesce'
+    OVERFLOW_POLICIES    = [
+        OVERFLOW_DISCONNECT,
+        OVERFLOW_DROP_OLDEST,
+        OVERFLOW_DROP_NEWEST,
+        OVERFLOW_BLOCK,
+        OVERFLOW_COALESCE,
+    ]
+    
+    def __init__(self, maxSize, overflow = OVERFLOW_DISCONNECT, blockTimeout = None, coalesceKey = None):
         self.maxQSize = maxSize
-        Queue.__init__(self)
+        self.lock = threading.Lock()
+        self.notEmpty = threading.Condition(self.lock)
+        self.notFull = threading.Condition(self.lock)
+        self.slots = [None] * maxSize
+        self.head = 0               # slot of the oldest notification
+        self.count = 0              # number of notifications queued
+        self.headSeq = 0            # sequence number of the oldest notification
+        self.numGetters = 0         # threads waiting in get()
+        self.numPutters = 0         # threads waiting in put()
+        self.numKicks = 0           # disconnections to report to get()
+        self.isDisconnected = False # whether put() must stop waiting for room
+        self.keySeqs = {}           # sequence number of the newest notification, by coalesce key
+        self.setOverflow(overflow, blockTimeout, coalesceKey)
+        self._resetStats()
+    
+    #======================== public ==========================================
+    
+    def setOverflow(self, overflow, blockTimeout = None, coalesceKey = None):
+        '''
+        \brief Choose what happens to the notifications received while the
+               queue is full.
+        
+        \param overflow     One of OVERFLOW_POLICIES.
+        \param blockTimeout For OVERFLOW_BLOCK, the maximum time to wait for
+                            room in the queue, in seconds. None waits
+                            forever.
+        \param coalesceKey  For OVERFLOW_COALESCE, a function returning the
+                            key of a notification, notifications with the
+                            same key replacing each other. Default:
+                            NotifQueue.notifCoalesceKey.
+        '''
+        if overflow not in self.OVERFLOW_POLICIES :
+            raise ValueError("unsupported overflow policy {0}".format(overflow))
+        with self.lock :
+            self.overflow = overflow
+            self.blockTimeout = blockTimeout
+            self.coalesceKey = coalesceKey or self.notifCoalesceKey
+            self._reindex()
+            self.notFull.notify_all()
+    
+    def put(self, item):
+        '''
+        \brief Queue a notification, applying the overflow policy if the
+               queue is full.
+        
+        \exception ConnectionError The queue is full, and the overflow
+                   policy is OVERFLOW_DISCONNECT.
+        \returns Whether the notification was queued.
+        '''
+        with self.lock :
+            if self.count == self.maxQSize :
+                if not self._overflow(item) :
+                    return False
+            else :
+                self._append(item)
+            if self.count > self.stats['maxDepth'] :
+                self.stats['maxDepth'] = self.count
+            if self.count <= self.numGetters :
+                self.notEmpty.notify()  # else, the waiting getters were notified already
+            return True
     
     def get(self, timeout = -1):
         '''
@@ -156,28 +645,283 @@ class NotifQueue(Queue):
         
         \returns   Notification object or None if queue is empty.
         '''
+        with self.lock :
+            if not self._waitNotEmpty(timeout) :
+                return None
+            return self._popleft()
+    
+    def getBatch(self, maxItems, timeout = -1):
+        '''
+        \brief Get up to maxItems notifications from queue, in one operation.
         
-        try :
-            if timeout < 0 :
-                notif = Queue.get(self, True)
-            elif timeout == 0 :
-                notif = Queue.get(self, False)
-            else:
-                notif = Queue.get(self, True, timeout)
-            if isinstance(notif, NotifQueue._DisconnectNotification) :  
-                notif = Queue.get(self, False)  # disconnect notification is used for kick 'get' method  
-            return notif
-        except Empty:
-            return None 
-               
+        Waits as get() does for the first notification, then returns it with
+        those queued after it, without waiting for more.
+        
+        \param maxItems maximum number of notifications returned
+        \param timeout  timeout for waiting if queue is empty.
+               <0 wait forever (blocked), >=0 wait up to 'timeout' seconds
+        
+        \returns   List of notification objects, empty if queue is empty.
+        '''
+        with self.lock :
+            if not self._waitNotEmpty(timeout) :
+                return []
+            numItems = min(maxItems, self.count)
+            end = self.head + numItems
+            if end <= self.maxQSize :
+                items = self.slots[self.head:end]
+                self.slots[self.head:end] = [None] * numItems
+            else :
+                end -= self.maxQSize
+                items = self.slots[self.head:] + self.slots[:end]
+                self.slots[self.head:] = [None] * (self.maxQSize - self.head)
+                self.slots[:end] = [None] * end
+            self.head = end % self.maxQSize
+            self.headSeq += numItems
+            self.count -= numItems
+            if self.numPutters :
+                self.notFull.notify_all()
+            return items
+    
+    def qsize(self):
+        return self.count
+    
+    def empty(self):
+        return self.count == 0
+    
     def putDisconnectNotification(self, reason):
         '''
-        \brief Put Disconnect notification to queue
-       
+        \brief Wake up a thread waiting in get(), which returns None if the
+               queue is empty, and the threads waiting in put() for room,
+               which drop their notification.
+        
         \param reason reason for disconnection
         '''
-        self.put(NotifQueue._DisconnectNotification(reason))
+        with self.lock :
+            self.numKicks += 1
+            self.isDisconnected = True
+            self.notEmpty.notify()
+            self.notFull.notify_all()
         
     def clear(self) :
-        while self.get(0) : pass
+        '''
+        \brief Drop the queued notifications, and reset the statistics.
+        '''
+        with self.lock :
+            self.slots = [None] * self.maxQSize
+            self.head = 0
+            self.count = 0
+            self.numKicks = 0
+            self.isDisconnected = False
+            self.keySeqs = {}
+            self._resetStats()
+            self.notFull.notify_all()
+    
+    def ack(self, offset = None):
+        '''
+        \brief Acknowledge the notifications read. They are not kept once
+               read, so this does nothing.
+        '''
+        pass
+    
+    def close(self):
+        '''
+        \brief Release the resources of the queue. Nothing to release in
+               memory.
+        '''
+        pass
+    
+    def getStats(self):
+        '''
+        \brief Get statistics about the queue, since it was created or
+               cleared.
+        
+        \returns A dictionary with the following keys:
+            - 'overflow': the overflow policy
+            - 'size': maximum number of notifications queued
+            - 'depth': number of notifications queued
+            - 'maxDepth': highest depth (the high-water mark)
+            - 'numQueued': number of notifications queued
+            - 'numDropped': number of notifications dropped, including those
+              coalesced
+            - 'numCoalesced': number of notifications replaced by a newer one
+              with the same coalesce key
+            - 'numBlocked': number of times put() waited for room
+            - 'droppedPerType': number of notifications dropped, by
+              notification type
+        '''
+        with self.lock :
+            returnVal = dict(self.stats)
+            returnVal['droppedPerType'] = dict(self.stats['droppedPerType'])
+            returnVal['overflow'] = self.overflow
+            returnVal['size'] = self.maxQSize
+            returnVal['depth'] = self.count
+        return returnVal
+    
+    @staticmethod
+    def notifType(item):
+        '''
+        \brief The type of a notification, the last name of its name array.
+        '''
+        try :
+            names = item[0]
+        except (TypeError, IndexError, KeyError) :
+            return None
+        if isinstance(names, (list, tuple)) and names :
+            return names[-1]
+        return None
+    
+    @staticmethod
+    def notifCoalesceKey(item):
+        '''
+        \brief The default coalesce key of a notification: its type and the
+               MAC address of the mote it is about, if any.
+        '''
+        try :
+            params = item[1]
+        except (TypeError, IndexError, KeyError) :
+            return (NotifQueue.notifType(item), None)
+        if isinstance(params, dict) :
+            mac = params.get('macAddress')
+        else :
+            mac = getattr(params, 'macAddress', None)
+        if isinstance(mac, list) :
+            mac = tuple(mac)
+        elif isinstance(mac, memoryview) :
+            mac = mac.tobytes()
+        elif isinstance(mac, bytearray) :
+            mac = str(mac)
+        return (NotifQueue.notifType(item), mac)
+    
+    #======================== private =========================================
+    
+    def _resetStats(self):
+        self.stats = {
+            'maxDepth':           self.count,
+            'numQueued':          0,
+            'numDropped':         0,
+            'numCoalesced':       0,
+            'numBlocked':         0,
+            'droppedPerType':     {},
+        }
+    
+    def _waitNotEmpty(self, timeout):
+        '''
+        \brief Wait for a notification, the lock being held.
         
+        \returns False if the queue is still empty after timeout, or if a
+                 disconnection kicked the wait.
+        '''
+        if not self.count :
+            if self.numKicks :
+                self.numKicks -= 1
+                return False
+            if timeout == 0 :
+                return False
+            self.numGetters += 1
+            try :
+                if timeout < 0 :
+                    while not self.count and not self.numKicks :
+                        self.notEmpty.wait()
+                else :
+                    endTime = time.time() + timeout
+                    while not self.count and not self.numKicks :
+                        remaining = endTime - time.time()
+                        if remaining <= 0 :
+                            break
+                        self.notEmpty.wait(remaining)
+            finally :
+                self.numGetters -= 1
+            if not self.count :
+                if self.numKicks :
+                    self.numKicks -= 1   # disconnection used to kick 'get' method
+                return False
+        return True
+    
+    def _append(self, item):
+        self.slots[(self.head + self.count) % self.maxQSize] = item
+        if self.overflow == self.OVERFLOW_COALESCE :
+            if len(self.keySeqs) >= 2 * self.maxQSize :
+                self._reindex()     # drop the keys of the notifications read
+            self.keySeqs[self.coalesceKey(item)] = self.headSeq + self.count
+        self.count += 1
+        self.stats['numQueued'] += 1
+    
+    def _popleft(self):
+        item = self.slots[self.head]
+        self.slots[self.head] = None
+        self.head = (self.head + 1) % self.maxQSize
+        self.headSeq += 1
+        self.count -= 1
+        if self.numPutters :
+            self.notFull.notify()
+        return item
+    
+    def _drop(self, item):
+        notifType = self.notifType(item)
+        self.stats['numDropped'] += 1
+        self.stats['droppedPerType'][notifType] = self.stats['droppedPerType'].get(notifType, 0) + 1
+    
+    def _overflow(self, item):
+        '''
+        \brief Apply the overflow policy to a notification received while the
+               queue is full, the lock being held.
+        
+        \returns Whether the notification was queued.
+        '''
+        if   self.overflow == self.OVERFLOW_DISCONNECT :
+            self._drop(item)
+            raise ApiException.ConnectionError("Queue overflowed")
+        elif self.overflow == self.OVERFLOW_DROP_NEWEST :
+            self._drop(item)
+            return False
+        elif self.overflow == self.OVERFLOW_BLOCK :
+            self.stats['numBlocked'] += 1
+            self.numPutters += 1
+            try :
+                if self.blockTimeout is None :
+                    while self._isBlocking() :
+                        self.notFull.wait()
+                else :
+                    endTime = time.time() + self.blockTimeout
+                    while self._isBlocking() :
+                        remaining = endTime - time.time()
+                        if remaining <= 0 :
+                            break
+                        self.notFull.wait(remaining)
+            finally :
+                self.numPutters -= 1
+            if self.count == self.maxQSize or self.isDisconnected :
+                self._drop(item)
+                return False
+            self._append(item)
+            return True
+        elif self.overflow == self.OVERFLOW_COALESCE :
+            key = self.coalesceKey(item)
+            seq = self.keySeqs.get(key)
+            if seq is not None and seq >= self.headSeq :
+                # replace the queued notification with the same key
+                index = (self.head + seq - self.headSeq) % self.maxQSize
+                self._drop(self.slots[index])
+                self.slots[index] = item
+                self.stats['numCoalesced'] += 1
+                self.stats['numQueued'] += 1
+                return True
+        # OVERFLOW_DROP_OLDEST, or OVERFLOW_COALESCE without a notification
+        # to replace
+        self._drop(self._popleft())
+        self._append(item)
+        return True
+    
+    def _isBlocking(self):
+        return self.count == self.maxQSize and self.overflow == self.OVERFLOW_BLOCK and not self.isDisconnected
+    
+    def _reindex(self):
+        '''
+        \brief Rebuild the coalesce keys of the queued notifications.
+        '''
+        self.keySeqs = {}
+        if self.overflow == self.OVERFLOW_COALESCE :
+            for i in range(self.count) :
+                item = self.slots[(self.head + i) % self.maxQSize]
+                self.keySeqs[self.coalesceKey(item)] = self.headSeq + i
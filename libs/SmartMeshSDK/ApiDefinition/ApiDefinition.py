@@ -1,7 +1,9 @@
 #!/usr/bin/python
 
+import threading
 import types
 from SmartMeshSDK.ApiException import CommandError
+from SmartMeshSDK.utils        import NumpyUtils
 
 import logging
 class NullHandler(logging.Handler):
@@ -46,14 +48,24 @@ class FieldOptions(object):
             for i in fieldOptions[self.optionName]:
                self.validOptions.append(i[0])
                self.optionDescs.append(i[1])
+        
+        # set of the valid options, looked up in constant time
+        self.validSet = None
+        if self.validOptions:
+            try:
+                self.validSet = frozenset(self.validOptions)
+            except TypeError:
+                pass # unhashable option, looked up in validOptions
     
     def isValidValue(self,val):
-        if (
-            (not self.validOptions)   or
-            (val in self.validOptions)
-           ):
+        if not self.validOptions:
             return True
-        return False
+        if self.validSet is not None:
+            try:
+                return val in self.validSet
+            except TypeError:
+                pass # unhashable value, e.g. a list
+        return val in self.validOptions
     
     def valueToDesc(self,val):
         if self.validOptions:
@@ -68,54 +80,191 @@ class Field(object):
     \brief Object representing one field of a command.
     '''
     
+    INT_TYPES    = (types.IntType,types.LongType)
+    STRING_TYPES = (types.StringType,types.UnicodeType)
+    BYTES_TYPES  = (types.StringType,bytearray,memoryview)
+    LIST_TYPES   = (types.ListType,types.TupleType)
+    FLOAT_TYPES  = (types.IntType,types.FloatType)
+    
     def __init__(self,fieldDef,fieldOptions):
         self.name       = fieldDef[0]
         self.format     = fieldDef[1]
         self.length     = fieldDef[2]
         self.options    = FieldOptions(fieldDef[3],fieldOptions,self.name)
+        self.validator  = self._compileValidator()
     
     def isValidValue(self,val):
-        # check format and length
+        return self.validator(val)
+    
+    def _compileValidator(self):
+        '''
+        \brief Build the function checking the values of this field.
+        
+        The limits of the field are computed here, once, rather than each time
+        a value is checked.
+        
+        \returns A function taking a value, and returning whether it is valid.
+        '''
+        length          = self.length
+        options         = self.options
+        if options.validOptions:
+            isValidOption = options.isValidValue
+        else:
+            isValidOption = lambda val: True
+        
         if   self.format==FieldFormats.STRING:
-            if ( (type(val) not in [types.StringType,types.UnicodeType]) or
-                 len(val)>self.length
-               ):
-                return False
+            STRING_TYPES = self.STRING_TYPES
+            def validator(val):
+                if type(val) not in STRING_TYPES or len(val)>length:
+                    return False
+                return isValidOption(val)
         elif self.format==FieldFormats.BOOL:
-            if type(val)!=types.BooleanType:
-                return False
+            def validator(val):
+                if type(val)!=types.BooleanType:
+                    return False
+                return isValidOption(val)
         elif self.format==FieldFormats.INT:
-            if ( (type(val)!=types.IntType and  type(val)!=types.LongType)  or
-                 val>pow(2,8*self.length)
-               ):
-                return False
+            INT_TYPES    = self.INT_TYPES
+            maxVal       = pow(2,8*length)
+            def validator(val):
+                if type(val) not in INT_TYPES or val>maxVal:
+                    return False
+                return isValidOption(val)
         elif self.format==FieldFormats.INTS:
-            if ( (type(val)!=types.IntType and  type(val)!=types.LongType)  or
-                 val>(pow(2,8*self.length)/2) or
-                 val<(-pow(2,8*self.length)/2)
-               ):
-                return False
+            INT_TYPES    = self.INT_TYPES
+            maxVal       = pow(2,8*length)/2
+            minVal       = -pow(2,8*length)/2
+            def validator(val):
+                if type(val) not in INT_TYPES or val>maxVal or val<minVal:
+                    return False
+                return isValidOption(val)
         elif self.format==FieldFormats.HEXDATA:
-            if type(val)!=types.ListType and type(val)!=types.TupleType:
-                return False
-            if self.length and len(val)>self.length:
-                return False
-            for i in val:
-                if type(i)!=types.IntType:
+            BYTES_TYPES  = self.BYTES_TYPES
+            LIST_TYPES   = self.LIST_TYPES
+            BYTE_TYPES   = frozenset([types.IntType])
+            def validator(val):
+                valType  = type(val)
+                if valType in BYTES_TYPES:
+                    # binary fields can also be passed as bytes
+                    if length and len(val)>length:
+                        return False
+                    return isValidOption(val)
+                if valType not in LIST_TYPES:
+                    return False
+                if length and len(val)>length:
                     return False
-                if i>=pow(2,8):
+                # bytes, each an int below 0x100, checked without a loop
+                if val and (frozenset(map(type,val))!=BYTE_TYPES or max(val)>=0x100):
                     return False
+                return isValidOption(val)
         elif self.format==FieldFormats.FLOAT:
-            if ( (type(val)!=types.IntType and type(val)!=types.FloatType) ):
-                return False
+            FLOAT_TYPES  = self.FLOAT_TYPES
+            def validator(val):
+                if type(val) not in FLOAT_TYPES:
+                    return False
+                return isValidOption(val)
         else:
-            raise SystemError('unknown field format='+self.format)
+            format       = self.format
+            def validator(val):
+                raise SystemError('unknown field format='+format)
+        
+        return validator
+
+class RequestValidator(object):
+    '''
+    \ingroup ApiDefinition
+    
+    \brief Validates the requests of one (sub)command.
+    
+    Built once per (sub)command by ApiDefinition.validateRequest(), it checks
+    a request as areSameFieldNames() then isValidFieldFormatting() do, raising
+    the same errors, but with the field names and the field validators looked
+    up in precomputed tables.
+    '''
+    
+    def __init__(self,requestDef,fields):
+        self.requestDef       = requestDef
+        self.numNames         = len(requestDef)
+        self.names            = frozenset([field[0] for field in requestDef])
+        self.validators       = {}   # validator of the first field, by name
+        for field in fields:
+            self.validators.setdefault(field.name,field.validator)
+    
+    def validate(self,apiDef,commandArray,fields):
+        '''
+        \brief Validate the fields of a request.
+        
+        \param apiDef       The ApiDefinition this (sub)command belongs to.
+        \param commandArray The name of the (sub)command.
+        \param fields       The fields of the request, as passed to
+                            ApiDefinition.validateRequest().
+        
+        \exception CommandError Describes the validation error
+        '''
+        # step 1. same field names, the complete comparison only determining
+        #         the error to raise
+        if len(fields)!=self.numNames or not self.names.issuperset(fields):
+            apiDef.areSameFieldNames(self.requestDef,fields)
         
-        # check options
-        if self.options.isValidValue(val)==False:
-            return False
+        # step 2. formatting of each field
+        validators            = self.validators
+        for (fieldName,fieldValue) in fields.items():
+            if not validators[fieldName](fieldValue):
+                raise CommandError(
+                    CommandError.MALFORMED_FIELD,
+                    'commandArray={0} fieldName={1} fieldValue={2}'.format(commandArray,fieldName,fieldValue)
+                )
+
+class DefinitionTables(object):
+    '''
+    \ingroup ApiDefinition
+    
+    \brief The definitions of an API, and the indexes used to look them up.
+    
+    Built once per ApiDefinition class by ApiDefinition.getTables(). When
+    several definitions share an ID or a name, the first one is indexed, as a
+    linear scan would return it.
+    '''
+    
+    def __init__(self,commands,notifications,rcOptions):
+        self.commands         = commands
+        self.notifications    = notifications
+        self.idIndex          = {}   # definition by ID, per type
+        self.nameIndex        = {}   # definition by tuple(nameArray), per type
+        self.subIdIndex       = {}   # subcommand name by ID, per (type,tuple(nameArray))
+        self.subNameIndex     = {}   # subcommand ID by name, per (type,tuple(nameArray))
+        self.requestFields    = {}   # list of Field, per tuple(commandArray), built when used
+        self.responseFields   = {}   # list of Field, per (type,tuple(nameArray)), built when used
+        self.caches           = {}   # see ApiDefinition.getCache()
+        for (type,list) in [
+                (ApiDefinition.COMMAND,      commands),
+                (ApiDefinition.NOTIFICATION, notifications),
+            ]:
+            self.idIndex[type]   = {}
+            self.nameIndex[type] = {}
+            for item in list:
+                if 'id' in item:
+                    self.idIndex[type].setdefault(item['id'],item)
+            self._indexNames(type,(),list)
         
-        return True
+        # RC label and generic description, by RC
+        self.rcIndex          = {}
+        for r in rcOptions:
+            self.rcIndex.setdefault(r[0],(r[1],r[2] if len(r)>2 else None))
+    
+    def _indexNames(self,type,prefix,list):
+        for item in list:
+            nameArray = prefix+(item['name'],)
+            self.nameIndex[type].setdefault(nameArray,item)
+            if 'subCommands' in item and self.nameIndex[type][nameArray] is item:
+                subIds   = {}
+                subNames = {}
+                for subcommand in item['subCommands']:
+                    subIds.setdefault(subcommand.get('id'),subcommand['name'])
+                    subNames.setdefault(subcommand['name'],subcommand.get('id'))
+                self.subIdIndex[(type,nameArray)]   = subIds
+                self.subNameIndex[(type,nameArray)] = subNames
+                self._indexNames(type,nameArray,item['subCommands'])
 
 class ApiDefinition(object):
     '''
@@ -135,19 +284,83 @@ class ApiDefinition(object):
     
     #======================== id and name =====================================
     def __init__(self, array2scalar = True) :
-        if array2scalar :
-            self._array2scalar(self.commands)
-            self._array2scalar(self.notifications)
+        tables                = self.getTables(array2scalar)
+        self.commands         = tables.commands
+        self.notifications    = tables.notifications
+        self._idIndex         = tables.idIndex
+        self._nameIndex       = tables.nameIndex
+        self._subIdIndex      = tables.subIdIndex
+        self._subNameIndex    = tables.subNameIndex
+        self._rcIndex         = tables.rcIndex
+        self._requestFields   = tables.requestFields
+        self._responseFields  = tables.responseFields
+        self._caches          = tables.caches
+    
+    _registry                 = {}   # DefinitionTables, per (class,array2scalar)
+    _registryLock             = threading.Lock()
+    
+    @classmethod
+    def getTables(cls,array2scalar=True):
+        '''
+        \brief Get the definitions of this API, processed for lookups.
+        
+        The definitions are processed the first time they are requested, then
+        shared by all the instances of this class in the process. The commands
+        and notifications declared by the class are not modified.
+        
+        \param array2scalar Whether ARRAY fields are converted into scalars.
+        
+        \returns A DefinitionTables instance, which must not be modified.
+        '''
+        key = (cls,array2scalar)
+        try:
+            return ApiDefinition._registry[key]
+        except KeyError:
+            pass
+        with ApiDefinition._registryLock:
+            if key not in ApiDefinition._registry:
+                commands      = cls.commands
+                notifications = cls.notifications
+                if array2scalar:
+                    commands      = cls._array2scalar(commands)
+                    notifications = cls._array2scalar(notifications)
+                ApiDefinition._registry[key] = DefinitionTables(
+                    commands,
+                    notifications,
+                    cls.fieldOptions.get(cls.RC,[]),
+                )
+            return ApiDefinition._registry[key]
     
-    def _array2scalar(self, defs) :
+    def getCache(self,name):
+        '''
+        \brief Get a dictionary shared by all the instances of this API
+               definition, for modules to cache what they derive from it.
+        
+        \param name The name of the cache, e.g. the name of the module.
+        
+        \returns The cache, a dictionary.
+        '''
+        return self._caches.setdefault(name,{})
+    
+    @classmethod
+    def _array2scalar(cls, defs) :
         '''
         \brief Convert ARRAY to list of scalars
+        
+        \returns A copy of defs, the definitions containing ARRAY fields being
+                 replaced. defs is not modified.
         '''
+        returnVal = []
         for fields in defs:
             if 'subCommands' in fields :
-                self._array2scalar(fields['subCommands'])
+                fields = dict(fields)
+                fields['subCommands'] = cls._array2scalar(fields['subCommands'])
             if 'response' in fields and 'FIELDS' in fields['response'] :
                 arrays = [f for f in fields['response']['FIELDS'] if f[1] == FieldFormats.ARRAY]
+                if arrays :
+                    fields             = dict(fields)
+                    fields['response'] = dict(fields['response'])
+                    fields['response']['FIELDS'] = list(fields['response']['FIELDS'])
                 for array in arrays :
                     scalars = []
                     for n in range(array[2]) :
@@ -156,6 +369,8 @@ class ApiDefinition(object):
                             scalars.append([name] + item[1:])
                     fields['response']['FIELDS'].remove(array)
                     fields['response']['FIELDS'] += scalars
+            returnVal.append(fields)
+        return returnVal
     
     def idToName(self,type,id):
         '''
@@ -165,12 +380,16 @@ class ApiDefinition(object):
                    not exist
         \returns The command name.
         '''
-        list = self._getList(type)
-        for item in list:
-            if item['id']==id:
-               return item['name']
-        raise CommandError(CommandError.INVALID_COMMAND,
-                           'id=%s' % str(id))
+        try:
+            return self._idIndex[type][id]['name']
+        except KeyError:
+            self._getList(type) # raises ValueError if type unsupported
+            raise CommandError(CommandError.INVALID_COMMAND,
+                               'id=%s' % str(id))
+        except TypeError:
+            # unhashable id
+            raise CommandError(CommandError.INVALID_COMMAND,
+                               'id=%s' % str(id))
     
     def nameToId(self,type,nameArray):
         '''
@@ -180,12 +399,12 @@ class ApiDefinition(object):
                    not exist
         \returns The command ID.
         '''
-        list = self._getList(type)
-        for item in list:
-            if item['name']==nameArray[0]:
-               return item['id']
-        raise CommandError(CommandError.INVALID_COMMAND,
-                                        nameArray[0])
+        try:
+            return self._nameIndex[type][(nameArray[0],)]['id']
+        except KeyError:
+            self._getList(type) # raises ValueError if type unsupported
+            raise CommandError(CommandError.INVALID_COMMAND,
+                                            nameArray[0])
     
     def rcToLabel(self,rc):
         '''
@@ -199,14 +418,7 @@ class ApiDefinition(object):
         '''
         
         # get the RC description
-        rcLabel       = None
-        for r in self.fieldOptions[self.RC]:
-            if r[0]==rc:
-                rcLabel           = r[1]
-                break
-        if not rcLabel:
-            raise CommandError(CommandError.VALUE_NOT_IN_OPTIONS,
-                               'rc={0} does not exist'.format(rc))
+        (rcLabel,rcGenericDesc) = self._rcLookup(rc)
         
         return rcLabel
     
@@ -227,16 +439,7 @@ class ApiDefinition(object):
         returnVal = ''
         
         # get the RC description
-        rcLabel       = None
-        rcGenericDesc = None
-        for r in self.fieldOptions[self.RC]:
-            if r[0]==rc:
-                rcLabel           = r[1]
-                rcGenericDesc     = r[2]
-                break
-        if not rcLabel:
-            raise CommandError(CommandError.VALUE_NOT_IN_OPTIONS,
-                               'rc={0} does not exist'.format(rc))
+        (rcLabel,rcGenericDesc) = self._rcLookup(rc)
         
         # retrieve rcDescription
         definition = self.getDefinition(self.COMMAND,nameArray)
@@ -247,6 +450,16 @@ class ApiDefinition(object):
         
         return returnVal
     
+    def _rcLookup(self,rc):
+        try:
+            (rcLabel,rcGenericDesc) = self._rcIndex[rc]
+        except (KeyError,TypeError):
+            rcLabel       = None
+        if not rcLabel:
+            raise CommandError(CommandError.VALUE_NOT_IN_OPTIONS,
+                               'rc={0} does not exist'.format(rc))
+        return (rcLabel,rcGenericDesc)
+    
     def getIds(self,type):
         '''
         \brief Get the list of command IDs this API defines
@@ -294,10 +507,14 @@ class ApiDefinition(object):
                    does not exist.
         \returns The definition of a (sub)command, represented as a dictionary.
         '''
-        list = self._getList(type)
-        definition  = None
-        definition,list = self._commandIterator(nameArray,list)
-        return definition
+        try:
+            return self._nameIndex[type][tuple(nameArray)]
+        except KeyError:
+            # raises ValueError if type unsupported
+            self._commandIterator(nameArray,self._getList(type))
+        except TypeError:
+            raise CommandError(CommandError.INVALID_COMMAND,
+                                            '.'.join(nameArray))
         
     def getDescription(self,type,nameArray):
         '''
@@ -322,20 +539,27 @@ class ApiDefinition(object):
         return 'subCommands' in self.getDefinition(type,nameArray)
     
     def subcommandIdToName(self,type,nameArray,id):
-        subcommands = self.getSubcommands(type,nameArray)
-        for subcommand in subcommands:
-            if subcommand['id']==id:
-                return subcommand['name']
-        raise CommandError(CommandError.UNKNOWN_SUBCOMMAND,
-                                            str(id))
+        subIds = self._getSubcommandIndex(self._subIdIndex,type,nameArray)
+        try:
+            return subIds[id]
+        except (KeyError,TypeError):
+            raise CommandError(CommandError.UNKNOWN_SUBCOMMAND,
+                                                str(id))
     
     def subcommandNameToId(self,type,nameArray,name):
-        subcommands = self.getSubcommands(type,nameArray)
-        for subcommand in subcommands:
-            if subcommand['name']==name:
-                return subcommand['id']
-        raise CommandError(CommandError.UNKNOWN_SUBCOMMAND,
-                                            str(name))
+        subNames = self._getSubcommandIndex(self._subNameIndex,type,nameArray)
+        try:
+            return subNames[name]
+        except (KeyError,TypeError):
+            raise CommandError(CommandError.UNKNOWN_SUBCOMMAND,
+                                                str(name))
+    
+    def _getSubcommandIndex(self,index,type,nameArray):
+        try:
+            return index[(type,tuple(nameArray))]
+        except KeyError:
+            self.getSubcommands(type,nameArray) # raises the appropriate error
+            raise
     
     def getSubcommands(self,type,nameArray):
         definition = self.getDefinition(type,nameArray)
@@ -354,24 +578,16 @@ class ApiDefinition(object):
         return list
     
     def _commandIterator(self,nameArray,list):
-        for commandName in nameArray:
-            if not list:
-                raise CommandError(CommandError.INVALID_COMMAND,
-                                            '.'.join(nameArray))
-            found = False
-            for elem in list:
-                if elem['name']==commandName:
-                    found       = True
-                    definition  = elem
-                    if 'subCommands' in elem:
-                        list = definition['subCommands']
-                    else:
-                        list = None
-                    break
-            if found==False:
-                raise CommandError(CommandError.INVALID_COMMAND,
+        if list is self.commands:
+            index = self._nameIndex[self.COMMAND]
+        else:
+            index = self._nameIndex[self.NOTIFICATION]
+        try:
+            definition = index[tuple(nameArray)]
+        except (KeyError,TypeError):
+            raise CommandError(CommandError.INVALID_COMMAND,
                                             '.'.join(nameArray))
-        return definition,list
+        return definition,definition.get('subCommands')
     
     def getRequestFieldNames(self,commandArray):
         '''
@@ -406,13 +622,15 @@ class ApiDefinition(object):
                                         '%s in %s' % (fieldName, '.'.join(commandArray))) 
     
     def getRequestFields(self,commandArray):
-        commandDef = self.getDefinition(self.COMMAND,commandArray)
-        if 'request' not in commandDef:
-            raise CommandError(CommandError.NO_REQUEST,
-                                            '.'.join(commandArray)) 
-        fields = [Field(fieldRaw,self.fieldOptions)
-                             for fieldRaw in commandDef['request']]
-        return fields
+        key = tuple(commandArray)
+        if key not in self._requestFields:
+            commandDef = self.getDefinition(self.COMMAND,commandArray)
+            if 'request' not in commandDef:
+                raise CommandError(CommandError.NO_REQUEST,
+                                                '.'.join(commandArray)) 
+            self._requestFields[key] = [Field(fieldRaw,self.fieldOptions)
+                                 for fieldRaw in commandDef['request']]
+        return list(self._requestFields[key])
     
     def getResponseFieldNames(self,type,nameArray):
         '''
@@ -450,18 +668,111 @@ class ApiDefinition(object):
     
     def getResponseFields(self,type,nameArray):
         
-        commandDef = self.getDefinition(type,nameArray)
+        key = (type,tuple(nameArray))
+        if key not in self._responseFields:
+            
+            commandDef = self.getDefinition(type,nameArray)
+            
+            if 'response' not in commandDef:
+                raise CommandError(CommandError.NO_RESPONSE,
+                                                '.'.join(nameArray))
+            
+            keys          = commandDef['response'].keys()
+            responseName  = keys[0]
+            
+            self._responseFields[key] = [Field(fieldRaw,self.fieldOptions)
+                                 for fieldRaw in commandDef['response'][responseName]]
+        return list(self._responseFields[key])
+    
+    def getDtype(self,type,nameArray):
+        '''
+        \brief The NumPy structured dtype of the fixed-layout part of the
+               response of a (sub)command, or of a notification.
         
-        if 'response' not in commandDef:
-            raise CommandError(CommandError.NO_RESPONSE,
-                                            '.'.join(nameArray))
+        The dtype covers the fields of all the levels of nameArray, up to the
+        first variable-length field, e.g. the header of a notifData. It
+        starts at the first byte of the payload, as passed to deserialize().
+        Reserved fields are skipped. Ints are big-endian; ints of 3, 5, 6 or
+        7 bytes and fixed-length binary fields are arrays of bytes.
+        
+        NumPy is imported on the first call.
+        
+        \exception ImportError NumPy is not installed.
+        \exception ValueError  nameArray has no fixed-layout header, e.g. its
+                               first field is of variable length.
+        \returns A numpy.dtype.
+        '''
+        dtypes = self.getCache('ApiDefinition.dtypes')
+        key    = (type,tuple(nameArray))
+        if key not in dtypes:
+            numpy   = NumpyUtils.importNumpy()
+            names   = []
+            formats = []
+            offsets = []
+            offset  = 0
+            for i in range(len(nameArray)):
+                fields = self.getResponseFields(type,nameArray[:i+1])
+                for field in fields:
+                    if not field.length:
+                        break
+                    if field.name not in self.RESERVED:
+                        names   += [field.name]
+                        formats += [self._dtypeFormat(field)]
+                        offsets += [offset]
+                    offset += field.length
+                else:
+                    continue
+                break   # variable-length field reached
+            if not names:
+                raise ValueError("{0} has no fixed-layout header".format(
+                                     '.'.join(nameArray)))
+            dtypes[key] = numpy.dtype({
+                'names':    names,
+                'formats':  formats,
+                'offsets':  offsets,
+                'itemsize': offset,
+            })
+        return dtypes[key]
+    
+    def decodeBatch(self,type,nameArray,payloads):
+        '''
+        \brief Decode the fixed-layout part of many payloads of the same
+               (sub)command or notification at once, with NumPy.
+        
+        The payloads are not checked to be of that (sub)command: filter them
+        on their command ID and subcommand ID first.
         
-        keys          = commandDef['response'].keys()
-        responseName  = keys[0]
+        \param payloads The payloads, as passed to deserialize(), in a list.
+                        Bytes past the fixed-layout part are ignored. The
+                        payloads can also be passed as a single str,
+                        bytearray or memoryview holding the fixed-layout
+                        parts one after the other.
         
-        fields = [Field(fieldRaw,self.fieldOptions)
-                             for fieldRaw in commandDef['response'][responseName]]
-        return fields
+        \exception ImportError NumPy is not installed.
+        \exception ValueError  A payload is too short, or nameArray has no
+                               fixed-layout header.
+        \returns The fields as columns: a dictionary of NumPy arrays indexed
+                 by field name, the i-th element of each array coming from
+                 the i-th payload. See getDtype() for their types.
+        '''
+        numpy   = NumpyUtils.importNumpy()
+        dtype   = self.getDtype(type,nameArray)
+        buf     = NumpyUtils.joinRecords(payloads,dtype.itemsize)
+        records = numpy.frombuffer(buf,dtype)
+        return NumpyUtils.toColumns(records)
+    
+    @staticmethod
+    def _dtypeFormat(field):
+        if   field.format==FieldFormats.INT and field.length in [1,2,4,8]:
+            return '>u{0}'.format(field.length)
+        elif field.format==FieldFormats.INTS and field.length in [1,2,4,8]:
+            return '>i{0}'.format(field.length)
+        elif field.format==FieldFormats.BOOL and field.length==1:
+            return '?'
+        elif field.format==FieldFormats.STRING:
+            return 'S{0}'.format(field.length)
+        else:
+            return ('u1',(field.length,))
         
     def responseFieldValueToDesc(self,nameArray,fieldName,fieldValue):
         return self.fieldValueToDesc(
@@ -594,23 +905,35 @@ class ApiDefinition(object):
        
         \exception CommandError Describes the validation error
         '''
-       
+        self._getRequestValidator(commandArray).validate(self,commandArray,fields)
+    
+    def _getRequestValidator(self,commandArray):
+        '''
+        \brief Get the RequestValidator of a (sub)command, building it the
+               first time it is requested.
+        
+        \exception CommandError(INVALID_COMMAND) The (sub)command does not
+                   exist.
+        \exception CommandError(NO_REQUEST) The (sub)command has no request.
+        '''
+        validators = self.getCache('ApiDefinition.validators')
+        try:
+            return validators[tuple(commandArray)]
+        except (KeyError,TypeError):
+            pass
+        
         definition = self.getDefinition(self.COMMAND,commandArray)
         
         if 'request' not in definition:
             raise CommandError(CommandError.NO_REQUEST,
                                             '.'.join(commandArray))
         
-        # step 1. make sure the command definition and the fields passed have
-        #         the same fields (raises errors if not)
-        self.areSameFieldNames(definition['request'],fields)
-        
-        # step 2. for each field, make sure formatting is correct
-        #         (raises errors if not)
-        for fieldName,fieldValue in fields.items():
-            self.isValidFieldFormatting(commandArray,
-                                        fieldName,
-                                        fieldValue)
+        validator  = RequestValidator(
+            definition['request'],
+            self.getRequestFields(commandArray),
+        )
+        validators[tuple(commandArray)] = validator
+        return validator
     
     #======================== serialization ===================================
     
@@ -626,7 +949,7 @@ class ApiDefinition(object):
         '''
         return self.getDefinition(self.COMMAND,commandArray)['serializer']
     
-    def serialize(self,commandArray,fields):
+    def serialize(self,commandArray,fields,trusted=False):
         '''
         \brief Serialize a command.
        
@@ -645,13 +968,20 @@ class ApiDefinition(object):
                                   ...,
                               }
                               </tt>
+        \param trusted        Whether the fields come from a trusted caller,
+                              e.g. a protocol implementation in this SDK, and
+                              are serialized without being validated. A
+                              malformed request from a trusted caller is not
+                              reported as a CommandError, and may be
+                              serialized into a malformed command.
        
         \returns The serialized command, in the format specified by this field\'s
                  serializer.
         '''
         
         # verify that this is a valid request (raises exception if not)
-        self.validateRequest(commandArray,fields)
+        if not trusted:
+            self.validateRequest(commandArray,fields)
         
         # get the serializer associated with this (sub)command
         try:
@@ -1,7 +1,7 @@
 #!/usr/bin/python
 
+import binascii
 import struct
-import operator
 import types
 
 import ApiDefinition
@@ -16,15 +16,347 @@ log = logging.getLogger('ByteArraySerializer')
 log.setLevel(logging.ERROR)
 log.addHandler(NullHandler())
 
+#============================ codecs ==========================================
+
+class FieldsEncoder(object):
+    '''
+    \ingroup ApiDefinition
+    
+    \brief Encoder of the request fields of one (sub)command, compiled once
+           from its definition.
+    '''
+    
+    _INTS_STRUCTS = {
+        1: struct.Struct('>b'),
+        2: struct.Struct('>h'),
+        4: struct.Struct('>i'),
+    }
+    
+    def __init__(self,ApiDef,commandArray):
+        definition          = ApiDef.getDefinition(
+            ApiDefinition.ApiDefinition.COMMAND,
+            commandArray,
+        )
+        
+        self.encoders       = []   # (fieldName,encodeFunction,length), in order
+        for fieldRaw in definition['request']:
+            field           = ApiDefinition.Field(fieldRaw,ApiDef.fieldOptions)
+            if field.name in ApiDefinition.ApiDefinition.RESERVED:
+                encoder     = None
+            else:
+                encoder     = self._compileField(field)
+            self.encoders  += [(field.name,encoder,field.length)]
+        
+        # IDs of the subcommands, written in the reserved field
+        self.subcommandIds  = {}
+        if 'subCommands' in definition:
+            for subcommand in definition['subCommands']:
+                self.subcommandIds[subcommand['name']] = subcommand['id']
+    
+    def encode(self,fieldsToFill,subcommandName=None):
+        '''
+        \brief Serialize the fields of this (sub)command.
+        
+        \param fieldsToFill   The value of the fields, by name.
+        \param subcommandName The name of the next subcommand, written in the
+                              reserved field.
+        
+        \returns The serialized fields, a list of bytes.
+        '''
+        byteArray           = []
+        for (name,encoder,length) in self.encoders:
+            if encoder:
+                thisFieldByteArray  = encoder(fieldsToFill[name])
+                
+                # padding
+                if length and len(thisFieldByteArray)<length:
+                    thisFieldByteArray = [0x00]*(length-len(thisFieldByteArray))+thisFieldByteArray
+            else:
+                try:
+                    thisFieldByteArray = [self.subcommandIds[subcommandName]]
+                except KeyError:
+                    raise CommandError(CommandError.UNKNOWN_SUBCOMMAND,
+                                       str(subcommandName))
+            
+            byteArray      += thisFieldByteArray
+        return byteArray
+    
+    def _compileField(self,field):
+        if   field.format==ApiDefinition.FieldFormats.STRING:
+            return lambda val: [ord(car) for car in val]
+        
+        elif field.format==ApiDefinition.FieldFormats.BOOL:
+            return lambda val: [val]
+        
+        elif field.format==ApiDefinition.FieldFormats.INT:
+            shifts          = [8*i for i in xrange(field.length-1,-1,-1)]
+            return lambda val: [int(val>>shift)&0xff for shift in shifts]
+        
+        elif field.format==ApiDefinition.FieldFormats.INTS:
+            if field.length not in self._INTS_STRUCTS:
+                return self._unsupported(field)
+            packer          = self._INTS_STRUCTS[field.length]
+            return lambda val: list(bytearray(packer.pack(int(val))))
+        
+        elif field.format==ApiDefinition.FieldFormats.HEXDATA:
+            return self._encodeHexdata
+        
+        else:
+            def _encode(val):
+                raise SystemError('unknown field format='+field.format)
+            return _encode
+    
+    @staticmethod
+    def _encodeHexdata(val):
+        if isinstance(val,(list,tuple)):
+            return list(val)
+        return list(bytearray(val))   # str, bytearray or memoryview
+    
+    def _unsupported(self,field):
+        def _encode(val):
+            raise SystemError('field with format='+field.format+' and length='+str(field.length)+' unsupported.')
+        return _encode
+
+class FieldsDecoder(object):
+    '''
+    \ingroup ApiDefinition
+    
+    \brief Decoder of the response fields of one (sub)command, compiled once
+           from its definition.
+    
+    The fixed-length fields at the beginning of the (sub)command are decoded
+    at once by a struct.Struct, when the packet contains all of them. The
+    other fields, and the fields of truncated packets, are decoded one by one.
+    '''
+    
+    _INT_CODES      = {1:'B',2:'H',4:'I',8:'Q'}
+    _INTS_CODES     = {1:'b',2:'h',4:'i'}
+    
+    # how the value unpacked by the struct is converted
+    _CONVERT_NONE   = 0     # used as is
+    _CONVERT_INT    = 1     # string of bytes to unsigned int
+    _CONVERT_BOOL   = 2     # 0 or 1 to bool
+    _CONVERT_SLICE  = 3     # not unpacked, slice of the original packet
+    
+    def __init__(self,ApiDef,type,nameArray,parentNames=()):
+        
+        # the fields, as tuples (name,format,length,validOptions,isReserved)
+        self.fields         = []
+        for field in ApiDef.getResponseFields(type,nameArray):
+            if not field.options.validOptions:
+                validOptions = None
+            elif field.format==ApiDefinition.FieldFormats.HEXDATA:
+                validOptions = field.options.validOptions   # lists are not hashable
+            else:
+                validOptions = frozenset(field.options.validOptions)
+            self.fields    += [(
+                field.name,
+                field.format,
+                field.length,
+                validOptions,
+                field.name in ApiDefinition.ApiDefinition.RESERVED,
+            )]
+        
+        # names of the values decoded by this decoder and the decoders of the
+        # parent commands, in order
+        self.names          = tuple(parentNames)+tuple(
+            [name for (name,_,_,_,isReserved) in self.fields if not isReserved]
+        )
+        
+        # compile the struct of the fixed-length fields at the beginning
+        structFormat        = '>'
+        self.fixedFields    = []   # (field,conversion)
+        self.fixedLength    = 0
+        for field in self.fields:
+            (name,format,length,_,_) = field
+            if not length:
+                break
+            if   format==ApiDefinition.FieldFormats.INT:
+                if length in self._INT_CODES:
+                    code    = self._INT_CODES[length]
+                    conversion = self._CONVERT_NONE
+                else:
+                    code    = '{0}s'.format(length)
+                    conversion = self._CONVERT_INT
+            elif format==ApiDefinition.FieldFormats.INTS and length in self._INTS_CODES:
+                code        = self._INTS_CODES[length]
+                conversion  = self._CONVERT_NONE
+            elif format==ApiDefinition.FieldFormats.BOOL and length==1:
+                code        = 'B'
+                conversion  = self._CONVERT_BOOL
+            elif format==ApiDefinition.FieldFormats.STRING:
+                code        = '{0}s'.format(length)
+                conversion  = self._CONVERT_NONE
+            elif format==ApiDefinition.FieldFormats.HEXDATA:
+                code        = '{0}x'.format(length)
+                conversion  = self._CONVERT_SLICE
+            else:
+                break
+            structFormat   += code
+            self.fixedFields += [(field,conversion)]
+            self.fixedLength += length
+        self.struct         = struct.Struct(structFormat)
+        
+        # the subcommands, by ID
+        self.hasSubcommands = ApiDef.hasSubcommands(type,nameArray)
+        self.subcommandNames = {}
+        if self.hasSubcommands:
+            for subcommand in ApiDef.getSubcommands(type,nameArray):
+                self.subcommandNames[subcommand['id']] = subcommand['name']
+    
+    def decode(self,byteArray,buf,index,values):
+        '''
+        \brief Deserialize the fields of this (sub)command.
+        
+        \param byteArray    The packet, a list or tuple of ints, a str or a
+                            memoryview. Binary fields are slices of it.
+        \param buf          The same packet, as a bytearray.
+        \param index        Where the fields of this (sub)command start in the
+                            packet.
+        \param values       The list the values of the decoded fields are
+                            appended to, in the order of their definition.
+                            The value of the reserved field is not.
+        
+        \returns A tuple (index,idNextCommand,notRcOk), where index is where
+                 the fields of the next subcommand start, idNextCommand the
+                 value of the reserved field (None if absent) and notRcOk
+                 whether the RC decoded is not RC_OK.
+        '''
+        idNextCommand       = None
+        numDecoded          = 0
+        append              = values.append
+        
+        if len(byteArray)-index>=self.fixedLength:
+            values          = iter(self.struct.unpack_from(buf,index))
+            offset          = index
+            for ((name,format,length,validOptions,isReserved),conversion) in self.fixedFields:
+                if   conversion==self._CONVERT_NONE:
+                    value   = next(values)
+                elif conversion==self._CONVERT_SLICE:
+                    value   = byteArray[offset:offset+length]
+                elif conversion==self._CONVERT_INT:
+                    value   = int(binascii.hexlify(next(values)),16)
+                else:
+                    value   = next(values)
+                    if value>1:
+                        raise CommandError(CommandError.VALUE_NOT_IN_OPTIONS,
+                                           "field="+name+" value="+str(value))
+                    value   = value==1
+                offset     += length
+                numDecoded += 1
+                
+                if validOptions is not None and value not in validOptions:
+                    raise CommandError(CommandError.VALUE_NOT_IN_OPTIONS,
+                                       "field="+name+" value="+str(value))
+                if isReserved:
+                    idNextCommand = value
+                else:
+                    append(value)
+                    if name==ApiDefinition.ApiDefinition.RC and value!=ApiDefinition.ApiDefinition.RC_OK:
+                        return (offset,idNextCommand,True)
+            index           = offset
+        
+        for (name,format,length,validOptions,isReserved) in self.fields[numDecoded:]:
+            
+            # isolate the piece of the byteArray corresponding to this field
+            start           = index
+            if length:
+                thisFieldArray = buf[index:index+length]
+                index      += length
+                if len(thisFieldArray)<length and len(thisFieldArray)>0:
+                    # incomplete field: not allowed
+                    raise CommandError(
+                        CommandError.TOO_FEW_BYTES,
+                        "incomplete field {0}".format(name),
+                    )
+            else:
+                thisFieldArray = buf[index:]
+                index       = len(byteArray)
+            
+            # field missing: allowed
+            if len(thisFieldArray)==0:
+                value       = None
+            elif format==ApiDefinition.FieldFormats.HEXDATA:
+                value       = byteArray[start:index]
+            else:
+                value       = self._convert(name,format,thisFieldArray)
+                if validOptions is not None and value not in validOptions:
+                    raise CommandError(CommandError.VALUE_NOT_IN_OPTIONS,
+                                       "field="+name+" value="+str(value))
+            
+            if isReserved:
+                # the subcommand specifier cannot be missing
+                if value is None:
+                    raise CommandError(
+                        CommandError.TOO_FEW_BYTES,
+                        "reserved field missing {0}".format(name),
+                    )
+                idNextCommand = value
+            else:
+                append(value)
+                if name==ApiDefinition.ApiDefinition.RC and value!=ApiDefinition.ApiDefinition.RC_OK:
+                    return (index,idNextCommand,True)
+        
+        return (index,idNextCommand,False)
+    
+    def subcommandName(self,id):
+        try:
+            return self.subcommandNames[id]
+        except KeyError:
+            raise CommandError(CommandError.UNKNOWN_SUBCOMMAND,
+                               str(id))
+    
+    def _convert(self,name,format,thisFieldArray):
+        # thisFieldArray is a bytearray
+        if   format==ApiDefinition.FieldFormats.STRING:
+            return str(thisFieldArray)
+        
+        elif format==ApiDefinition.FieldFormats.BOOL:
+            if len(thisFieldArray)==1 and thisFieldArray[0] in [0x00,0x01]:
+                return thisFieldArray[0]==0x01
+            raise CommandError(CommandError.VALUE_NOT_IN_OPTIONS,
+                               "field="+name+" value="+str(list(thisFieldArray)))
+        
+        elif format==ApiDefinition.FieldFormats.INT:
+            value           = 0
+            for byte in thisFieldArray:
+                value       = (value<<8)|byte
+            return value
+        
+        elif format==ApiDefinition.FieldFormats.INTS:
+            if len(thisFieldArray) not in self._INTS_CODES:
+                raise SystemError('field with format='+format+' and length='+str(len(thisFieldArray))+' unsupported.')
+            (value,)        = struct.unpack(
+                '>'+self._INTS_CODES[len(thisFieldArray)],
+                str(thisFieldArray),
+            )
+            return value
+        
+        else:
+            raise SystemError('unknown field format='+format)
+
+#============================ serializer ======================================
+
 class ByteArraySerializer(object):
     '''
     \ingroup ApiDefinition
     
     \brief Serializer/deserializer for byte arrays.
+    
+    The definition of each (sub)command is compiled into a FieldsEncoder or a
+    FieldsDecoder the first time it is used, and shared by the serializers of
+    all the instances of that API definition.
+    
+    Packets are deserialized into a dictionary of fields by deserialize(), or
+    directly into a record, e.g. a named tuple, by deserializeRecord().
     '''
 
     def __init__(self,ApiDef):
-        self.ApiDef = ApiDef
+        self.ApiDef   = ApiDef
+        self.encoders = ApiDef.getCache('ByteArraySerializer.encoders') # FieldsEncoder, indexed by tuple(commandArray)
+        self.decoders = ApiDef.getCache('ByteArraySerializer.decoders') # FieldsDecoder, indexed by (type,tuple(nameArray))
+        self.names    = ApiDef.getCache('ByteArraySerializer.names')    # name of the (sub)command, indexed by (type,id)
+        self.layouts  = ApiDef.getCache('ByteArraySerializer.layouts')  # position of the fields of a record, indexed by (decoder,recordType)
     
     def serialize(self,commandArray,fieldsToFill):
         
@@ -45,61 +377,13 @@ class ByteArraySerializer(object):
         byteArray  = []
         
         for cmdCounter in range(len(commandArray)):
-        
-            # packet payload
-            definition = self.ApiDef.getDefinition(
-                ApiDefinition.ApiDefinition.COMMAND,
-                commandArray[:cmdCounter+1]
-            )
-            
-            fields = [ApiDefinition.Field(fieldRaw,self.ApiDef.fieldOptions)
-                         for fieldRaw in definition['request']]
             
-            for field in fields:
-                thisFieldByteArray = []
-                if field.name in ApiDefinition.ApiDefinition.RESERVED:
-                    thisFieldByteArray.append(
-                        self.ApiDef.subcommandNameToId(
-                            ApiDefinition.ApiDefinition.COMMAND,
-                            commandArray[:cmdCounter+1],
-                            commandArray[cmdCounter+1]
-                        )
-                    )
-                else:
-                    val                          = fieldsToFill[field.name]
-                    
-                    if   field.format==ApiDefinition.FieldFormats.STRING:
-                        thisFieldByteArray      += [ord(car) for car in val]
-                    
-                    elif field.format==ApiDefinition.FieldFormats.BOOL:
-                        thisFieldByteArray.append(val)
-                    
-                    elif field.format==ApiDefinition.FieldFormats.INT:
-                        thisFieldByteArray      += [operator.mod(int(val>>(8*i)), 0x100) for i in xrange(field.length-1, -1, -1)]
-                    
-                    elif field.format==ApiDefinition.FieldFormats.INTS:
-                        if   field.length==1:
-                            temp = struct.pack('>b',int(val))
-                        elif field.length==2:
-                            temp = struct.pack('>h',int(val))
-                        elif field.length==4:
-                            temp = struct.pack('>i',int(val))
-                        else:
-                            raise SystemError('field with format='+field.format+' and length='+str(field.length)+' unsupported.')
-                        for i in range(len(temp)):
-                            thisFieldByteArray.append(ord(temp[i]))
-                    
-                    elif field.format==ApiDefinition.FieldFormats.HEXDATA:
-                        thisFieldByteArray    += val
-                    
-                    else:
-                        raise SystemError('unknown field format='+field.format)
-                    
-                    # padding
-                    while len(thisFieldByteArray)<field.length:
-                        thisFieldByteArray  = [0x00]+thisFieldByteArray
-                
-                byteArray = byteArray+thisFieldByteArray
+            # packet payload
+            encoder = self._getEncoder(commandArray[:cmdCounter+1])
+            if cmdCounter+1<len(commandArray):
+                byteArray += encoder.encode(fieldsToFill,commandArray[cmdCounter+1])
+            else:
+                byteArray += encoder.encode(fieldsToFill)
         
         cmdId = self.ApiDef.nameToId(ApiDefinition.ApiDefinition.COMMAND,commandArray)
         
@@ -114,10 +398,71 @@ class ByteArraySerializer(object):
         return cmdId,byteArray
 
     def deserialize(self,type,id,byteArray):
-        notRcOk         = False
-        returnFields    = {}
-        nameArray       = [self.ApiDef.idToName(type,id)]
+        (nameArray,decoder,values) = self._decode(type,id,byteArray)
+        returnFields    = dict(zip(decoder.names,values))
+        
+        if log.isEnabledFor(logging.DEBUG):
+            output  = []
+            output += ["... deserialized into"]
+            output += ["- nameArray:        {0}".format(nameArray)]
+            output += ["- returnFields:     {0}".format(returnFields)]
+            output  = '\n'.join(output)
+            log.debug(output)
+        
+        return nameArray,returnFields
+    
+    def deserializeRecord(self,type,id,byteArray,recordTypes):
+        '''
+        \brief Deserialize a packet directly into a record, without building a
+               dictionary of its fields first.
+        
+        \param recordTypes The record type of each (sub)command, indexed by
+                           the last name of its nameArray. A record type is a
+                           tuple subclass with a _fields attribute listing the
+                           names of the fields, e.g. a named tuple. Fields
+                           absent from the packet are None.
+        
+        \returns A tuple (nameArray,record). When recordTypes has no record
+                 type for the (sub)command, or None, the fields are returned
+                 as a dictionary, as by deserialize().
+        '''
+        (nameArray,decoder,values) = self._decode(type,id,byteArray)
+        recordType      = recordTypes.get(nameArray[-1])
+        if recordType is None:
+            return nameArray,dict(zip(decoder.names,values))
+        
+        positions       = self._getLayout(decoder,recordType)
+        if positions is None:
+            if len(values)<len(recordType._fields):
+                values += [None]*(len(recordType._fields)-len(values))
+        else:
+            values     += [None]*(len(decoder.names)+1-len(values))
+            values      = [values[i] for i in positions]
+        record          = tuple.__new__(recordType,values)
+        
+        if log.isEnabledFor(logging.DEBUG):
+            output  = []
+            output += ["... deserialized into"]
+            output += ["- nameArray:        {0}".format(nameArray)]
+            output += ["- record:           {0}".format(record)]
+            output  = '\n'.join(output)
+            log.debug(output)
+        
+        return nameArray,record
+    
+    #======================== private =========================================
+    
+    def _decode(self,type,id,byteArray):
+        '''
+        \returns A tuple (nameArray,decoder,values), where decoder is the last
+                 decoder applied, and values the values of the fields decoded,
+                 named by decoder.names.
+        '''
+        values          = []
+        nameArray       = [self._idToName(type,id)]
         index           = 0
+        buf             = bytearray(byteArray)
+        idNextCommand   = None
         
         # log
         if log.isEnabledFor(logging.DEBUG):
@@ -129,143 +474,74 @@ class ByteArraySerializer(object):
             output  = '\n'.join(output)
             log.debug(output)
         
-        continueParsing  = True
-        while continueParsing:
+        while True:
             
-            fieldDefs   = self.ApiDef.getResponseFields(type,nameArray)
+            decoder     = self._getDecoder(type,nameArray)
             
-            for fieldDef in fieldDefs:
-                
-                fieldMissing = False
-                
-                # isolate the piece of the byteArray corresponding to this field
-                if fieldDef.length:
-                    # this field has an expected length
-                    
-                    thisFieldArray = byteArray[index:index+fieldDef.length]
-                    index         += fieldDef.length
-                    
-                    if   len(thisFieldArray)==0:
-                        # field missing: allowed
-                        fieldMissing   = True
-                    elif len(thisFieldArray)<fieldDef.length:
-                        # incomplete field: not allowed
-                        raise CommandError(
-                            CommandError.TOO_FEW_BYTES,
-                            "incomplete field {0}".format(fieldDef.name),
-                        )
-                    
-                else:
-                    thisFieldArray = byteArray[index:]
-                    index          = len(byteArray)
-                    
-                    if len(thisFieldArray)<1:
-                        # too few bytes
-                        fieldMissing    = True
-                
-                # find thisFieldValue
-                if fieldMissing:
-                    thisFieldValue = None
-                else:
-                    if   fieldDef.format==ApiDefinition.FieldFormats.STRING:
-                        thisFieldValue = ''
-                        for byte in thisFieldArray:
-                            thisFieldValue += chr(byte)
-                    
-                    elif fieldDef.format==ApiDefinition.FieldFormats.BOOL:
-                        if    len(thisFieldArray)==1 and thisFieldArray[0]==0x00:
-                            thisFieldValue = False
-                        elif  len(thisFieldArray)==1 and thisFieldArray[0]==0x01:
-                            thisFieldValue = True
-                        else:
-                            raise CommandError(CommandError.VALUE_NOT_IN_OPTIONS,
-                                               "field="+fieldDef.name+" value="+str(thisFieldValue))
-                    
-                    elif fieldDef.format==ApiDefinition.FieldFormats.INT:
-                        thisFieldValue = 0
-                        for i in range(len(thisFieldArray)):
-                            thisFieldValue += thisFieldArray[i]*pow(2,8*(len(thisFieldArray)-i-1))
-                    
-                    elif fieldDef.format==ApiDefinition.FieldFormats.INTS:
-                        tempList = [chr(i) for i in thisFieldArray]
-                        tempString = ''.join(tempList)
-                        if   len(thisFieldArray)==1:
-                            (thisFieldValue,) = struct.unpack_from('>b',tempString)
-                        elif len(thisFieldArray)==2:
-                            (thisFieldValue,) = struct.unpack_from('>h',tempString)
-                        elif len(thisFieldArray)==4:
-                            (thisFieldValue,) = struct.unpack_from('>i',tempString)
-                        else:
-                            raise SystemError('field with format='+fieldDef.format+' and length='+str(fieldDef.length)+' unsupported.')
-                    
-                    elif fieldDef.format==ApiDefinition.FieldFormats.HEXDATA:
-                        thisFieldValue = thisFieldArray
-                    
-                    else:
-                        raise SystemError('unknown field format='+fieldDef.format)
-                    
-                    # make sure thisFieldValue in fieldDef.options
-                    if fieldDef.options.validOptions:
-                        if thisFieldValue not in fieldDef.options.validOptions:
-                            raise CommandError(CommandError.VALUE_NOT_IN_OPTIONS,
-                                               "field="+fieldDef.name+" value="+str(thisFieldValue))
-                
-                if fieldDef.name in ApiDefinition.ApiDefinition.RESERVED:
-                    # the subcommand specifier cannot be missing
-                    if thisFieldValue==None:
-                        raise CommandError(
-                            CommandError.TOO_FEW_BYTES,
-                            "reserved field missing {0}".format(fieldDef.name),
-                        )
-                    idNextCommand = thisFieldValue
-                else:
-                    returnFields[fieldDef.name] = thisFieldValue
-                    
-                # stop if not RC_OK
-                if  (
-                        (ApiDefinition.ApiDefinition.RC in returnFields) and
-                        (
-                            returnFields[ApiDefinition.ApiDefinition.RC]!= \
-                                ApiDefinition.ApiDefinition.RC_OK
-                        )
-                   ):
-                   notRcOk = True
-                   break
+            (index,idReserved,notRcOk) = decoder.decode(byteArray,buf,index,values)
+            if idReserved is not None:
+                idNextCommand = idReserved
             
-            # continue if subCommand
-            if  (
-                    (not notRcOk)           and
-                    continueParsing         and
-                    self.ApiDef.hasSubcommands(type,nameArray)
-                ):
-                # find name of subCommand
-                nameArray.append(self.ApiDef.subcommandIdToName(type,
-                                                                nameArray,
-                                                                idNextCommand))
-                continueParsing = True
-            else:
-                continueParsing = False
+            # stop if not RC_OK, or no subCommand
+            if notRcOk or not decoder.hasSubcommands:
+                break
             
-            # stop if not RC_OK
-            if  (
-                    continueParsing         and
-                    notRcOk
-                ):
-                continueParsing = False
+            # find name of subCommand
+            nameArray.append(decoder.subcommandName(idNextCommand))
             
             # stop if end of packet reached
-            if  (
-                    continueParsing         and
-                    index>=len(byteArray)
-                ):
-                continueParsing = False
+            if index>=len(byteArray):
+                break
         
-        if log.isEnabledFor(logging.DEBUG):
-            output  = []
-            output += ["... deserialized into"]
-            output += ["- nameArray:        {0}".format(nameArray)]
-            output += ["- returnFields:     {0}".format(returnFields)]
-            output  = '\n'.join(output)
-            log.debug(output)
-        
-        return nameArray,returnFields
+        return (nameArray,decoder,values)
+    
+    def _getLayout(self,decoder,recordType):
+        '''
+        \returns None when the fields of the record are the values decoded, in
+                 the same order. Otherwise, the position of each field of the
+                 record in the values, past the end for a field not decoded.
+        '''
+        key = (decoder,recordType)
+        try:
+            return self.layouts[key]
+        except KeyError:
+            fields = tuple(recordType._fields)
+            if fields[:len(decoder.names)]==decoder.names:
+                positions = None
+            else:
+                positions = [
+                    decoder.names.index(name) if name in decoder.names else len(decoder.names)
+                    for name in fields
+                ]
+            self.layouts[key] = positions
+            return positions
+    
+    def _getEncoder(self,commandArray):
+        key = tuple(commandArray)
+        try:
+            return self.encoders[key]
+        except KeyError:
+            encoder = FieldsEncoder(self.ApiDef,list(commandArray))
+            self.encoders[key] = encoder
+            return encoder
+    
+    def _getDecoder(self,type,nameArray):
+        key = (type,tuple(nameArray))
+        try:
+            return self.decoders[key]
+        except KeyError:
+            if len(nameArray)>1:
+                parentNames = self._getDecoder(type,nameArray[:-1]).names
+            else:
+                parentNames = ()
+            decoder = FieldsDecoder(self.ApiDef,type,list(nameArray),parentNames)
+            self.decoders[key] = decoder
+            return decoder
+    
+    def _idToName(self,type,id):
+        try:
+            return self.names[(type,id)]
+        except KeyError:
+            name = self.ApiDef.idToName(type,id)
+            self.names[(type,id)] = name
+            return name
@@ -44,6 +44,13 @@ class HartMoteDefinition(ApiDefinition.ApiDefinition):
         '''
         return self.serializer.deserialize(type,cmdId,byteArray)
     
+    def deserializeRecord(self,type,cmdId,byteArray,recordTypes):
+        '''
+        \brief Deserialize directly into the record type of the (sub)command,
+               see ByteArraySerializer.deserializeRecord().
+        '''
+        return self.serializer.deserializeRecord(type,cmdId,byteArray,recordTypes)
+    
     def serializeSend(self,commandArray,fieldsToFill):
         '''
         \brief Serializer specific for the send command
@@ -74,6 +74,13 @@ class IpMgrDefinition(ApiDefinition.ApiDefinition):
         '''
         return self.serializer.deserialize(type,cmdId,byteArray)
     
+    def deserializeRecord(self,type,cmdId,byteArray,recordTypes):
+        '''
+        \brief Deserialize directly into the record type of the (sub)command,
+               see ByteArraySerializer.deserializeRecord().
+        '''
+        return self.serializer.deserializeRecord(type,cmdId,byteArray,recordTypes)
+    
     # We redefine this attribute inherited from ApiDefinition. See
     # ApiDefinition for a full description of the structure of this field.
     fieldOptions = {
@@ -28,6 +28,15 @@ class CommandTimeoutError(Exception) :
     def __str__(self) :
         return "Device timeout error for command {0}".format(self.cmd)
     
+class FutureTimeoutError(Exception) :
+    '''
+    \brief Timeout waiting for the completion of an asynchronous command.
+    '''
+    def __init__(self, timeout):
+        self.timeout = timeout
+    def __str__(self) :
+        return "Command not completed after {0}s".format(self.timeout)
+    
 class APIError(Exception) :
     '''
     \brief Exception class associated with connection the API.
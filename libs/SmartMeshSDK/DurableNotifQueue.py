@@ -0,0 +1,502 @@
+'''
+Notification queue backed by a log on disk.
+
+The notifications received by a connector are appended to a log of segment
+files, so that they survive a consumer stalling for longer than the memory
+queue can absorb, and a restart of the application. The most recent
+notifications are also kept in memory, and are read from there while the
+consumer keeps up.
+'''
+
+import collections
+import cPickle
+import logging
+import os
+import struct
+import threading
+import traceback
+import zlib
+
+import ApiException
+from   ApiConnector import NotifQueue
+
+# Log initialization
+class NullHandler(logging.Handler):
+    def emit(self, record):
+        pass
+log = logging.getLogger('DurableNotifQueue')
+log.setLevel(logging.ERROR)
+log.addHandler(NullHandler())
+
+# length and CRC-32 of each record of a segment file
+_RECORD_HEADER = struct.Struct('!II')
+
+# acknowledged offset, and its CRC-32
+_OFFSET_RECORD = struct.Struct('!QI')
+
+class DurableNotifQueue(NotifQueue):
+    '''
+    \ingroup ApiConnector
+
+    \brief Notification queue which writes the notifications to a log on
+           disk, and replays them after a restart.
+
+    Each notification is given an offset, its position in the log. The log
+    is a directory of segment files, each named after the offset of its first
+    notification, and rolled over when it reaches segmentSize bytes. The
+    segment files are written through a buffer, and flushed to disk by a
+    syncer thread every syncInterval seconds, or once syncCount notifications
+    are waiting, so that writing a notification does not wait for the disk.
+
+    The last memSize notifications are also kept in memory. Older ones, when
+    the consumer falls behind, are read back from the log.
+
+    The consumer acknowledges the notifications it is done with, with ack(),
+    or as they are read with autoAck. The acknowledged offset is saved with
+    the segment files. The log is replayed from it when the queue is opened
+    again, and the segment files holding only acknowledged notifications are
+    deleted.
+
+    Notifications are stored as their name and a dictionary of their
+    fields, as getNotificationInternal() returns them, with their binary
+    fields as lists or str. Notifications of another shape must be
+    picklable.
+
+    When maxBytes is set and the log reaches it, the overflow policy applies:
+    OVERFLOW_DISCONNECT, OVERFLOW_DROP_NEWEST, or OVERFLOW_DROP_OLDEST to
+    delete the oldest segment file, acknowledged or not. The notifications
+    dropped with a segment file are counted under the None type.
+    '''
+
+    SEGMENT_SUFFIX = '.seg'
+    OFFSET_FILE    = 'consumer.offset'
+
+    def __init__(self, path, memSize = 1000, segmentSize = 16*1024*1024,
+            syncInterval = 0.1, syncCount = 1000, autoAck = False,
+            maxBytes = None, overflow = NotifQueue.OVERFLOW_DISCONNECT):
+        '''
+        \param path         Directory of the log, created if needed.
+        \param memSize      Maximum number of notifications kept in memory.
+        \param segmentSize  Size of a segment file, in bytes, before rolling
+                            over to the next one.
+        \param syncInterval Maximum time a notification written, or an
+                            acknowledgement, waits to be flushed to disk, in
+                            seconds.
+        \param syncCount    Number of notifications written after which they
+                            are flushed to disk without waiting for
+                            syncInterval.
+        \param autoAck      Whether the notifications are acknowledged as
+                            they are read.
+        \param maxBytes     Maximum size of the log, in bytes. None for no
+                            limit.
+        \param overflow     What happens to a notification received when the
+                            log has reached maxBytes.
+        '''
+        self.path = path
+        self.segmentSize = segmentSize
+        self.syncInterval = syncInterval
+        self.syncCount = syncCount
+        self.autoAck = autoAck
+        self.maxBytes = maxBytes
+        self.syncLock = threading.Lock()  # serializes the flushes to disk
+        NotifQueue.__init__(self, memSize, overflow)
+        self.syncWakeup = threading.Condition(self.lock)
+        self.mem = collections.deque()    # the newest notifications
+        self.segments = []                # (firstOffset, size) of each segment file
+        self.writeFile = None             # the last segment file
+        self.readFile = None              # segment file read from, when behind the memory
+        self.readFileOffset = None        # offset of the next notification in readFile
+        self.numUnsynced = 0              # notifications written since the last flush
+        self.isAckDirty = False           # whether ackedOffset must be saved
+        self.savedAckedOffset = None      # ackedOffset saved in the offset file
+        self.isClosed = False
+        self._open()
+        self.syncThread = threading.Thread(target = self._syncLoop)
+        self.syncThread.name = "DurableNotifQueue"
+        self.syncThread.daemon = True
+        self.syncThread.start()
+
+    #======================== public ==========================================
+
+    def setOverflow(self, overflow, blockTimeout = None, coalesceKey = None):
+        '''
+        \brief Choose what happens to a notification received when the log
+               has reached maxBytes: OVERFLOW_DISCONNECT,
+               OVERFLOW_DROP_NEWEST or OVERFLOW_DROP_OLDEST.
+        '''
+        if overflow not in [self.OVERFLOW_DISCONNECT, self.OVERFLOW_DROP_NEWEST, self.OVERFLOW_DROP_OLDEST] :
+            raise ValueError("unsupported overflow policy {0} for a durable queue".format(overflow))
+        NotifQueue.setOverflow(self, overflow)
+
+    def put(self, item):
+        '''
+        \brief Append a notification to the log.
+
+        \exception ConnectionError The log has reached maxBytes, and the
+                   overflow policy is OVERFLOW_DISCONNECT.
+        \returns Whether the notification was queued.
+        '''
+        data = cPickle.dumps(self._toStorable(item), cPickle.HIGHEST_PROTOCOL)
+        with self.lock :
+            if self.isClosed :
+                raise ApiException.ConnectionError("Notification log closed")
+            recordSize = _RECORD_HEADER.size + len(data)
+            while self.maxBytes and self.diskBytes + recordSize > self.maxBytes :
+                if self.overflow == self.OVERFLOW_DROP_OLDEST and len(self.segments) > 1 :
+                    self._dropOldestSegment()
+                    continue
+                self._drop(item)
+                if self.overflow == self.OVERFLOW_DISCONNECT :
+                    raise ApiException.ConnectionError("Notification log full")
+                return False
+            if self.segments[-1][1] >= self.segmentSize :
+                self._rollSegment()
+            self.writeFile.write(_RECORD_HEADER.pack(len(data), zlib.crc32(data) & 0xffffffff))
+            self.writeFile.write(data)
+            (firstOffset, size) = self.segments[-1]
+            self.segments[-1] = (firstOffset, size + recordSize)
+            self.diskBytes += recordSize
+
+            # keep the newest notifications in memory
+            if len(self.mem) == self.maxQSize :
+                self.mem.popleft()
+                self.memStart += 1
+            self.mem.append(item)
+            self.nextOffset += 1
+            self.count += 1
+            self.stats['numQueued'] += 1
+            if self.count > self.stats['maxDepth'] :
+                self.stats['maxDepth'] = self.count
+
+            self.numUnsynced += 1
+            if self.numUnsynced == self.syncCount :
+                self.syncWakeup.notify()
+            if self.count <= self.numGetters :
+                self.notEmpty.notify()  # else, the waiting getters were notified already
+            return True
+
+    def getBatch(self, maxItems, timeout = -1):
+        '''
+        \brief Get up to maxItems notifications from queue, in one operation,
+               see NotifQueue.getBatch().
+        '''
+        with self.lock :
+            if not self._waitNotEmpty(timeout) :
+                return []
+            return [self._popleft() for _ in xrange(min(maxItems, self.count))]
+
+    def ack(self, offset = None):
+        '''
+        \brief Acknowledge the notifications before offset, which are not
+               replayed anymore.
+
+        \param offset Offset of the first notification not acknowledged. None
+                      to acknowledge all the notifications read.
+        '''
+        with self.lock :
+            self._ack(self.readOffset if offset is None else min(offset, self.readOffset))
+
+    def sync(self):
+        '''
+        \brief Flush the notifications written, and the acknowledged offset,
+               to disk.
+        '''
+        with self.syncLock :
+            with self.lock :
+                if self.isClosed or (not self.numUnsynced and not self.isAckDirty) :
+                    return
+                self.writeFile.flush()
+                fd = os.dup(self.writeFile.fileno())
+                self.numUnsynced = 0
+                ackedOffset = self.ackedOffset
+                self.isAckDirty = False
+            try :
+                os.fsync(fd)
+            finally :
+                os.close(fd)
+            if ackedOffset != self.savedAckedOffset :
+                self._saveAckedOffset(ackedOffset)
+            with self.lock :
+                self.stats['numSyncs'] += 1
+
+    def close(self):
+        '''
+        \brief Flush the log to disk, close it, and wait for the syncer
+               thread to stop.
+        '''
+        self.sync()
+        with self.lock :
+            if self.isClosed :
+                return
+            self.isClosed = True
+            self.syncWakeup.notify()
+            self.writeFile.close()
+            self._closeReadFile()
+            self.numKicks += 1
+            self.notEmpty.notify_all()
+        self.syncThread.join()
+
+    def clear(self):
+        '''
+        \brief Reset the statistics, on connection.
+
+        The notifications are kept: they are replayed until acknowledged.
+        '''
+        with self.lock :
+            self.numKicks = 0
+            self.isDisconnected = False
+            self._resetStats()
+
+    def getStats(self):
+        '''
+        \brief Get statistics about the queue, those of NotifQueue.getStats()
+               and:
+            - 'nextOffset': offset of the next notification written
+            - 'readOffset': offset of the next notification read
+            - 'ackedOffset': offset of the first notification not
+              acknowledged
+            - 'memDepth': number of notifications kept in memory
+            - 'numSegments': number of segment files
+            - 'diskBytes': size of the log, in bytes
+            - 'numDiskReads': number of notifications read back from disk
+            - 'numSyncs': number of flushes to disk
+        '''
+        returnVal = NotifQueue.getStats(self)
+        with self.lock :
+            returnVal['nextOffset']  = self.nextOffset
+            returnVal['readOffset']  = self.readOffset
+            returnVal['ackedOffset'] = self.ackedOffset
+            returnVal['memDepth']    = len(self.mem)
+            returnVal['numSegments'] = len(self.segments)
+            returnVal['diskBytes']   = self.diskBytes
+        return returnVal
+
+    #======================== private =========================================
+
+    def _resetStats(self):
+        NotifQueue._resetStats(self)
+        self.stats['numDiskReads'] = 0
+        self.stats['numSyncs'] = 0
+
+    def _toStorable(self, item):
+        '''
+        \brief Convert a notification into picklable types.
+        '''
+        if not isinstance(item, tuple) or len(item) != 2 :
+            return item
+        (names, params) = item
+        if isinstance(params, tuple) and hasattr(params, '_fields') :
+            params = dict(zip(params._fields, params))
+        if isinstance(params, dict) :
+            for (name, value) in params.items() :
+                if isinstance(value, (memoryview, bytearray)) :
+                    params = dict(params)
+                    params[name] = str(value) if isinstance(value, bytearray) else value.tobytes()
+        return (names, params)
+
+    def _popleft(self):
+        if self.readOffset >= self.memStart :
+            item = self.mem.popleft()
+            self.memStart += 1
+        else :
+            item = self._readFromDisk()
+            self.stats['numDiskReads'] += 1
+        self.readOffset += 1
+        self.count -= 1
+        if self.autoAck :
+            self._ack(self.readOffset)
+        return item
+
+    def _ack(self, offset):
+        if offset <= self.ackedOffset :
+            return
+        self.ackedOffset = offset
+        self.isAckDirty = True
+        # delete the segment files holding only acknowledged notifications
+        while len(self.segments) > 1 and self.segments[1][0] <= offset :
+            self._deleteSegment(self.segments.pop(0))
+
+    #=== segment files
+
+    def _segmentPath(self, firstOffset):
+        return os.path.join(self.path, '{0:020d}{1}'.format(firstOffset, self.SEGMENT_SUFFIX))
+
+    def _open(self):
+        '''
+        \brief Open the log, recovering from an interrupted write, and queue
+               the notifications not acknowledged.
+        '''
+        if not os.path.isdir(self.path) :
+            os.makedirs(self.path)
+        firstOffsets = sorted([int(name[:-len(self.SEGMENT_SUFFIX)]) for name in os.listdir(self.path)
+                                                                     if name.endswith(self.SEGMENT_SUFFIX)])
+        self.segments = [(firstOffset, os.path.getsize(self._segmentPath(firstOffset))) for firstOffset in firstOffsets]
+        if not self.segments :
+            self.segments = [(0, 0)]
+
+        # drop the records of the last segment after the last complete one
+        (firstOffset, size) = self.segments[-1]
+        (numRecords, validSize) = self._scanSegment(firstOffset)
+        if validSize != size :
+            log.warning("truncating {0} from {1} to {2} bytes".format(self._segmentPath(firstOffset), size, validSize))
+        self.writeFile = open(self._segmentPath(firstOffset), 'ab')
+        self.writeFile.truncate(validSize)
+        self.segments[-1] = (firstOffset, validSize)
+        self.diskBytes = sum([size for (firstOffset, size) in self.segments])
+        self.nextOffset = firstOffset + numRecords
+
+        ackedOffset = self._loadAckedOffset()
+        self.ackedOffset = min(max(ackedOffset, self.segments[0][0]), self.nextOffset)
+        self.savedAckedOffset = ackedOffset
+        self.readOffset = self.ackedOffset
+        self.memStart = self.nextOffset
+        self.count = self.nextOffset - self.readOffset
+        self.stats['maxDepth'] = self.count
+
+    def _scanSegment(self, firstOffset):
+        '''
+        \returns (number of complete records, size they take)
+        '''
+        numRecords = 0
+        validSize = 0
+        with open(self._segmentPath(firstOffset), 'ab+') as f :
+            f.seek(0)
+            while True :
+                header = f.read(_RECORD_HEADER.size)
+                if len(header) < _RECORD_HEADER.size :
+                    break
+                (length, crc) = _RECORD_HEADER.unpack(header)
+                data = f.read(length)
+                if len(data) < length or zlib.crc32(data) & 0xffffffff != crc :
+                    break
+                numRecords += 1
+                validSize += _RECORD_HEADER.size + length
+        return (numRecords, validSize)
+
+    def _rollSegment(self):
+        self.writeFile.flush()
+        os.fsync(self.writeFile.fileno())
+        self.writeFile.close()
+        self.segments.append((self.nextOffset, 0))
+        self.writeFile = open(self._segmentPath(self.nextOffset), 'ab')
+
+    def _deleteSegment(self, segment):
+        (firstOffset, size) = segment
+        if self.readFile and self.readFile.name == self._segmentPath(firstOffset) :
+            self._closeReadFile()
+        try :
+            os.remove(self._segmentPath(firstOffset))
+        except OSError as err :
+            log.error("could not delete {0}: {1}".format(self._segmentPath(firstOffset), err))
+        self.diskBytes -= size
+
+    def _dropOldestSegment(self):
+        '''
+        \brief Delete the oldest segment file, to make room in the log,
+               dropping its notifications not acknowledged.
+        '''
+        nextFirstOffset = self.segments[1][0]
+        numDropped = nextFirstOffset - max(self.ackedOffset, self.segments[0][0])
+        self.stats['numDropped'] += numDropped
+        self.stats['droppedPerType'][None] = self.stats['droppedPerType'].get(None, 0) + numDropped
+        if self.readOffset < nextFirstOffset :
+            self.count -= nextFirstOffset - self.readOffset
+            self.readOffset = nextFirstOffset
+            while self.memStart < self.readOffset and self.mem :
+                self.mem.popleft()
+                self.memStart += 1
+        if self.ackedOffset < nextFirstOffset :
+            self.ackedOffset = nextFirstOffset
+            self.isAckDirty = True
+        self._deleteSegment(self.segments.pop(0))
+
+    def _readFromDisk(self):
+        '''
+        \brief Read the notification at readOffset from its segment file.
+        '''
+        if self.readFileOffset != self.readOffset :
+            self._openReadFile()
+        if self.readFile.name == self.writeFile.name :
+            self.writeFile.flush()
+        header = self.readFile.read(_RECORD_HEADER.size)
+        if len(header) < _RECORD_HEADER.size :
+            # end of this segment, continue with the next one
+            self._openReadFile()
+            header = self.readFile.read(_RECORD_HEADER.size)
+        (length, crc) = _RECORD_HEADER.unpack(header)
+        data = self.readFile.read(length)
+        if zlib.crc32(data) & 0xffffffff != crc :
+            raise ApiException.QueueError()
+        self.readFileOffset += 1
+        return cPickle.loads(data)
+
+    def _openReadFile(self):
+        '''
+        \brief Open the segment file holding readOffset, and skip to it.
+        '''
+        self._closeReadFile()
+        for (firstOffset, size) in reversed(self.segments) :
+            if firstOffset <= self.readOffset :
+                break
+        self.readFile = open(self._segmentPath(firstOffset), 'rb')
+        if self.readFile.name == self.writeFile.name :
+            self.writeFile.flush()
+        for _ in xrange(self.readOffset - firstOffset) :
+            (length, crc) = _RECORD_HEADER.unpack(self.readFile.read(_RECORD_HEADER.size))
+            self.readFile.seek(length, os.SEEK_CUR)
+        self.readFileOffset = self.readOffset
+
+    def _closeReadFile(self):
+        if self.readFile :
+            self.readFile.close()
+        self.readFile = None
+        self.readFileOffset = None
+
+    #=== acknowledged offset
+
+    def _loadAckedOffset(self):
+        try :
+            with open(os.path.join(self.path, self.OFFSET_FILE), 'rb') as f :
+                (ackedOffset, crc) = _OFFSET_RECORD.unpack(f.read(_OFFSET_RECORD.size))
+        except (IOError, struct.error) :
+            return 0
+        if zlib.crc32(struct.pack('!Q', ackedOffset)) & 0xffffffff != crc :
+            log.error("corrupted {0}, replaying the whole log".format(self.OFFSET_FILE))
+            return 0
+        return ackedOffset
+
+    def _saveAckedOffset(self, ackedOffset):
+        '''
+        \brief Write the acknowledged offset to a temporary file, and rename
+               it, so that the offset file is never partially written.
+        '''
+        filePath = os.path.join(self.path, self.OFFSET_FILE)
+        with open(filePath + '.tmp', 'wb') as f :
+            f.write(_OFFSET_RECORD.pack(ackedOffset, zlib.crc32(struct.pack('!Q', ackedOffset)) & 0xffffffff))
+            f.flush()
+            os.fsync(f.fileno())
+        os.rename(filePath + '.tmp', filePath)
+        self.savedAckedOffset = ackedOffset
+
+    #=== syncer thread
+
+    def _syncLoop(self):
+        try :
+            while True :
+                with self.lock :
+                    if self.numUnsynced < self.syncCount and not self.isClosed :
+                        self.syncWakeup.wait(self.syncInterval)
+                    if self.isClosed :
+                        return
+                self.sync()
+        except Exception as err :
+            output  = []
+            output += ['===== crash in thread {0} ====='.format(self.syncThread.name)]
+            output += ['\nerror:\n']
+            output += [str(err)]
+            output += ['\ncall stack:\n']
+            output += [traceback.format_exc()]
+            output  = '\n'.join(output)
+            print output # critical error
+            log.critical(output)
+            raise
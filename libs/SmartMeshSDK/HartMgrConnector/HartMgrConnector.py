@@ -2,8 +2,8 @@
 This module was generated automatically. Do not edit directly.
 '''
 
-import collections
 from   SmartMeshSDK import ApiException
+from   SmartMeshSDK.utils import LazyNamedTuple
 from   HartMgrConnectorInternal import HartMgrConnectorInternal
 
 ##
@@ -24,7 +24,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>result</tt>: 32-byte field formatted as a string.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_activateAdvertising = collections.namedtuple("Tuple_dn_activateAdvertising", ['result'])
+    Tuple_dn_activateAdvertising = LazyNamedTuple.namedtuple("Tuple_dn_activateAdvertising", ['result'])
 
     ##
     # Activate advertisement frame
@@ -46,7 +46,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>result</tt>: 32-byte field formatted as a string.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_activateFastPipe = collections.namedtuple("Tuple_dn_activateFastPipe", ['result'])
+    Tuple_dn_activateFastPipe = LazyNamedTuple.namedtuple("Tuple_dn_activateFastPipe", ['result'])
 
     ##
     # Activate the fast network pipe to the specified mote.
@@ -71,7 +71,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>result</tt>: 32-byte field formatted as a string.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_cancelOtap = collections.namedtuple("Tuple_dn_cancelOtap", ['result'])
+    Tuple_dn_cancelOtap = LazyNamedTuple.namedtuple("Tuple_dn_cancelOtap", ['result'])
 
     ##
     # This command cancels the OTAP (Over-The-Air-Programming) process to upgrade software on motes and the access point.
@@ -90,7 +90,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>result</tt>: 32-byte field formatted as a string.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_cli = collections.namedtuple("Tuple_dn_cli", ['result'])
+    Tuple_dn_cli = LazyNamedTuple.namedtuple("Tuple_dn_cli", ['result'])
 
     ##
     # This command tunnels a given command through to the manager's Command Line Interface (CLI). The CLI command can be called by only one XML API client at a time. The response to the given CLI command is tunneled back to the client via the notifications channel. To receive the CLI notification, the client must be subscribed to CLI notifications (see Notification Channel)
@@ -110,7 +110,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>result</tt>: 32-byte field formatted as a string.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_deactivateFastPipe = collections.namedtuple("Tuple_dn_deactivateFastPipe", ['result'])
+    Tuple_dn_deactivateFastPipe = LazyNamedTuple.namedtuple("Tuple_dn_deactivateFastPipe", ['result'])
 
     ##
     # Deactivate the fast network pipe to the specified mote.
@@ -166,7 +166,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>callbackId</tt>: 4-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_exchangeJoinKey = collections.namedtuple("Tuple_dn_exchangeJoinKey", ['callbackId'])
+    Tuple_dn_exchangeJoinKey = LazyNamedTuple.namedtuple("Tuple_dn_exchangeJoinKey", ['callbackId'])
 
     ##
     # Exchange the common join key
@@ -186,7 +186,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>callbackId</tt>: 4-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_exchangeMoteJoinKey = collections.namedtuple("Tuple_dn_exchangeMoteJoinKey", ['callbackId'])
+    Tuple_dn_exchangeMoteJoinKey = LazyNamedTuple.namedtuple("Tuple_dn_exchangeMoteJoinKey", ['callbackId'])
 
     ##
     # Exchange a mote's join key
@@ -208,7 +208,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>callbackId</tt>: 4-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_exchangeMoteNetworkId = collections.namedtuple("Tuple_dn_exchangeMoteNetworkId", ['callbackId'])
+    Tuple_dn_exchangeMoteNetworkId = LazyNamedTuple.namedtuple("Tuple_dn_exchangeMoteNetworkId", ['callbackId'])
 
     ##
     # Exchange the network ID for a mote
@@ -230,7 +230,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>callbackId</tt>: 4-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_exchangeNetworkKey = collections.namedtuple("Tuple_dn_exchangeNetworkKey", ['callbackId'])
+    Tuple_dn_exchangeNetworkKey = LazyNamedTuple.namedtuple("Tuple_dn_exchangeNetworkKey", ['callbackId'])
 
     ##
     # Exchange the network key
@@ -249,7 +249,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>callbackId</tt>: 4-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_exchangeNetworkId = collections.namedtuple("Tuple_dn_exchangeNetworkId", ['callbackId'])
+    Tuple_dn_exchangeNetworkId = LazyNamedTuple.namedtuple("Tuple_dn_exchangeNetworkId", ['callbackId'])
 
     ##
     # Exchange the network ID
@@ -269,7 +269,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>callbackId</tt>: 4-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_exchangeSessionKey = collections.namedtuple("Tuple_dn_exchangeSessionKey", ['callbackId'])
+    Tuple_dn_exchangeSessionKey = LazyNamedTuple.namedtuple("Tuple_dn_exchangeSessionKey", ['callbackId'])
 
     ##
     # Exchange a mote's session key
@@ -291,7 +291,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>result</tt>: 32-byte field formatted as a string.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_decommissionDevice = collections.namedtuple("Tuple_dn_decommissionDevice", ['result'])
+    Tuple_dn_decommissionDevice = LazyNamedTuple.namedtuple("Tuple_dn_decommissionDevice", ['result'])
 
     ##
     # Decommission a device in the network
@@ -311,7 +311,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>macAddr</tt>: 25-byte field formatted as a string.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getAcl = collections.namedtuple("Tuple_dn_getAcl", ['macAddr'])
+    Tuple_dn_getAcl = LazyNamedTuple.namedtuple("Tuple_dn_getAcl", ['macAddr'])
 
     ##
     # Check whether a device is part of the ACL
@@ -331,7 +331,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>macAddr</tt>: 25-byte field formatted as a string.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getAcls = collections.namedtuple("Tuple_dn_getAcls", ['macAddr'])
+    Tuple_dn_getAcls = LazyNamedTuple.namedtuple("Tuple_dn_getAcls", ['macAddr'])
 
     ##
     # Get the list of devices on the ACL
@@ -353,7 +353,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>frequency</tt>: 4-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getBlacklist = collections.namedtuple("Tuple_dn_getBlacklist", ['frequency'])
+    Tuple_dn_getBlacklist = LazyNamedTuple.namedtuple("Tuple_dn_getBlacklist", ['frequency'])
 
     ##
     # Get the channel blacklist. The output is a list of the blacklisted frequency values.
@@ -440,7 +440,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #      - supported: supported
     #      - not supported: not supported
     # 
-    Tuple_dn_getMote = collections.namedtuple("Tuple_dn_getMote", ['moteId', 'macAddr', 'name', 'state', 'numJoins', 'joinTime', 'reason', 'isAccessPoint', 'powerSource', 'dischargeCurrent', 'dischargeTime', 'recoveryTime', 'enableRouting', 'productName', 'hwModel', 'hwRev', 'swRev', 'voltage', 'numNeighbors', 'needNeighbor', 'goodNeighbors', 'allocatedPkPeriod', 'allocatedPipePkPeriod', 'pipeStatus', 'advertisingStatus', 'locationTag'])
+    Tuple_dn_getMote = LazyNamedTuple.namedtuple("Tuple_dn_getMote", ['moteId', 'macAddr', 'name', 'state', 'numJoins', 'joinTime', 'reason', 'isAccessPoint', 'powerSource', 'dischargeCurrent', 'dischargeTime', 'recoveryTime', 'enableRouting', 'productName', 'hwModel', 'hwRev', 'swRev', 'voltage', 'numNeighbors', 'needNeighbor', 'goodNeighbors', 'allocatedPkPeriod', 'allocatedPipePkPeriod', 'pipeStatus', 'advertisingStatus', 'locationTag'])
 
     ##
     # 
@@ -525,7 +525,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #      - supported: supported
     #      - not supported: not supported
     # 
-    Tuple_dn_setMote = collections.namedtuple("Tuple_dn_setMote", ['moteId', 'macAddr', 'name', 'state', 'numJoins', 'joinTime', 'reason', 'isAccessPoint', 'powerSource', 'dischargeCurrent', 'dischargeTime', 'recoveryTime', 'enableRouting', 'productName', 'hwModel', 'hwRev', 'swRev', 'voltage', 'numNeighbors', 'needNeighbor', 'goodNeighbors', 'allocatedPkPeriod', 'allocatedPipePkPeriod', 'pipeStatus', 'advertisingStatus', 'locationTag'])
+    Tuple_dn_setMote = LazyNamedTuple.namedtuple("Tuple_dn_setMote", ['moteId', 'macAddr', 'name', 'state', 'numJoins', 'joinTime', 'reason', 'isAccessPoint', 'powerSource', 'dischargeCurrent', 'dischargeTime', 'recoveryTime', 'enableRouting', 'productName', 'hwModel', 'hwRev', 'swRev', 'voltage', 'numNeighbors', 'needNeighbor', 'goodNeighbors', 'allocatedPkPeriod', 'allocatedPipePkPeriod', 'pipeStatus', 'advertisingStatus', 'locationTag'])
 
     ##
     # Set mote configuration
@@ -614,7 +614,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #      - supported: supported
     #      - not supported: not supported
     # 
-    Tuple_dn_getMotes = collections.namedtuple("Tuple_dn_getMotes", ['moteId', 'macAddr', 'name', 'state', 'numJoins', 'joinTime', 'reason', 'isAccessPoint', 'powerSource', 'dischargeCurrent', 'dischargeTime', 'recoveryTime', 'enableRouting', 'productName', 'hwModel', 'hwRev', 'swRev', 'voltage', 'numNeighbors', 'needNeighbor', 'goodNeighbors', 'allocatedPkPeriod', 'allocatedPipePkPeriod', 'pipeStatus', 'advertisingStatus', 'locationTag'])
+    Tuple_dn_getMotes = LazyNamedTuple.namedtuple("Tuple_dn_getMotes", ['moteId', 'macAddr', 'name', 'state', 'numJoins', 'joinTime', 'reason', 'isAccessPoint', 'powerSource', 'dischargeCurrent', 'dischargeTime', 'recoveryTime', 'enableRouting', 'productName', 'hwModel', 'hwRev', 'swRev', 'voltage', 'numNeighbors', 'needNeighbor', 'goodNeighbors', 'allocatedPkPeriod', 'allocatedPipePkPeriod', 'pipeStatus', 'advertisingStatus', 'locationTag'])
 
     ##
     # Get the list of Motes
@@ -654,7 +654,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>latencyToMote</tt>: 4-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getMoteStatistics = collections.namedtuple("Tuple_dn_getMoteStatistics", ['index', 'startTime', 'avgLatency', 'reliability', 'numJoins', 'voltage', 'chargeConsumption', 'temperature', 'numLostPackets', 'latencyToMote'])
+    Tuple_dn_getMoteStatistics = LazyNamedTuple.namedtuple("Tuple_dn_getMoteStatistics", ['index', 'startTime', 'avgLatency', 'reliability', 'numJoins', 'voltage', 'chargeConsumption', 'temperature', 'numLostPackets', 'latencyToMote'])
 
     ##
     # Get the Mote Statistics
@@ -723,7 +723,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>backboneSize</tt>: 4-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getNetwork = collections.namedtuple("Tuple_dn_getNetwork", ['netName', 'networkId', 'maxMotes', 'numMotes', 'optimizationEnable', 'accessPointPA', 'ccaEnabled', 'requestedBasePkPeriod', 'minServicesPkPeriod', 'minPipePkPeriod', 'bandwidthProfile', 'manualUSFrameSize', 'manualDSFrameSize', 'manualAdvFrameSize', 'netQueueSize', 'userQueueSize', 'locationMode', 'backboneEnabled', 'backboneSize'])
+    Tuple_dn_getNetwork = LazyNamedTuple.namedtuple("Tuple_dn_getNetwork", ['netName', 'networkId', 'maxMotes', 'numMotes', 'optimizationEnable', 'accessPointPA', 'ccaEnabled', 'requestedBasePkPeriod', 'minServicesPkPeriod', 'minPipePkPeriod', 'bandwidthProfile', 'manualUSFrameSize', 'manualDSFrameSize', 'manualAdvFrameSize', 'netQueueSize', 'userQueueSize', 'locationMode', 'backboneEnabled', 'backboneSize'])
 
     ##
     # Retrieves network configuration parameters
@@ -752,7 +752,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>lostUpstreamPackets</tt>: 4-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getNetworkStatistics = collections.namedtuple("Tuple_dn_getNetworkStatistics", ['index', 'startTime', 'netLatency', 'netReliability', 'netPathStability', 'lostUpstreamPackets'])
+    Tuple_dn_getNetworkStatistics = LazyNamedTuple.namedtuple("Tuple_dn_getNetworkStatistics", ['index', 'startTime', 'netLatency', 'netReliability', 'netPathStability', 'lostUpstreamPackets'])
 
     ##
     # Get the Network Statistics
@@ -790,7 +790,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>macAddr</tt>: 25-byte field formatted as a string.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getOpenAlarms = collections.namedtuple("Tuple_dn_getOpenAlarms", ['timeStamp', 'eventId', 'alarmType', 'macAddr'])
+    Tuple_dn_getOpenAlarms = LazyNamedTuple.namedtuple("Tuple_dn_getOpenAlarms", ['timeStamp', 'eventId', 'alarmType', 'macAddr'])
 
     ##
     # Retrieves a list of the open alarms on the Manager
@@ -826,7 +826,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>pathQuality</tt>: 0-byte field formatted as a float.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getPaths = collections.namedtuple("Tuple_dn_getPaths", ['pathId', 'moteAMac', 'moteBMac', 'numLinks', 'pathDirection', 'pathQuality'])
+    Tuple_dn_getPaths = LazyNamedTuple.namedtuple("Tuple_dn_getPaths", ['pathId', 'moteAMac', 'moteBMac', 'numLinks', 'pathDirection', 'pathQuality'])
 
     ##
     # Get the list of Paths to the mote's neighbors
@@ -857,7 +857,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>stability</tt>: 8-byte field formatted as a float.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getPathStatistics = collections.namedtuple("Tuple_dn_getPathStatistics", ['index', 'startTime', 'baPwr', 'abPwr', 'stability'])
+    Tuple_dn_getPathStatistics = LazyNamedTuple.namedtuple("Tuple_dn_getPathStatistics", ['index', 'startTime', 'baPwr', 'abPwr', 'stability'])
 
     ##
     # Get Statistics for a specific Path
@@ -898,7 +898,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>peerControllerSwRev</tt>: 16-byte field formatted as a string.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getRedundancy = collections.namedtuple("Tuple_dn_getRedundancy", ['localMode', 'peerStatus', 'peerControllerSwRev'])
+    Tuple_dn_getRedundancy = LazyNamedTuple.namedtuple("Tuple_dn_getRedundancy", ['localMode', 'peerStatus', 'peerControllerSwRev'])
 
     ##
     # Get the redundancy state
@@ -921,7 +921,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>acceptHARTDevicesOnly</tt>: 1-byte field formatted as a bool.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getSecurity = collections.namedtuple("Tuple_dn_getSecurity", ['securityMode', 'acceptHARTDevicesOnly'])
+    Tuple_dn_getSecurity = LazyNamedTuple.namedtuple("Tuple_dn_getSecurity", ['securityMode', 'acceptHARTDevicesOnly'])
 
     ##
     # Get the Security configuration
@@ -946,7 +946,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>apRdntCoverageThreshold</tt>: 8-byte field formatted as a float.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getSla = collections.namedtuple("Tuple_dn_getSla", ['minNetReliability', 'maxNetLatency', 'minNetPathStability', 'apRdntCoverageThreshold'])
+    Tuple_dn_getSla = LazyNamedTuple.namedtuple("Tuple_dn_getSla", ['minNetReliability', 'maxNetLatency', 'minNetPathStability', 'apRdntCoverageThreshold'])
 
     ##
     # Get the Service Level Agreement (SLA) configuration
@@ -983,7 +983,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>controllerSwRev</tt>: 32-byte field formatted as a string.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getSystem = collections.namedtuple("Tuple_dn_getSystem", ['systemName', 'location', 'swRev', 'hwModel', 'hwRev', 'serialNumber', 'time', 'startTime', 'cliTimeout', 'controllerSwRev'])
+    Tuple_dn_getSystem = LazyNamedTuple.namedtuple("Tuple_dn_getSystem", ['systemName', 'location', 'swRev', 'hwModel', 'hwRev', 'serialNumber', 'time', 'startTime', 'cliTimeout', 'controllerSwRev'])
 
     ##
     # Retrieves system-level information
@@ -1007,7 +1007,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #      - user: user
     #      - superuser: superuser
     # 
-    Tuple_dn_getUser = collections.namedtuple("Tuple_dn_getUser", ['userName', 'privilege'])
+    Tuple_dn_getUser = LazyNamedTuple.namedtuple("Tuple_dn_getUser", ['userName', 'privilege'])
 
     ##
     # Get the description of a user 
@@ -1032,7 +1032,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #      - user: user
     #      - superuser: superuser
     # 
-    Tuple_dn_getUsers = collections.namedtuple("Tuple_dn_getUsers", ['userName', 'privilege'])
+    Tuple_dn_getUsers = LazyNamedTuple.namedtuple("Tuple_dn_getUsers", ['userName', 'privilege'])
 
     ##
     # Get the list of users
@@ -1058,7 +1058,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>secondaryPath</tt>: 16-byte field formatted as a list.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getSourceRoute = collections.namedtuple("Tuple_dn_getSourceRoute", ['destMacAddr', 'primaryPath', 'secondaryPath'])
+    Tuple_dn_getSourceRoute = LazyNamedTuple.namedtuple("Tuple_dn_getSourceRoute", ['destMacAddr', 'primaryPath', 'secondaryPath'])
 
     ##
     # Get the Source Route for a specific Mote
@@ -1080,7 +1080,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>upstream</tt>: 4-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getLatency = collections.namedtuple("Tuple_dn_getLatency", ['downstream', 'upstream'])
+    Tuple_dn_getLatency = LazyNamedTuple.namedtuple("Tuple_dn_getLatency", ['downstream', 'upstream'])
 
     ##
     # Get estimated latency for a mote.
@@ -1100,7 +1100,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>license</tt>: 40-byte field formatted as a string.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getLicense = collections.namedtuple("Tuple_dn_getLicense", ['license'])
+    Tuple_dn_getLicense = LazyNamedTuple.namedtuple("Tuple_dn_getLicense", ['license'])
 
     ##
     # Get the software license key.
@@ -1121,7 +1121,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>asn_time</tt>: 8-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getTime = collections.namedtuple("Tuple_dn_getTime", ['utc_time', 'asn_time'])
+    Tuple_dn_getTime = LazyNamedTuple.namedtuple("Tuple_dn_getTime", ['utc_time', 'asn_time'])
 
     ##
     # Get the current time.
@@ -1140,7 +1140,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>callbackId</tt>: 4-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_pingMote = collections.namedtuple("Tuple_dn_pingMote", ['callbackId'])
+    Tuple_dn_pingMote = LazyNamedTuple.namedtuple("Tuple_dn_pingMote", ['callbackId'])
 
     ##
     # Ping the specified mote. A Net Ping Reply event notification will contain the mote's response.
@@ -1160,7 +1160,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>result</tt>: 32-byte field formatted as a string.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_promoteToOperational = collections.namedtuple("Tuple_dn_promoteToOperational", ['result'])
+    Tuple_dn_promoteToOperational = LazyNamedTuple.namedtuple("Tuple_dn_promoteToOperational", ['result'])
 
     ##
     # Promote a quarantined device to operational
@@ -1180,7 +1180,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>result</tt>: 32-byte field formatted as a string.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_reset = collections.namedtuple("Tuple_dn_reset", ['result'])
+    Tuple_dn_reset = LazyNamedTuple.namedtuple("Tuple_dn_reset", ['result'])
 
     ##
     # Reset the system or network
@@ -1204,7 +1204,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>result</tt>: 32-byte field formatted as a string.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_resetWithId = collections.namedtuple("Tuple_dn_resetWithId", ['result'])
+    Tuple_dn_resetWithId = LazyNamedTuple.namedtuple("Tuple_dn_resetWithId", ['result'])
 
     ##
     # Reset mote by ID
@@ -1227,7 +1227,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>result</tt>: 32-byte field formatted as a string.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_resetWithMac = collections.namedtuple("Tuple_dn_resetWithMac", ['result'])
+    Tuple_dn_resetWithMac = LazyNamedTuple.namedtuple("Tuple_dn_resetWithMac", ['result'])
 
     ##
     # Reset mote by MAC address
@@ -1250,7 +1250,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>callbackId</tt>: 4-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_sendRequest = collections.namedtuple("Tuple_dn_sendRequest", ['callbackId'])
+    Tuple_dn_sendRequest = LazyNamedTuple.namedtuple("Tuple_dn_sendRequest", ['callbackId'])
 
     ##
     # Send downstream (request) data
@@ -1281,7 +1281,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>callbackId</tt>: 4-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_sendResponse = collections.namedtuple("Tuple_dn_sendResponse", ['callbackId'])
+    Tuple_dn_sendResponse = LazyNamedTuple.namedtuple("Tuple_dn_sendResponse", ['callbackId'])
 
     ##
     # Send downstream data as a response. sendResponse should only be used in special cases.
@@ -1314,7 +1314,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>macAddr</tt>: 25-byte field formatted as a string.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_setAcl = collections.namedtuple("Tuple_dn_setAcl", ['macAddr'])
+    Tuple_dn_setAcl = LazyNamedTuple.namedtuple("Tuple_dn_setAcl", ['macAddr'])
 
     ##
     # Add or update a device in the ACL
@@ -1336,7 +1336,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>frequency</tt>: 4-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_setBlacklist = collections.namedtuple("Tuple_dn_setBlacklist", ['frequency'])
+    Tuple_dn_setBlacklist = LazyNamedTuple.namedtuple("Tuple_dn_setBlacklist", ['frequency'])
 
     ##
     # Update the channel blacklist. The input is a list of blacklisted frequency values separated by spaces.
@@ -1394,7 +1394,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>backboneSize</tt>: 4-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_setNetwork = collections.namedtuple("Tuple_dn_setNetwork", ['netName', 'networkId', 'maxMotes', 'optimizationEnable', 'accessPointPA', 'ccaEnabled', 'requestedBasePkPeriod', 'minServicesPkPeriod', 'minPipePkPeriod', 'bandwidthProfile', 'manualUSFrameSize', 'manualDSFrameSize', 'manualAdvFrameSize', 'locationMode', 'backboneEnabled', 'backboneSize'])
+    Tuple_dn_setNetwork = LazyNamedTuple.namedtuple("Tuple_dn_setNetwork", ['netName', 'networkId', 'maxMotes', 'optimizationEnable', 'accessPointPA', 'ccaEnabled', 'requestedBasePkPeriod', 'minServicesPkPeriod', 'minPipePkPeriod', 'bandwidthProfile', 'manualUSFrameSize', 'manualDSFrameSize', 'manualAdvFrameSize', 'locationMode', 'backboneEnabled', 'backboneSize'])
 
     ##
     # Set network configuration
@@ -1449,7 +1449,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>acceptHARTDevicesOnly</tt>: 1-byte field formatted as a bool.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_setSecurity = collections.namedtuple("Tuple_dn_setSecurity", ['securityMode', 'acceptHARTDevicesOnly'])
+    Tuple_dn_setSecurity = LazyNamedTuple.namedtuple("Tuple_dn_setSecurity", ['securityMode', 'acceptHARTDevicesOnly'])
 
     ##
     # Set security configuration
@@ -1481,7 +1481,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>apRdntCoverageThreshold</tt>: 8-byte field formatted as a float.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_setSla = collections.namedtuple("Tuple_dn_setSla", ['minNetReliability', 'maxNetLatency', 'minNetPathStability', 'apRdntCoverageThreshold'])
+    Tuple_dn_setSla = LazyNamedTuple.namedtuple("Tuple_dn_setSla", ['minNetReliability', 'maxNetLatency', 'minNetPathStability', 'apRdntCoverageThreshold'])
 
     ##
     # Set SLA configuration
@@ -1511,7 +1511,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>cliTimeout</tt>: 4-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_setSystem = collections.namedtuple("Tuple_dn_setSystem", ['systemName', 'location', 'cliTimeout'])
+    Tuple_dn_setSystem = LazyNamedTuple.namedtuple("Tuple_dn_setSystem", ['systemName', 'location', 'cliTimeout'])
 
     ##
     # Set system-level configuration
@@ -1540,7 +1540,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #      - user: user
     #      - superuser: superuser
     # 
-    Tuple_dn_setUser = collections.namedtuple("Tuple_dn_setUser", ['userName', 'privilege'])
+    Tuple_dn_setUser = LazyNamedTuple.namedtuple("Tuple_dn_setUser", ['userName', 'privilege'])
 
     ##
     # Add or update user configuration
@@ -1567,7 +1567,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>result</tt>: 32-byte field formatted as a string.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_setLicense = collections.namedtuple("Tuple_dn_setLicense", ['result'])
+    Tuple_dn_setLicense = LazyNamedTuple.namedtuple("Tuple_dn_setLicense", ['result'])
 
     ##
     # Set the software license key.
@@ -1587,7 +1587,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>result</tt>: 32-byte field formatted as a string.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_startOtap = collections.namedtuple("Tuple_dn_startOtap", ['result'])
+    Tuple_dn_startOtap = LazyNamedTuple.namedtuple("Tuple_dn_startOtap", ['result'])
 
     ##
     # This command initiates the OTAP (Over-The-Air-Programming) process to upgrade software on motes and the Access Point. By default, the process will retry the OTAP file transmission 100 times.
@@ -1606,7 +1606,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>result</tt>: 32-byte field formatted as a string.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_startOtapWithRetries = collections.namedtuple("Tuple_dn_startOtapWithRetries", ['result'])
+    Tuple_dn_startOtapWithRetries = LazyNamedTuple.namedtuple("Tuple_dn_startOtapWithRetries", ['result'])
 
     ##
     # This command initiates the OTAP (Over-The-Air-Programming) process to upgrade software for motes and the Access Point, using the specified number of retries.
@@ -1626,7 +1626,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>notif_token</tt>: 32-byte field formatted as a string.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_subscribe = collections.namedtuple("Tuple_dn_subscribe", ['notif_token'])
+    Tuple_dn_subscribe = LazyNamedTuple.namedtuple("Tuple_dn_subscribe", ['notif_token'])
 
     ##
     # Subscribe to notifications. This function adds or updates the subscribed notifications to match 'filter'. The filter is a space-separated list of notification types. Valid types include 'data' and 'events'.
@@ -1646,7 +1646,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     # - <tt>result</tt>: 32-byte field formatted as a string.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_unsubscribe = collections.namedtuple("Tuple_dn_unsubscribe", ['result'])
+    Tuple_dn_unsubscribe = LazyNamedTuple.namedtuple("Tuple_dn_unsubscribe", ['result'])
 
     ##
     # Unsubscribe from notifications. This function clears the existing notification subscription of the client and stops the notification thread. 
@@ -1664,7 +1664,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     ##
     # Dictionary of all notification tuples.
     #
-    notifTupleTable = {}
+    notifTupleTable = LazyNamedTuple.TupleTable()
     
     ##
     # \brief USERCONNECT notification.
@@ -1687,7 +1687,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     USERCONNECT = "UserConnect"
-    notifTupleTable[USERCONNECT] = Tuple_UserConnect = collections.namedtuple("Tuple_UserConnect", ['timeStamp', 'eventId', 'channel', 'ipAddr', 'userName'])
+    notifTupleTable[USERCONNECT] = Tuple_UserConnect = LazyNamedTuple.namedtuple("Tuple_UserConnect", ['timeStamp', 'eventId', 'channel', 'ipAddr', 'userName'])
 
     ##
     # \brief USERDISCONNECT notification.
@@ -1710,7 +1710,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     USERDISCONNECT = "UserDisconnect"
-    notifTupleTable[USERDISCONNECT] = Tuple_UserDisconnect = collections.namedtuple("Tuple_UserDisconnect", ['timeStamp', 'eventId', 'channel', 'ipAddr', 'userName'])
+    notifTupleTable[USERDISCONNECT] = Tuple_UserDisconnect = LazyNamedTuple.namedtuple("Tuple_UserDisconnect", ['timeStamp', 'eventId', 'channel', 'ipAddr', 'userName'])
 
     ##
     # \brief MANUALMOTERESET notification.
@@ -1730,7 +1730,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     MANUALMOTERESET = "ManualMoteReset"
-    notifTupleTable[MANUALMOTERESET] = Tuple_ManualMoteReset = collections.namedtuple("Tuple_ManualMoteReset", ['timeStamp', 'eventId', 'userName', 'moteId', 'macAddr'])
+    notifTupleTable[MANUALMOTERESET] = Tuple_ManualMoteReset = LazyNamedTuple.namedtuple("Tuple_ManualMoteReset", ['timeStamp', 'eventId', 'userName', 'moteId', 'macAddr'])
 
     ##
     # \brief MANUALMOTEDELETE notification.
@@ -1750,7 +1750,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     MANUALMOTEDELETE = "ManualMoteDelete"
-    notifTupleTable[MANUALMOTEDELETE] = Tuple_ManualMoteDelete = collections.namedtuple("Tuple_ManualMoteDelete", ['timeStamp', 'eventId', 'userName', 'moteId', 'macAddr'])
+    notifTupleTable[MANUALMOTEDELETE] = Tuple_ManualMoteDelete = LazyNamedTuple.namedtuple("Tuple_ManualMoteDelete", ['timeStamp', 'eventId', 'userName', 'moteId', 'macAddr'])
 
     ##
     # \brief MANUALMOTEDECOMMISSION notification.
@@ -1770,7 +1770,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     MANUALMOTEDECOMMISSION = "ManualMoteDecommission"
-    notifTupleTable[MANUALMOTEDECOMMISSION] = Tuple_ManualMoteDecommission = collections.namedtuple("Tuple_ManualMoteDecommission", ['timeStamp', 'eventId', 'userName', 'moteId', 'macAddr'])
+    notifTupleTable[MANUALMOTEDECOMMISSION] = Tuple_ManualMoteDecommission = LazyNamedTuple.namedtuple("Tuple_ManualMoteDecommission", ['timeStamp', 'eventId', 'userName', 'moteId', 'macAddr'])
 
     ##
     # \brief MANUALNETRESET notification.
@@ -1786,7 +1786,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     MANUALNETRESET = "ManualNetReset"
-    notifTupleTable[MANUALNETRESET] = Tuple_ManualNetReset = collections.namedtuple("Tuple_ManualNetReset", ['timeStamp', 'eventId', 'userName'])
+    notifTupleTable[MANUALNETRESET] = Tuple_ManualNetReset = LazyNamedTuple.namedtuple("Tuple_ManualNetReset", ['timeStamp', 'eventId', 'userName'])
 
     ##
     # \brief MANUALDCCRESET notification.
@@ -1802,7 +1802,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     MANUALDCCRESET = "ManualDccReset"
-    notifTupleTable[MANUALDCCRESET] = Tuple_ManualDccReset = collections.namedtuple("Tuple_ManualDccReset", ['timeStamp', 'eventId', 'userName'])
+    notifTupleTable[MANUALDCCRESET] = Tuple_ManualDccReset = LazyNamedTuple.namedtuple("Tuple_ManualDccReset", ['timeStamp', 'eventId', 'userName'])
 
     ##
     # \brief MANUALSTATRESET notification.
@@ -1818,7 +1818,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     MANUALSTATRESET = "ManualStatReset"
-    notifTupleTable[MANUALSTATRESET] = Tuple_ManualStatReset = collections.namedtuple("Tuple_ManualStatReset", ['timeStamp', 'eventId', 'userName'])
+    notifTupleTable[MANUALSTATRESET] = Tuple_ManualStatReset = LazyNamedTuple.namedtuple("Tuple_ManualStatReset", ['timeStamp', 'eventId', 'userName'])
 
     ##
     # \brief CONFIGCHANGE notification.
@@ -1838,7 +1838,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     CONFIGCHANGE = "ConfigChange"
-    notifTupleTable[CONFIGCHANGE] = Tuple_ConfigChange = collections.namedtuple("Tuple_ConfigChange", ['timeStamp', 'eventId', 'userName', 'objectType', 'objectId'])
+    notifTupleTable[CONFIGCHANGE] = Tuple_ConfigChange = LazyNamedTuple.namedtuple("Tuple_ConfigChange", ['timeStamp', 'eventId', 'userName', 'objectType', 'objectId'])
 
     ##
     # \brief BOOTUP notification.
@@ -1852,7 +1852,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     BOOTUP = "BootUp"
-    notifTupleTable[BOOTUP] = Tuple_BootUp = collections.namedtuple("Tuple_BootUp", ['timeStamp', 'eventId'])
+    notifTupleTable[BOOTUP] = Tuple_BootUp = LazyNamedTuple.namedtuple("Tuple_BootUp", ['timeStamp', 'eventId'])
 
     ##
     # \brief NETWORKRESET notification.
@@ -1866,7 +1866,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     NETWORKRESET = "NetworkReset"
-    notifTupleTable[NETWORKRESET] = Tuple_NetworkReset = collections.namedtuple("Tuple_NetworkReset", ['timeStamp', 'eventId'])
+    notifTupleTable[NETWORKRESET] = Tuple_NetworkReset = LazyNamedTuple.namedtuple("Tuple_NetworkReset", ['timeStamp', 'eventId'])
 
     ##
     # \brief COMMANDFINISHED notification.
@@ -1888,7 +1888,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     COMMANDFINISHED = "CommandFinished"
-    notifTupleTable[COMMANDFINISHED] = Tuple_CommandFinished = collections.namedtuple("Tuple_CommandFinished", ['timeStamp', 'eventId', 'callbackId', 'objectType', 'macAddr', 'resultCode'])
+    notifTupleTable[COMMANDFINISHED] = Tuple_CommandFinished = LazyNamedTuple.namedtuple("Tuple_CommandFinished", ['timeStamp', 'eventId', 'callbackId', 'objectType', 'macAddr', 'resultCode'])
 
     ##
     # \brief PACKETSENT notification.
@@ -1906,7 +1906,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     PACKETSENT = "PacketSent"
-    notifTupleTable[PACKETSENT] = Tuple_PacketSent = collections.namedtuple("Tuple_PacketSent", ['timeStamp', 'eventId', 'callbackId', 'macAddr'])
+    notifTupleTable[PACKETSENT] = Tuple_PacketSent = LazyNamedTuple.namedtuple("Tuple_PacketSent", ['timeStamp', 'eventId', 'callbackId', 'macAddr'])
 
     ##
     # \brief MOTEJOIN notification.
@@ -1928,7 +1928,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     MOTEJOIN = "MoteJoin"
-    notifTupleTable[MOTEJOIN] = Tuple_MoteJoin = collections.namedtuple("Tuple_MoteJoin", ['timeStamp', 'eventId', 'moteId', 'macAddr', 'reason', 'userData'])
+    notifTupleTable[MOTEJOIN] = Tuple_MoteJoin = LazyNamedTuple.namedtuple("Tuple_MoteJoin", ['timeStamp', 'eventId', 'moteId', 'macAddr', 'reason', 'userData'])
 
     ##
     # \brief MOTELIVE notification.
@@ -1948,7 +1948,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     MOTELIVE = "MoteLive"
-    notifTupleTable[MOTELIVE] = Tuple_MoteLive = collections.namedtuple("Tuple_MoteLive", ['timeStamp', 'eventId', 'moteId', 'macAddr', 'reason'])
+    notifTupleTable[MOTELIVE] = Tuple_MoteLive = LazyNamedTuple.namedtuple("Tuple_MoteLive", ['timeStamp', 'eventId', 'moteId', 'macAddr', 'reason'])
 
     ##
     # \brief MOTEQUARANTINE notification.
@@ -1968,7 +1968,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     MOTEQUARANTINE = "MoteQuarantine"
-    notifTupleTable[MOTEQUARANTINE] = Tuple_MoteQuarantine = collections.namedtuple("Tuple_MoteQuarantine", ['timeStamp', 'eventId', 'moteId', 'macAddr', 'reason'])
+    notifTupleTable[MOTEQUARANTINE] = Tuple_MoteQuarantine = LazyNamedTuple.namedtuple("Tuple_MoteQuarantine", ['timeStamp', 'eventId', 'moteId', 'macAddr', 'reason'])
 
     ##
     # \brief MOTEJOINQUARANTINE notification.
@@ -1990,7 +1990,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     MOTEJOINQUARANTINE = "MoteJoinQuarantine"
-    notifTupleTable[MOTEJOINQUARANTINE] = Tuple_MoteJoinQuarantine = collections.namedtuple("Tuple_MoteJoinQuarantine", ['timeStamp', 'eventId', 'moteId', 'macAddr', 'reason', 'userData'])
+    notifTupleTable[MOTEJOINQUARANTINE] = Tuple_MoteJoinQuarantine = LazyNamedTuple.namedtuple("Tuple_MoteJoinQuarantine", ['timeStamp', 'eventId', 'moteId', 'macAddr', 'reason', 'userData'])
 
     ##
     # \brief MOTEUNKNOWN notification.
@@ -2010,7 +2010,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     MOTEUNKNOWN = "MoteUnknown"
-    notifTupleTable[MOTEUNKNOWN] = Tuple_MoteUnknown = collections.namedtuple("Tuple_MoteUnknown", ['timeStamp', 'eventId', 'moteId', 'macAddr', 'reason'])
+    notifTupleTable[MOTEUNKNOWN] = Tuple_MoteUnknown = LazyNamedTuple.namedtuple("Tuple_MoteUnknown", ['timeStamp', 'eventId', 'moteId', 'macAddr', 'reason'])
 
     ##
     # \brief MOTEDISCONNECT notification.
@@ -2030,7 +2030,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     MOTEDISCONNECT = "MoteDisconnect"
-    notifTupleTable[MOTEDISCONNECT] = Tuple_MoteDisconnect = collections.namedtuple("Tuple_MoteDisconnect", ['timeStamp', 'eventId', 'moteId', 'macAddr', 'reason'])
+    notifTupleTable[MOTEDISCONNECT] = Tuple_MoteDisconnect = LazyNamedTuple.namedtuple("Tuple_MoteDisconnect", ['timeStamp', 'eventId', 'moteId', 'macAddr', 'reason'])
 
     ##
     # \brief MOTEJOINFAILURE notification.
@@ -2048,7 +2048,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     MOTEJOINFAILURE = "MoteJoinFailure"
-    notifTupleTable[MOTEJOINFAILURE] = Tuple_MoteJoinFailure = collections.namedtuple("Tuple_MoteJoinFailure", ['timeStamp', 'eventId', 'macAddr', 'reason'])
+    notifTupleTable[MOTEJOINFAILURE] = Tuple_MoteJoinFailure = LazyNamedTuple.namedtuple("Tuple_MoteJoinFailure", ['timeStamp', 'eventId', 'macAddr', 'reason'])
 
     ##
     # \brief INVALIDMIC notification.
@@ -2064,7 +2064,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     INVALIDMIC = "InvalidMIC"
-    notifTupleTable[INVALIDMIC] = Tuple_InvalidMIC = collections.namedtuple("Tuple_InvalidMIC", ['timeStamp', 'eventId', 'macAddr'])
+    notifTupleTable[INVALIDMIC] = Tuple_InvalidMIC = LazyNamedTuple.namedtuple("Tuple_InvalidMIC", ['timeStamp', 'eventId', 'macAddr'])
 
     ##
     # \brief PATHCREATE notification.
@@ -2084,7 +2084,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     PATHCREATE = "PathCreate"
-    notifTupleTable[PATHCREATE] = Tuple_PathCreate = collections.namedtuple("Tuple_PathCreate", ['timeStamp', 'eventId', 'pathId', 'moteAMac', 'moteBMac'])
+    notifTupleTable[PATHCREATE] = Tuple_PathCreate = LazyNamedTuple.namedtuple("Tuple_PathCreate", ['timeStamp', 'eventId', 'pathId', 'moteAMac', 'moteBMac'])
 
     ##
     # \brief PATHDELETE notification.
@@ -2104,7 +2104,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     PATHDELETE = "PathDelete"
-    notifTupleTable[PATHDELETE] = Tuple_PathDelete = collections.namedtuple("Tuple_PathDelete", ['timeStamp', 'eventId', 'pathId', 'moteAMac', 'moteBMac'])
+    notifTupleTable[PATHDELETE] = Tuple_PathDelete = LazyNamedTuple.namedtuple("Tuple_PathDelete", ['timeStamp', 'eventId', 'pathId', 'moteAMac', 'moteBMac'])
 
     ##
     # \brief PATHACTIVATE notification.
@@ -2124,7 +2124,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     PATHACTIVATE = "PathActivate"
-    notifTupleTable[PATHACTIVATE] = Tuple_PathActivate = collections.namedtuple("Tuple_PathActivate", ['timeStamp', 'eventId', 'pathId', 'moteAMac', 'moteBMac'])
+    notifTupleTable[PATHACTIVATE] = Tuple_PathActivate = LazyNamedTuple.namedtuple("Tuple_PathActivate", ['timeStamp', 'eventId', 'pathId', 'moteAMac', 'moteBMac'])
 
     ##
     # \brief PATHDEACTIVATE notification.
@@ -2144,7 +2144,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     PATHDEACTIVATE = "PathDeactivate"
-    notifTupleTable[PATHDEACTIVATE] = Tuple_PathDeactivate = collections.namedtuple("Tuple_PathDeactivate", ['timeStamp', 'eventId', 'pathId', 'moteAMac', 'moteBMac'])
+    notifTupleTable[PATHDEACTIVATE] = Tuple_PathDeactivate = LazyNamedTuple.namedtuple("Tuple_PathDeactivate", ['timeStamp', 'eventId', 'pathId', 'moteAMac', 'moteBMac'])
 
     ##
     # \brief PATHALERT notification.
@@ -2164,7 +2164,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     PATHALERT = "PathAlert"
-    notifTupleTable[PATHALERT] = Tuple_PathAlert = collections.namedtuple("Tuple_PathAlert", ['timeStamp', 'eventId', 'pathId', 'moteAMac', 'moteBMac'])
+    notifTupleTable[PATHALERT] = Tuple_PathAlert = LazyNamedTuple.namedtuple("Tuple_PathAlert", ['timeStamp', 'eventId', 'pathId', 'moteAMac', 'moteBMac'])
 
     ##
     # \brief PIPEON notification.
@@ -2182,7 +2182,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     PIPEON = "PipeOn"
-    notifTupleTable[PIPEON] = Tuple_PipeOn = collections.namedtuple("Tuple_PipeOn", ['timeStamp', 'eventId', 'macAddr', 'allocatedPipePkPeriod'])
+    notifTupleTable[PIPEON] = Tuple_PipeOn = LazyNamedTuple.namedtuple("Tuple_PipeOn", ['timeStamp', 'eventId', 'macAddr', 'allocatedPipePkPeriod'])
 
     ##
     # \brief PIPEOFF notification.
@@ -2198,7 +2198,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     PIPEOFF = "PipeOff"
-    notifTupleTable[PIPEOFF] = Tuple_PipeOff = collections.namedtuple("Tuple_PipeOff", ['timeStamp', 'eventId', 'macAddr'])
+    notifTupleTable[PIPEOFF] = Tuple_PipeOff = LazyNamedTuple.namedtuple("Tuple_PipeOff", ['timeStamp', 'eventId', 'macAddr'])
 
     ##
     # \brief SERVICEDENIED notification.
@@ -2229,7 +2229,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     SERVICEDENIED = "ServiceDenied"
-    notifTupleTable[SERVICEDENIED] = Tuple_ServiceDenied = collections.namedtuple("Tuple_ServiceDenied", ['timeStamp', 'eventId', 'serviceId', 'requestingMacAddr', 'peerMacAddr', 'appDomain', 'isSource', 'isSink', 'isIntermittent', 'period'])
+    notifTupleTable[SERVICEDENIED] = Tuple_ServiceDenied = LazyNamedTuple.namedtuple("Tuple_ServiceDenied", ['timeStamp', 'eventId', 'serviceId', 'requestingMacAddr', 'peerMacAddr', 'appDomain', 'isSource', 'isSink', 'isIntermittent', 'period'])
 
     ##
     # \brief PINGREPLY notification.
@@ -2255,7 +2255,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     PINGREPLY = "PingReply"
-    notifTupleTable[PINGREPLY] = Tuple_PingReply = collections.namedtuple("Tuple_PingReply", ['timeStamp', 'eventId', 'macAddr', 'callbackId', 'latency', 'temperature', 'voltage', 'hopCount'])
+    notifTupleTable[PINGREPLY] = Tuple_PingReply = LazyNamedTuple.namedtuple("Tuple_PingReply", ['timeStamp', 'eventId', 'macAddr', 'callbackId', 'latency', 'temperature', 'voltage', 'hopCount'])
 
     ##
     # \brief TRANSPORTTIMEOUT notification.
@@ -2277,7 +2277,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     TRANSPORTTIMEOUT = "TransportTimeout"
-    notifTupleTable[TRANSPORTTIMEOUT] = Tuple_TransportTimeout = collections.namedtuple("Tuple_TransportTimeout", ['timeStamp', 'eventId', 'srcMacAddr', 'destMacAddr', 'timeoutType', 'callbackId'])
+    notifTupleTable[TRANSPORTTIMEOUT] = Tuple_TransportTimeout = LazyNamedTuple.namedtuple("Tuple_TransportTimeout", ['timeStamp', 'eventId', 'srcMacAddr', 'destMacAddr', 'timeoutType', 'callbackId'])
 
     ##
     # \brief DATA notification.
@@ -2307,7 +2307,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     DATA = "data"
-    notifTupleTable[DATA] = Tuple_data = collections.namedtuple("Tuple_data", ['moteId', 'macAddr', 'time', 'payload', 'payloadType', 'isReliable', 'isRequest', 'isBroadcast', 'callbackId', 'counter'])
+    notifTupleTable[DATA] = Tuple_data = LazyNamedTuple.namedtuple("Tuple_data", ['moteId', 'macAddr', 'time', 'payload', 'payloadType', 'isReliable', 'isRequest', 'isBroadcast', 'callbackId', 'counter'])
 
     ##
     # \brief LOCATION notification.
@@ -2327,7 +2327,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     LOCATION = "Location"
-    notifTupleTable[LOCATION] = Tuple_Location = collections.namedtuple("Tuple_Location", ['ver', 'asn', 'src', 'dest', 'payload'])
+    notifTupleTable[LOCATION] = Tuple_Location = LazyNamedTuple.namedtuple("Tuple_Location", ['ver', 'asn', 'src', 'dest', 'payload'])
 
     ##
     # \brief CLI notification.
@@ -2341,7 +2341,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     CLI = "cli"
-    notifTupleTable[CLI] = Tuple_cli = collections.namedtuple("Tuple_cli", ['time', 'message'])
+    notifTupleTable[CLI] = Tuple_cli = LazyNamedTuple.namedtuple("Tuple_cli", ['time', 'message'])
 
     ##
     # \brief LOG notification.
@@ -2357,7 +2357,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     LOG = "log"
-    notifTupleTable[LOG] = Tuple_log = collections.namedtuple("Tuple_log", ['time', 'severity', 'message'])
+    notifTupleTable[LOG] = Tuple_log = LazyNamedTuple.namedtuple("Tuple_log", ['time', 'severity', 'message'])
 
     ##
     # \brief STDMOTEREPORT notification.
@@ -2373,7 +2373,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     STDMOTEREPORT = "stdMoteReport"
-    notifTupleTable[STDMOTEREPORT] = Tuple_stdMoteReport = collections.namedtuple("Tuple_stdMoteReport", ['time', 'macAddr', 'payload'])
+    notifTupleTable[STDMOTEREPORT] = Tuple_stdMoteReport = LazyNamedTuple.namedtuple("Tuple_stdMoteReport", ['time', 'macAddr', 'payload'])
 
     ##
     # \brief VENDORMOTEREPORT notification.
@@ -2389,7 +2389,7 @@ class HartMgrConnector(HartMgrConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     VENDORMOTEREPORT = "vendorMoteReport"
-    notifTupleTable[VENDORMOTEREPORT] = Tuple_vendorMoteReport = collections.namedtuple("Tuple_vendorMoteReport", ['time', 'macAddr', 'payload'])
+    notifTupleTable[VENDORMOTEREPORT] = Tuple_vendorMoteReport = LazyNamedTuple.namedtuple("Tuple_vendorMoteReport", ['time', 'macAddr', 'payload'])
 
     ##
     # \brief Get a notification from the notification queue, and returns
@@ -2401,6 +2401,15 @@ class HartMgrConnector(HartMgrConnectorInternal):
         temp = self.getNotificationInternal(timeoutSec)
         if not temp:
             return temp
+        return self._formatNotification(temp)
+
+    ##
+    # \brief Format a notification, as queued, the way getNotification() and
+    #        getNotifications() return it.
+    #
+    # \exception NotificationError if unknown notification.
+    # 
+    def _formatNotification(self, temp) :
         (ids, param) = temp
         try :
             if  HartMgrConnector.notifTupleTable[ids[-1]] :
@@ -2,8 +2,8 @@
 This module was generated automatically. Do not edit directly.
 '''
 
-import collections
 from   SmartMeshSDK import ApiException
+from   SmartMeshSDK.utils import LazyNamedTuple
 from   HartMoteConnectorInternal import HartMoteConnectorInternal
 
 ##
@@ -41,7 +41,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #      - 18: RC_OPEN_FAIL
     #      - 19: RC_ERASE_FAIL
     # 
-    Tuple_dn_setParameter_txPower = collections.namedtuple("Tuple_dn_setParameter_txPower", ['RC'])
+    Tuple_dn_setParameter_txPower = LazyNamedTuple.namedtuple("Tuple_dn_setParameter_txPower", ['RC'])
 
     ##
     # The setParameter<txPower> command sets the mote conducted RF output power. Refer to product datasheets for supported RF output power values. For example, if the mote has a typical RF output power of +8 dBm when the Power Amplifier (PA) is enabled, set the txPower parameter to 8 to enable the PA. Similarly, if the mote has a typical RF output power of -2 dBm when the PA is disabled, then set the txPower parameter to -2 to turn off the PA. Note that this value is the RF output power coming out of the mote and not the radiated power coming out of the antenna. This command may be issued at any time and takes effect upon the next transmission.
@@ -78,7 +78,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #      - 18: RC_OPEN_FAIL
     #      - 19: RC_ERASE_FAIL
     # 
-    Tuple_dn_setParameter_joinDutyCycle = collections.namedtuple("Tuple_dn_setParameter_joinDutyCycle", ['RC'])
+    Tuple_dn_setParameter_joinDutyCycle = LazyNamedTuple.namedtuple("Tuple_dn_setParameter_joinDutyCycle", ['RC'])
 
     ##
     # The setParameter<joinDutyCycle> command allows the microprocessor to control the join duty cycle the ratio of active listen time to doze time (a low-power radio state) during the period when the mote is searching for the network. The default duty cycle enables the mote to join the network at a reasonable rate without using excessive battery power. If you desire a faster join time at the cost of higher power consumption, use the setParameter<joinDutyCycle> command to increase the join duty cycle up to 100%. Note that the setParameter<joinDutyCycle> command is not persistent and stays in effect only until reset. For power consumption information, refer to the mote product datasheet.
@@ -117,7 +117,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #      - 18: RC_OPEN_FAIL
     #      - 19: RC_ERASE_FAIL
     # 
-    Tuple_dn_setParameter_batteryLife = collections.namedtuple("Tuple_dn_setParameter_batteryLife", ['RC'])
+    Tuple_dn_setParameter_batteryLife = LazyNamedTuple.namedtuple("Tuple_dn_setParameter_batteryLife", ['RC'])
 
     ##
     # The setParameter<batteryLife> command allows the microprocessor to update the remaining battery life information that the mote reports to WirelessHART Gateway in Command 778. This parameter must be set during the Idle state prior to joining, and should be updated periodically throughout operation. This parameter is only used in WirelessHART-compliant devices.
@@ -165,7 +165,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     # - <tt>numServices</tt>: 1-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_setParameter_service = collections.namedtuple("Tuple_dn_setParameter_service", ['RC', 'numServices'])
+    Tuple_dn_setParameter_service = LazyNamedTuple.namedtuple("Tuple_dn_setParameter_service", ['RC', 'numServices'])
 
     ##
     # The setParameter<service> command is used to request new device-originated bandwidth services and modify existing device-initiated services (now called "Timetables" in WirelessHART 7.4). Calling this command updates the motes internal service table, which later initiates a request to the network manager for bandwidth allocation. A subsequent serviceIndication notification will be sent indicating the response from the network manager. The getParameter<service> command may be used to read the service table, including the state of the service request.
@@ -220,7 +220,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #      - 18: RC_OPEN_FAIL
     #      - 19: RC_ERASE_FAIL
     # 
-    Tuple_dn_setParameter_hartDeviceStatus = collections.namedtuple("Tuple_dn_setParameter_hartDeviceStatus", ['RC'])
+    Tuple_dn_setParameter_hartDeviceStatus = LazyNamedTuple.namedtuple("Tuple_dn_setParameter_hartDeviceStatus", ['RC'])
 
     ##
     # The setParameter<hartDeviceStatus> command sets the current status of a WirelessHART device. The value passed in this parameter is used in all subsequent WirelessHART communications between the mote and the manager. This command is only required for WirelessHART-compliant devices. Refer to the HART Command Specifications for the appropriate value to use.
@@ -259,7 +259,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #      - 18: RC_OPEN_FAIL
     #      - 19: RC_ERASE_FAIL
     # 
-    Tuple_dn_setParameter_hartDeviceInfo = collections.namedtuple("Tuple_dn_setParameter_hartDeviceInfo", ['RC'])
+    Tuple_dn_setParameter_hartDeviceInfo = LazyNamedTuple.namedtuple("Tuple_dn_setParameter_hartDeviceInfo", ['RC'])
 
     ##
     # The setParameter<hartDeviceInfo> command is used to set HART device information that the mote passes to gateway during join. This command must be issued prior to join. This command is only required for WirelessHART-compliant devices. Note that the contents of this command are not validated by mote.
@@ -298,7 +298,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #      - 18: RC_OPEN_FAIL
     #      - 19: RC_ERASE_FAIL
     # 
-    Tuple_dn_setParameter_eventMask = collections.namedtuple("Tuple_dn_setParameter_eventMask", ['RC'])
+    Tuple_dn_setParameter_eventMask = LazyNamedTuple.namedtuple("Tuple_dn_setParameter_eventMask", ['RC'])
 
     ##
     # The setParameter<eventMask> command allows the microprocessor to subscribe to the types of events that may be sent in the motes events notification message. This command may be called at any time and takes effect at the next event notification. The mote includes an event in the notification message if the corresponding bit in <eventMask> is set to 1, and excludes the event if the bit is set to 0. At mote reset, the default value of <eventMask> is 1 for all events.
@@ -337,7 +337,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #      - 18: RC_OPEN_FAIL
     #      - 19: RC_ERASE_FAIL
     # 
-    Tuple_dn_setParameter_writeProtect = collections.namedtuple("Tuple_dn_setParameter_writeProtect", ['RC'])
+    Tuple_dn_setParameter_writeProtect = LazyNamedTuple.namedtuple("Tuple_dn_setParameter_writeProtect", ['RC'])
 
     ##
     # The setParameter<writeProtect> command allows the microprocessor to enable or disable access to selected WirelessHART commands via wireless or the hartPayload command. Refer to the SmartMesh WirelessHART User's Guide for the list of affected commands. If writeProtect is enabled and the mote receives any of these commands (either via wireless connection or via the hartPayload command), the command will have no effect, and the mote will return RC_7 (In Write Protect Mode). At mote boot, writeProtect is set to 0 (writes allowed). The current status of writeProtect may be read via the getParameter<moteStatus> command. This command is for WirelessHART-compliant devices only.
@@ -376,7 +376,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #      - 18: RC_OPEN_FAIL
     #      - 19: RC_ERASE_FAIL
     # 
-    Tuple_dn_setParameter_lock = collections.namedtuple("Tuple_dn_setParameter_lock", ['RC'])
+    Tuple_dn_setParameter_lock = LazyNamedTuple.namedtuple("Tuple_dn_setParameter_lock", ['RC'])
 
     ##
     # The setParameter<lock> command locks/unlocks select HART commands (ones that affect the configuration changed flag) to a specific master (GW or serial maintenance port) to prevent the other master from changing it. This command is intended for use when the lock is temporary, i.e. it does not persist through power cycle or reset. For nonvolatile locking, use the setNVParameter<lock> command. Note: This parameter is available in devices running mote software >= 1.1.0
@@ -417,7 +417,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     # - <tt>joinDutyCycle</tt>: 1-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getParameter_joinDutyCycle = collections.namedtuple("Tuple_dn_getParameter_joinDutyCycle", ['RC', 'joinDutyCycle'])
+    Tuple_dn_getParameter_joinDutyCycle = LazyNamedTuple.namedtuple("Tuple_dn_getParameter_joinDutyCycle", ['RC', 'joinDutyCycle'])
 
     ##
     # The getParameter<joinDutyCycle> command return mote's join duty cycle, which determines the percentage of time the mote spends in radio receive mode while searching for network. The value of join duty cycle is expressed in increments of 1/255th of 100%, where 0 corresponds to 0% and 255 corresponds to 100%.
@@ -472,7 +472,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     # - <tt>time</tt>: 4-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getParameter_service = collections.namedtuple("Tuple_dn_getParameter_service", ['RC', 'serviceId', 'serviceState', 'serviceFlags', 'appDomain', 'destAddr', 'time'])
+    Tuple_dn_getParameter_service = LazyNamedTuple.namedtuple("Tuple_dn_getParameter_service", ['RC', 'serviceId', 'serviceState', 'serviceFlags', 'appDomain', 'destAddr', 'time'])
 
     ##
     # The getParameter<service> command retrieves information about the service allocation that is currently available to the field device. Services (now called "Timetables" in WirelessHART 7.4) in the range 0x00-7F are those requested by the device, and those in the range 0x80-FF are assigned independently by the network manager.
@@ -525,7 +525,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     # - <tt>swBuild</tt>: 2-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getParameter_moteInfo = collections.namedtuple("Tuple_dn_getParameter_moteInfo", ['RC', 'apiVersion', 'serialNum', 'hwModel', 'hwRev', 'swMajorRev', 'swMinorRev', 'swPatch', 'swBuild'])
+    Tuple_dn_getParameter_moteInfo = LazyNamedTuple.namedtuple("Tuple_dn_getParameter_moteInfo", ['RC', 'apiVersion', 'serialNum', 'hwModel', 'hwRev', 'swMajorRev', 'swMinorRev', 'swPatch', 'swBuild'])
 
     ##
     # The getParameter<moteInfo> command returns static information about the motes hardware and software. Note that network state-related information about the mote may be retrieved using getParameter<networkInfo>.
@@ -567,7 +567,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     # - <tt>networkId</tt>: 2-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getParameter_networkInfo = collections.namedtuple("Tuple_dn_getParameter_networkInfo", ['RC', 'macAddress', 'moteId', 'networkId'])
+    Tuple_dn_getParameter_networkInfo = LazyNamedTuple.namedtuple("Tuple_dn_getParameter_networkInfo", ['RC', 'macAddress', 'moteId', 'networkId'])
 
     ##
     # The getParameter<networkInfo> command may be used to retrieve the mote's network-related parameters. Note that static information about the motes hardware and software may be retrieved using getParameter<moteInfo>.
@@ -625,7 +625,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     # - <tt>statusFlags</tt>: 1-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getParameter_moteStatus = collections.namedtuple("Tuple_dn_getParameter_moteStatus", ['RC', 'state', 'moteStateReason', 'changeCounter', 'numParents', 'moteAlarms', 'statusFlags'])
+    Tuple_dn_getParameter_moteStatus = LazyNamedTuple.namedtuple("Tuple_dn_getParameter_moteStatus", ['RC', 'state', 'moteStateReason', 'changeCounter', 'numParents', 'moteAlarms', 'statusFlags'])
 
     ##
     # The getParameter<moteStatus> command is used to retrieve the mote's state and frequently changing information. Note that static information about the state of the mote hardware and software may be retrieved using getParameter<moteInfo>.
@@ -667,7 +667,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     # - <tt>asnOffset</tt>: 2-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getParameter_time = collections.namedtuple("Tuple_dn_getParameter_time", ['RC', 'utcTime', 'asn', 'asnOffset'])
+    Tuple_dn_getParameter_time = LazyNamedTuple.namedtuple("Tuple_dn_getParameter_time", ['RC', 'utcTime', 'asn', 'asnOffset'])
 
     ##
     # The getParameter<time> command is used to request the current time on the mote.
@@ -711,7 +711,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     # - <tt>fractionalTemp</tt>: 1-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getParameter_charge = collections.namedtuple("Tuple_dn_getParameter_charge", ['RC', 'charge', 'uptime', 'temperature', 'fractionalTemp'])
+    Tuple_dn_getParameter_charge = LazyNamedTuple.namedtuple("Tuple_dn_getParameter_charge", ['RC', 'charge', 'uptime', 'temperature', 'fractionalTemp'])
 
     ##
     # The getParameter<charge> command retrieves estimated charge consumption of the mote since the last reset, as well as the mote uptime and last measured temperature.
@@ -751,7 +751,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     # - <tt>rxFailed</tt>: 2-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getParameter_testRadioRxStats = collections.namedtuple("Tuple_dn_getParameter_testRadioRxStats", ['RC', 'rxOk', 'rxFailed'])
+    Tuple_dn_getParameter_testRadioRxStats = LazyNamedTuple.namedtuple("Tuple_dn_getParameter_testRadioRxStats", ['RC', 'rxOk', 'rxFailed'])
 
     ##
     # The getParameter<testRadioRxStats> command retrieves statistics for the latest radio reception test performed using the testRadioRx command. The statistics show the number of good and bad packets (CRC failures) received during the test.
@@ -791,7 +791,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     # - <tt>master</tt>: 2-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getParameter_lock = collections.namedtuple("Tuple_dn_getParameter_lock", ['RC', 'code', 'master'])
+    Tuple_dn_getParameter_lock = LazyNamedTuple.namedtuple("Tuple_dn_getParameter_lock", ['RC', 'code', 'master'])
 
     ##
     # The getParameter<lock> command returns the current (RAM resident) lock code and locking master. To determine what the lock status will be after reset, use the getNVParameter<lock> command. Note: This parameter is available in devices running mote software >= 1.1.0
@@ -827,7 +827,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #      - 18: RC_OPEN_FAIL
     #      - 19: RC_ERASE_FAIL
     # 
-    Tuple_dn_setNVParameter_macAddress = collections.namedtuple("Tuple_dn_setNVParameter_macAddress", ['RC'])
+    Tuple_dn_setNVParameter_macAddress = LazyNamedTuple.namedtuple("Tuple_dn_setNVParameter_macAddress", ['RC'])
 
     ##
     # The setNVParameter<macAddress> command may be used to supersede the factory-configured MAC address of the mote.
@@ -864,7 +864,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #      - 18: RC_OPEN_FAIL
     #      - 19: RC_ERASE_FAIL
     # 
-    Tuple_dn_setNVParameter_joinKey = collections.namedtuple("Tuple_dn_setNVParameter_joinKey", ['RC'])
+    Tuple_dn_setNVParameter_joinKey = LazyNamedTuple.namedtuple("Tuple_dn_setNVParameter_joinKey", ['RC'])
 
     ##
     # The setNVParameter<joinKey> command may be used to set the join key. Upon receiving this request, the mote stores the new join key in its persistent storage. Using the write RAM option will only have an effect if the command is called while the mote is in Idle state. Otherwise, the new value will be used after the next mote boot.
@@ -901,7 +901,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #      - 18: RC_OPEN_FAIL
     #      - 19: RC_ERASE_FAIL
     # 
-    Tuple_dn_setNVParameter_networkId = collections.namedtuple("Tuple_dn_setNVParameter_networkId", ['RC'])
+    Tuple_dn_setNVParameter_networkId = LazyNamedTuple.namedtuple("Tuple_dn_setNVParameter_networkId", ['RC'])
 
     ##
     # The setNVParameter<networkId> command may be used to set the persistent Network ID of the mote. The networkId is used to separate networks, and can be set during manufacturing or in the field. The mote reads this value from persistent storage at boot time. Note: while the mote is in Idle state, it is possible to update the value of mote's in-RAM Network ID by using the RAM flag in the header of this command. This avoids the extra reset that is needed to start using the Network ID. Network ID can also be set over the air using HART command 773 in a WirelessHART-compliant network.
@@ -942,7 +942,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #      - 18: RC_OPEN_FAIL
     #      - 19: RC_ERASE_FAIL
     # 
-    Tuple_dn_setNVParameter_txPower = collections.namedtuple("Tuple_dn_setNVParameter_txPower", ['RC'])
+    Tuple_dn_setNVParameter_txPower = LazyNamedTuple.namedtuple("Tuple_dn_setNVParameter_txPower", ['RC'])
 
     ##
     # The setNVParameter<txPower> command sets the mote output power. Refer to product datasheets for supported RF output power values. For example, if the mote has a typical RF output power of +8 dBm when the Power Amplifier (PA) is enabled, then set the txPower parameter to 8 to enable the PA. Similarly, if the mote has a typical RF output power of -2 dBm when the PA is disabled, then set the txPower parameter to -2 to turn off the PA. This command may be issued at any time and takes effect at the next mote boot. To change the transmit power immediately, use the write RAM option of this command, which can also be used at any time.
@@ -979,7 +979,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #      - 18: RC_OPEN_FAIL
     #      - 19: RC_ERASE_FAIL
     # 
-    Tuple_dn_setNVParameter_powerInfo = collections.namedtuple("Tuple_dn_setNVParameter_powerInfo", ['RC'])
+    Tuple_dn_setNVParameter_powerInfo = LazyNamedTuple.namedtuple("Tuple_dn_setNVParameter_powerInfo", ['RC'])
 
     ##
     # The setNVParameter<powerInfo> command specifies the average current that is available to the mote. Using the write RAM option will only have an effect if the command is called while the mote is in Idle state. Otherwise, the new value will be used after the next mote boot.
@@ -1025,7 +1025,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #      - 18: RC_OPEN_FAIL
     #      - 19: RC_ERASE_FAIL
     # 
-    Tuple_dn_setNVParameter_ttl = collections.namedtuple("Tuple_dn_setNVParameter_ttl", ['RC'])
+    Tuple_dn_setNVParameter_ttl = LazyNamedTuple.namedtuple("Tuple_dn_setNVParameter_ttl", ['RC'])
 
     ##
     # The setNVParameter<ttl> command sets the mote's persistent packet Time To Live (TTL) value. TTL specifies the maximum number of hops a packet may traverse before it is discarded from the network. A mote sets the initial value of the TTL field in the packets it generates to this value. The mote reads the value from persistent storage at boot time. To change the TTL used currently, this command may be issued with the RAM option.
@@ -1064,7 +1064,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #      - 18: RC_OPEN_FAIL
     #      - 19: RC_ERASE_FAIL
     # 
-    Tuple_dn_setNVParameter_hartAntennaGain = collections.namedtuple("Tuple_dn_setNVParameter_hartAntennaGain", ['RC'])
+    Tuple_dn_setNVParameter_hartAntennaGain = LazyNamedTuple.namedtuple("Tuple_dn_setNVParameter_hartAntennaGain", ['RC'])
 
     ##
     # The setNVParameter<hartAntennaGain> command stores value of the antenna gain in the mote's persistent storage. This value is added to the conducted output power of the mote when replying to HART command 797 (Write Radio Power Output) and to HART command 798 (Read Radio Output Power). The antenna gain should take into account both the gain of the antenna and any loss (for example, attenuation from a long coax cable) between the mote and the antenna. By default, this value is 2, assuming a +2 dBi antenna gain. To change the transmit power immediately, use the write RAM option of this command.
@@ -1101,7 +1101,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #      - 18: RC_OPEN_FAIL
     #      - 19: RC_ERASE_FAIL
     # 
-    Tuple_dn_setNVParameter_OTAPlockout = collections.namedtuple("Tuple_dn_setNVParameter_OTAPlockout", ['RC'])
+    Tuple_dn_setNVParameter_OTAPlockout = LazyNamedTuple.namedtuple("Tuple_dn_setNVParameter_OTAPlockout", ['RC'])
 
     ##
     # The setNVParameter<OTAPlockout> command specifies whether the mote's firmware can be updated over the air. Over-The-Air-Programming (OTAP) is allowed by default. The mote reads the OTAPlockout value from persistent storage at boot time. To change the value used currently, this command may be issued with RAM option.
@@ -1142,7 +1142,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #      - 18: RC_OPEN_FAIL
     #      - 19: RC_ERASE_FAIL
     # 
-    Tuple_dn_setNVParameter_hrCounterMode = collections.namedtuple("Tuple_dn_setNVParameter_hrCounterMode", ['RC'])
+    Tuple_dn_setNVParameter_hrCounterMode = LazyNamedTuple.namedtuple("Tuple_dn_setNVParameter_hrCounterMode", ['RC'])
 
     ##
     # The setNVParameter<hrCounterMode> command may be used to control how the mote increments statistics counters reported via HART health reports. The two options are "saturating" (i.e. stop counting at maximum value) and "rollover" (i.e. continue counting through rollover). The default value of "saturating" is required for compatibility with Dust Wireless HART managers. This parameter takes effect upon mote reset.
@@ -1185,7 +1185,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     # - <tt>nvParamId</tt>: 1-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_setNVParameter_autojoin = collections.namedtuple("Tuple_dn_setNVParameter_autojoin", ['RC', 'nvParamId'])
+    Tuple_dn_setNVParameter_autojoin = LazyNamedTuple.namedtuple("Tuple_dn_setNVParameter_autojoin", ['RC', 'nvParamId'])
 
     ##
     # The setNVParameter<autojoin> command allows the microprocessor to change between automatic and manual joining by the mote's networking stack. In manual mode, an explicit join command from the application is required to initiate joining. This setting is persistent and takes effect after mote reset. (Available Mote >= 1.1) Note that auto join mode must not be set if the application is also configured to join (e.g combining 'auto join' with 'master' mode will result in mote not joining).
@@ -1222,7 +1222,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #      - 18: RC_OPEN_FAIL
     #      - 19: RC_ERASE_FAIL
     # 
-    Tuple_dn_setNVParameter_hartCompliantMode = collections.namedtuple("Tuple_dn_setNVParameter_hartCompliantMode", ['RC'])
+    Tuple_dn_setNVParameter_hartCompliantMode = LazyNamedTuple.namedtuple("Tuple_dn_setNVParameter_hartCompliantMode", ['RC'])
 
     ##
     # The setNVParameter<hartCompliantMode> command may be used to force strict compliance to HART specification requirements, specifically:
@@ -1265,7 +1265,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #      - 18: RC_OPEN_FAIL
     #      - 19: RC_ERASE_FAIL
     # 
-    Tuple_dn_setNVParameter_lock = collections.namedtuple("Tuple_dn_setNVParameter_lock", ['RC'])
+    Tuple_dn_setNVParameter_lock = LazyNamedTuple.namedtuple("Tuple_dn_setNVParameter_lock", ['RC'])
 
     ##
     # The setNVParameter<lock> command persistently locks/unlocks select HART commands (ones that affect the configuration changed flag) to a specific master (GW or serial maintenance port) to prevent the other master from changing it. This command is intended for use when the lock persists through power cycle or reset. For temporary locking, use the setParameter<lock> command. Bit 7 in the flags field of the API header (see Packet Format) should be set (store in NV & RAM) when calling this command. Note: This parameter is available in devices running mote software >= 1.1.0
@@ -1304,7 +1304,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #      - 18: RC_OPEN_FAIL
     #      - 19: RC_ERASE_FAIL
     # 
-    Tuple_dn_setNVParameter_euCompliantMode = collections.namedtuple("Tuple_dn_setNVParameter_euCompliantMode", ['RC'])
+    Tuple_dn_setNVParameter_euCompliantMode = LazyNamedTuple.namedtuple("Tuple_dn_setNVParameter_euCompliantMode", ['RC'])
 
     ##
     # The setNVParameter<euCompliantMode> command may be used to enforce EN 300 328 duty cycle limits based on output power. This may cause the mote to skip some transmit opportunities to remain within average power limits. Motes below +10 dBm radiated power do not need to duty cycle to meet EN 300 328 requirements.
@@ -1343,7 +1343,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #      - 18: RC_OPEN_FAIL
     #      - 19: RC_ERASE_FAIL
     # 
-    Tuple_dn_setNVParameter_joinShedTime = collections.namedtuple("Tuple_dn_setNVParameter_joinShedTime", ['RC'])
+    Tuple_dn_setNVParameter_joinShedTime = LazyNamedTuple.namedtuple("Tuple_dn_setNVParameter_joinShedTime", ['RC'])
 
     ##
     # The setNVParameter<joinShedTime> command sets the join shed time u sed with HART command 771/772 to determine when the mote should transition between active and passive search. This command may be issued at any time and takes effect at the next mote boot.
@@ -1382,7 +1382,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     # - <tt>macAddr</tt>: 8-byte field formatted as a hex.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getNVParameter_macAddress = collections.namedtuple("Tuple_dn_getNVParameter_macAddress", ['RC', 'macAddr'])
+    Tuple_dn_getNVParameter_macAddress = LazyNamedTuple.namedtuple("Tuple_dn_getNVParameter_macAddress", ['RC', 'macAddr'])
 
     ##
     # The getNVParameter<macAddress> command returns the MAC address stored in mote's persistent storage (i.e. set with setNVParameter<macAddress>).
@@ -1422,7 +1422,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     # - <tt>networkId</tt>: 2-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getNVParameter_networkId = collections.namedtuple("Tuple_dn_getNVParameter_networkId", ['RC', 'networkId'])
+    Tuple_dn_getNVParameter_networkId = LazyNamedTuple.namedtuple("Tuple_dn_getNVParameter_networkId", ['RC', 'networkId'])
 
     ##
     # The getNVParameter<networkId> command returns the Network ID stored in mote's persistent storage.
@@ -1460,7 +1460,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     # - <tt>txPower</tt>: 1-byte field formatted as a ints.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getNVParameter_txPower = collections.namedtuple("Tuple_dn_getNVParameter_txPower", ['RC', 'txPower'])
+    Tuple_dn_getNVParameter_txPower = LazyNamedTuple.namedtuple("Tuple_dn_getNVParameter_txPower", ['RC', 'txPower'])
 
     ##
     # The getNVParameter<txPower> command returns the transmit power value stored in mote's persistent storage.
@@ -1507,7 +1507,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     # - <tt>recoverTime</tt>: 4-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getNVParameter_powerInfo = collections.namedtuple("Tuple_dn_getNVParameter_powerInfo", ['RC', 'powerSource', 'dischargeCur', 'dischargeTime', 'recoverTime'])
+    Tuple_dn_getNVParameter_powerInfo = LazyNamedTuple.namedtuple("Tuple_dn_getNVParameter_powerInfo", ['RC', 'powerSource', 'dischargeCur', 'dischargeTime', 'recoverTime'])
 
     ##
     # The getNVParameter<powerInfo> command returns the power supply information stored in mote's persistent storage.
@@ -1545,7 +1545,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     # - <tt>timeToLive</tt>: 1-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getNVParameter_ttl = collections.namedtuple("Tuple_dn_getNVParameter_ttl", ['RC', 'timeToLive'])
+    Tuple_dn_getNVParameter_ttl = LazyNamedTuple.namedtuple("Tuple_dn_getNVParameter_ttl", ['RC', 'timeToLive'])
 
     ##
     # The getNVParameter<ttl> command reads the Time To Live parameter from the mote's persistent storage. Time To Live is used when the mote sends a packet into the network, and specifies the maximum number of hops the packet may traverse before it is discarded from the network.
@@ -1583,7 +1583,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     # - <tt>antennaGain</tt>: 1-byte field formatted as a ints.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getNVParameter_HARTantennaGain = collections.namedtuple("Tuple_dn_getNVParameter_HARTantennaGain", ['RC', 'antennaGain'])
+    Tuple_dn_getNVParameter_HARTantennaGain = LazyNamedTuple.namedtuple("Tuple_dn_getNVParameter_HARTantennaGain", ['RC', 'antennaGain'])
 
     ##
     # The getNVParameter<HARTantennaGain> command reads the antenna gain value from the mote's persistent storage. This value is added to conducted output power of the Dust mote when replying to HART command 797 (Write Radio Power Output) and to HART command 798 (Read Radio Output Power).
@@ -1623,7 +1623,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #      - 0: OTAP allowed (default)
     #      - 1: OTAP disabled
     # 
-    Tuple_dn_getNVParameter_OTAPlockout = collections.namedtuple("Tuple_dn_getNVParameter_OTAPlockout", ['RC', 'otapLockout'])
+    Tuple_dn_getNVParameter_OTAPlockout = LazyNamedTuple.namedtuple("Tuple_dn_getNVParameter_OTAPlockout", ['RC', 'otapLockout'])
 
     ##
     # The getNVParameter<OTAPlockout> command reads the OTAP lockout setting from the motes persistent storage. OTAP lockout specifies whether the mote can be Over-The-Air-Programmed (OTAP).
@@ -1663,7 +1663,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #      - 0: Rollover
     #      - 1: Saturating
     # 
-    Tuple_dn_getNVParameter_hrCounterMode = collections.namedtuple("Tuple_dn_getNVParameter_hrCounterMode", ['RC', 'hrCounterMode'])
+    Tuple_dn_getNVParameter_hrCounterMode = LazyNamedTuple.namedtuple("Tuple_dn_getNVParameter_hrCounterMode", ['RC', 'hrCounterMode'])
 
     ##
     # The getNVParameter<hrCounterMode> command may be used to retrieve the health report counter mode that is used by devices. This mode controls how the mote deals with statistics counters when they reach their maximum value.
@@ -1703,7 +1703,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     # - <tt>autojoin</tt>: 1-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getNVParameter_autojoin = collections.namedtuple("Tuple_dn_getNVParameter_autojoin", ['RC', 'autojoin'])
+    Tuple_dn_getNVParameter_autojoin = LazyNamedTuple.namedtuple("Tuple_dn_getNVParameter_autojoin", ['RC', 'autojoin'])
 
     ##
     # The getNVParameter<autojoin> command returns the autojoin status stored in mote's persistent storage (i.e. set with setNVParameter<autojoin>). Autojoin can be used to cause a mote in slave mode to join on its own when booted.
@@ -1743,7 +1743,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #      - 0: Some timers and counters deviate from HART specification
     #      - 1: Strict HART compliance
     # 
-    Tuple_dn_getNVParameter_hartCompliantMode = collections.namedtuple("Tuple_dn_getNVParameter_hartCompliantMode", ['RC', 'hartCompliantMode'])
+    Tuple_dn_getNVParameter_hartCompliantMode = LazyNamedTuple.namedtuple("Tuple_dn_getNVParameter_hartCompliantMode", ['RC', 'hartCompliantMode'])
 
     ##
     # The getNVParameter<hartCompliantMode> command may be used to retrieve the HART compliance mode that is used by devices. This mode controls strict compliance to HART specification requirements, specifically:
@@ -1789,7 +1789,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     # - <tt>master</tt>: 2-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getNVParameter_lock = collections.namedtuple("Tuple_dn_getNVParameter_lock", ['RC', 'code', 'master'])
+    Tuple_dn_getNVParameter_lock = LazyNamedTuple.namedtuple("Tuple_dn_getNVParameter_lock", ['RC', 'code', 'master'])
 
     ##
     # The getNVParameter < lock > command returns the persisted lock code and locking master (those to be used after reset). To determine the current lock status, use the getParameter<lock> command. Note: This parameter is available in devices running mote software >= 1.1.0
@@ -1827,7 +1827,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     # - <tt>euCompliantMode</tt>: 1-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getNVParameter_euCompliantMode = collections.namedtuple("Tuple_dn_getNVParameter_euCompliantMode", ['RC', 'euCompliantMode'])
+    Tuple_dn_getNVParameter_euCompliantMode = LazyNamedTuple.namedtuple("Tuple_dn_getNVParameter_euCompliantMode", ['RC', 'euCompliantMode'])
 
     ##
     # The getNVParameter<euCompliantMode> command may be used to retrieve the EN 300 328 compliance mode that is used by devices. When enabled, the mote may skip some transmit opportunities to remain within average power limits. Motes below +10 dBm radiated power do not need to duty cycle to meet EN 300 328 requirements.
@@ -1867,7 +1867,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     # - <tt>joinShedTime</tt>: 4-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getNVParameter_joinShedTime = collections.namedtuple("Tuple_dn_getNVParameter_joinShedTime", ['RC', 'joinShedTime'])
+    Tuple_dn_getNVParameter_joinShedTime = LazyNamedTuple.namedtuple("Tuple_dn_getNVParameter_joinShedTime", ['RC', 'joinShedTime'])
 
     ##
     # The getNVParameter<joinShedTime> command returns the join shed time used with HART command 771/772 to determine when the mote should transition between active and passive search.
@@ -1903,7 +1903,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #      - 18: RC_OPEN_FAIL
     #      - 19: RC_ERASE_FAIL
     # 
-    Tuple_dn_send = collections.namedtuple("Tuple_dn_send", ['RC'])
+    Tuple_dn_send = LazyNamedTuple.namedtuple("Tuple_dn_send", ['RC'])
 
     ##
     # The send command allows a serial device to send a packet into the network through the mote's serial port. The mote forwards the packet to the network upon receiving it. The microprocessor must not attempt to send data at a rate that exceeds its allocated bandwidth. For a WirelessHART device, the payload of the packet must include the status byte and the extended status byte, followed by one or more sets of HART commands up to the maximum send payload size, as follows:
@@ -1973,7 +1973,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #      - 18: RC_OPEN_FAIL
     #      - 19: RC_ERASE_FAIL
     # 
-    Tuple_dn_join = collections.namedtuple("Tuple_dn_join", ['RC'])
+    Tuple_dn_join = LazyNamedTuple.namedtuple("Tuple_dn_join", ['RC'])
 
     ##
     # The join command requests that a mote start searching for the network and attempt to join. The mote must be in the Idle state or the Promiscuous Listen state (see search) for this command to be valid. The join time is partly determined by the join duty cycle. For guidance on setting the join duty cycle, see setParameter<joinDutyCycle>.
@@ -2009,7 +2009,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #      - 18: RC_OPEN_FAIL
     #      - 19: RC_ERASE_FAIL
     # 
-    Tuple_dn_disconnect = collections.namedtuple("Tuple_dn_disconnect", ['RC'])
+    Tuple_dn_disconnect = LazyNamedTuple.namedtuple("Tuple_dn_disconnect", ['RC'])
 
     ##
     # The disconnect command requests that the mote disconnect from the network. The mote will send an indication to its network neighbors that it is about to become unavailable. Just after the mote disconnects, it sends the microprocessor an events packet with the disconnected bit set, indicating it will reset. This command is only valid in when the mote is in the Connected or Operational state (see Mote State).
@@ -2049,7 +2049,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #      - 18: RC_OPEN_FAIL
     #      - 19: RC_ERASE_FAIL
     # 
-    Tuple_dn_reset = collections.namedtuple("Tuple_dn_reset", ['RC'])
+    Tuple_dn_reset = LazyNamedTuple.namedtuple("Tuple_dn_reset", ['RC'])
 
     ##
     # Upon receiving this command, the mote resets itself after a short delay. The mote will always send a response packet before initiating the reset. To force the mote to gracefully leave the network, use the disconnect command.
@@ -2085,7 +2085,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #      - 18: RC_OPEN_FAIL
     #      - 19: RC_ERASE_FAIL
     # 
-    Tuple_dn_lowPowerSleep = collections.namedtuple("Tuple_dn_lowPowerSleep", ['RC'])
+    Tuple_dn_lowPowerSleep = LazyNamedTuple.namedtuple("Tuple_dn_lowPowerSleep", ['RC'])
 
     ##
     # The lowPowerSleep command shuts down all peripherals and places the mote in deep sleep mode. The lowPowerSleep command may be issued at any time and will cause the mote to interrupt all in-progress network operation. The command executes after the mote sends its response. The mote enters deep sleep within two seconds after the command executes.
@@ -2127,7 +2127,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     # - <tt>payload</tt>: None-byte field formatted as a hex.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_hartPayload = collections.namedtuple("Tuple_dn_hartPayload", ['RC', 'payloadLen', 'payload'])
+    Tuple_dn_hartPayload = LazyNamedTuple.namedtuple("Tuple_dn_hartPayload", ['RC', 'payloadLen', 'payload'])
 
     ##
     # The hartPayload command allows the microprocessor to forward a HART payload to the mote. The format of the command must be as follows:
@@ -2170,7 +2170,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #      - 18: RC_OPEN_FAIL
     #      - 19: RC_ERASE_FAIL
     # 
-    Tuple_dn_testRadioTx = collections.namedtuple("Tuple_dn_testRadioTx", ['RC'])
+    Tuple_dn_testRadioTx = LazyNamedTuple.namedtuple("Tuple_dn_testRadioTx", ['RC'])
 
     ##
     # The testRadioTx command initiates transmission over the radio. This command may only be issued prior to the mote joining the network. While executing this command the mote sends numPackets packets. Each packet consists of a payload of up to 125 bytes, and a 2-byte 802.15.4 CRC at the end. Bytes 0 and 1 contain the packet number (in big-endian format) that increments with every packet transmitted. Bytes 2..N contain a counter (from 0..N-2) that increments with every byte inside payload. Transmissions occur on the specified channel.
@@ -2219,7 +2219,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #      - 18: RC_OPEN_FAIL
     #      - 19: RC_ERASE_FAIL
     # 
-    Tuple_dn_testRadioRx = collections.namedtuple("Tuple_dn_testRadioRx", ['RC'])
+    Tuple_dn_testRadioRx = LazyNamedTuple.namedtuple("Tuple_dn_testRadioRx", ['RC'])
 
     ##
     # The testRadioRx command clears all previously collected statistics and initiates a test of radio reception for the specified channel and duration. During the test, the mote keeps statistics about the number of packets received (with and without error). The test results may be retrieved using the getParameter<testRadioRxStats> command. The mote must be reset (either hardware or software reset) after radio tests are complete and prior to joining.
@@ -2266,7 +2266,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #      - 18: RC_OPEN_FAIL
     #      - 19: RC_ERASE_FAIL
     # 
-    Tuple_dn_clearNV = collections.namedtuple("Tuple_dn_clearNV", ['RC'])
+    Tuple_dn_clearNV = LazyNamedTuple.namedtuple("Tuple_dn_clearNV", ['RC'])
 
     ##
     # The clearNV command resets the motes Non-Volatile (NV) memory to its factory-default state. Refer to the WirelessHART User Guide for table of default values. Note that since this command clears the mote's security join counter, the corresponding manager's Access Control List (ACL) entry may need to be cleared as well to allow joining.
@@ -2302,7 +2302,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #      - 18: RC_OPEN_FAIL
     #      - 19: RC_ERASE_FAIL
     # 
-    Tuple_dn_search = collections.namedtuple("Tuple_dn_search", ['RC'])
+    Tuple_dn_search = LazyNamedTuple.namedtuple("Tuple_dn_search", ['RC'])
 
     ##
     # The search command causes the mote to listen for network advertisements and notify the microprocessor about each advertisement it hears. This is referred to as the Promiscuous Listen state. Notifications are sent using the advReceived notification. The search command may only be issued prior to join. The mote stays in listen mode until the join command is received or the mote is reset.
@@ -2338,7 +2338,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #      - 18: RC_OPEN_FAIL
     #      - 19: RC_ERASE_FAIL
     # 
-    Tuple_dn_testRadioTxExt = collections.namedtuple("Tuple_dn_testRadioTxExt", ['RC'])
+    Tuple_dn_testRadioTxExt = LazyNamedTuple.namedtuple("Tuple_dn_testRadioTxExt", ['RC'])
 
     ##
     # The testRadioTxExt command allows the microprocessor to initiate a radio transmission test. This command may only be issued prior to the mote joining the network. Three types of transmission tests are supported:
@@ -2458,7 +2458,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #      - 18: RC_OPEN_FAIL
     #      - 19: RC_ERASE_FAIL
     # 
-    Tuple_dn_testRadioRxExt = collections.namedtuple("Tuple_dn_testRadioRxExt", ['RC'])
+    Tuple_dn_testRadioRxExt = LazyNamedTuple.namedtuple("Tuple_dn_testRadioRxExt", ['RC'])
 
     ##
     # The testRadioRxExt command clears all previously collected statistics and initiates a test of radio reception for the specified channel and duration. During the test, the mote keeps statistics about the number of packets received (with and without error). The test results may be retrieved using the getParameter<testRadioRxStats> command. The mote must be reset (either hardware or software reset) after radio tests are complete and prior to joining.
@@ -2505,7 +2505,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #      - 18: RC_OPEN_FAIL
     #      - 19: RC_ERASE_FAIL
     # 
-    Tuple_dn_zeroize = collections.namedtuple("Tuple_dn_zeroize", ['RC'])
+    Tuple_dn_zeroize = LazyNamedTuple.namedtuple("Tuple_dn_zeroize", ['RC'])
 
     ##
     # The zeroize (zeroise) command erases flash area that is used to store configuration parameters, such as join keys. This command is intended to satisfy the zeroization requirement of the FIPS-140 standard. After the command executes, the mote should be reset. Available in mote >= 1.1.x
@@ -2546,7 +2546,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     # - <tt>length</tt>: 4-byte field formatted as a ints.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_fileWrite = collections.namedtuple("Tuple_dn_fileWrite", ['RC', 'length'])
+    Tuple_dn_fileWrite = LazyNamedTuple.namedtuple("Tuple_dn_fileWrite", ['RC', 'length'])
 
     ##
     # The fileWrite command may be used to read data stored in the scratchpad file in the mote filesystem. The size of the data read is limited by the size of a serial API transaction.
@@ -2597,7 +2597,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     # - <tt>data</tt>: None-byte field formatted as a hex.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_fileRead = collections.namedtuple("Tuple_dn_fileRead", ['RC', 'descriptor', 'offset', 'length', 'data'])
+    Tuple_dn_fileRead = LazyNamedTuple.namedtuple("Tuple_dn_fileRead", ['RC', 'descriptor', 'offset', 'length', 'data'])
 
     ##
     # The fileRead command may be used to read data stored in the scratchpad file in the mote filesystem. The size of the data read is limited by the size of a serial API transaction.
@@ -2640,7 +2640,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     # - <tt>descriptor</tt>: 4-byte field formatted as a ints.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_fileOpen = collections.namedtuple("Tuple_dn_fileOpen", ['RC', 'descriptor'])
+    Tuple_dn_fileOpen = LazyNamedTuple.namedtuple("Tuple_dn_fileOpen", ['RC', 'descriptor'])
 
     ##
     # The fileOpen command may be used to open the scratchpad file in the mote filesystem.
@@ -2689,7 +2689,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #      - 18: RC_OPEN_FAIL
     #      - 19: RC_ERASE_FAIL
     # 
-    Tuple_dn_testRadioRxPER = collections.namedtuple("Tuple_dn_testRadioRxPER", ['RC'])
+    Tuple_dn_testRadioRxPER = LazyNamedTuple.namedtuple("Tuple_dn_testRadioRxPER", ['RC'])
 
     ##
     # The testRadioRxPER command initiates Packet Error Rate (PER) test in rx mode. This command may be issued only when mote is in Idle state.
@@ -2727,7 +2727,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #      - 18: RC_OPEN_FAIL
     #      - 19: RC_ERASE_FAIL
     # 
-    Tuple_dn_testRadioTxPER = collections.namedtuple("Tuple_dn_testRadioTxPER", ['RC'])
+    Tuple_dn_testRadioTxPER = LazyNamedTuple.namedtuple("Tuple_dn_testRadioTxPER", ['RC'])
 
     ##
     # The testRadioTxPER command initiates Packet Error Rate (PER) test in tx mode. This command may be issued only when mote is in Idle state.
@@ -2754,7 +2754,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     ##
     # Dictionary of all notification tuples.
     #
-    notifTupleTable = {}
+    notifTupleTable = LazyNamedTuple.TupleTable()
     
     ##
     # \brief TIMEINDICATION notification.
@@ -2776,7 +2776,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     TIMEINDICATION = "timeIndication"
-    notifTupleTable[TIMEINDICATION] = Tuple_timeIndication = collections.namedtuple("Tuple_timeIndication", ['utcSec', 'utcMicroSec', 'asn', 'asnOffset'])
+    notifTupleTable[TIMEINDICATION] = Tuple_timeIndication = LazyNamedTuple.namedtuple("Tuple_timeIndication", ['utcSec', 'utcMicroSec', 'asn', 'asnOffset'])
 
     ##
     # \brief SERVICEINDICATION notification.
@@ -2809,7 +2809,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     SERVICEINDICATION = "serviceIndication"
-    notifTupleTable[SERVICEINDICATION] = Tuple_serviceIndication = collections.namedtuple("Tuple_serviceIndication", ['eventCode', 'netMgrCode', 'serviceId', 'serviceState', 'serviceFlags', 'appDomain', 'destAddr', 'time'])
+    notifTupleTable[SERVICEINDICATION] = Tuple_serviceIndication = LazyNamedTuple.namedtuple("Tuple_serviceIndication", ['eventCode', 'netMgrCode', 'serviceId', 'serviceState', 'serviceFlags', 'appDomain', 'destAddr', 'time'])
 
     ##
     # \brief EVENTS notification.
@@ -2835,7 +2835,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     EVENTS = "events"
-    notifTupleTable[EVENTS] = Tuple_events = collections.namedtuple("Tuple_events", ['events', 'state', 'moteAlarms'])
+    notifTupleTable[EVENTS] = Tuple_events = LazyNamedTuple.namedtuple("Tuple_events", ['events', 'state', 'moteAlarms'])
 
     ##
     # \brief DATARECEIVED notification.
@@ -2853,7 +2853,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     DATARECEIVED = "dataReceived"
-    notifTupleTable[DATARECEIVED] = Tuple_dataReceived = collections.namedtuple("Tuple_dataReceived", ['srcAddr', 'seqNum', 'pktLength', 'data'])
+    notifTupleTable[DATARECEIVED] = Tuple_dataReceived = LazyNamedTuple.namedtuple("Tuple_dataReceived", ['srcAddr', 'seqNum', 'pktLength', 'data'])
 
     ##
     # \brief ADVRECEIVED notification.
@@ -2871,7 +2871,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     ADVRECEIVED = "advReceived"
-    notifTupleTable[ADVRECEIVED] = Tuple_advReceived = collections.namedtuple("Tuple_advReceived", ['netId', 'moteId', 'rssi', 'joinPri'])
+    notifTupleTable[ADVRECEIVED] = Tuple_advReceived = LazyNamedTuple.namedtuple("Tuple_advReceived", ['netId', 'moteId', 'rssi', 'joinPri'])
 
     ##
     # \brief SUSPENDSTARTED notification.
@@ -2883,7 +2883,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     SUSPENDSTARTED = "suspendStarted"
-    notifTupleTable[SUSPENDSTARTED] = Tuple_suspendStarted = collections.namedtuple("Tuple_suspendStarted", ['duration'])
+    notifTupleTable[SUSPENDSTARTED] = Tuple_suspendStarted = LazyNamedTuple.namedtuple("Tuple_suspendStarted", ['duration'])
 
     ##
     # \brief TESTRADIOSTATSPER notification.
@@ -2907,7 +2907,7 @@ class HartMoteConnector(HartMoteConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     TESTRADIOSTATSPER = "testRadioStatsPER"
-    notifTupleTable[TESTRADIOSTATSPER] = Tuple_testRadioStatsPER = collections.namedtuple("Tuple_testRadioStatsPER", ['numRxOK', 'numRxErr', 'numRxInv', 'numRxMiss', 'perInt', 'perFrac'])
+    notifTupleTable[TESTRADIOSTATSPER] = Tuple_testRadioStatsPER = LazyNamedTuple.namedtuple("Tuple_testRadioStatsPER", ['numRxOK', 'numRxErr', 'numRxInv', 'numRxMiss', 'perInt', 'perFrac'])
 
     ##
     # \brief Get a notification from the notification queue, and returns
@@ -2916,10 +2916,21 @@ class HartMoteConnector(HartMoteConnectorInternal):
     # \exception NotificationError if unknown notification.
     # 
     def getNotification(self, timeoutSec=-1) :
-        temp = self.getNotificationInternal(timeoutSec)
+        temp = self._getNotificationRecord(timeoutSec)
         if not temp:
             return temp
+        return self._formatNotification(temp)
+
+    ##
+    # \brief Format a notification, as queued, the way getNotification() and
+    #        getNotifications() return it.
+    #
+    # \exception NotificationError if unknown notification.
+    # 
+    def _formatNotification(self, temp) :
         (ids, param) = temp
+        if isinstance(param, tuple) :
+            return (ids[-1], param)     # already deserialized into its named tuple
         try :
             if  HartMoteConnector.notifTupleTable[ids[-1]] :
                 return (ids[-1], HartMoteConnector.notifTupleTable[ids[-1]](**param))
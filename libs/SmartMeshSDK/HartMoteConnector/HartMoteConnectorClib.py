@@ -257,7 +257,7 @@ class HartMoteConnector(ApiConnector,threading.Thread):
             subCommandName   = None
         
         apiCommand = None
-        for c in HartMoteDefinition.HartMoteDefinition.commands:
+        for c in HartMoteDefinition.HartMoteDefinition.getTables().commands:
             if c['name']==commandName:
                 
                 if ('subCommands' in c) and subCommandName:
@@ -407,7 +407,7 @@ class HartMoteConnector(ApiConnector,threading.Thread):
         # find apiNotif
         apiNotifFields  = []
         nameArray       = []
-        for notif in HartMoteDefinition.HartMoteDefinition.notifications:
+        for notif in HartMoteDefinition.HartMoteDefinition.getTables().notifications:
             if notif['id']==cmdId:
                 nameArray += [notif['name']]
                 for f in notif['response']['FIELDS']:
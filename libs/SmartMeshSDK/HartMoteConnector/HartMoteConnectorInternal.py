@@ -55,9 +55,19 @@ class HartMoteConnectorInternal(SerialConnector.SerialConnector):
         else:
             # I received a request
             
-            self._sendInternal(cmdId,True,[])
+            self._sendAck(cmdId)
             return True
     
+    def _buildAckPacket(self,cmdId,packetId):
+        txHeader = []
+        
+        txHeader.append(cmdId)                     # command ID
+        txHeader.append(0)                         # length
+        txHeader.append(0x01|(packetId<<1))        # flags
+        txHeader.append(0)                         # RC (always 0)
+        
+        return txHeader
+    
     #======================== RX ==============================================
     
     def _parseRxHeader(self,frameRx):
@@ -0,0 +1,385 @@
+'''
+IP manager connector, through Serial Mux, driven by a shared reactor thread.
+
+An AsyncIpMgrConnectorMux does not have a thread of its own: the sockets of
+all the connectors attached to a MuxReactor are serviced by the reactor
+thread. Commands return a CommandFuture instead of blocking, and
+notifications can be delivered to a callback on the reactor thread, so that
+one thread drives any number of managers.
+'''
+
+import errno
+import inspect
+import socket
+import threading
+
+from   SmartMeshSDK                      import ApiException,                   \
+                                                ApiConnector
+from   SmartMeshSDK.SerialConnector      import HdlcReactor
+from   IpMgrConnectorMux                 import IpMgrConnectorMux
+
+import logging
+class NullHandler(logging.Handler):
+    def emit(self, record):
+        pass
+log = logging.getLogger('AsyncIpMgrConnectorMux')
+log.setLevel(logging.ERROR)
+log.addHandler(NullHandler())
+
+class MuxReactor(HdlcReactor.HdlcReactor) :
+    '''
+    \ingroup ApiConnector
+
+    \brief A single thread servicing the Serial Mux sockets of many
+           AsyncIpMgrConnectorMux connectors.
+
+    The socket of each connector is watched by the same loop as the serial
+    ports of an HdlcReactor. The acknowledges and notifications received are
+    processed from this thread, which therefore must not block waiting for
+    the result of a command.
+    '''
+
+    def __init__(self) :
+        HdlcReactor.HdlcReactor.__init__(self)
+        self.name = 'MuxReactor'
+
+class AsyncIpMgrConnectorMux(IpMgrConnectorMux) :
+    '''
+    \ingroup ApiConnector
+
+    \brief IP manager connector, through Serial Mux, serviced by a MuxReactor.
+
+    Each dn_<command>() method has a dn_<command>_async() variant which
+    returns a CommandFuture completed, from the reactor thread, with the named
+    tuple of the response. Commands are sent one at a time, in the order they
+    were called, as the Serial Mux expects. The dn_<command>() methods block
+    until the response is received, and must not be called from the reactor
+    thread.
+
+    Notifications are queued for getNotification() and iterNotifications(),
+    or passed to the 'notifCallback' connection parameter, from the reactor
+    thread.
+
+    The socket is non-blocking: the commands are queued in a buffer of the
+    connector, sent as far as the socket accepts them, and the rest by the
+    reactor once the socket is writable, so that a Serial Mux which stops
+    reading does not hold up the other connections of the reactor.
+    '''
+    PARAM_REACTOR       = 'reactor'
+    PARAM_NOTIFCALLBACK = 'notifCallback'
+
+    def __init__(self, maxQSize = 100) :
+        IpMgrConnectorMux.__init__(self, maxQSize)
+        self.reactor = None
+        self.ownReactor = False
+        self.notifCallback = None
+        self.comPort = None         # name of the connection, for the reactor
+        self.pendingLock = threading.Lock()
+        self.pendingCmds = []       # (cmdNames, packet, future, convert), the first one sent
+        self.txLock = threading.Lock()
+        self.txBuf = ''             # bytes not accepted by the socket yet
+        self.isWatchingWrite = False
+
+    #======================== public ==========================================
+
+    def connect(self, params = {}) :
+        '''
+        \brief Connect to the Serial Mux, and start servicing its socket from
+               the reactor.
+
+        \param params Dictionary of connection parameters, those of
+            IpMgrConnectorMux.connect() and:
+            - 'reactor' - the MuxReactor servicing the connection (default: a
+              reactor of its own, stopped on disconnection)
+            - 'notifCallback' - function called as notifCallback(notifName,
+              notifParams) for each notification received, from the reactor
+              thread, instead of queuing it (default None)
+
+        \returns The CommandFuture of the hello command, None if
+                 'isSendHello' is False.
+        '''
+        host = params.get(self.PARAM_HOST) or self.DEFAULT_PARAM_HOST
+        port = int(params.get(self.PARAM_PORT) or self.DEFAULT_PARAM_PORT)
+        isSendHello = params.get(self.PARAM_ISSENDHELLO, True)
+        if self.PARAM_BINARYFIELDS in params :
+            self.setBinaryFields(params[self.PARAM_BINARYFIELDS])
+        if params.get(self.PARAM_NOTIFLOG) :
+            self.openNotifLog(params[self.PARAM_NOTIFLOG])
+        if self.PARAM_NOTIFOVERFLOW in params :
+            self.setNotifOverflow(params[self.PARAM_NOTIFOVERFLOW])
+        if self.PARAM_NOTIFFILTER in params :
+            self.setNotifFilter(params[self.PARAM_NOTIFFILTER])
+        self.notifCallback = params.get(self.PARAM_NOTIFCALLBACK)
+
+        if self.isConnected :
+            raise ApiException.ConnectionError("Already connected")
+
+        try:
+            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.socket.connect( (host, port) )
+            self.socket.setblocking(0)
+        except socket.error as ex:
+            raise ApiException.ConnectionError(str(ex))
+        self.comPort = '{0}:{1}'.format(host, port)
+        self.txBuf = ''
+        self.isWatchingWrite = False
+
+        if params.get(self.PARAM_REACTOR) :
+            self.reactor = params[self.PARAM_REACTOR]
+            self.ownReactor = False
+        else :
+            self.reactor = MuxReactor()
+            self.ownReactor = True
+
+        self.disconnectReason = ''
+        ApiConnector.ApiConnector.connect(self)
+        try :
+            self.reactor.add(self)
+        except ApiException.ConnectionError :
+            # the reactor is stopped
+            self.isConnected = False
+            self.socket.close()
+            raise
+        if isSendHello :
+            return self.send_async(["mux_hello"], {"version" : self.muxMsg.getVer(), "secret" :  self.muxMsg.getAuth()})
+        return None
+
+    def disconnect(self, reason = "") :
+        '''
+        \brief Close the connection.
+
+        Returns immediately. The reactor then closes the socket, and fails
+        the commands waiting for a response with a ConnectionError.
+        '''
+        if not self.isConnected :
+            return
+        ApiConnector.ApiConnector.disconnect(self, reason)
+        self._transmit("stop")      # after the commands queued, if the socket takes it
+        self.reactor.remove(self)
+
+    def _sendAndWait(self, cmdNames, params) :
+        '''
+        \brief Send a command and wait for its response, for send() and the
+               dn_<command>() methods.
+
+        \exception RuntimeError Called from the reactor thread, which would
+                   never receive the response.
+        '''
+        if threading.current_thread() is self.reactor :
+            raise RuntimeError("blocking command {0} called from the reactor thread".format(cmdNames))
+        return self.send_async(cmdNames, params).result()
+
+    def send_async(self, cmdNames, params) :
+        '''
+        \brief Send a command without waiting for its response.
+
+        \returns A CommandFuture, completed from the reactor thread with the
+                 response fields, as a dictionary, or with the exception
+                 send() would raise.
+        '''
+        return self._sendAsync(cmdNames, params, None)
+
+    def iterNotifications(self, timeoutSec = -1) :
+        '''
+        \brief Iterate over the notifications received, as returned by
+               getNotification().
+
+        The iteration ends when the connection is closed, once the queued
+        notifications have been returned, or when no notification is
+        received for timeoutSec seconds (timeoutSec>=0).
+        '''
+        while True :
+            try :
+                notif = self.getNotification(timeoutSec)
+            except (ApiException.ConnectionError, ApiException.QueueError) :
+                return
+            if not notif :
+                return
+            yield notif
+
+    def putNotification(self, item) :
+        if not self.notifCallback :
+            return IpMgrConnectorMux.putNotification(self, item)
+        (ids, param) = item
+        if not isinstance(param, tuple) :
+            recordType = self.notifTupleTable.get(ids[-1])
+            param = recordType(**param) if recordType else None
+        try :
+            self.notifCallback(ids[-1], param)
+        except Exception as err :
+            log.exception("notifCallback failed on {0}: {1}".format(ids[-1], err))
+
+    def __getattr__(self, name) :
+        '''
+        \brief Provide the dn_<command>_async() variant of each dn_<command>()
+               method, returning a CommandFuture completed from the reactor
+               thread, rather than by the dispatcher thread of ApiConnector.
+
+        dn_<command>_trusted_async() sends the command without validating it,
+        as dn_<command>_trusted() does.
+        '''
+        if name.startswith('dn_') and name.endswith('_async') :
+            cmdName = name[len('dn_'):-len('_async')]
+            trusted = cmdName.endswith('_trusted')
+            if trusted :
+                cmdName = cmdName[:-len('_trusted')]
+            func = getattr(IpMgrConnectorMux, 'dn_' + cmdName, None)
+            if func is not None :
+                return self._makeAsync(name, cmdName, func, trusted)
+        return IpMgrConnectorMux.__getattr__(self, name)
+
+    #======================== reactor interface ===============================
+
+    def fileno(self) :
+        return self.socket.fileno()
+
+    def rxReady(self) :
+        '''
+        \brief Read from the socket, called by the reactor when it is readable.
+
+        \returns False if the connection is lost.
+        '''
+        try :
+            return self.muxMsg.recv_into(self.socket) > 0
+        except socket.error as way :
+            if way.args[0] in [errno.EAGAIN, errno.EWOULDBLOCK] :
+                return True
+            self.disconnectReason = "Disconnect. Reason: {0}".format(way)
+            return False
+
+    def txReady(self) :
+        '''
+        \brief Send the bytes queued, called by the reactor when the socket
+               is writable.
+
+        \returns False if the connection is lost.
+        '''
+        try :
+            with self.txLock :
+                self._flush()
+        except socket.error as way :
+            self.disconnectReason = "Disconnect. Reason: {0}".format(way)
+            return False
+        return True
+
+    def detached(self) :
+        '''
+        \brief Close the socket, called by the reactor once it has stopped
+               servicing it.
+        '''
+        reason = self.disconnectReason or "Disconnect. Reason: Connection close"
+        ApiConnector.ApiConnector.disconnect(self, reason)
+        with self.txLock :
+            try :
+                self._flush()       # e.g. "stop", if the socket takes it
+            except socket.error :
+                pass    # Ignore socket error
+            self.txBuf = ''
+        try :
+            self.socket.close()
+        except socket.error :
+            pass    # Ignore socket error
+        with self.pendingLock :
+            (pendingCmds, self.pendingCmds) = (self.pendingCmds, [])
+        for (cmdNames, packet, future, convert) in pendingCmds :
+            future.set_exception(ApiException.ConnectionError(reason))
+        if self.ownReactor :
+            self.reactor.close()
+
+    #======================== private =========================================
+
+    def _makeAsync(self, name, cmdName, func, trusted) :
+        argNames = inspect.getargspec(func).args[1:]
+        # commands without a named tuple, e.g. hello, return the fields dict
+        tupleClass = getattr(IpMgrConnectorMux, 'Tuple_dn_' + cmdName, None)
+        convert = (lambda res : tupleClass(**res)) if tupleClass else None
+        def _async(*args, **kwargs) :
+            fields = dict(zip(argNames, args))
+            fields.update(kwargs)
+            return self._sendAsync([cmdName], fields, convert, trusted)
+        _async.__name__ = name
+        return _async
+
+    def _sendAsync(self, cmdNames, params, convert, trusted = False) :
+        '''
+        \brief Serialize a command, and send it once the previous ones have
+               been acknowledged.
+
+        \param convert function applied to the response fields, None to
+                       return them as is
+        '''
+        future = ApiConnector.CommandFuture()
+        try :
+            if not self.isConnected :
+                raise ApiException.ConnectionError("Disconnected")
+            ApiConnector.log.debug("IO OUT.    {0} : {1}".format(cmdNames, params))
+            (cmdId, paramsBinList) = self.apiDef.serialize(cmdNames, params, trusted or self.isTrustedCall())
+        except Exception as err :
+            future.set_exception(err)
+            return future
+        paramsBin = str(bytearray(paramsBinList))
+        ApiConnector.logDump(paramsBin, "RawIO OUT. Command ID: {0}".format(cmdId))
+        packet = self.muxMsg.build_message(cmdId, paramsBin)
+
+        with self.pendingLock :
+            self.pendingCmds.append((cmdNames, packet, future, convert))
+            isFirst = len(self.pendingCmds) == 1
+        if isFirst :
+            self._transmit(packet)
+        return future
+
+    def _transmit(self, packet) :
+        '''
+        \brief Queue a packet, and send as much of it as the socket accepts
+               without blocking. The reactor sends the rest.
+        '''
+        try :
+            with self.txLock :
+                self.txBuf += packet
+                self._flush()
+        except socket.error, way :
+            # Socket error. Disconnect from device, failing the pending commands
+            self.disconnect("IO output error [{0}] {1}".format(way.args[0], way.args[-1]))
+
+    def _flush(self) :
+        '''
+        \brief Send the bytes queued until the socket would block, and have
+               the reactor call txReady() while some are left.
+
+        \pre txLock is held.
+        '''
+        while self.txBuf :
+            try :
+                numBytes = self.socket.send(self.txBuf)
+            except socket.error as way :
+                if way.args[0] in [errno.EAGAIN, errno.EWOULDBLOCK] :
+                    break
+                raise
+            self.txBuf = self.txBuf[numBytes:]
+        isWatchingWrite = len(self.txBuf) > 0
+        if isWatchingWrite != self.isWatchingWrite :
+            self.isWatchingWrite = isWatchingWrite
+            self.reactor.watchWrite(self, isWatchingWrite)
+
+    def processCmd(self, reserved, cmdId, payload) :
+        if cmdId in self.notifIds :
+            return IpMgrConnectorMux.processCmd(self, reserved, cmdId, payload)
+
+        # acknowledge of the first pending command
+        ApiConnector.logDump(payload, "RawIO INP. Command ID: {0}".format(cmdId))
+        with self.pendingLock :
+            if not self.pendingCmds :
+                log.error("Unexpected acknowledge {0}, no command pending".format(cmdId))
+                return
+            (cmdNames, packet, future, convert) = self.pendingCmds.pop(0)
+            nextPacket = self.pendingCmds[0][1] if self.pendingCmds else None
+        try :
+            resParams = self._parseAcknowledge(cmdNames, cmdId, payload)
+            if convert :
+                resParams = convert(resParams)
+        except Exception as err :
+            future.set_exception(err)
+        else :
+            future.set_result(resParams)
+        if nextPacket and self.isConnected :
+            self._transmit(nextPacket)
@@ -2,8 +2,8 @@
 This module was generated automatically. Do not edit directly.
 '''
 
-import collections
 from   SmartMeshSDK import ApiException
+from   SmartMeshSDK.utils import LazyNamedTuple
 from   IpMgrConnectorMuxInternal import IpMgrConnectorMuxInternal
 
 ##
@@ -38,7 +38,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     # - <tt>version</tt>: 1-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_mux_hello = collections.namedtuple("Tuple_dn_mux_hello", ['RC', 'version'])
+    Tuple_dn_mux_hello = LazyNamedTuple.namedtuple("Tuple_dn_mux_hello", ['RC', 'version'])
 
     ##
     # Sent by the manager to initiate a new session with a client.
@@ -89,7 +89,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     #     This field can only take one of the following values:
     #      - 0: legacy
     # 
-    Tuple_dn_hello_response = collections.namedtuple("Tuple_dn_hello_response", ['successCode', 'version', 'mgrSeqNo', 'cliSeqNo', 'mode'])
+    Tuple_dn_hello_response = LazyNamedTuple.namedtuple("Tuple_dn_hello_response", ['successCode', 'version', 'mgrSeqNo', 'cliSeqNo', 'mode'])
 
     ##
     # 
@@ -122,7 +122,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     # - <tt>macAddress</tt>: 8-byte field formatted as a hex.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_reset = collections.namedtuple("Tuple_dn_reset", ['RC', 'macAddress'])
+    Tuple_dn_reset = LazyNamedTuple.namedtuple("Tuple_dn_reset", ['RC', 'macAddress'])
 
     ##
     # The reset command is used to reset various objects. The command argument is an object type, and if the object is a mote the MAC address must be specified (otherwise that argument is ignored).
@@ -158,7 +158,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     #      - 18: RC_NOT_FOUND
     #      - 19: RC_UNSUPPORTED
     # 
-    Tuple_dn_subscribe = collections.namedtuple("Tuple_dn_subscribe", ['RC'])
+    Tuple_dn_subscribe = LazyNamedTuple.namedtuple("Tuple_dn_subscribe", ['RC'])
 
     ##
     # The subscribe command indicates that the manager should send the external application the specified notifications. It contains two filter fields:
@@ -209,7 +209,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     # - <tt>asnOffset</tt>: 2-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getTime = collections.namedtuple("Tuple_dn_getTime", ['RC', 'uptime', 'utcSecs', 'utcUsecs', 'asn', 'asnOffset'])
+    Tuple_dn_getTime = LazyNamedTuple.namedtuple("Tuple_dn_getTime", ['RC', 'uptime', 'utcSecs', 'utcUsecs', 'asn', 'asnOffset'])
 
     ##
     # The getTime command returns the current manager UTC time and current absolute slot number (ASN). The time values returned by this command are delayed by queuing and transfer time over the serial connection. For additional precision, an external application should trigger the networkTime notification using the Time Pin.
@@ -240,7 +240,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     #      - 18: RC_NOT_FOUND
     #      - 19: RC_UNSUPPORTED
     # 
-    Tuple_dn_setNetworkConfig = collections.namedtuple("Tuple_dn_setNetworkConfig", ['RC'])
+    Tuple_dn_setNetworkConfig = LazyNamedTuple.namedtuple("Tuple_dn_setNetworkConfig", ['RC'])
 
     ##
     # The setNetworkConfig command changes network configuration parameters. The response code indicates whether the changes were successfully applied. This change is persistent.
@@ -315,7 +315,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     #      - 18: RC_NOT_FOUND
     #      - 19: RC_UNSUPPORTED
     # 
-    Tuple_dn_clearStatistics = collections.namedtuple("Tuple_dn_clearStatistics", ['RC'])
+    Tuple_dn_clearStatistics = LazyNamedTuple.namedtuple("Tuple_dn_clearStatistics", ['RC'])
 
     ##
     # The clearStatistics command clears the accumulated network statistics. The command does not clear path quality or mote statistics.
@@ -348,7 +348,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     # - <tt>callbackId</tt>: 4-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_exchangeMoteJoinKey = collections.namedtuple("Tuple_dn_exchangeMoteJoinKey", ['RC', 'callbackId'])
+    Tuple_dn_exchangeMoteJoinKey = LazyNamedTuple.namedtuple("Tuple_dn_exchangeMoteJoinKey", ['RC', 'callbackId'])
 
     ##
     # The exchangeMoteJoinKey command triggers the manager to send a new join key to the specified mote and update the manager's ACL entry for the mote. The response contains a callbackId. A commandFinished event notification with this callbackId will be sent when the operation is complete. This change is persistent.
@@ -384,7 +384,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     # - <tt>callbackId</tt>: 4-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_exchangeNetworkId = collections.namedtuple("Tuple_dn_exchangeNetworkId", ['RC', 'callbackId'])
+    Tuple_dn_exchangeNetworkId = LazyNamedTuple.namedtuple("Tuple_dn_exchangeNetworkId", ['RC', 'callbackId'])
 
     ##
     # The exchangeNetworkId command triggers the manager to distribute a new network ID to all the motes in the network. A callbackId is returned in the response. A commandFinished notification with this callbackId will be sent when the operation is complete. This change is persistent.
@@ -416,7 +416,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     #      - 18: RC_NOT_FOUND
     #      - 19: RC_UNSUPPORTED
     # 
-    Tuple_dn_radiotestTx = collections.namedtuple("Tuple_dn_radiotestTx", ['RC'])
+    Tuple_dn_radiotestTx = LazyNamedTuple.namedtuple("Tuple_dn_radiotestTx", ['RC'])
 
     ##
     # The radiotestTx command allows the user to initiate a radio transmission test. It may only be executed if the manager has been booted up in radiotest mode (see setNetworkConfig command). Four types of transmission tests are supported:
@@ -528,7 +528,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     #      - 18: RC_NOT_FOUND
     #      - 19: RC_UNSUPPORTED
     # 
-    Tuple_dn_radiotestRx = collections.namedtuple("Tuple_dn_radiotestRx", ['RC'])
+    Tuple_dn_radiotestRx = LazyNamedTuple.namedtuple("Tuple_dn_radiotestRx", ['RC'])
 
     ##
     # The radiotestRx command clears all previously collected statistics and initiates radio reception on the specified channel. It may only be executed if the manager has been booted up in radiotest mode (see setNetworkConfig command). During the test, the device keeps statistics about the number of packets received (with and without error). The test results may be retrieved using the getRadiotestStatistics command.
@@ -574,7 +574,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     # - <tt>rxFail</tt>: 2-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getRadiotestStatistics = collections.namedtuple("Tuple_dn_getRadiotestStatistics", ['RC', 'rxOk', 'rxFail'])
+    Tuple_dn_getRadiotestStatistics = LazyNamedTuple.namedtuple("Tuple_dn_getRadiotestStatistics", ['RC', 'rxOk', 'rxFail'])
 
     ##
     # This command retrieves statistics from a previously run radiotestRx command. It may only be executed if the manager has been booted up in radiotest mode (see setNetworkConfig command).
@@ -605,7 +605,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     #      - 18: RC_NOT_FOUND
     #      - 19: RC_UNSUPPORTED
     # 
-    Tuple_dn_setACLEntry = collections.namedtuple("Tuple_dn_setACLEntry", ['RC'])
+    Tuple_dn_setACLEntry = LazyNamedTuple.namedtuple("Tuple_dn_setACLEntry", ['RC'])
 
     ##
     # The setACLEntry command adds a new entry or updates an existing entry in the Access Control List (ACL). This change is persistent. The maximum number of entries is 1,200.
@@ -643,7 +643,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     # - <tt>joinKey</tt>: 16-byte field formatted as a hex.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getNextACLEntry = collections.namedtuple("Tuple_dn_getNextACLEntry", ['RC', 'macAddress', 'joinKey'])
+    Tuple_dn_getNextACLEntry = LazyNamedTuple.namedtuple("Tuple_dn_getNextACLEntry", ['RC', 'macAddress', 'joinKey'])
 
     ##
     # The getNextACLEntry command returns information about next mote entry in the access control list (ACL). To begin a search (find the first mote in ACL), a zero MAC address (0000000000000000) should be sent. There is no mechanism for reading the ACL entry of a specific mote. This call is an iterator. If you call getNextACLEntry with mote A as the argument, your response is the ACL entry for mote B, where B is the next mote in the ACL.
@@ -675,7 +675,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     #      - 18: RC_NOT_FOUND
     #      - 19: RC_UNSUPPORTED
     # 
-    Tuple_dn_deleteACLEntry = collections.namedtuple("Tuple_dn_deleteACLEntry", ['RC'])
+    Tuple_dn_deleteACLEntry = LazyNamedTuple.namedtuple("Tuple_dn_deleteACLEntry", ['RC'])
 
     ##
     # The deleteACLEntry command deletes the specified mote from the access control list (ACL). If the macAddress parameter is set to all 0xFFs or all 0x00s, the entire ACL is cleared. This change is persistent.
@@ -709,7 +709,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     # - <tt>callbackId</tt>: 4-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_pingMote = collections.namedtuple("Tuple_dn_pingMote", ['RC', 'callbackId'])
+    Tuple_dn_pingMote = LazyNamedTuple.namedtuple("Tuple_dn_pingMote", ['RC', 'callbackId'])
 
     ##
     # The pingMote command sends a ping (echo request) to the mote specified by MAC address. A unique callbackId is generated and returned with the response. When the response is received from the mote, the manager generates a pingResponse notification with the measured round trip delay and several other parameters. The request is sent using unacknowledged transport, so the mote is not guaranteed to receive the request.
@@ -741,7 +741,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     #      - 18: RC_NOT_FOUND
     #      - 19: RC_UNSUPPORTED
     # 
-    Tuple_dn_getLog = collections.namedtuple("Tuple_dn_getLog", ['RC'])
+    Tuple_dn_getLog = LazyNamedTuple.namedtuple("Tuple_dn_getLog", ['RC'])
 
     ##
     # The getLog command retrieves diagnostic logs from the manager or a mote specified by MAC address.
@@ -775,7 +775,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     # - <tt>callbackId</tt>: 4-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_sendData = collections.namedtuple("Tuple_dn_sendData", ['RC', 'callbackId'])
+    Tuple_dn_sendData = LazyNamedTuple.namedtuple("Tuple_dn_sendData", ['RC', 'callbackId'])
 
     ##
     # The sendData command sends a packet to a mote in the network. The response contains a callbackId. When the manager injects the packet into the network, it will generate a packetSent notification. It is the responsibility of the customer's application layer at the mote to send a response. It is also the responsibility of the customer's application layer to timeout if no response is received at the manager if one is expected.
@@ -822,7 +822,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     #      - 18: RC_NOT_FOUND
     #      - 19: RC_UNSUPPORTED
     # 
-    Tuple_dn_startNetwork = collections.namedtuple("Tuple_dn_startNetwork", ['RC'])
+    Tuple_dn_startNetwork = LazyNamedTuple.namedtuple("Tuple_dn_startNetwork", ['RC'])
 
     ##
     # The startNetwork command tells the manager to allow the network to start forming (begin accepting join requests from devices). The external application must issue the startNetwork command if the autoStartNetwork flag is not set (see setNetworkConfig).
@@ -869,7 +869,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     # - <tt>swBuild</tt>: 2-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getSystemInfo = collections.namedtuple("Tuple_dn_getSystemInfo", ['RC', 'macAddress', 'hwModel', 'hwRev', 'swMajor', 'swMinor', 'swPatch', 'swBuild'])
+    Tuple_dn_getSystemInfo = LazyNamedTuple.namedtuple("Tuple_dn_getSystemInfo", ['RC', 'macAddress', 'hwModel', 'hwRev', 'swMajor', 'swMinor', 'swPatch', 'swBuild'])
 
     ##
     # The getSystemInfo command returns system-level information about the hardware and software versions.
@@ -915,7 +915,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     # - <tt>isRouting</tt>: 1-byte field formatted as a bool.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getMoteConfig = collections.namedtuple("Tuple_dn_getMoteConfig", ['RC', 'macAddress', 'moteId', 'isAP', 'state', 'reserved', 'isRouting'])
+    Tuple_dn_getMoteConfig = LazyNamedTuple.namedtuple("Tuple_dn_getMoteConfig", ['RC', 'macAddress', 'moteId', 'isAP', 'state', 'reserved', 'isRouting'])
 
     ##
     # The getMoteConfig command returns a single mote description as the response. The command takes two arguments, a MAC Address and a flag indicating whether the MAC Address refers to the requested mote or to the next mote in managers memory. This command may be used to iterate through all motes known by the manager by starting with the macAddress parameter set to 0 and next set to true, and then using the MAC Address of that response as the input to the next call.
@@ -969,7 +969,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     # - <tt>rssiDestSrc</tt>: 1-byte field formatted as a ints.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getPathInfo = collections.namedtuple("Tuple_dn_getPathInfo", ['RC', 'source', 'dest', 'direction', 'numLinks', 'quality', 'rssiSrcDest', 'rssiDestSrc'])
+    Tuple_dn_getPathInfo = LazyNamedTuple.namedtuple("Tuple_dn_getPathInfo", ['RC', 'source', 'dest', 'direction', 'numLinks', 'quality', 'rssiSrcDest', 'rssiDestSrc'])
 
     ##
     # The getPathInfo command returns parameters of requested path.
@@ -1023,7 +1023,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     # - <tt>rssiDestSrc</tt>: 1-byte field formatted as a ints.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getNextPathInfo = collections.namedtuple("Tuple_dn_getNextPathInfo", ['RC', 'pathId', 'source', 'dest', 'direction', 'numLinks', 'quality', 'rssiSrcDest', 'rssiDestSrc'])
+    Tuple_dn_getNextPathInfo = LazyNamedTuple.namedtuple("Tuple_dn_getNextPathInfo", ['RC', 'pathId', 'source', 'dest', 'direction', 'numLinks', 'quality', 'rssiSrcDest', 'rssiDestSrc'])
 
     ##
     # The getNextPathInfo command allows iteration across paths connected to a particular mote. The pathId parameter indicates the previous value in the iteration. Setting pathId to 0 returns the first path. A pathId can not be used as a unique identifier for a path. It is only valid when associated with a particular mote.
@@ -1063,7 +1063,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     # - <tt>callbackId</tt>: 4-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_setAdvertising = collections.namedtuple("Tuple_dn_setAdvertising", ['RC', 'callbackId'])
+    Tuple_dn_setAdvertising = LazyNamedTuple.namedtuple("Tuple_dn_setAdvertising", ['RC', 'callbackId'])
 
     ##
     # The setAdvertising command tells the manager to activate, deactivate, or use slow advertising. The response is a callbackId. A commandFinished notification with the callbackId is generated when the command propagation is complete.
@@ -1105,7 +1105,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     # - <tt>callbackId</tt>: 4-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_setDownstreamFrameMode = collections.namedtuple("Tuple_dn_setDownstreamFrameMode", ['RC', 'callbackId'])
+    Tuple_dn_setDownstreamFrameMode = LazyNamedTuple.namedtuple("Tuple_dn_setDownstreamFrameMode", ['RC', 'callbackId'])
 
     ##
     # The setDownstreamFrameMode command tells the manager to shorten or extend the downstream slotframe. The base slotframe length will be multiplied by the downFrameMultVal for "normal" speed. For "fast" speed the downstream slotframe is the base length. Once this command is executed, the manager switches to manual mode and no longer changes slotframe size automatically. The response is a callbackId. A commandFinished notification with the callbackId is generated when the command propagation is complete.
@@ -1161,7 +1161,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     # - <tt>apiRxProtErr</tt>: 2-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getManagerStatistics = collections.namedtuple("Tuple_dn_getManagerStatistics", ['RC', 'serTxCnt', 'serRxCnt', 'serRxCRCErr', 'serRxOverruns', 'apiEstabConn', 'apiDroppedConn', 'apiTxOk', 'apiTxErr', 'apiTxFail', 'apiRxOk', 'apiRxProtErr'])
+    Tuple_dn_getManagerStatistics = LazyNamedTuple.namedtuple("Tuple_dn_getManagerStatistics", ['RC', 'serTxCnt', 'serRxCnt', 'serRxCRCErr', 'serRxOverruns', 'apiEstabConn', 'apiDroppedConn', 'apiTxOk', 'apiTxErr', 'apiTxFail', 'apiRxOk', 'apiRxProtErr'])
 
     ##
     # The getManagerStatistics command returns dynamic information and statistics about the manager API. The statistics counts are cleared together with all current statistics using clearStatistics.
@@ -1192,7 +1192,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     #      - 18: RC_NOT_FOUND
     #      - 19: RC_UNSUPPORTED
     # 
-    Tuple_dn_setTime = collections.namedtuple("Tuple_dn_setTime", ['RC'])
+    Tuple_dn_setTime = LazyNamedTuple.namedtuple("Tuple_dn_setTime", ['RC'])
 
     ##
     # This command has been deprecated, and should not be used in new designs. When the Manager restarts, it will start counting from 20:00:00 UTC July 2, 2002.
@@ -1232,7 +1232,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     # - <tt>license</tt>: 13-byte field formatted as a hex.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getLicense = collections.namedtuple("Tuple_dn_getLicense", ['RC', 'license'])
+    Tuple_dn_getLicense = LazyNamedTuple.namedtuple("Tuple_dn_getLicense", ['RC', 'license'])
 
     ##
     # The getLicense command has been deprecated in Manager >= 1.3.0.There is no need to use a license to enable > 32 mote networks.
@@ -1265,7 +1265,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     #      - 18: RC_NOT_FOUND
     #      - 19: RC_UNSUPPORTED
     # 
-    Tuple_dn_setLicense = collections.namedtuple("Tuple_dn_setLicense", ['RC'])
+    Tuple_dn_setLicense = LazyNamedTuple.namedtuple("Tuple_dn_setLicense", ['RC'])
 
     ##
     # The setLicense command has been deprecated in Manager >= 1.3.0. There is no longer a need to use a license to enable > 32 mote networks.
@@ -1299,7 +1299,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     #      - 18: RC_NOT_FOUND
     #      - 19: RC_UNSUPPORTED
     # 
-    Tuple_dn_setCLIUser = collections.namedtuple("Tuple_dn_setCLIUser", ['RC'])
+    Tuple_dn_setCLIUser = LazyNamedTuple.namedtuple("Tuple_dn_setCLIUser", ['RC'])
 
     ##
     # The setCLIUser command sets the password that must be used to log into the command line for a particular user role. The user roles are:
@@ -1340,7 +1340,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     # - <tt>callbackId</tt>: 4-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_sendIP = collections.namedtuple("Tuple_dn_sendIP", ['RC', 'callbackId'])
+    Tuple_dn_sendIP = LazyNamedTuple.namedtuple("Tuple_dn_sendIP", ['RC', 'callbackId'])
 
     ##
     # The sendIP command sends a 6LoWPAN packet to a mote in the network. The response contains a callback Id. When the manager injects the packet into the network, it will generate a packetSent notification with the calllbackId. The application is responsible for constructing a valid 6LoWPAN packet. The packet is sent to the mote best-effort, so the application should deal with responses and timeouts, if any.
@@ -1385,7 +1385,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     #      - 18: RC_NOT_FOUND
     #      - 19: RC_UNSUPPORTED
     # 
-    Tuple_dn_restoreFactoryDefaults = collections.namedtuple("Tuple_dn_restoreFactoryDefaults", ['RC'])
+    Tuple_dn_restoreFactoryDefaults = LazyNamedTuple.namedtuple("Tuple_dn_restoreFactoryDefaults", ['RC'])
 
     ##
     # The restoreFactoryDefaults command restores the default configuration and clears the ACL. This change is persistent.
@@ -1447,7 +1447,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     # - <tt>hopDepth</tt>: 1-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getMoteInfo = collections.namedtuple("Tuple_dn_getMoteInfo", ['RC', 'macAddress', 'state', 'numNbrs', 'numGoodNbrs', 'requestedBw', 'totalNeededBw', 'assignedBw', 'packetsReceived', 'packetsLost', 'avgLatency', 'stateTime', 'numJoins', 'hopDepth'])
+    Tuple_dn_getMoteInfo = LazyNamedTuple.namedtuple("Tuple_dn_getMoteInfo", ['RC', 'macAddress', 'state', 'numNbrs', 'numGoodNbrs', 'requestedBw', 'totalNeededBw', 'assignedBw', 'packetsReceived', 'packetsLost', 'avgLatency', 'stateTime', 'numJoins', 'hopDepth'])
 
     ##
     # The getMoteInfo command returns dynamic information for the specified mote.
@@ -1519,7 +1519,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     # - <tt>oneChannel</tt>: 1-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getNetworkConfig = collections.namedtuple("Tuple_dn_getNetworkConfig", ['RC', 'networkId', 'apTxPower', 'frameProfile', 'maxMotes', 'baseBandwidth', 'downFrameMultVal', 'numParents', 'ccaMode', 'channelList', 'autoStartNetwork', 'locMode', 'bbMode', 'bbSize', 'isRadioTest', 'bwMult', 'oneChannel'])
+    Tuple_dn_getNetworkConfig = LazyNamedTuple.namedtuple("Tuple_dn_getNetworkConfig", ['RC', 'networkId', 'apTxPower', 'frameProfile', 'maxMotes', 'baseBandwidth', 'downFrameMultVal', 'numParents', 'ccaMode', 'channelList', 'autoStartNetwork', 'locMode', 'bbMode', 'bbSize', 'isRadioTest', 'bwMult', 'oneChannel'])
 
     ##
     # The getNetworkConfig command returns general network configuration parameters, including the Network ID, bandwidth parameters and number of motes.
@@ -1584,7 +1584,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     # - <tt>maxNumbHops</tt>: 1-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getNetworkInfo = collections.namedtuple("Tuple_dn_getNetworkInfo", ['RC', 'numMotes', 'asnSize', 'advertisementState', 'downFrameState', 'netReliability', 'netPathStability', 'netLatency', 'netState', 'ipv6Address', 'numLostPackets', 'numArrivedPackets', 'maxNumbHops'])
+    Tuple_dn_getNetworkInfo = LazyNamedTuple.namedtuple("Tuple_dn_getNetworkInfo", ['RC', 'numMotes', 'asnSize', 'advertisementState', 'downFrameState', 'netReliability', 'netPathStability', 'netLatency', 'netState', 'ipv6Address', 'numLostPackets', 'numArrivedPackets', 'maxNumbHops'])
 
     ##
     # The getNetworkInfo command returns dynamic network information and statistics.
@@ -1630,7 +1630,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     # - <tt>isRouting</tt>: 1-byte field formatted as a bool.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getMoteConfigById = collections.namedtuple("Tuple_dn_getMoteConfigById", ['RC', 'macAddress', 'moteId', 'isAP', 'state', 'reserved', 'isRouting'])
+    Tuple_dn_getMoteConfigById = LazyNamedTuple.namedtuple("Tuple_dn_getMoteConfigById", ['RC', 'macAddress', 'moteId', 'isAP', 'state', 'reserved', 'isRouting'])
 
     ##
     # The getMoteConfigById command returns a single mote description as the response. The command takes one argument, the short address of a mote (Mote ID). The command returns the same response structure as the getMoteConfig command.
@@ -1662,7 +1662,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     #      - 18: RC_NOT_FOUND
     #      - 19: RC_UNSUPPORTED
     # 
-    Tuple_dn_setCommonJoinKey = collections.namedtuple("Tuple_dn_setCommonJoinKey", ['RC'])
+    Tuple_dn_setCommonJoinKey = LazyNamedTuple.namedtuple("Tuple_dn_setCommonJoinKey", ['RC'])
 
     ##
     # The setCommonJoinKey command will set a new value for the common join key. The common join key is used to decrypt join messages only if the ACL is empty.
@@ -1698,7 +1698,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     # - <tt>mask</tt>: 16-byte field formatted as a hex.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getIPConfig = collections.namedtuple("Tuple_dn_getIPConfig", ['RC', 'ipv6Address', 'mask'])
+    Tuple_dn_getIPConfig = LazyNamedTuple.namedtuple("Tuple_dn_getIPConfig", ['RC', 'ipv6Address', 'mask'])
 
     ##
     # The getIPConfig command returns the manager's IP configuration parameters, including the IPv6 address and mask.
@@ -1729,7 +1729,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     #      - 18: RC_NOT_FOUND
     #      - 19: RC_UNSUPPORTED
     # 
-    Tuple_dn_setIPConfig = collections.namedtuple("Tuple_dn_setIPConfig", ['RC'])
+    Tuple_dn_setIPConfig = LazyNamedTuple.namedtuple("Tuple_dn_setIPConfig", ['RC'])
 
     ##
     # The setIPConfig command sets the IPv6 prefix of the mesh network. Only the upper 8 bytes of the IPv6 address are relevant: the lower 8 bytes of the IPv6 address are ignored, and lower 8 bytes of the mask field are reserved and should be set to 0. This change is persistent.
@@ -1763,7 +1763,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     #      - 18: RC_NOT_FOUND
     #      - 19: RC_UNSUPPORTED
     # 
-    Tuple_dn_deleteMote = collections.namedtuple("Tuple_dn_deleteMote", ['RC'])
+    Tuple_dn_deleteMote = LazyNamedTuple.namedtuple("Tuple_dn_deleteMote", ['RC'])
 
     ##
     # The deleteMote command deletes a mote from the manager's list. A mote can only be deleted if it is in the Lost state.
@@ -1901,7 +1901,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     # - <tt>flags_10</tt>: 1-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getMoteLinks = collections.namedtuple("Tuple_dn_getMoteLinks", ['RC', 'idx', 'utilization', 'numLinks', 'frameId_1', 'slot_1', 'channelOffset_1', 'moteId_1', 'flags_1', 'frameId_2', 'slot_2', 'channelOffset_2', 'moteId_2', 'flags_2', 'frameId_3', 'slot_3', 'channelOffset_3', 'moteId_3', 'flags_3', 'frameId_4', 'slot_4', 'channelOffset_4', 'moteId_4', 'flags_4', 'frameId_5', 'slot_5', 'channelOffset_5', 'moteId_5', 'flags_5', 'frameId_6', 'slot_6', 'channelOffset_6', 'moteId_6', 'flags_6', 'frameId_7', 'slot_7', 'channelOffset_7', 'moteId_7', 'flags_7', 'frameId_8', 'slot_8', 'channelOffset_8', 'moteId_8', 'flags_8', 'frameId_9', 'slot_9', 'channelOffset_9', 'moteId_9', 'flags_9', 'frameId_10', 'slot_10', 'channelOffset_10', 'moteId_10', 'flags_10'])
+    Tuple_dn_getMoteLinks = LazyNamedTuple.namedtuple("Tuple_dn_getMoteLinks", ['RC', 'idx', 'utilization', 'numLinks', 'frameId_1', 'slot_1', 'channelOffset_1', 'moteId_1', 'flags_1', 'frameId_2', 'slot_2', 'channelOffset_2', 'moteId_2', 'flags_2', 'frameId_3', 'slot_3', 'channelOffset_3', 'moteId_3', 'flags_3', 'frameId_4', 'slot_4', 'channelOffset_4', 'moteId_4', 'flags_4', 'frameId_5', 'slot_5', 'channelOffset_5', 'moteId_5', 'flags_5', 'frameId_6', 'slot_6', 'channelOffset_6', 'moteId_6', 'flags_6', 'frameId_7', 'slot_7', 'channelOffset_7', 'moteId_7', 'flags_7', 'frameId_8', 'slot_8', 'channelOffset_8', 'moteId_8', 'flags_8', 'frameId_9', 'slot_9', 'channelOffset_9', 'moteId_9', 'flags_9', 'frameId_10', 'slot_10', 'channelOffset_10', 'moteId_10', 'flags_10'])
 
     ##
     # The getMoteLinks command returns information about links assigned to the mote. The response contains a list of links starting with Nth link on the mote, where N is supplied as the idx parameter in the request. To retrieve all links on the device the user can call this command with idx that increments by number of links returned with prior response, until the command returns RC_END_OF_LIST response code. Note that links assigned to a mote may change between API calls.
@@ -1935,7 +1935,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     #      - 18: RC_NOT_FOUND
     #      - 19: RC_UNSUPPORTED
     # 
-    Tuple_dn_radiotestRxPER = collections.namedtuple("Tuple_dn_radiotestRxPER", ['RC'])
+    Tuple_dn_radiotestRxPER = LazyNamedTuple.namedtuple("Tuple_dn_radiotestRxPER", ['RC'])
 
     ##
     # The radiotestRxPER command initiates the Packet Error Rate (PER) test in RX mode. This command may be issued only if the manager has been booted up in radiotest mode (see setNetworkConfig command).
@@ -1968,7 +1968,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     #      - 18: RC_NOT_FOUND
     #      - 19: RC_UNSUPPORTED
     # 
-    Tuple_dn_radiotestTxPER = collections.namedtuple("Tuple_dn_radiotestTxPER", ['RC'])
+    Tuple_dn_radiotestTxPER = LazyNamedTuple.namedtuple("Tuple_dn_radiotestTxPER", ['RC'])
 
     ##
     # The radiotestTxPER command initiates the Packet Error Rate (PER) test in TX mode. This command may be issued only if the manager has been booted up in radiotest mode (see setNetworkConfig command).
@@ -1996,7 +1996,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     ##
     # Dictionary of all notification tuples.
     #
-    notifTupleTable = {}
+    notifTupleTable = LazyNamedTuple.TupleTable()
     
     ##
     # \brief MANAGER_HELLO notification.
@@ -2010,7 +2010,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     #     There is no restriction on the value of this field.    
     # 
     MANAGER_HELLO = "manager_hello"
-    notifTupleTable[MANAGER_HELLO] = Tuple_manager_hello = collections.namedtuple("Tuple_manager_hello", ['version', 'mode'])
+    notifTupleTable[MANAGER_HELLO] = Tuple_manager_hello = LazyNamedTuple.namedtuple("Tuple_manager_hello", ['version', 'mode'])
 
     ##
     # \brief EVENTMOTERESET notification.
@@ -2024,7 +2024,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     #     There is no restriction on the value of this field.    
     # 
     EVENTMOTERESET = "eventMoteReset"
-    notifTupleTable[EVENTMOTERESET] = Tuple_eventMoteReset = collections.namedtuple("Tuple_eventMoteReset", ['eventId', 'macAddress'])
+    notifTupleTable[EVENTMOTERESET] = Tuple_eventMoteReset = LazyNamedTuple.namedtuple("Tuple_eventMoteReset", ['eventId', 'macAddress'])
 
     ##
     # \brief EVENTNETWORKRESET notification.
@@ -2036,7 +2036,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     #     There is no restriction on the value of this field.    
     # 
     EVENTNETWORKRESET = "eventNetworkReset"
-    notifTupleTable[EVENTNETWORKRESET] = Tuple_eventNetworkReset = collections.namedtuple("Tuple_eventNetworkReset", ['eventId'])
+    notifTupleTable[EVENTNETWORKRESET] = Tuple_eventNetworkReset = LazyNamedTuple.namedtuple("Tuple_eventNetworkReset", ['eventId'])
 
     ##
     # \brief EVENTCOMMANDFINISHED notification.
@@ -2055,7 +2055,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     #      - 2: commandTimeout    
     # 
     EVENTCOMMANDFINISHED = "eventCommandFinished"
-    notifTupleTable[EVENTCOMMANDFINISHED] = Tuple_eventCommandFinished = collections.namedtuple("Tuple_eventCommandFinished", ['eventId', 'callbackId', 'rc'])
+    notifTupleTable[EVENTCOMMANDFINISHED] = Tuple_eventCommandFinished = LazyNamedTuple.namedtuple("Tuple_eventCommandFinished", ['eventId', 'callbackId', 'rc'])
 
     ##
     # \brief EVENTMOTEJOIN notification.
@@ -2069,7 +2069,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     #     There is no restriction on the value of this field.    
     # 
     EVENTMOTEJOIN = "eventMoteJoin"
-    notifTupleTable[EVENTMOTEJOIN] = Tuple_eventMoteJoin = collections.namedtuple("Tuple_eventMoteJoin", ['eventId', 'macAddress'])
+    notifTupleTable[EVENTMOTEJOIN] = Tuple_eventMoteJoin = LazyNamedTuple.namedtuple("Tuple_eventMoteJoin", ['eventId', 'macAddress'])
 
     ##
     # \brief EVENTMOTEOPERATIONAL notification.
@@ -2083,7 +2083,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     #     There is no restriction on the value of this field.    
     # 
     EVENTMOTEOPERATIONAL = "eventMoteOperational"
-    notifTupleTable[EVENTMOTEOPERATIONAL] = Tuple_eventMoteOperational = collections.namedtuple("Tuple_eventMoteOperational", ['eventId', 'macAddress'])
+    notifTupleTable[EVENTMOTEOPERATIONAL] = Tuple_eventMoteOperational = LazyNamedTuple.namedtuple("Tuple_eventMoteOperational", ['eventId', 'macAddress'])
 
     ##
     # \brief EVENTMOTELOST notification.
@@ -2097,7 +2097,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     #     There is no restriction on the value of this field.    
     # 
     EVENTMOTELOST = "eventMoteLost"
-    notifTupleTable[EVENTMOTELOST] = Tuple_eventMoteLost = collections.namedtuple("Tuple_eventMoteLost", ['eventId', 'macAddress'])
+    notifTupleTable[EVENTMOTELOST] = Tuple_eventMoteLost = LazyNamedTuple.namedtuple("Tuple_eventMoteLost", ['eventId', 'macAddress'])
 
     ##
     # \brief EVENTNETWORKTIME notification.
@@ -2125,7 +2125,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     #     There is no restriction on the value of this field.    
     # 
     EVENTNETWORKTIME = "eventNetworkTime"
-    notifTupleTable[EVENTNETWORKTIME] = Tuple_eventNetworkTime = collections.namedtuple("Tuple_eventNetworkTime", ['eventId', 'uptime', 'utcSecs', 'utcUsecs', 'asn', 'asnOffset'])
+    notifTupleTable[EVENTNETWORKTIME] = Tuple_eventNetworkTime = LazyNamedTuple.namedtuple("Tuple_eventNetworkTime", ['eventId', 'uptime', 'utcSecs', 'utcUsecs', 'asn', 'asnOffset'])
 
     ##
     # \brief EVENTPINGRESPONSE notification.
@@ -2147,7 +2147,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     #     There is no restriction on the value of this field.    
     # 
     EVENTPINGRESPONSE = "eventPingResponse"
-    notifTupleTable[EVENTPINGRESPONSE] = Tuple_eventPingResponse = collections.namedtuple("Tuple_eventPingResponse", ['eventId', 'callbackId', 'macAddress', 'delay', 'voltage', 'temperature'])
+    notifTupleTable[EVENTPINGRESPONSE] = Tuple_eventPingResponse = LazyNamedTuple.namedtuple("Tuple_eventPingResponse", ['eventId', 'callbackId', 'macAddress', 'delay', 'voltage', 'temperature'])
 
     ##
     # \brief EVENTPATHCREATE notification.
@@ -2169,7 +2169,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     #      - 3: downstream    
     # 
     EVENTPATHCREATE = "eventPathCreate"
-    notifTupleTable[EVENTPATHCREATE] = Tuple_eventPathCreate = collections.namedtuple("Tuple_eventPathCreate", ['eventId', 'source', 'dest', 'direction'])
+    notifTupleTable[EVENTPATHCREATE] = Tuple_eventPathCreate = LazyNamedTuple.namedtuple("Tuple_eventPathCreate", ['eventId', 'source', 'dest', 'direction'])
 
     ##
     # \brief EVENTPATHDELETE notification.
@@ -2191,7 +2191,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     #      - 3: downstream    
     # 
     EVENTPATHDELETE = "eventPathDelete"
-    notifTupleTable[EVENTPATHDELETE] = Tuple_eventPathDelete = collections.namedtuple("Tuple_eventPathDelete", ['eventId', 'source', 'dest', 'direction'])
+    notifTupleTable[EVENTPATHDELETE] = Tuple_eventPathDelete = LazyNamedTuple.namedtuple("Tuple_eventPathDelete", ['eventId', 'source', 'dest', 'direction'])
 
     ##
     # \brief EVENTPACKETSENT notification.
@@ -2207,7 +2207,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     #     There is no restriction on the value of this field.    
     # 
     EVENTPACKETSENT = "eventPacketSent"
-    notifTupleTable[EVENTPACKETSENT] = Tuple_eventPacketSent = collections.namedtuple("Tuple_eventPacketSent", ['eventId', 'callbackId', 'rc'])
+    notifTupleTable[EVENTPACKETSENT] = Tuple_eventPacketSent = LazyNamedTuple.namedtuple("Tuple_eventPacketSent", ['eventId', 'callbackId', 'rc'])
 
     ##
     # \brief EVENTMOTECREATE notification.
@@ -2223,7 +2223,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     #     There is no restriction on the value of this field.    
     # 
     EVENTMOTECREATE = "eventMoteCreate"
-    notifTupleTable[EVENTMOTECREATE] = Tuple_eventMoteCreate = collections.namedtuple("Tuple_eventMoteCreate", ['eventId', 'macAddress', 'moteId'])
+    notifTupleTable[EVENTMOTECREATE] = Tuple_eventMoteCreate = LazyNamedTuple.namedtuple("Tuple_eventMoteCreate", ['eventId', 'macAddress', 'moteId'])
 
     ##
     # \brief EVENTMOTEDELETE notification.
@@ -2239,7 +2239,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     #     There is no restriction on the value of this field.    
     # 
     EVENTMOTEDELETE = "eventMoteDelete"
-    notifTupleTable[EVENTMOTEDELETE] = Tuple_eventMoteDelete = collections.namedtuple("Tuple_eventMoteDelete", ['eventId', 'macAddress', 'moteId'])
+    notifTupleTable[EVENTMOTEDELETE] = Tuple_eventMoteDelete = LazyNamedTuple.namedtuple("Tuple_eventMoteDelete", ['eventId', 'macAddress', 'moteId'])
 
     ##
     # \brief EVENTJOINFAILED notification.
@@ -2259,7 +2259,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     #      - 3: unexpected    
     # 
     EVENTJOINFAILED = "eventJoinFailed"
-    notifTupleTable[EVENTJOINFAILED] = Tuple_eventJoinFailed = collections.namedtuple("Tuple_eventJoinFailed", ['eventId', 'macAddress', 'reason'])
+    notifTupleTable[EVENTJOINFAILED] = Tuple_eventJoinFailed = LazyNamedTuple.namedtuple("Tuple_eventJoinFailed", ['eventId', 'macAddress', 'reason'])
 
     ##
     # \brief EVENTINVALIDMIC notification.
@@ -2273,7 +2273,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     #     There is no restriction on the value of this field.    
     # 
     EVENTINVALIDMIC = "eventInvalidMIC"
-    notifTupleTable[EVENTINVALIDMIC] = Tuple_eventInvalidMIC = collections.namedtuple("Tuple_eventInvalidMIC", ['eventId', 'macAddress'])
+    notifTupleTable[EVENTINVALIDMIC] = Tuple_eventInvalidMIC = LazyNamedTuple.namedtuple("Tuple_eventInvalidMIC", ['eventId', 'macAddress'])
 
     ##
     # \brief NOTIFLOG notification.
@@ -2287,7 +2287,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     #     There is no restriction on the value of this field.    
     # 
     NOTIFLOG = "notifLog"
-    notifTupleTable[NOTIFLOG] = Tuple_notifLog = collections.namedtuple("Tuple_notifLog", ['macAddress', 'logMsg'])
+    notifTupleTable[NOTIFLOG] = Tuple_notifLog = LazyNamedTuple.namedtuple("Tuple_notifLog", ['macAddress', 'logMsg'])
 
     ##
     # \brief NOTIFDATA notification.
@@ -2311,7 +2311,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     #     There is no restriction on the value of this field.    
     # 
     NOTIFDATA = "notifData"
-    notifTupleTable[NOTIFDATA] = Tuple_notifData = collections.namedtuple("Tuple_notifData", ['utcSecs', 'utcUsecs', 'macAddress', 'srcPort', 'dstPort', 'data'])
+    notifTupleTable[NOTIFDATA] = Tuple_notifData = LazyNamedTuple.namedtuple("Tuple_notifData", ['utcSecs', 'utcUsecs', 'macAddress', 'srcPort', 'dstPort', 'data'])
 
     ##
     # \brief NOTIFIPDATA notification.
@@ -2329,7 +2329,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     #     There is no restriction on the value of this field.    
     # 
     NOTIFIPDATA = "notifIpData"
-    notifTupleTable[NOTIFIPDATA] = Tuple_notifIpData = collections.namedtuple("Tuple_notifIpData", ['utcSecs', 'utcUsecs', 'macAddress', 'data'])
+    notifTupleTable[NOTIFIPDATA] = Tuple_notifIpData = LazyNamedTuple.namedtuple("Tuple_notifIpData", ['utcSecs', 'utcUsecs', 'macAddress', 'data'])
 
     ##
     # \brief NOTIFHEALTHREPORT notification.
@@ -2343,7 +2343,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     #     There is no restriction on the value of this field.    
     # 
     NOTIFHEALTHREPORT = "notifHealthReport"
-    notifTupleTable[NOTIFHEALTHREPORT] = Tuple_notifHealthReport = collections.namedtuple("Tuple_notifHealthReport", ['macAddress', 'payload'])
+    notifTupleTable[NOTIFHEALTHREPORT] = Tuple_notifHealthReport = LazyNamedTuple.namedtuple("Tuple_notifHealthReport", ['macAddress', 'payload'])
 
     ##
     # \brief NOTIFRADIOTESTSTATSPER notification.
@@ -2367,7 +2367,7 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     #     There is no restriction on the value of this field.    
     # 
     NOTIFRADIOTESTSTATSPER = "notifRadiotestStatsPER"
-    notifTupleTable[NOTIFRADIOTESTSTATSPER] = Tuple_notifRadiotestStatsPER = collections.namedtuple("Tuple_notifRadiotestStatsPER", ['numRxOK', 'numRxErr', 'numRxInv', 'numRxMiss', 'perInt', 'perFrac'])
+    notifTupleTable[NOTIFRADIOTESTSTATSPER] = Tuple_notifRadiotestStatsPER = LazyNamedTuple.namedtuple("Tuple_notifRadiotestStatsPER", ['numRxOK', 'numRxErr', 'numRxInv', 'numRxMiss', 'perInt', 'perFrac'])
 
     ##
     # \brief Get a notification from the notification queue, and returns
@@ -2376,10 +2376,21 @@ class IpMgrConnectorMux(IpMgrConnectorMuxInternal):
     # \exception NotificationError if unknown notification.
     # 
     def getNotification(self, timeoutSec=-1) :
-        temp = self.getNotificationInternal(timeoutSec)
+        temp = self._getNotificationRecord(timeoutSec)
         if not temp:
             return temp
+        return self._formatNotification(temp)
+
+    ##
+    # \brief Format a notification, as queued, the way getNotification() and
+    #        getNotifications() return it.
+    #
+    # \exception NotificationError if unknown notification.
+    # 
+    def _formatNotification(self, temp) :
         (ids, param) = temp
+        if isinstance(param, tuple) :
+            return (ids[-1], param)     # already deserialized into its named tuple
         try :
             if  IpMgrConnectorMux.notifTupleTable[ids[-1]] :
                 return (ids[-1], IpMgrConnectorMux.notifTupleTable[ids[-1]](**param))
@@ -25,6 +25,10 @@ class IpMgrConnectorMuxInternal(ApiConnector.ApiConnector ) :
     PARAM_HOST         = 'host'
     PARAM_PORT         = 'port'
     PARAM_ISSENDHELLO  = 'isSendHello'
+    PARAM_BINARYFIELDS = 'binaryFields'
+    PARAM_NOTIFOVERFLOW = 'notifOverflow'
+    PARAM_NOTIFLOG     = 'notifLog'
+    PARAM_NOTIFFILTER  = 'notifFilter'
 
     DEFAULT_PARAM_HOST = '127.0.0.1'
     DEFAULT_PARAM_PORT = 9900
@@ -40,7 +44,7 @@ class IpMgrConnectorMuxInternal(ApiConnector.ApiConnector ) :
         self.sendLock = threading.Lock()
         self.socket = None
         self.inputThread = None
-        self.muxMsg = MuxMsg.MuxMsg(self.processCmd)
+        self.muxMsg = MuxMsg.MuxMsg(self.processCmd, views = True)
         self.apiDef = IpMgrDefinition.IpMgrDefinition()
         self.notifIds = self.apiDef.getIds(self.apiDef.NOTIFICATION) 
         
@@ -52,6 +56,16 @@ class IpMgrConnectorMuxInternal(ApiConnector.ApiConnector ) :
             - 'host' - IP address of Mux (default: '127.0.0.1')
             - 'port' - port of Mux (default: 9900)
             - 'isSendHello' - send Hello message after connection (default True)
+            - 'binaryFields' - how binary fields are delivered, see
+              ApiConnector.setBinaryFields() (default BINARY_LIST)
+            - 'notifOverflow' - what happens to the notifications received
+              while the notification queue is full, see
+              ApiConnector.setNotifOverflow() (default OVERFLOW_DISCONNECT)
+            - 'notifLog' - directory of a log on disk to queue the
+              notifications in, see ApiConnector.openNotifLog() (default
+              None, in memory only)
+            - 'notifFilter' - NotifFilter of the notifications kept, see
+              ApiConnector.setNotifFilter() (default None, all of them)
         '''
         
         host = self.DEFAULT_PARAM_HOST 
@@ -63,6 +77,14 @@ class IpMgrConnectorMuxInternal(ApiConnector.ApiConnector ) :
             port = int(params[self.PARAM_PORT])
         if self.PARAM_ISSENDHELLO in params :
             isSendHello = params[self.PARAM_ISSENDHELLO]
+        if self.PARAM_BINARYFIELDS in params :
+            self.setBinaryFields(params[self.PARAM_BINARYFIELDS])
+        if params.get(self.PARAM_NOTIFLOG) :
+            self.openNotifLog(params[self.PARAM_NOTIFLOG])
+        if self.PARAM_NOTIFOVERFLOW in params :
+            self.setNotifOverflow(params[self.PARAM_NOTIFOVERFLOW])
+        if self.PARAM_NOTIFFILTER in params :
+            self.setNotifFilter(params[self.PARAM_NOTIFFILTER])
         
         if self.inputThread :   # Wait finish disconnect process
             try :
@@ -101,6 +123,13 @@ class IpMgrConnectorMuxInternal(ApiConnector.ApiConnector ) :
         ApiConnector.ApiConnector.disconnect(self, reason)
         
     def send(self, cmdNames, params) :
+        return self._sendAndWait(cmdNames, params)
+    
+    def _sendAndWait(self, cmdNames, params) :
+        '''
+        \brief Send a command and wait for its acknowledge, from the caller
+               thread.
+        '''
         self.sendLock.acquire()
         try :
             if not self.isConnected :
@@ -108,8 +137,8 @@ class IpMgrConnectorMuxInternal(ApiConnector.ApiConnector ) :
     
             # Send data
             ApiConnector.log.debug("IO OUT.    {0} : {1}".format(cmdNames, params))
-            (cmdId, paramsBinList) = self.apiDef.serialize(cmdNames, params)
-            paramsBin = struct.pack('!'+str(len(paramsBinList))+'B', *paramsBinList) 
+            (cmdId, paramsBinList) = self.apiDef.serialize(cmdNames, params, self.isTrustedCall())
+            paramsBin = str(bytearray(paramsBinList))
             ApiConnector.logDump(paramsBin, "RawIO OUT. Command ID: {0}".format(cmdId))
             packet = self.muxMsg.build_message(cmdId, paramsBin)
             self.acknowledgeBuf = None
@@ -128,39 +157,7 @@ class IpMgrConnectorMuxInternal(ApiConnector.ApiConnector ) :
                 raise ApiException.ConnectionError(self.disconnectReason)
                                                         
             # Process acknowledge
-            cmdId = self.apiDef.nameToId(self.apiDef.COMMAND, (cmdNames[0],))
-            if self.ackCmdId != cmdId :
-                reason = "Unexpected acknowledge {0} for command {1} ({2})".format(self.ackCmdId, cmdId, cmdNames)
-                self.disconnect(reason)
-                raise ApiException.ConnectionError(reason)
-    
-            # Parse acknowledge
-            ackList = struct.unpack('!'+str(len(self.acknowledgeBuf))+'B', self.acknowledgeBuf)
-            (resCmdName, resParams) = self.apiDef.deserialize(self.apiDef.COMMAND, self.ackCmdId, ackList) 
-            ApiConnector.log.debug("IO INP.    {0} : {1}".format(resCmdName, resParams))
-            
-            if self.apiDef.RC in resParams and resParams[self.apiDef.RC] != self._RC_OK : 
-                if resParams[self.apiDef.RC] == self._RC_TIMEOUT :
-                    raise ApiException.CommandTimeoutError(resCmdName)
-                try:
-                    desc = '({0})\n{1}'.format(
-                        self.apiDef.responseFieldValueToDesc(
-                            resCmdName,
-                            self.apiDef.RC,
-                            resParams[self.apiDef.RC],
-                        ),
-                        self.apiDef.rcToDescription(
-                            resParams[self.apiDef.RC],
-                            resCmdName,
-                        ),
-                    )
-                except:
-                    desc = None
-                raise   ApiException.APIError(
-                            cmd=resCmdName,
-                            rc=resParams[self.apiDef.RC],
-                            desc=desc
-                        )
+            resParams = self._parseAcknowledge(cmdNames, self.ackCmdId, self.acknowledgeBuf)
             
             self.ackCmdId = -1
             self.acknowledgeBuf = None
@@ -168,6 +165,51 @@ class IpMgrConnectorMuxInternal(ApiConnector.ApiConnector ) :
             self.sendLock.release()
         return resParams
             
+    def _parseAcknowledge(self, cmdNames, ackCmdId, acknowledgeBuf):
+        '''
+        \brief Deserialize the acknowledge of a command.
+        
+        \exception ConnectionError The acknowledge is not for this command, the
+                   connection is closed.
+        \exception CommandTimeoutError, APIError The acknowledge reports an
+                   error.
+        \returns The response fields, as a dictionary.
+        '''
+        cmdId = self.apiDef.nameToId(self.apiDef.COMMAND, (cmdNames[0],))
+        if ackCmdId != cmdId :
+            reason = "Unexpected acknowledge {0} for command {1} ({2})".format(ackCmdId, cmdId, cmdNames)
+            self.disconnect(reason)
+            raise ApiException.ConnectionError(reason)
+
+        # Parse acknowledge
+        ackList = self._unpackPayload(acknowledgeBuf)
+        (resCmdName, resParams) = self.apiDef.deserialize(self.apiDef.COMMAND, ackCmdId, ackList) 
+        ApiConnector.log.debug("IO INP.    {0} : {1}".format(resCmdName, resParams))
+        
+        if self.apiDef.RC in resParams and resParams[self.apiDef.RC] != self._RC_OK : 
+            if resParams[self.apiDef.RC] == self._RC_TIMEOUT :
+                raise ApiException.CommandTimeoutError(resCmdName)
+            try:
+                desc = '({0})\n{1}'.format(
+                    self.apiDef.responseFieldValueToDesc(
+                        resCmdName,
+                        self.apiDef.RC,
+                        resParams[self.apiDef.RC],
+                    ),
+                    self.apiDef.rcToDescription(
+                        resParams[self.apiDef.RC],
+                        resCmdName,
+                    ),
+                )
+            except:
+                desc = None
+            raise   ApiException.APIError(
+                        cmd=resCmdName,
+                        rc=resParams[self.apiDef.RC],
+                        desc=desc
+                    )
+        return resParams
+
     def ackSignal(self):
         '''
         \brief Send signal 'Acknowledge received'
@@ -184,10 +226,8 @@ class IpMgrConnectorMuxInternal(ApiConnector.ApiConnector ) :
         try :
             while True :
                 select.select([self.socket], [], [self.socket])
-                buf = self.socket.recv(4096)
-                if not buf :
+                if not self.muxMsg.recv_into(self.socket) :
                     raise socket.error(0, "Connection close")
-                self.muxMsg.parse(buf)
         except socket.error, way:
             # Disconnect process -------------------------------------------------
             if way.args[0] == 9 :   # 
@@ -204,12 +244,21 @@ class IpMgrConnectorMuxInternal(ApiConnector.ApiConnector ) :
     def processCmd(self, reserved, cmdId, payload):
         '''
         \brief deserialize and process command
+        
+        payload is a memoryview into the input buffer of muxMsg, only valid
+        until this function returns.
         '''
         ApiConnector.logDump(payload, "RawIO INP. Command ID: {0}".format(cmdId))
         if cmdId in self.notifIds :
             try :
-                payloadList = struct.unpack('!'+str(len(payload))+'B', payload)
-                (notifNames, params) = self.apiDef.deserialize(self.apiDef.NOTIFICATION, cmdId, payloadList)
+                notifFilter = self.notifFilter
+                if notifFilter and not notifFilter.accept(cmdId, payload) :
+                    return    # filtered out, not deserialized
+                payloadList = self._unpackPayload(payload)
+                if self.notifTupleTable :
+                    (notifNames, params) = self.apiDef.deserializeRecord(self.apiDef.NOTIFICATION, cmdId, payloadList, self.notifTupleTable)
+                else :
+                    (notifNames, params) = self.apiDef.deserialize(self.apiDef.NOTIFICATION, cmdId, payloadList)
                 ApiConnector.log.debug("IO INP.    {0} : {1}".format(notifNames, params))
                 self.putNotification((notifNames, params))
             except ApiException.ConnectionError as ex:
@@ -218,9 +267,22 @@ class IpMgrConnectorMuxInternal(ApiConnector.ApiConnector ) :
                 ApiConnector.log.error("Deserialization command {0}. Error {1}".format(cmdId, ex))
         else :
             self.ackCmdId = cmdId
-            self.acknowledgeBuf = payload
+            self.acknowledgeBuf = payload.tobytes()
             self.ackSignal()
     
+    def _getApiDefinition(self):
+        return self.apiDef
+    
+    def _unpackPayload(self, payload):
+        '''
+        \brief Prepare a received payload for the deserializer.
+        '''
+        if self.binaryFields == self.BINARY_LIST :
+            return struct.unpack('!'+str(len(payload))+'B', payload)
+        if isinstance(payload, memoryview) :
+            payload = payload.tobytes()     # the input buffer is reused
+        return self._toBinaryFields(payload)
+    
     def sendHelloCmd(self):
         '''
         \brief Send Hello command
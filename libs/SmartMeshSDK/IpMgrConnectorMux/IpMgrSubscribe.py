@@ -2,12 +2,34 @@
 # This file is automatically generated by GenIpMgrSubscribe.py
 
 import threading
+import time
+import traceback
 
-from   SmartMeshSDK import ApiException
+from   SmartMeshSDK import ApiConnector,                                    \
+                           ApiException,                                    \
+                           NotifFilter
+
+import logging
+class NullHandler(logging.Handler):
+    def emit(self, record):
+        pass
+log = logging.getLogger('IpMgrSubscribe')
+log.setLevel(logging.ERROR)
+log.addHandler(NullHandler())
 
 class IpMgrSubscribe(object):
     '''
     \brief Notification listener for IpMgrConnectorMux object
+    
+    Notifications are dispatched to the callbacks registered with subscribe(),
+    one per notification type, from the thread of the listener. They are also
+    published to the subscribers added with addSubscriber(), any number per
+    notification type, each with a queue and worker threads of its own.
+    
+    The callbacks and subscribers can be given a NotifFilter. The filters are
+    pushed down to the connector, see ApiConnector.setNotifFilter(), which
+    drops the notifications no callback or subscriber wants before they are
+    deserialized. This replaces the filter set on the connector.
     '''
     
     class SubscribeError(Exception) :
@@ -16,6 +38,135 @@ class IpMgrSubscribe(object):
         def __str__(self):
             return self.msg
     
+    class Subscriber(object) :
+        '''
+        \brief A subscriber to the notifications published by IpMgrSubscribe,
+               see IpMgrSubscribe.addSubscriber().
+        
+        The notifications are queued in a bounded queue of its own, and
+        passed to its function by its worker threads, so that a slow
+        subscriber does not delay the others.
+        '''
+        
+        DRAIN_SIZE = 64 # notifications taken from the queue at once by a single worker
+        
+        def __init__(self, name, notifTypes, fun, isRlbl, queueSize, overflow, numWorkers, batchSize, notifFilter = None) :
+            self.name = name
+            self.notifTypes = notifTypes
+            self.fun = fun
+            self.isRlbl = isRlbl
+            self.notifFilter = notifFilter
+            self.batchSize = batchSize
+            if batchSize :
+                self.drainSize = batchSize
+            elif numWorkers == 1 :
+                self.drainSize = self.DRAIN_SIZE
+            else :
+                self.drainSize = 1      # leave the other notifications to the other workers
+            self.queue = ApiConnector.NotifQueue(queueSize, overflow)
+            self.isStopped = False
+            self.statsLock = threading.Lock()
+            self.stats = {
+                'numDelivered':  0,
+                'numErrors':     0,
+                'lastLag':       0.0,
+                'maxLag':        0.0,
+                'totalLag':      0.0,
+            }
+            self.workers = []
+            for i in range(numWorkers) :
+                worker = threading.Thread(target = self._work)
+                worker.name = "IpMgrSubscribe_{0}_{1}".format(name, i)
+                worker.daemon = True
+                worker.start()
+                self.workers.append(worker)
+        
+        def getStats(self) :
+            '''
+            \brief Get statistics about the subscriber.
+            
+            \returns A dictionary with the statistics of its queue, see
+                NotifQueue.getStats(), and:
+                - 'name': the name of the subscriber
+                - 'isStopped': whether it was removed
+                - 'numDelivered': number of notifications passed to its
+                  function
+                - 'numErrors': number of exceptions raised by its function
+                - 'lastLag': time between the publication and the delivery of
+                  the last notification delivered, in seconds
+                - 'maxLag': the highest lastLag
+                - 'avgLag': average lastLag
+            '''
+            returnVal = self.queue.getStats()
+            with self.statsLock :
+                returnVal.update(self.stats)
+            returnVal['name'] = self.name
+            returnVal['isStopped'] = self.isStopped
+            returnVal['avgLag'] = returnVal.pop('totalLag') / returnVal['numDelivered'] if returnVal['numDelivered'] else 0.0
+            return returnVal
+        
+        def publish(self, notifName, payload, publishTime) :
+            '''
+            \brief Queue a notification for the workers.
+            
+            \returns False if the queue overflowed and its overflow policy is
+                     OVERFLOW_DISCONNECT.
+            '''
+            try :
+                self.queue.put(((notifName,), payload, publishTime))
+            except ApiException.ConnectionError :
+                return False
+            return True
+        
+        def stop(self) :
+            '''
+            \brief Stop the workers, once they have delivered the queued
+                   notifications.
+            '''
+            self.isStopped = True
+            for _ in self.workers :
+                self.queue.putDisconnectNotification('stopped')
+        
+        def _work(self) :
+            try :
+                while True :
+                    items = self.queue.getBatch(self.drainSize)
+                    if not items :
+                        return    # stopped
+                    lag = time.time() - items[0][2]
+                    numErrors = 0
+                    if self.batchSize :
+                        try :
+                            self.fun([(names[0], payload) for (names, payload, publishTime) in items])
+                        except Exception as err :
+                            log.exception("subscriber {0} failed: {1}".format(self.name, err))
+                            numErrors += 1
+                    else :
+                        for (names, payload, publishTime) in items :
+                            try :
+                                self.fun(names[0], payload)
+                            except Exception as err :
+                                log.exception("subscriber {0} failed on {1}: {2}".format(self.name, names[0], err))
+                                numErrors += 1
+                    with self.statsLock :
+                        self.stats['numDelivered'] += len(items)
+                        self.stats['numErrors'] += numErrors
+                        self.stats['lastLag'] = lag
+                        self.stats['totalLag'] += lag * len(items)
+                        if lag > self.stats['maxLag'] :
+                            self.stats['maxLag'] = lag
+            except Exception as err :
+                output  = []
+                output += ['===== crash in thread {0} ====='.format(threading.current_thread().name)]
+                output += ['\nerror:\n']
+                output += [str(err)]
+                output += ['\ncall stack:\n']
+                output += [traceback.format_exc()]
+                output  = '\n'.join(output)
+                print output # critical error
+                log.critical(output)
+                raise
+    
     ERROR                = "error"
     FINISH               = "finish"
     NOTIFEVENT           = "notifEvent"
@@ -62,26 +213,41 @@ class IpMgrSubscribe(object):
     
     #======================== public ==========================================
     
-    def __init__(self, ipMgrConnector) :
+    def __init__(self, ipMgrConnector, batchSize = 1) :
+        '''
+        \param ipMgrConnector The connector the notifications are read from.
+        \param batchSize      Maximum number of notifications read from the
+            connector at once. With batchSize>1, the notifications are read
+            with getNotifications(), and the callbacks looked up once per
+            batch. This is required for the callbacks subscribed with
+            isBatch=True to receive more than one notification per call.
+        '''
         # Structure of self._callback :
         #     Notification Name : 
         #         [0] - subscription mask mask, 
         #         [1] - cb-function. Notification is subscribed if [1]!=None, 
         #         [2] - transport for notification: True - reliable, false - unreliable
+        #         [3] - cb-function is called with a list of notifications
+        #         [4] - NotifFilter of the notifications passed to cb-function, None for all
         self._callback = {
-            self.ERROR             : [0x00, None, True],
-            self.FINISH            : [0x00, None, True],
-            self.NOTIFEVENT        : [0x02, None, True],
-            self.NOTIFLOG          : [0x04, None, True],
-            self.NOTIFDATA         : [0x10, None, True],
-            self.NOTIFIPDATA       : [0x20, None, True],
-            self.NOTIFHEALTHREPORT : [0x40, None, True],
-            self.NOTIFRADIOTESTSTATSPER : [0x80, None, True],
+            self.ERROR             : [0x00, None, True, False, None],
+            self.FINISH            : [0x00, None, True, False, None],
+            self.NOTIFEVENT        : [0x02, None, True, False, None],
+            self.NOTIFLOG          : [0x04, None, True, False, None],
+            self.NOTIFDATA         : [0x10, None, True, False, None],
+            self.NOTIFIPDATA       : [0x20, None, True, False, None],
+            self.NOTIFHEALTHREPORT : [0x40, None, True, False, None],
+            self.NOTIFRADIOTESTSTATSPER : [0x80, None, True, False, None],
         
         }
+        # Structure of self._subscribers :
+        #     Notification Name : list of Subscriber, replaced on change
+        self._subscribers = {}
         self._con    = ipMgrConnector
+        self._batchSize = batchSize
         self._thread = None
         self._mask = self._unrlblMask = 0
+        self._isFilterPushed = False
         self._isStarted = False
         self._lock = threading.Lock()
         
@@ -99,17 +265,21 @@ class IpMgrSubscribe(object):
                 pass    # Ignore join error
             self._thread = None 
         
-        # Clear _callback table
+        # Clear _callback table, and remove the subscribers
         for i in self._callback :
             self._callback[i][1] = None
             self._callback[i][2] = True
+            self._callback[i][3] = False
+            self._callback[i][4] = None
+        self._stopSubscribers()
         self._mask = self._unrlblMask = 0
+        self._updateNotifFilter()
         self._thread = threading.Thread(target = self._process) 
         self._thread.name = "IpMgrSubscribe"
         self._thread.start()
         self._isStarted = True
         
-    def subscribe(self, notifTypes, fun, isRlbl):
+    def subscribe(self, notifTypes, fun, isRlbl, isBatch = False, notifFilter = None):
         '''
         \brief Subscribe to notification(s).
         
@@ -132,6 +302,14 @@ class IpMgrSubscribe(object):
             as described below.
         \param isRlbl define type of transport using for delivery 
              notification: reliable (True) or best effort (False)
+        \param isBatch call the function once per batch of notifications read
+             from the connector (see the batchSize parameter of the
+             constructor), as fun(<list of (notification name, notification
+             parameter)>), rather than once per notification. The ERROR and
+             FINISH callbacks are always called once per event.
+        \param notifFilter NotifFilter of the notifications passed to the
+             function, None for all of them. It does not apply to ERROR and
+             FINISH.
         The _callback function is called with a notification name and a
         notification parameter. Depending on the type of notification, the
         parameter will be of a different format, according to the table below.
@@ -178,26 +356,116 @@ class IpMgrSubscribe(object):
         for nType in notifTypes :
             self._callback[nType][1] = fun
             self._callback[nType][2] = isRlbl
+            self._callback[nType][3] = isBatch
+            self._callback[nType][4] = notifFilter if nType not in [self.ERROR, self.FINISH] else None
         self._lock.release()
         
-        mask = unrlblMask = 0
-        # Structure of self._callback.values() :
-        #     [0] - subscription mask mask, 
-        #     [1] - cb-function. Notification is subscribed if [1]!=None, 
-        #     [2] - transport for notification: True - reliable, false - unreliable
-        for cb in self._callback.values() :
-            if cb[1] :
-                mask = mask | cb[0]
-            if cb[2] == False :
-                unrlblMask = unrlblMask | cb[0] 
-        if mask != self._mask or unrlblMask != self._unrlblMask :
-            self._mask = mask
-            self._unrlblMask = unrlblMask
-            self._con.dn_subscribe([0,self._mask], [0,self._unrlblMask])
+        self._updateSubscription()
+    
+    def addSubscriber(self, notifTypes, fun, isRlbl = True, queueSize = 100,
+            overflow = ApiConnector.NotifQueue.OVERFLOW_DROP_OLDEST,
+            numWorkers = 1, batchSize = None, name = None, notifFilter = None):
+        '''
+        \brief Add a subscriber to notification(s), with a queue and worker
+               threads of its own.
+        
+        Any number of subscribers can subscribe to the same notification
+        type, in addition to the callback registered with subscribe(). Each
+        notification is queued for each of its subscribers, and passed to
+        their function from their worker threads: a slow subscriber only
+        fills its own queue, whose overflow policy applies, and does not
+        delay the other subscribers.
+        
+        \pre Call start() before calling this function.
+        
+        \param notifTypes Type(s) of notification(s) to subscribe to, as for
+            subscribe().
+        \param fun        The function called with each notification, as
+            fun(<notification name>, <notification parameter>), see
+            subscribe().
+        \param isRlbl     Transport for the notifications: reliable (True) or
+            best effort (False). Notifications subscribed to as reliable by
+            anyone are transported reliably.
+        \param queueSize  Maximum number of notifications waiting for the
+            workers.
+        \param overflow   What happens to a notification published when the
+            queue is full, see NotifQueue. With OVERFLOW_DISCONNECT, the
+            subscriber is removed.
+        \param numWorkers Number of worker threads. With more than one, the
+            notifications may be delivered out of order.
+        \param batchSize  None to call fun once per notification. Otherwise,
+            fun is called with a list of up to batchSize (notification name,
+            notification parameter), of the notifications waiting.
+        \param name       Name of the subscriber, in its statistics and the
+            names of its workers.
+        \param notifFilter NotifFilter of the notifications published to the
+            subscriber, None for all of them.
+        
+        \exception IpMgrSubscribe.SubscribeError The subscriber hasn't been
+            started, or the notification type(s) specified is (are) not valid.
+        \returns The Subscriber, to pass to removeSubscriber(), and with the
+            lag and drop statistics of the subscriber, see
+            Subscriber.getStats().
+        '''
+        
+        if not self._isStarted :
+            raise self.SubscribeError("Error: subscriber is not started")
+        if isinstance(notifTypes, str) :
+            notifTypes = [notifTypes]
+        for nType in notifTypes :  # subscribe type validation
+            if nType not in self._callback :
+                raise self.SubscribeError("Error subscribe type: {0}".format(nType))
+        
+        if name is None :
+            name = getattr(fun, '__name__', 'subscriber')
+        subscriber = self.Subscriber(name, notifTypes, fun, isRlbl, queueSize, overflow, numWorkers, batchSize, notifFilter)
+        self._lock.acquire()
+        for nType in notifTypes :
+            self._subscribers[nType] = self._subscribers.get(nType, []) + [subscriber]
+        self._lock.release()
+        
+        self._updateSubscription()
+        return subscriber
+    
+    def removeSubscriber(self, subscriber):
+        '''
+        \brief Remove a subscriber added with addSubscriber(). Its workers
+               stop once they have delivered the notifications queued.
+        '''
+        self._lock.acquire()
+        for nType in subscriber.notifTypes :
+            subscribers = [s for s in self._subscribers.get(nType, []) if s is not subscriber]
+            if subscribers :
+                self._subscribers[nType] = subscribers
+            else :
+                self._subscribers.pop(nType, None)
+        self._lock.release()
+        subscriber.stop()
+        
+        if self._isStarted :
+            self._updateSubscription()
+    
+    def getSubscriberStats(self):
+        '''
+        \brief Get the statistics of all the subscribers added with
+               addSubscriber(), see Subscriber.getStats().
+        
+        \returns A list of dictionaries, one per subscriber.
+        '''
+        self._lock.acquire()
+        subscribers = []
+        for nTypeSubscribers in self._subscribers.values() :
+            for subscriber in nTypeSubscribers :
+                if subscriber not in subscribers :
+                    subscribers.append(subscriber)
+        self._lock.release()
+        return [subscriber.getStats() for subscriber in subscribers]
 
     #======================== private =========================================
     
     def _process(self):
+        if self._batchSize > 1 :
+            return self._processBatches()
         while True :
             try :
                 notif = self._con.getNotification()
@@ -207,22 +475,144 @@ class IpMgrSubscribe(object):
                 self._processOneNotif(name, notif[0], notif[1])
             except ApiException.QueueError:
                 self._processOneNotif(self.FINISH, self.FINISH, '')
+                self._stopSubscribers()
                 self._isStarted = False
                 break
             except Exception as ex :
                 self._processOneNotif(self.ERROR, self.ERROR, ex)
     
+    def _processBatches(self):
+        while True :
+            try :
+                notifs = self._con.getNotifications(self._batchSize)
+            except ApiException.QueueError:
+                self._processOneNotif(self.FINISH, self.FINISH, '')
+                self._stopSubscribers()
+                self._isStarted = False
+                break
+            except Exception as ex :
+                self._processOneNotif(self.ERROR, self.ERROR, ex)
+                continue
+            self._processNotifBatch(notifs)
+    
+    def _processNotifBatch(self, notifs):
+        # look up the callbacks and subscribers once for the whole batch
+        self._lock.acquire()
+        callbacks = dict([(name, (cb[1], cb[3], cb[4])) for (name, cb) in self._callback.items()])
+        subscribers = dict(self._subscribers)
+        self._lock.release()
+        
+        batchFuns = []
+        batches = {}
+        for (notifName, payload) in notifs :
+            name = self._trNotifNameTable.get(notifName, notifName)
+            if name in subscribers :
+                self._publish(subscribers[name], name, notifName, payload)
+            (fun, isBatch, notifFilter) = callbacks.get(name, (None, False, None))
+            if not fun :
+                continue
+            if notifFilter and not notifFilter.filter(notifName, payload, (name,)) :
+                continue
+            if isBatch :
+                if fun not in batches :
+                    batchFuns.append(fun)
+                    batches[fun] = []
+                batches[fun].append((notifName, payload))
+                continue
+            try :
+                fun(notifName, payload)
+            except Exception as ex :
+                self._processOneNotif(self.ERROR, self.ERROR, ex)
+        for fun in batchFuns :
+            try :
+                fun(batches[fun])
+            except Exception as ex :
+                self._processOneNotif(self.ERROR, self.ERROR, ex)
+    
     def _processOneNotif(self, notifType, notifName, payload):
-        cb = self._getCallback(notifType)
+        subscribers = self._getSubscribers(notifType)
+        if subscribers :
+            self._publish(subscribers, notifType, notifName, payload)
+        (cb, notifFilter) = self._getCallback(notifType)
+        if notifFilter and not notifFilter.filter(notifName, payload, (notifType,)) :
+            return
         if cb : 
             cb(notifName, payload)
     
+    def _publish(self, subscribers, notifType, notifName, payload):
+        publishTime = time.time()
+        for subscriber in subscribers :
+            if subscriber.notifFilter and not subscriber.notifFilter.filter(notifName, payload, (notifType,)) :
+                continue
+            if not subscriber.publish(notifName, payload, publishTime) :
+                log.error("removing subscriber {0}, its queue overflowed".format(subscriber.name))
+                self.removeSubscriber(subscriber)
+    
+    def _getSubscribers(self, name) :
+        self._lock.acquire()
+        res = self._subscribers.get(name)
+        self._lock.release()
+        return res
+    
+    def _stopSubscribers(self) :
+        self._lock.acquire()
+        (subscribers, self._subscribers) = (self._subscribers, {})
+        self._lock.release()
+        stopped = []
+        for nTypeSubscribers in subscribers.values() :
+            for subscriber in nTypeSubscribers :
+                if subscriber not in stopped :
+                    subscriber.stop()
+                    stopped.append(subscriber)
+    
+    def _updateSubscription(self) :
+        mask = unrlblMask = 0
+        # Structure of self._callback.values() :
+        #     [0] - subscription mask mask, 
+        #     [1] - cb-function. Notification is subscribed if [1]!=None, 
+        #     [2] - transport for notification: True - reliable, false - unreliable
+        self._lock.acquire()
+        for (name, cb) in self._callback.items() :
+            subscribers = self._subscribers.get(name, [])
+            if cb[1] or subscribers :
+                mask = mask | cb[0]
+            if (cb[1] or subscribers) and not ((cb[1] and cb[2]) or [s for s in subscribers if s.isRlbl]) :
+                unrlblMask = unrlblMask | cb[0] 
+        self._lock.release()
+        if mask != self._mask or unrlblMask != self._unrlblMask :
+            self._mask = mask
+            self._unrlblMask = unrlblMask
+            self._con.dn_subscribe([0,self._mask], [0,self._unrlblMask])
+        self._updateNotifFilter()
+    
+    def _updateNotifFilter(self) :
+        # push the filters down to the connector, which drops the
+        # notifications no callback or subscriber wants before deserializing
+        # them; they are filtered again for each callback and subscriber
+        notifFilters = NotifFilter.NotifFilterSet()
+        self._lock.acquire()
+        for (name, cb) in self._callback.items() :
+            if cb[1] :
+                notifFilters.add(name, cb[4])
+            for subscriber in self._subscribers.get(name, []) :
+                notifFilters.add(name, subscriber.notifFilter)
+        self._lock.release()
+        if not notifFilters.isFiltering() :
+            if not self._isFilterPushed :
+                return
+            notifFilters = None
+        try :
+            self._con.setNotifFilter(notifFilters)
+        except NotImplementedError :
+            return    # filtered after deserialization only
+        self._isFilterPushed = notifFilters is not None
+    
     def _getCallback(self, name) :
-        res = None
+        res = (None, None)
 
         self._lock.acquire()
         if name in self._callback :
-            res = self._callback[name][1]
+            res = (self._callback[name][1], self._callback[name][4])
         self._lock.release()
         
         return res
@@ -12,15 +12,46 @@ LOCATION_MAGIC = struct.pack('BBBB', 0x73, 0x03, 0xc6, 0x5d)
 AUTH    = [ 48, 49, 50, 51, 52, 53, 54, 55 ]  # TODO: randomize me!
 VERSION = 4
 
+# Command ID and type, after the magic token and the length
+_CMD_HEADER = struct.Struct('!HB')
+
 # Message Parser
 
 class MuxMsg(object):
-    def __init__(self, cb, ver = VERSION, magic = MAGIC, auth = AUTH):
+    '''
+    Serial Mux message builder and parser
+    
+    Received data is appended to a preallocated input buffer, either by
+    parse(), or by recv_into() directly from a socket. Messages are parsed in
+    place, between a read and a write offset, and the unparsed bytes are only
+    moved to the start of the buffer when the space left after them is too
+    small for the next receive. The buffer grows when a message does not fit.
+    '''
+    
+    BUFFER_SIZE = 65536  # initial size of the input buffer
+    RECV_SIZE   = 16384  # maximum number of bytes received at once
+    
+    def __init__(self, cb, ver = VERSION, magic = MAGIC, auth = AUTH, views = False):
+        '''
+        cb:    called as cb(cmd_id, cmd_type, data) for each message received
+        views: whether data is passed as a memoryview into the input buffer,
+               rather than a str. The memoryview is only valid until cb
+               returns: copy it to keep it.
+        '''
         self.callback = cb
         self.ver = ver
         self.auth = auth
         self.magic = magic
-        self.input_buffer = ''
+        self.views = views
+        self.buf = bytearray(self.BUFFER_SIZE)
+        self.view = memoryview(self.buf)
+        self.read_offset = 0    # start of the unparsed input
+        self.write_offset = 0   # end of the input
+    
+    @property
+    def input_buffer(self):
+        '''The unparsed input, as a str'''
+        return self.view[self.read_offset:self.write_offset].tobytes()
     
     def getVer(self) :
         return self.ver
@@ -42,39 +73,89 @@ class MuxMsg(object):
         '''
         if not data:
             return
-        self.input_buffer += data
-        while self.parse_one():
-            pass
-
+        self._reserve(len(data))
+        self.buf[self.write_offset:self.write_offset+len(data)] = data
+        self.write_offset += len(data)
+        self._parse_all()
+    
+    def recv_into(self, sock, size = RECV_SIZE):
+        '''
+        Receive up to size bytes from sock directly into the input buffer,
+        then parse them as parse() does
+        Returns: the number of bytes received, 0 if the connection is closed
+        '''
+        self._reserve(size)
+        num_bytes = sock.recv_into(self.view[self.write_offset:self.write_offset+size], size)
+        if num_bytes:
+            self.write_offset += num_bytes
+            self._parse_all()
+        return num_bytes
+    
     def parse_one(self):
         '''Parse a single command from input_data
         Returns: whether a command was found
         '''
-        msg_start = self.input_buffer.find(self.magic)
-        if msg_start >= 0:
-            # strip the ignored input
-            self.input_buffer = self.input_buffer[msg_start:]
+        return self._parse_all(1) == 1
+    
+    def _parse_all(self, max_msgs = -1):
+        '''Parse up to max_msgs commands from the input, all if negative
+        Returns: the number of commands found
+        '''
+        buf = self.buf
+        magic = self.magic
+        write_offset = self.write_offset
+        num_msgs = 0
+        while num_msgs != max_msgs:
+            msg_start = self.read_offset
+            if not buf.startswith(magic, msg_start, write_offset):
+                msg_start = buf.find(magic, msg_start, write_offset)
+                if msg_start < 0:
+                    # if the token doesn't appear, ignore all but the last 3 characters
+                    self.read_offset = max(self.read_offset, write_offset-3)
+                    break
+                # skip the ignored input
+                self.read_offset = msg_start
             # verify input is long enough
-            if len(self.input_buffer) < 6:
-                return False
+            if write_offset - msg_start < 6:
+                break
             # parse message header
-            bin_len = self.input_buffer[4:6]
-            msg_len = struct.unpack('!H', bin_len)[0]
+            msg_len = (buf[msg_start+4] << 8) | buf[msg_start+5]
             # TODO: limit the length of valid messages
-            index_end = 6 + msg_len
+            index_end = msg_start + 6 + msg_len
             # verify the message is complete
-            if len(self.input_buffer) < index_end:
-                return False
+            if write_offset < index_end:
+                break
             
-            msg = self.input_buffer[6:index_end]
-            (cmd_id, cmd_type) = struct.unpack('!HB', msg[0:3])
-            data = msg[3:]
+            if msg_len < 3:
+                raise struct.error('unpack requires a string argument of length 3')
+            (cmd_id, cmd_type) = _CMD_HEADER.unpack_from(buf, msg_start+6)
+            data = self.view[msg_start+9:index_end]
+            if not self.views:
+                data = data.tobytes()
             if self.callback:
                 self.callback(cmd_id, cmd_type, data)
-            self.input_buffer = self.input_buffer[index_end:]
-            return True
+            self.read_offset = index_end
+            num_msgs += 1
+        if self.read_offset == write_offset:
+            # all the input is parsed, start over at the start of the buffer
+            self.read_offset = 0
+            self.write_offset = 0
+        return num_msgs
+    
+    def _reserve(self, size):
+        '''Make room for size more bytes after the input'''
+        if len(self.buf) - self.write_offset >= size:
+            return
+        pending = self.write_offset - self.read_offset
+        if pending + size <= len(self.buf):
+            # move the unparsed input to the start of the buffer
+            self.buf[0:pending] = self.buf[self.read_offset:self.write_offset]
         else:
-            # if the token doesn't appear, ignore all but the last 3 characters
-            self.input_buffer = self.input_buffer[-3:]
-            return False
-            
+            # grow the buffer, which cannot be resized while views into it
+            # exist
+            buf = bytearray(max(2*len(self.buf), pending+size))
+            buf[0:pending] = self.view[self.read_offset:self.write_offset]
+            self.buf = buf
+            self.view = memoryview(buf)
+        self.read_offset = 0
+        self.write_offset = pending
@@ -250,7 +250,7 @@ class IpMgrConnectorSerial(ApiConnector,threading.Thread):
         commandName = commandArray[0]
         
         apiCommand = None
-        for c in IpMgrDefinition.IpMgrDefinition.commands:
+        for c in IpMgrDefinition.IpMgrDefinition.getTables().commands:
             if c['name']==commandName:
                 apiCommand = c
                 break
@@ -85,12 +85,17 @@ class IpMgrConnectorSerialInternal(SerialConnector.SerialConnector):
                 (self.shouldAck)
             ):
             # send normal ACK (with RC=0)
-            self._sendInternal(cmdId,True,[0])
+            self._sendAck(cmdId)
             return True
         elif cmdId == self.HELLO_IDS['manager_hello'] and self.isConnect :
             raise ConnectionError("Unexpected manager_hello")
         return False
     
+    def _buildAckPacket(self,cmdId,packetId):
+        controlByte = 0x02|0x01
+        payload     = [0]                 # RC
+        return [controlByte,cmdId,packetId,len(payload)]+payload
+    
     def _iShouldAck(self,isResponse):
         return 
     
@@ -0,0 +1,873 @@
+#!/usr/bin/python
+
+import heapq
+import random
+import struct
+import threading
+import time
+import traceback
+
+import NetworkModel
+
+from   SmartMeshSDK.ApiDefinition   import ApiDefinition,   \
+                                           IpMgrDefinition
+from   SmartMeshSDK.ApiException    import CommandError
+from   SmartMeshSDK.protocols.Hr    import HrParser
+
+import logging
+class NullHandler(logging.Handler):
+    def emit(self, record):
+        pass
+log = logging.getLogger('IpMgrEmulator')
+log.setLevel(logging.ERROR)
+log.addHandler(NullHandler())
+
+#============================ helpers =========================================
+
+def encodeFields(fieldDefs,values):
+    '''
+    \brief Serialize field values, following their definition.
+
+    \param fieldDefs A list of ApiDefinition.Field objects.
+    \param values    A dictionary of field values, indexed by field name.
+                     Missing fields are encoded as zeros.
+
+    \returns The serialized fields, a list of bytes.
+    '''
+    returnVal                = []
+    for field in fieldDefs:
+        val                  = values.get(field.name)
+        if   field.format==ApiDefinition.FieldFormats.INT:
+            val              = val or 0
+            returnVal       += [(val>>(8*i))&0xff for i in xrange(field.length-1,-1,-1)]
+        elif field.format==ApiDefinition.FieldFormats.INTS:
+            fmt              = {1:'>b',2:'>h',4:'>i'}[field.length]
+            returnVal       += list(bytearray(struct.pack(fmt,val or 0)))
+        elif field.format==ApiDefinition.FieldFormats.BOOL:
+            returnVal       += [1 if val else 0]
+        elif field.format in [ApiDefinition.FieldFormats.HEXDATA,
+                              ApiDefinition.FieldFormats.STRING]:
+            val              = list(bytearray(val or []))
+            if field.length:
+                # left-pad, as the serializer of the connectors
+                val          = ([0x00]*field.length+val)[-field.length:]
+            returnVal       += val
+        else:
+            raise SystemError('unsupported field format={0}'.format(field.format))
+    return returnVal
+
+def decodeFields(fieldDefs,byteArray):
+    '''
+    \brief Parse serialized fields, following their definition.
+
+    Fields missing at the end of byteArray are set to None.
+
+    \returns A dictionary of field values, indexed by field name.
+    '''
+    returnVal                = {}
+    index                    = 0
+    for field in fieldDefs:
+        if field.length:
+            raw              = byteArray[index:index+field.length]
+            index           += field.length
+        else:
+            raw              = byteArray[index:]
+            index            = len(byteArray)
+        if not raw:
+            returnVal[field.name] = None
+        elif field.format==ApiDefinition.FieldFormats.INT:
+            val              = 0
+            for b in raw:
+                val          = (val<<8)|b
+            returnVal[field.name] = val
+        elif field.format==ApiDefinition.FieldFormats.INTS:
+            val              = 0
+            for b in raw:
+                val          = (val<<8)|b
+            if val>=1<<(8*len(raw)-1):
+                val         -= 1<<(8*len(raw))
+            returnVal[field.name] = val
+        elif field.format==ApiDefinition.FieldFormats.BOOL:
+            returnVal[field.name] = raw[0]!=0
+        else:
+            returnVal[field.name] = list(raw)
+    return returnVal
+
+#============================ sessions ========================================
+
+class EmulatorSession(object):
+    '''
+    \ingroup IpMgrEmulator
+
+    \brief Base class for a client session with the emulated manager.
+
+    A session holds the subscription of the client. Child classes implement
+    the transport: the serial API over a pty (SerialSession) or the Serial
+    Mux protocol over TCP (MuxSession).
+    '''
+
+    def __init__(self,emulator):
+        self.emulator        = emulator
+        self.filter          = 0     # bitmask of the notification types subscribed to
+        self.unackFilter     = 0     # bitmask of the notification types sent unreliably
+
+    def subscribe(self,filter,unackFilter):
+        self.filter          = filter
+        self.unackFilter     = unackFilter
+
+    def isSubscribed(self,notifType):
+        return (self.filter>>notifType)&0x01==1
+
+    def isReliable(self,notifType):
+        return (self.unackFilter>>notifType)&0x01==0
+
+    def sendNotification(self,cmdId,payload,reliable):
+        '''
+        \brief Send a notification to the client.
+        '''
+        raise NotImplementedError() # to be implemented by child class
+
+    def close(self):
+        raise NotImplementedError() # to be implemented by child class
+
+#============================ emulator ========================================
+
+class IpMgrEmulator(threading.Thread):
+    '''
+    \ingroup IpMgrEmulator
+
+    \brief Emulated SmartMesh IP manager.
+
+    Answers the commands of IpMgrDefinition from a synthetic network model
+    (NetworkModel), and generates notifications at configurable rates. The
+    emulator itself is transport-agnostic: attach it to a pty with
+    SerialSession, or serve it over TCP with MuxServer.
+
+    The thread of this object generates the notifications, both periodic
+    ones and the events triggered by commands (e.g. eventPingResponse after
+    pingMote).
+    '''
+
+    SW_VERSION           = (1,4,2,8)  # reported by getSystemInfo
+    HW_MODEL             = 16
+    HW_REV               = 3
+    NETWORK_ID           = 1229
+    SLOT_DURATION        = 0.00725    # in seconds
+    MAX_BACKLOG          = 1.0        # in seconds, of periodic notifications generated late
+
+    NOTIF_EVENT          = 1
+    NOTIF_LOG            = 2
+    NOTIF_DATA           = 4
+    NOTIF_IPDATA         = 5
+    NOTIF_HEALTHREPORT   = 6
+
+    def __init__(self,network=None,dataRate=0,healthReportRate=0,eventRate=0,dataLength=None,seed=0):
+        '''
+        \param network          A NetworkModel. A network of 10 motes is
+                                created if not specified.
+        \param dataRate         Number of notifData per second, over the
+                                whole network.
+        \param healthReportRate Number of notifHealthReport per second.
+        \param eventRate        Number of notifEvent per second, not counting
+                                the events triggered by commands.
+        \param dataLength       Length of the payload of notifData. If None,
+                                motes publish OAP temperature samples.
+        \param seed             Seed of the random values of notifications.
+        '''
+
+        # store params
+        if network is None:
+            network          = NetworkModel.NetworkModel()
+        self.network         = network
+        self.dataLength      = dataLength
+
+        # initialize parent class
+        threading.Thread.__init__(self)
+        self.name            = 'IpMgrEmulator'
+        self.daemon          = True
+
+        # local variables
+        self.apiDef          = IpMgrDefinition.IpMgrDefinition()
+        self.random          = random.Random(seed)
+        self.dataLock        = threading.RLock()
+        self.scheduleCond    = threading.Condition(self.dataLock)
+        self.goOn            = True
+        self.sessions        = []
+        self.scheduled       = []   # heap of (time,sequence,nameArray,fields)
+        self.numScheduled    = 0
+        self.streams         = []   # periodic notifications
+        self.eventId         = 0
+        self.callbackId      = 0
+        self.moteIndex       = {}   # round-robin position, per stream
+        self.eventCycle      = 0
+        self.stats           = {
+            'numCommands':       0,
+            'numNotifs':         0,
+            'numNotifsDropped':  0,
+        }
+        self.notifCmdId      = self.apiDef.nameToId(
+            ApiDefinition.ApiDefinition.NOTIFICATION,
+            ['notification'],
+        )
+        self.generators      = {
+            'data':          self._generateData,
+            'healthReport':  self._generateHealthReport,
+            'event':         self._generateEvent,
+        }
+        for (name,rate) in [
+                ('data',          dataRate),
+                ('healthReport',  healthReportRate),
+                ('event',         eventRate),
+            ]:
+            if rate:
+                self.streams += [{
+                    'name':      name,
+                    'period':    1.0/rate,
+                    'next':      None,
+                    'generator': self.generators[name],
+                }]
+
+    def run(self):
+
+        # log
+        log.info('thread started')
+
+        try:
+            startTime        = time.time()
+            for stream in self.streams:
+                stream['next'] = startTime+stream['period']
+
+            while self.goOn:
+
+                # pick the notifications due
+                due          = []
+                with self.scheduleCond:
+                    now      = time.time()
+                    for stream in self.streams:
+                        if stream['next']<now-self.MAX_BACKLOG:
+                            stream['next'] = now
+                        while stream['next']<=now:
+                            due     += [(None,stream['generator'])]
+                            stream['next'] += stream['period']
+                    while self.scheduled and self.scheduled[0][0]<=now:
+                        (_,_,nameArray,fields) = heapq.heappop(self.scheduled)
+                        due += [(nameArray,fields)]
+
+                # generate them, without holding the lock
+                for (nameArray,fields) in due:
+                    if nameArray is None:
+                        fields()
+                    else:
+                        self.notify(nameArray,fields)
+
+                # wait for the next notification
+                with self.scheduleCond:
+                    if not self.goOn:
+                        break
+                    nextTimes  = [s['next'] for s in self.streams]
+                    if self.scheduled:
+                        nextTimes += [self.scheduled[0][0]]
+                    if nextTimes:
+                        timeout = min(nextTimes)-time.time()
+                        if timeout>0:
+                            self.scheduleCond.wait(timeout)
+                    else:
+                        self.scheduleCond.wait()
+
+        except Exception as err:
+            output  = []
+            output += ['===== crash in thread {0} ====='.format(self.name)]
+            output += ['\nerror:\n']
+            output += [str(err)]
+            output += ['\ncall stack:\n']
+            output += [traceback.format_exc()]
+            output  = '\n'.join(output)
+            print output # critical error
+            log.critical(output)
+            raise
+
+        # log
+        log.info('thread ended')
+
+    #======================== public ==========================================
+
+    def close(self):
+        '''
+        \brief Stop generating notifications, close all sessions, and wait
+               for the thread to end.
+        '''
+        with self.scheduleCond:
+            self.goOn        = False
+            self.scheduleCond.notify()
+            sessions         = list(self.sessions)
+        for session in sessions:
+            session.close()
+        # wait for the thread to leave run(), unless closing from it
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join()
+
+    def addSession(self,session):
+        with self.dataLock:
+            self.sessions   += [session]
+
+    def removeSession(self,session):
+        with self.dataLock:
+            if session in self.sessions:
+                self.sessions.remove(session)
+
+    def getStats(self):
+        '''
+        \brief Get statistics about the emulator.
+
+        \returns A dictionary with the following keys:
+            - 'numSessions': number of client sessions
+            - 'numCommands': number of commands answered
+            - 'numNotifs': number of notifications sent, over all sessions
+            - 'numNotifsDropped': number of notifications a session could not
+              queue
+        '''
+        with self.dataLock:
+            returnVal                = dict(self.stats)
+            returnVal['numSessions'] = len(self.sessions)
+            return returnVal
+
+    def handleCommand(self,session,cmdId,payload):
+        '''
+        \brief Execute a command received from a client.
+
+        \param session The EmulatorSession the command was received on.
+        \param cmdId   The command ID.
+        \param payload The request fields, a list of bytes.
+
+        \returns The serialized response, a list of bytes starting with the
+                 RC.
+        '''
+        with self.dataLock:
+            self.stats['numCommands'] += 1
+
+        try:
+            cmdName          = self.apiDef.idToName(ApiDefinition.ApiDefinition.COMMAND,cmdId)
+        except CommandError:
+            log.warning('unknown command {0}'.format(cmdId))
+            return [self._rc('RC_INVALID_COMMAND')]
+
+        requestFields        = decodeFields(self.apiDef.getRequestFields([cmdName]),payload)
+
+        handler              = getattr(self,'_cmd_{0}'.format(cmdName),None)
+        try:
+            if handler:
+                (rc,responseFields) = handler(session,requestFields)
+            else:
+                # accept any other command, responding with zero fields
+                (rc,responseFields) = ('RC_OK',{})
+        except Exception as err:
+            log.error('error executing {0}: {1}\n{2}'.format(cmdName,err,traceback.format_exc()))
+            (rc,responseFields)     = ('RC_INVALID_ARGUMENT',{})
+
+        # only the RC is sent when not RC_OK
+        rc                   = self._rc(rc)
+        if rc!=ApiDefinition.ApiDefinition.RC_OK:
+            return [rc]
+        responseFields[ApiDefinition.ApiDefinition.RC] = rc
+        return encodeFields(
+            self.apiDef.getResponseFields(ApiDefinition.ApiDefinition.COMMAND,[cmdName]),
+            responseFields,
+        )
+
+    def notify(self,nameArray,fields):
+        '''
+        \brief Send a notification to all the sessions subscribed to it.
+
+        \param nameArray The name of the notification, e.g.
+                         ['notification','notifEvent','eventMoteJoin'].
+        \param fields    The notification fields, by name.
+        '''
+        payload              = self._serializeNotification(nameArray,fields)
+        notifType            = self.apiDef.subcommandNameToId(
+            ApiDefinition.ApiDefinition.NOTIFICATION,
+            nameArray[:1],
+            nameArray[1],
+        )
+        with self.dataLock:
+            sessions         = list(self.sessions)
+        for session in sessions:
+            if session.isSubscribed(notifType):
+                queued       = session.sendNotification(
+                    self.notifCmdId,
+                    payload,
+                    session.isReliable(notifType),
+                )
+                with self.dataLock:
+                    if queued:
+                        self.stats['numNotifs']        += 1
+                    else:
+                        self.stats['numNotifsDropped'] += 1
+
+    def notifyEvent(self,eventName,fields,delay=0):
+        '''
+        \brief Generate an event, now or after a delay.
+        '''
+        with self.dataLock:
+            self.eventId     = (self.eventId+1)&0xffffffff
+            fields           = dict(fields)
+            fields['eventId'] = self.eventId
+        nameArray            = ['notification','notifEvent',eventName]
+        if delay:
+            self._schedule(delay,nameArray,fields)
+        else:
+            self.notify(nameArray,fields)
+
+    def generate(self,stream):
+        '''
+        \brief Generate one periodic notification now, whatever the rate of
+               its stream.
+
+        \param stream 'data', 'healthReport' or 'event'.
+        '''
+        self.generators[stream]()
+
+    #======================== commands ========================================
+
+    def _cmd_subscribe(self,session,fields):
+        session.subscribe(
+            filter           = self._toInt(fields['filter']),
+            unackFilter      = self._toInt(fields['unackFilter']),
+        )
+        return ('RC_OK',{})
+
+    def _cmd_getTime(self,session,fields):
+        return ('RC_OK',self._getTime())
+
+    def _cmd_getSystemInfo(self,session,fields):
+        ap                   = self.network.getMoteById(1)
+        return ('RC_OK',{
+            'macAddress':    ap.macAddress,
+            'hwModel':       self.HW_MODEL,
+            'hwRev':         self.HW_REV,
+            'swMajor':       self.SW_VERSION[0],
+            'swMinor':       self.SW_VERSION[1],
+            'swPatch':       self.SW_VERSION[2],
+            'swBuild':       self.SW_VERSION[3],
+        })
+
+    def _cmd_getNetworkConfig(self,session,fields):
+        return ('RC_OK',{
+            'networkId':         self.NETWORK_ID,
+            'apTxPower':         8,
+            'frameProfile':      1,
+            'maxMotes':          max(33,len(self.network.getMotes())),
+            'baseBandwidth':     9000,
+            'downFrameMultVal':  1,
+            'numParents':        2,
+            'ccaMode':           0,
+            'channelList':       0x7fff,
+            'autoStartNetwork':  True,
+            'bbMode':            0,
+            'bbSize':            1,
+            'bwMult':            300,
+        })
+
+    def _cmd_getNetworkInfo(self,session,fields):
+        returnVal            = self.network.getNetworkInfo()
+        returnVal.update({
+            'asnSize':           7250,
+            'advertisementState': 0,
+            'downFrameState':    0,
+            'netState':          0,
+            'ipv6Address':       [0xfe,0x80]+[0x00]*6+list(self.network.getMoteById(1).macAddress),
+        })
+        return ('RC_OK',returnVal)
+
+    def _cmd_getMoteConfig(self,session,fields):
+        if fields['next']:
+            mote             = self.network.getNextMote(fields['macAddress'])
+        else:
+            mote             = self.network.getMote(fields['macAddress'])
+        if not mote:
+            return ('RC_END_OF_LIST' if fields['next'] else 'RC_NOT_FOUND',{})
+        return ('RC_OK',self._moteConfig(mote))
+
+    def _cmd_getMoteConfigById(self,session,fields):
+        mote                 = self.network.getMoteById(fields['moteId'])
+        if not mote:
+            return ('RC_NOT_FOUND',{})
+        return ('RC_OK',self._moteConfig(mote))
+
+    def _cmd_getMoteInfo(self,session,fields):
+        mote                 = self.network.getMote(fields['macAddress'])
+        if not mote:
+            return ('RC_NOT_FOUND',{})
+        neighbors            = len(mote.parents)+len(mote.children)
+        return ('RC_OK',{
+            'macAddress':        mote.macAddress,
+            'state':             mote.state,
+            'numNbrs':           neighbors,
+            'numGoodNbrs':       neighbors,
+            'requestedBw':       mote.requestedBw,
+            'totalNeededBw':     mote.requestedBw,
+            'assignedBw':        mote.requestedBw,
+            'packetsReceived':   mote.packetsReceived,
+            'packetsLost':       mote.packetsLost,
+            'avgLatency':        mote.avgLatency,
+            'stateTime':         int(time.time()-mote.stateTime),
+            'numJoins':          mote.numJoins,
+            'hopDepth':          mote.hopDepth,
+        })
+
+    def _cmd_getPathInfo(self,session,fields):
+        path                 = self.network.getPath(fields['source'],fields['dest'])
+        if not path:
+            return ('RC_NOT_FOUND',{})
+        return ('RC_OK',self._pathInfo(path))
+
+    def _cmd_getNextPathInfo(self,session,fields):
+        if not self.network.getMote(fields['macAddress']):
+            return ('RC_NOT_FOUND',{})
+        path                 = self.network.getNextPath(
+            fields['macAddress'],
+            fields['filter']==1,
+            fields['pathId'] or 0,
+        )
+        if not path:
+            return ('RC_END_OF_LIST',{})
+        returnVal            = self._pathInfo(path)
+        returnVal['pathId']  = path.pathId
+        return ('RC_OK',returnVal)
+
+    def _cmd_getMoteLinks(self,session,fields):
+        mote                 = self.network.getMote(fields['macAddress'])
+        if not mote:
+            return ('RC_NOT_FOUND',{})
+        idx                  = fields['idx'] or 0
+        links                = mote.links[idx:idx+10]
+        if not links and idx:
+            return ('RC_END_OF_LIST',{})
+        returnVal            = {
+            'idx':               idx,
+            'utilization':       min(100,len(mote.links)),
+            'numLinks':          len(links),
+        }
+        for (i,(frameId,slot,channelOffset,moteId,flags)) in enumerate(links):
+            returnVal['frameId_{0}'.format(i+1)]       = frameId
+            returnVal['slot_{0}'.format(i+1)]          = slot
+            returnVal['channelOffset_{0}'.format(i+1)] = channelOffset
+            returnVal['moteId_{0}'.format(i+1)]        = moteId
+            returnVal['flags_{0}'.format(i+1)]         = flags
+        return ('RC_OK',returnVal)
+
+    def _cmd_getNextACLEntry(self,session,fields):
+        return ('RC_END_OF_LIST',{})
+
+    def _cmd_getIPConfig(self,session,fields):
+        return ('RC_OK',{
+            'ipv6Address':       [0xfe,0x80]+[0x00]*6+list(self.network.getMoteById(1).macAddress),
+            'mask':              [0xff]*8+[0x00]*8,
+        })
+
+    def _cmd_pingMote(self,session,fields):
+        mote                 = self.network.getMote(fields['macAddress'])
+        if not mote or mote.isAP:
+            return ('RC_NOT_FOUND',{})
+        if not mote.isOperational:
+            return ('RC_INV_STATE',{})
+        callbackId           = self._nextCallbackId()
+        self.notifyEvent(
+            'eventPingResponse',
+            {
+                'callbackId':    callbackId,
+                'macAddress':    mote.macAddress,
+                'delay':         2*mote.avgLatency,
+                'voltage':       mote.voltage,
+                'temperature':   mote.temperature,
+            },
+            delay            = 2*mote.avgLatency/1000.0,
+        )
+        return ('RC_OK',{'callbackId': callbackId})
+
+    def _cmd_sendData(self,session,fields):
+        mote                 = self.network.getMote(fields['macAddress'])
+        if not mote:
+            return ('RC_NOT_FOUND',{})
+        if not mote.isOperational:
+            return ('RC_INV_STATE',{})
+        callbackId           = self._nextCallbackId()
+        self.notifyEvent(
+            'eventPacketSent',
+            {
+                'callbackId':    callbackId,
+                'rc':            0,
+            },
+            delay            = mote.avgLatency/1000.0,
+        )
+        return ('RC_OK',{'callbackId': callbackId})
+
+    def _cmd_sendIP(self,session,fields):
+        return self._cmd_sendData(session,fields)
+
+    def _cmd_setAdvertising(self,session,fields):
+        return self._commandFinished()
+
+    def _cmd_setDownstreamFrameMode(self,session,fields):
+        return self._commandFinished()
+
+    def _cmd_exchangeMoteJoinKey(self,session,fields):
+        if not self.network.getMote(fields['macAddress']):
+            return ('RC_NOT_FOUND',{})
+        return self._commandFinished()
+
+    def _cmd_exchangeNetworkId(self,session,fields):
+        return self._commandFinished()
+
+    def _cmd_reset(self,session,fields):
+        if fields['type']==2:
+            # resetMote
+            mote             = self.network.getMote(fields['macAddress'])
+            if not mote or mote.isAP:
+                return ('RC_NOT_FOUND',{})
+            if not mote.isOperational:
+                return ('RC_INV_STATE',{})
+            self._rejoin(mote,lostEvent='eventMoteReset')
+        return ('RC_OK',{'macAddress': fields['macAddress']})
+
+    #======================== notifications ===================================
+
+    def _generateData(self):
+        mote                 = self._nextMote('data')
+        if not mote:
+            return
+        now                  = time.time()
+        if self.dataLength is None:
+            payload          = self._oapTemperature(mote,now)
+        else:
+            payload          = [self.random.randint(0x00,0xff) for _ in xrange(self.dataLength)]
+        mote.packetsReceived += 1
+        self.notify(
+            ['notification','notifData'],
+            {
+                'utcSecs':       int(now),
+                'utcUsecs':      int((now-int(now))*1000000),
+                'macAddress':    mote.macAddress,
+                'srcPort':       0xf0b9,
+                'dstPort':       0xf0b9,
+                'data':          payload,
+            },
+        )
+
+    def _generateHealthReport(self):
+        mote                 = self._nextMote('healthReport')
+        if not mote:
+            return
+        hr                   = HrParser.HrParser
+
+        # device health report
+        device               = struct.pack(
+            self._hrFormat(hr.HR_DESC_DEVICE),
+            self.network.getUptime(),                 # charge
+            self.random.randint(0,10),                # queueOcc
+            mote.temperature,
+            mote.voltage,
+            self.random.randint(50,100),              # numTxOk
+            self.random.randint(0,5),                 # numTxFail
+            self.random.randint(50,100),              # numRxOk
+            self.random.randint(0,5),                 # numRxLost
+            0,0,0,0,0,0,0,0,
+        )
+
+        # neighbors health report
+        neighborIds          = mote.parents+mote.children
+        neighbors            = struct.pack(self._hrFormat(hr.HR_DESC_NEIGHBORS),len(neighborIds))
+        for neighborId in neighborIds:
+            neighbors       += struct.pack(
+                self._hrFormat(hr.HR_DESC_NEIGHBOR_DATA),
+                neighborId,
+                0x01 if neighborId in mote.parents else 0x00,
+                self.random.randint(-85,-40),         # rssi
+                self.random.randint(10,50),           # numTxPackets
+                self.random.randint(0,3),             # numTxFailures
+                self.random.randint(10,50),           # numRxPackets
+            )
+
+        payload              = []
+        for (hrId,body) in [(hr.HR_ID_DEVICE,device),(hr.HR_ID_NEIGHBORS,neighbors)]:
+            payload         += [hrId,len(body)]+list(bytearray(body))
+        self.notify(
+            ['notification','notifHealthReport'],
+            {
+                'macAddress':    mote.macAddress,
+                'payload':       payload,
+            },
+        )
+
+    def _generateEvent(self):
+        '''
+        \brief Generate the next event of a cycle of path changes, motes
+               rejoining and network time reports.
+        '''
+        self.eventCycle     += 1
+        kind                 = self.eventCycle%3
+        if kind==0:
+            self.notifyEvent('eventNetworkTime',self._getTime())
+            return
+        mote                 = self._nextMote('event')
+        if not mote:
+            return
+        if kind==1:
+            paths            = [p for p in self.network.getPathsOf(mote)
+                                   if p.source is mote and p.direction==NetworkModel.Path.DIRECTION_UPSTREAM]
+            for eventName in ['eventPathDelete','eventPathCreate']:
+                for path in paths:
+                    self.notifyEvent(eventName,{
+                        'source':    path.source.macAddress,
+                        'dest':      path.dest.macAddress,
+                        'direction': path.direction,
+                    })
+        else:
+            self._rejoin(mote,lostEvent='eventMoteLost')
+
+    #======================== private =========================================
+
+    def _rejoin(self,mote,lostEvent):
+        '''
+        \brief Have a mote leave the network, then join it again.
+        '''
+        self.network.setMoteState(mote,NetworkModel.Mote.STATE_LOST)
+        self.notifyEvent(lostEvent,{'macAddress': mote.macAddress})
+        self._schedule(
+            1.0,
+            None,
+            lambda: self.network.setMoteState(mote,NetworkModel.Mote.STATE_NEGOTIATING),
+        )
+        self.notifyEvent('eventMoteJoin',{'macAddress': mote.macAddress},delay=1.0)
+        self._schedule(
+            3.0,
+            None,
+            lambda: self.network.setMoteState(mote,NetworkModel.Mote.STATE_OPERATIONAL),
+        )
+        self.notifyEvent('eventMoteOperational',{'macAddress': mote.macAddress},delay=3.0)
+
+    def _schedule(self,delay,nameArray,fields):
+        '''
+        \brief Send a notification after a delay. If nameArray is None,
+               fields is a function to call instead.
+        '''
+        with self.scheduleCond:
+            self.numScheduled += 1
+            heapq.heappush(
+                self.scheduled,
+                (time.time()+delay,self.numScheduled,nameArray,fields),
+            )
+            self.scheduleCond.notify()
+
+    def _serializeNotification(self,nameArray,fields):
+        payload              = []
+        for i in range(1,len(nameArray)+1):
+            fieldDefs        = self.apiDef.getResponseFields(
+                ApiDefinition.ApiDefinition.NOTIFICATION,
+                nameArray[:i],
+            )
+            values           = dict(fields)
+            for field in fieldDefs:
+                if field.name in ApiDefinition.ApiDefinition.RESERVED:
+                    values[field.name] = self.apiDef.subcommandNameToId(
+                        ApiDefinition.ApiDefinition.NOTIFICATION,
+                        nameArray[:i],
+                        nameArray[i],
+                    )
+            payload         += encodeFields(fieldDefs,values)
+        return payload
+
+    def _commandFinished(self):
+        callbackId           = self._nextCallbackId()
+        self.notifyEvent(
+            'eventCommandFinished',
+            {
+                'callbackId':    [(callbackId>>(8*i))&0xff for i in [3,2,1,0]],
+                'rc':            0,
+            },
+            delay            = 0.5,
+        )
+        return ('RC_OK',{'callbackId': callbackId})
+
+    def _nextCallbackId(self):
+        with self.dataLock:
+            self.callbackId  = (self.callbackId+1)&0xffffffff
+            return self.callbackId
+
+    def _nextMote(self,stream):
+        '''
+        \brief Round-robin over the operational motes.
+        '''
+        motes                = self.network.getOperationalMotes()
+        if not motes:
+            return None
+        index                = self.moteIndex.get(stream,0)%len(motes)
+        self.moteIndex[stream] = index+1
+        return motes[index]
+
+    def _getTime(self):
+        now                  = time.time()
+        uptime               = now-self.network.startTime
+        asn                  = int(uptime/self.SLOT_DURATION)
+        return {
+            'uptime':            int(uptime),
+            'utcSecs':           int(now),
+            'utcUsecs':          int((now-int(now))*1000000),
+            'asn':               [(asn>>(8*i))&0xff for i in [4,3,2,1,0]],
+            'asnOffset':         int((uptime%self.SLOT_DURATION)*1000000),
+        }
+
+    def _moteConfig(self,mote):
+        return {
+            'macAddress':        mote.macAddress,
+            'moteId':            mote.moteId,
+            'isAP':              mote.isAP,
+            'state':             mote.state,
+            'reserved':          1,
+            'isRouting':         mote.isRouting,
+        }
+
+    def _pathInfo(self,path):
+        return {
+            'source':            path.source.macAddress,
+            'dest':              path.dest.macAddress,
+            'direction':         path.direction,
+            'numLinks':          path.numLinks,
+            'quality':           path.quality,
+            'rssiSrcDest':       path.rssiSrcDest,
+            'rssiDestSrc':       path.rssiDestSrc,
+        }
+
+    def _oapTemperature(self,mote,now):
+        '''
+        \brief The payload of an OAP temperature sample, as published by the
+               default firmware of the motes.
+        '''
+        secs                 = int(now)
+        returnVal            = [0x00,0x00]        # OAP transport header
+        returnVal           += [0x05,0x00]        # OAP notification, sample
+        returnVal           += [0xff,0x01,0x05]   # address of the temperature channel
+        returnVal           += list(bytearray(struct.pack(
+            '!qllBBh',
+            secs,                                 # timestamp
+            int((now-secs)*1000000),
+            30000,                                # rate, in ms
+            1,                                    # numSamples
+            16,                                   # sampleSize
+            mote.temperature*100,                 # in centi-degrees C
+        )))
+        return returnVal
+
+    def _hrFormat(self,desc):
+        return '>'+''.join([f for (_,f) in desc])
+
+    def _rc(self,label):
+        for (rc,rcLabel,_) in self.apiDef.fieldOptions[ApiDefinition.ApiDefinition.RC]:
+            if rcLabel==label:
+                return rc
+        raise SystemError('unknown RC {0}'.format(label))
+
+    def _toInt(self,byteList):
+        returnVal            = 0
+        for b in byteList or []:
+            returnVal        = (returnVal<<8)|b
+        return returnVal
@@ -0,0 +1,213 @@
+#!/usr/bin/python
+
+import socket
+import struct
+import threading
+import traceback
+import Queue
+
+import IpMgrEmulator
+
+from   SmartMeshSDK.IpMgrConnectorMux   import MuxMsg
+
+import logging
+class NullHandler(logging.Handler):
+    def emit(self, record):
+        pass
+log = logging.getLogger('MuxSession')
+log.setLevel(logging.ERROR)
+log.addHandler(NullHandler())
+
+class MuxSession(IpMgrEmulator.EmulatorSession):
+    '''
+    \ingroup IpMgrEmulator
+
+    \brief A client of the emulated manager, connected over the Serial Mux
+           protocol.
+
+    The Serial Mux acknowledges the notifications of the manager itself, so
+    all notifications are simply sent on the socket, in order, by a dedicated
+    thread. Notifications which do not fit in the queue are dropped.
+    '''
+
+    def __init__(self,emulator,sock,address,maxQueueSize=1000):
+
+        # initialize parent class
+        IpMgrEmulator.EmulatorSession.__init__(self,emulator)
+
+        # store params
+        self.sock            = sock
+        self.address         = address
+
+        # local variables
+        self.apiDef          = emulator.apiDef
+        self.helloId         = self.apiDef.nameToId(self.apiDef.COMMAND,['mux_hello'])
+        self.muxMsg          = MuxMsg.MuxMsg(self._processCmd,views=True)
+        self.goOn            = True
+        self.sendLock        = threading.Lock()
+        self.txQueue         = Queue.Queue(maxQueueSize)
+        self.name            = 'MuxSession_{0}:{1}'.format(*address)
+
+        # start the threads
+        for (target,suffix) in [(self._rxThread,'rx'),(self._txThread,'tx')]:
+            thread           = threading.Thread(target=target)
+            thread.name      = '{0}_{1}'.format(self.name,suffix)
+            thread.daemon    = True
+            thread.start()
+
+        self.emulator.addSession(self)
+
+        log.info('{0} connected'.format(self.name))
+
+    #======================== public ==========================================
+
+    def sendNotification(self,cmdId,payload,reliable):
+        try:
+            self.txQueue.put_nowait((cmdId,payload))
+        except Queue.Full:
+            return False
+        return True
+
+    def close(self):
+        if not self.goOn:
+            return
+        self.goOn            = False
+        self.emulator.removeSession(self)
+        self.txQueue.put((None,None))
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except socket.error:
+            pass # already disconnected
+        self.sock.close()
+
+        log.info('{0} disconnected'.format(self.name))
+
+    #======================== private =========================================
+
+    def _rxThread(self):
+        try:
+            while self.goOn:
+                if not self.muxMsg.recv_into(self.sock):
+                    break
+        except socket.error as err:
+            log.info('{0}: {1}'.format(self.name,err))
+        except Exception as err:
+            self._logCrash(err)
+        self.close()
+
+    def _txThread(self):
+        try:
+            while True:
+                (cmdId,payload) = self.txQueue.get()
+                if cmdId is None:
+                    break
+                self._send(cmdId,payload)
+        except socket.error as err:
+            log.info('{0}: {1}'.format(self.name,err))
+        except Exception as err:
+            self._logCrash(err)
+        self.close()
+
+    def _processCmd(self,reserved,cmdId,payload):
+        payload              = list(bytearray(payload))
+        if cmdId==self.helloId:
+            fields           = IpMgrEmulator.decodeFields(
+                self.apiDef.getRequestFields(['mux_hello']),
+                payload,
+            )
+            rc               = 0 if fields['version']==MuxMsg.VERSION else 1
+            response         = [rc,MuxMsg.VERSION]
+        else:
+            response         = self.emulator.handleCommand(self,cmdId,payload)
+        self._send(cmdId,response)
+
+    def _send(self,cmdId,payload):
+        data                 = struct.pack('!{0}B'.format(len(payload)),*payload)
+        with self.sendLock:
+            self.sock.sendall(self.muxMsg.build_message(cmdId,data))
+
+    def _logCrash(self,err):
+        output  = []
+        output += ['===== crash in thread {0} ====='.format(threading.current_thread().name)]
+        output += ['\nerror:\n']
+        output += [str(err)]
+        output += ['\ncall stack:\n']
+        output += [traceback.format_exc()]
+        output  = '\n'.join(output)
+        print output # critical error
+        log.critical(output)
+
+class MuxServer(threading.Thread):
+    '''
+    \ingroup IpMgrEmulator
+
+    \brief Serve the emulated manager over TCP, as the Serial Mux does.
+
+    Connect IpMgrConnectorMux clients to the port of this server. Each client
+    gets its own MuxSession, hence its own subscription.
+    '''
+
+    DEFAULT_PORT     = 9900
+
+    def __init__(self,emulator,host='127.0.0.1',port=DEFAULT_PORT):
+
+        # store params
+        self.emulator        = emulator
+
+        # initialize parent class
+        threading.Thread.__init__(self)
+        self.name            = 'MuxServer'
+        self.daemon          = True
+
+        # local variables
+        self.goOn            = True
+        self.sock            = socket.socket(socket.AF_INET,socket.SOCK_STREAM)
+        self.sock.setsockopt(socket.SOL_SOCKET,socket.SO_REUSEADDR,1)
+        self.sock.bind((host,port))
+        self.sock.listen(5)
+        self.port            = self.sock.getsockname()[1]  # when port was 0
+
+        # start the thread
+        self.start()
+
+    def run(self):
+
+        # log
+        log.info('thread started')
+
+        try:
+            while self.goOn:
+                try:
+                    (sock,address) = self.sock.accept()
+                except socket.error:
+                    if self.goOn:
+                        raise
+                    break
+                MuxSession(self.emulator,sock,address)
+        except Exception as err:
+            output  = []
+            output += ['===== crash in thread {0} ====='.format(self.name)]
+            output += ['\nerror:\n']
+            output += [str(err)]
+            output += ['\ncall stack:\n']
+            output += [traceback.format_exc()]
+            output  = '\n'.join(output)
+            print output # critical error
+            log.critical(output)
+            raise
+
+        # log
+        log.info('thread ended')
+
+    #======================== public ==========================================
+
+    def close(self):
+        '''
+        \brief Stop accepting clients. Connected clients stay connected.
+        '''
+        self.goOn            = False
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except socket.error:
+            pass
+        self.sock.close()
@@ -0,0 +1,273 @@
+#!/usr/bin/python
+
+import random
+import threading
+import time
+
+import logging
+class NullHandler(logging.Handler):
+    def emit(self, record):
+        pass
+log = logging.getLogger('NetworkModel')
+log.setLevel(logging.ERROR)
+log.addHandler(NullHandler())
+
+class Mote(object):
+    '''
+    \ingroup IpMgrEmulator
+
+    \brief A mote of the synthetic network, including the access point.
+    '''
+
+    STATE_LOST         = 0
+    STATE_NEGOTIATING  = 1
+    STATE_OPERATIONAL  = 4
+
+    def __init__(self,moteId,macAddress,isAP,hopDepth):
+        self.moteId          = moteId
+        self.macAddress      = macAddress
+        self.isAP            = isAP
+        self.isRouting       = True
+        self.hopDepth        = hopDepth
+        self.state           = self.STATE_OPERATIONAL
+        self.stateTime       = time.time()
+        self.parents         = []     # moteIds of the upstream neighbors
+        self.children        = []     # moteIds of the downstream neighbors
+        self.links           = []     # (frameId,slot,channelOffset,moteId,flags)
+        self.numJoins        = 1
+        self.requestedBw     = 9000   # in ms per packet
+        self.packetsReceived = 0
+        self.packetsLost     = 0
+        self.avgLatency      = 0      # in ms
+        self.temperature     = 22     # in C
+        self.voltage         = 3000   # in mV
+
+    @property
+    def isOperational(self):
+        return self.state==self.STATE_OPERATIONAL
+
+class Path(object):
+    '''
+    \ingroup IpMgrEmulator
+
+    \brief A path between two motes of the synthetic network.
+    '''
+
+    DIRECTION_UPSTREAM   = 2
+    DIRECTION_DOWNSTREAM = 3
+
+    def __init__(self,pathId,source,dest,direction,numLinks,quality,rssiSrcDest,rssiDestSrc):
+        self.pathId          = pathId
+        self.source          = source # a Mote
+        self.dest            = dest   # a Mote
+        self.direction       = direction
+        self.numLinks        = numLinks
+        self.quality         = quality
+        self.rssiSrcDest     = rssiSrcDest
+        self.rssiDestSrc     = rssiDestSrc
+
+class NetworkModel(object):
+    '''
+    \ingroup IpMgrEmulator
+
+    \brief Synthetic SmartMesh IP network (motes, paths and links) the
+           emulated manager answers queries from.
+
+    Mote 1 is the access point. The other motes form a tree of the given
+    fanout, each mote also having a second parent at the same depth as its
+    first parent, when there is one. All random values are drawn from a
+    generator seeded with 'seed', so two models with the same parameters
+    are identical.
+    '''
+
+    MAC_PREFIX           = [0x00,0x17,0x0d,0x00,0x00,0x38]
+    MAX_SLOT             = 0xffff # highest slot number assigned to a link
+    NUM_CHANNELS         = 15
+
+    def __init__(self,numMotes=10,fanout=3,seed=0):
+
+        # store params
+        self.numMotes        = numMotes   # not counting the access point
+        self.fanout          = fanout
+
+        # local variables
+        self.dataLock        = threading.RLock()
+        self.random          = random.Random(seed)
+        self.motes           = []         # ordered by moteId
+        self.motesByMac      = {}
+        self.motesById       = {}
+        self.paths           = []         # ordered by pathId
+        self.usedSlots       = set()
+        self.startTime       = time.time()
+
+        self._build()
+
+    #======================== public ==========================================
+
+    def getMotes(self):
+        with self.dataLock:
+            return list(self.motes)
+
+    def getOperationalMotes(self):
+        '''
+        \brief The operational motes, not counting the access point.
+        '''
+        with self.dataLock:
+            return [m for m in self.motes if m.isOperational and not m.isAP]
+
+    def getMote(self,macAddress):
+        return self.motesByMac.get(tuple(macAddress))
+
+    def getMoteById(self,moteId):
+        return self.motesById.get(moteId)
+
+    def getNextMote(self,macAddress):
+        '''
+        \brief The mote following the given one, by moteId. An unknown MAC
+               address (e.g. all zeros) returns the first mote.
+        '''
+        with self.dataLock:
+            mote             = self.getMote(macAddress)
+            if not mote:
+                return self.motes[0]
+            index            = self.motes.index(mote)+1
+            if index<len(self.motes):
+                return self.motes[index]
+            return None
+
+    def getPath(self,source,dest):
+        with self.dataLock:
+            for path in self.paths:
+                if  (
+                        list(path.source.macAddress)==list(source) and
+                        list(path.dest.macAddress)==list(dest)
+                    ):
+                    return path
+            return None
+
+    def getNextPath(self,macAddress,upstreamOnly,pathId):
+        '''
+        \brief The first path from the given mote with an ID above pathId.
+        '''
+        with self.dataLock:
+            for path in self.paths:
+                if path.pathId<=pathId:
+                    continue
+                if list(path.source.macAddress)!=list(macAddress):
+                    continue
+                if upstreamOnly and path.direction!=Path.DIRECTION_UPSTREAM:
+                    continue
+                return path
+            return None
+
+    def getPathsOf(self,mote):
+        '''
+        \brief The paths from and to a mote.
+        '''
+        with self.dataLock:
+            return [p for p in self.paths if p.source is mote or p.dest is mote]
+
+    def setMoteState(self,mote,state):
+        with self.dataLock:
+            if state==Mote.STATE_OPERATIONAL and mote.state!=state:
+                mote.numJoins   += 1
+            mote.state           = state
+            mote.stateTime       = time.time()
+
+    def getUptime(self):
+        return int(time.time()-self.startTime)
+
+    def getNetworkInfo(self):
+        '''
+        \brief Network-wide counters, with the field names of getNetworkInfo.
+        '''
+        with self.dataLock:
+            numArrived       = sum([m.packetsReceived for m in self.motes])
+            numLost          = sum([m.packetsLost for m in self.motes])
+            numPaths         = len([p for p in self.paths if p.direction==Path.DIRECTION_UPSTREAM])
+            if numPaths:
+                stability    = sum([p.quality for p in self.paths])/len(self.paths)
+            else:
+                stability    = 100
+            if numArrived+numLost:
+                reliability  = 100*numArrived/(numArrived+numLost)
+            else:
+                reliability  = 100
+            return {
+                'numMotes':            len([m for m in self.motes if not m.isAP]),
+                'netReliability':      reliability,
+                'netPathStability':    stability,
+                'netLatency':          max([m.avgLatency for m in self.motes]),
+                'numLostPackets':      numLost,
+                'numArrivedPackets':   numArrived,
+                'maxNumbHops':         max([m.hopDepth for m in self.motes]),
+            }
+
+    #======================== private =========================================
+
+    def _build(self):
+        # the access point
+        self._addMote(isAP=True,hopDepth=0)
+
+        # the motes, in a tree of the given fanout
+        for i in range(1,self.numMotes+1):
+            parent           = self.motes[(i-1)/self.fanout]
+            mote             = self._addMote(isAP=False,hopDepth=parent.hopDepth+1)
+            self._addParent(mote,parent)
+            # second parent, at the same depth as the first one
+            peers            = [m for m in self.motes
+                                   if m.hopDepth==parent.hopDepth and m is not parent]
+            if peers:
+                self._addParent(mote,self.random.choice(peers))
+            mote.avgLatency  = 300*mote.hopDepth+self.random.randint(0,200)
+            mote.temperature = self.random.randint(15,30)
+            mote.voltage     = self.random.randint(2900,3100)
+
+        log.info('built a network of {0} motes, {1} paths'.format(len(self.motes),len(self.paths)))
+
+    def _addMote(self,isAP,hopDepth):
+        moteId               = len(self.motes)+1
+        macAddress           = tuple(self.MAC_PREFIX+[moteId>>8,moteId&0xff])
+        mote                 = Mote(moteId,macAddress,isAP,hopDepth)
+        if not isAP:
+            mote.isRouting   = (moteId-1)*self.fanout<self.numMotes
+        self.motes          += [mote]
+        self.motesByMac[macAddress] = mote
+        self.motesById[moteId]      = mote
+        return mote
+
+    def _addParent(self,mote,parent):
+        numLinks             = self.random.randint(1,3)
+        quality              = self.random.randint(70,100)
+        rssiUp               = self.random.randint(-85,-40)
+        rssiDown             = rssiUp+self.random.randint(-3,3)
+        for (source,dest,direction) in [
+                (mote,  parent, Path.DIRECTION_UPSTREAM),
+                (parent,mote,   Path.DIRECTION_DOWNSTREAM),
+            ]:
+            self.paths      += [Path(
+                pathId       = len(self.paths)+1,
+                source       = source,
+                dest         = dest,
+                direction    = direction,
+                numLinks     = numLinks,
+                quality      = quality,
+                rssiSrcDest  = rssiUp   if source is mote else rssiDown,
+                rssiDestSrc  = rssiDown if source is mote else rssiUp,
+            )]
+        mote.parents        += [parent.moteId]
+        parent.children     += [mote.moteId]
+
+        # transmit links on the child, receive links on the parent
+        for _ in range(numLinks):
+            slot             = self._allocateSlot()
+            channelOffset    = self.random.randint(0,self.NUM_CHANNELS)
+            mote.links      += [(0,slot,channelOffset,parent.moteId,0x01)]
+            parent.links    += [(0,slot,channelOffset,mote.moteId,0x02)]
+
+    def _allocateSlot(self):
+        while True:
+            slot             = self.random.randint(1,self.MAX_SLOT)
+            if slot not in self.usedSlots:
+                self.usedSlots.add(slot)
+                return slot
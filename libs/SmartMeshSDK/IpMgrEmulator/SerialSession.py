@@ -0,0 +1,310 @@
+#!/usr/bin/python
+
+import errno
+import fcntl
+import os
+import pty
+import Queue
+import select
+import struct
+import termios
+import threading
+import traceback
+import tty
+
+import IpMgrEmulator
+
+from   SmartMeshSDK.ApiException             import ConnectionError
+from   SmartMeshSDK.SerialConnector          import Hdlc
+
+import logging
+class NullHandler(logging.Handler):
+    def emit(self, record):
+        pass
+log = logging.getLogger('SerialSession')
+log.setLevel(logging.ERROR)
+log.addHandler(NullHandler())
+
+class PtyMaster(object):
+    '''
+    \ingroup IpMgrEmulator
+
+    \brief The master side of a pty, with the members of a pyserial port the
+           Hdlc module uses.
+    '''
+
+    _POLL_PERIOD     = 0.5    # in seconds, period at which a blocking read checks for close()
+
+    def __init__(self,fd):
+        self.fd              = fd
+        self.isOpen          = True
+
+    def fileno(self):
+        return self.fd
+
+    @property
+    def in_waiting(self):
+        buf                  = fcntl.ioctl(self.fd,termios.FIONREAD,struct.pack('I',0))
+        return struct.unpack('I',buf)[0]
+
+    def read(self,size=1):
+        '''
+        \brief Block until data is available, then read at most size bytes.
+
+        \returns The bytes read, or an empty string once closed.
+        '''
+        while self.isOpen:
+            try:
+                (readable,_,_) = select.select([self.fd],[],[],self._POLL_PERIOD)
+            except select.error as err:
+                if err.args[0]==errno.EINTR:
+                    continue
+                raise
+            if readable and self.isOpen:
+                return os.read(self.fd,size)
+        return ''
+
+    def write(self,data):
+        data                 = bytes(data)
+        numWritten           = 0
+        while numWritten<len(data):
+            numWritten      += os.write(self.fd,data[numWritten:])
+        return numWritten
+
+    def close(self):
+        if self.isOpen:
+            self.isOpen      = False
+            os.close(self.fd)
+
+class SerialSession(IpMgrEmulator.EmulatorSession):
+    '''
+    \ingroup IpMgrEmulator
+
+    \brief Serve the serial API of the emulated manager over a pty.
+
+    Connect an IpMgrConnectorSerial to portName, as if it were the API port of
+    a manager. The session implements the transport of the serial API: HDLC
+    framing, the hello/hello_response handshake, packet IDs, retransmissions
+    of the client and acknowledged notifications.
+
+    Notifications are queued and sent by a dedicated thread. A reliable
+    notification is retransmitted until acknowledged by the client, up to
+    MAX_RETRIES times, the queue filling up meanwhile; notifications which do
+    not fit in the queue are dropped.
+    '''
+
+    CONTROL_RESPONSE = 0x01   # packet is a response or an ACK
+    CONTROL_RELIABLE = 0x02   # packet needs to be acknowledged
+    ACK_TIMEOUT      = 0.2    # in seconds, before retransmitting a notification
+    MAX_RETRIES      = 3
+    MGR_HELLO_PERIOD = 1.0    # in seconds, between manager_hello while no client
+
+    def __init__(self,emulator,maxQueueSize=1000):
+
+        # initialize parent class
+        IpMgrEmulator.EmulatorSession.__init__(self,emulator)
+
+        # local variables
+        self.apiDef          = emulator.apiDef
+        self.helloIds        = {}
+        for (type,name) in [
+                (self.apiDef.COMMAND,     'hello'),
+                (self.apiDef.COMMAND,     'hello_response'),
+                (self.apiDef.NOTIFICATION,'manager_hello'),
+            ]:
+            self.helloIds[name] = self.apiDef.nameToId(type,[name])
+        self.dataLock        = threading.Lock()
+        self.goOn            = True
+        self.isActive        = False  # True once the client said hello
+        self.numHellos       = 0
+        self.mgrSeqNo        = 0      # packetId of the last reliable packet sent
+        self.lastRequest     = None   # (packetId,cmdId,response), to answer retransmissions
+        self.txQueue         = Queue.Queue(maxQueueSize)
+        self.ackEvent        = threading.Event()
+        self.ackExpected     = None   # (cmdId,packetId) of the notification in flight
+        self.numRetries      = 0
+
+        # open the pty
+        (self.masterFd,self.slaveFd) = pty.openpty()
+        tty.setraw(self.slaveFd)
+        self.portName        = os.ttyname(self.slaveFd)
+        self.pty             = PtyMaster(self.masterFd)
+
+        # start receiving
+        self.hdlc            = Hdlc.Hdlc(
+            self._hdlcRxCb,
+            self._hdlcConnectCb,
+            rxMode           = Hdlc.Hdlc.RXMODE_CHUNK,
+        )
+        self.hdlc.attach(self.pty,self.portName)
+
+        # start sending
+        self.txThread        = threading.Thread(target=self._txThread)
+        self.txThread.name   = '{0}_tx'.format(self.portName)
+        self.txThread.daemon = True
+        self.txThread.start()
+
+        self.emulator.addSession(self)
+
+        log.info('serving on {0}'.format(self.portName))
+
+    #======================== public ==========================================
+
+    def sendNotification(self,cmdId,payload,reliable):
+        if not self.isActive:
+            return False
+        try:
+            self.txQueue.put_nowait((cmdId,payload,reliable))
+        except Queue.Full:
+            return False
+        return True
+
+    def close(self):
+        if not self.goOn:
+            return
+        self.goOn            = False
+        self.emulator.removeSession(self)
+        self.ackEvent.set()
+        self.hdlc.disconnect()
+        os.close(self.slaveFd)
+
+    def getStats(self):
+        return {
+            'numRetries':    self.numRetries,
+            'queueSize':     self.txQueue.qsize(),
+        }
+
+    #======================== private =========================================
+
+    def _hdlcRxCb(self,frame):
+        if len(frame)<4:
+            log.warning('packet too short: {0}'.format(frame))
+            return
+        (control,cmdId,packetId,length) = frame[:4]
+        payload              = frame[4:4+length]
+
+        if control&self.CONTROL_RESPONSE:
+            # ACK of a notification
+            with self.dataLock:
+                if self.ackExpected==(cmdId,packetId):
+                    self.ackExpected = None
+                    self.ackEvent.set()
+            return
+
+        if cmdId==self.helloIds['hello']:
+            self._handleHello(payload)
+            return
+
+        if not self.isActive:
+            log.warning('command {0} received before hello'.format(cmdId))
+            return
+
+        # answer retransmissions without executing the command again
+        with self.dataLock:
+            lastRequest      = self.lastRequest
+        if lastRequest and lastRequest[:2]==(packetId,cmdId):
+            response         = lastRequest[2]
+        else:
+            response         = self.emulator.handleCommand(self,cmdId,payload)
+            with self.dataLock:
+                self.lastRequest = (packetId,cmdId,response)
+
+        self._send(
+            self.CONTROL_RESPONSE|self.CONTROL_RELIABLE,
+            cmdId,
+            packetId,
+            response,
+        )
+
+    def _handleHello(self,payload):
+        fields               = IpMgrEmulator.decodeFields(
+            self.apiDef.getRequestFields(['hello']),
+            payload,
+        )
+        version              = self.apiDef.fieldOptions['protocolVersion']
+        successCode          = 0 if fields['version']==version else 1
+        with self.dataLock:
+            # hold the lock while sending, for no manager_hello to follow
+            self.lastRequest = None
+            self.ackExpected = None
+            self.numHellos  += 1
+            self.isActive    = successCode==0
+            self._send(0x00,self.helloIds['hello_response'],self.mgrSeqNo,[
+                successCode,
+                version,
+                self.mgrSeqNo,
+                fields['cliSeqNo'] or 0,
+                fields['mode'] or 0,
+            ])
+        self.ackEvent.set()
+
+    def _hdlcConnectCb(self,connected):
+        if not connected:
+            self.isActive    = False
+            log.info('{0} closed'.format(self.portName))
+
+    def _txThread(self):
+        try:
+            while self.goOn:
+                with self.dataLock:
+                    isActive = self.isActive
+                    if not isActive:
+                        # announce the manager until a client says hello
+                        self._send(0x00,self.helloIds['manager_hello'],0,[
+                            self.apiDef.fieldOptions['protocolVersion'],
+                            0,
+                        ])
+                if not isActive:
+                    self.ackEvent.wait(self.MGR_HELLO_PERIOD)
+                    self.ackEvent.clear()
+                    continue
+                try:
+                    (cmdId,payload,reliable) = self.txQueue.get(timeout=self.MGR_HELLO_PERIOD)
+                except Queue.Empty:
+                    continue
+                if reliable:
+                    self._sendReliable(cmdId,payload)
+                else:
+                    self._send(0x00,cmdId,0,payload)
+        except ConnectionError as err:
+            log.info('{0} closed: {1}'.format(self.portName,err))
+        except Exception as err:
+            output  = []
+            output += ['===== crash in thread {0} ====='.format(threading.current_thread().name)]
+            output += ['\nerror:\n']
+            output += [str(err)]
+            output += ['\ncall stack:\n']
+            output += [traceback.format_exc()]
+            output  = '\n'.join(output)
+            print output # critical error
+            log.critical(output)
+            raise
+
+    def _sendReliable(self,cmdId,payload):
+        '''
+        \brief Send a notification, and wait for the client to acknowledge it.
+
+        A notification which is not acknowledged does not consume its packetId,
+        so the client does not lose track of the sequence.
+        '''
+        with self.dataLock:
+            packetId         = (self.mgrSeqNo+1)%256
+            numHellos        = self.numHellos
+            self.ackExpected = (cmdId,packetId)
+            self.ackEvent.clear()
+        for _ in range(self.MAX_RETRIES+1):
+            self._send(self.CONTROL_RELIABLE,cmdId,packetId,payload)
+            self.ackEvent.wait(self.ACK_TIMEOUT)
+            with self.dataLock:
+                if self.numHellos!=numHellos:
+                    return # the client reconnected, its sequence restarted
+                if self.ackExpected is None:
+                    self.mgrSeqNo = packetId
+                    return
+            self.numRetries += 1
+        log.warning('notification {0} not acknowledged'.format(packetId))
+        with self.dataLock:
+            self.ackExpected = None
+
+    def _send(self,control,cmdId,packetId,payload):
+        self.hdlc.send([control,cmdId,packetId,len(payload)]+list(payload))
@@ -2,8 +2,8 @@
 This module was generated automatically. Do not edit directly.
 '''
 
-import collections
 from   SmartMeshSDK import ApiException
+from   SmartMeshSDK.utils import LazyNamedTuple
 from   IpMoteConnectorInternal import IpMoteConnectorInternal
 
 ##
@@ -41,7 +41,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     #      - 16: RC_ACCESS_DENIED
     #      - 18: RC_ERASE_FAIL
     # 
-    Tuple_dn_setParameter_macAddress = collections.namedtuple("Tuple_dn_setParameter_macAddress", ['RC'])
+    Tuple_dn_setParameter_macAddress = LazyNamedTuple.namedtuple("Tuple_dn_setParameter_macAddress", ['RC'])
 
     ##
     # This command allows user to overwrite the manufacturer-assigned MAC address of the mote. The new value takes effect after the mote resets.
@@ -78,7 +78,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     #      - 16: RC_ACCESS_DENIED
     #      - 18: RC_ERASE_FAIL
     # 
-    Tuple_dn_setParameter_joinKey = collections.namedtuple("Tuple_dn_setParameter_joinKey", ['RC'])
+    Tuple_dn_setParameter_joinKey = LazyNamedTuple.namedtuple("Tuple_dn_setParameter_joinKey", ['RC'])
 
     ##
     # The setParameter<joinKey> command may be used to set the join key in mote's persistent storage. Join keys are used by motes to establish secure connection with the network. The join key is used at next join.
@@ -117,7 +117,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     #      - 16: RC_ACCESS_DENIED
     #      - 18: RC_ERASE_FAIL
     # 
-    Tuple_dn_setParameter_networkId = collections.namedtuple("Tuple_dn_setParameter_networkId", ['RC'])
+    Tuple_dn_setParameter_networkId = LazyNamedTuple.namedtuple("Tuple_dn_setParameter_networkId", ['RC'])
 
     ##
     # This command may be used to set the Network ID of the mote. This setting is persistent and is used on next join attempt.
@@ -158,7 +158,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     #      - 16: RC_ACCESS_DENIED
     #      - 18: RC_ERASE_FAIL
     # 
-    Tuple_dn_setParameter_txPower = collections.namedtuple("Tuple_dn_setParameter_txPower", ['RC'])
+    Tuple_dn_setParameter_txPower = LazyNamedTuple.namedtuple("Tuple_dn_setParameter_txPower", ['RC'])
 
     ##
     # This command sets the radio output power. This setting is persistent. The command may be issued at any time and takes effect on next transmission. Refer to product datasheets for supported RF output power values. If the provided txPower does not match an appropriate value for the hardware, the radio driver will select the nearest appropriate value. The nearest appropriate value varies depending on the hardware and calibration. The getParameter<txPower> command will return the value selected by the radio driver.
@@ -199,7 +199,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     #      - 16: RC_ACCESS_DENIED
     #      - 18: RC_ERASE_FAIL
     # 
-    Tuple_dn_setParameter_joinDutyCycle = collections.namedtuple("Tuple_dn_setParameter_joinDutyCycle", ['RC'])
+    Tuple_dn_setParameter_joinDutyCycle = LazyNamedTuple.namedtuple("Tuple_dn_setParameter_joinDutyCycle", ['RC'])
 
     ##
     # The setParameter<joinDutyCycle> command allows the microprocessor to control the ratio of active listen time to doze time (a low-power radio state) during the period when the mote is searching for the network. If you desire a faster join time at the risk of higher power consumption, use the setParameter<joinDutyCycle> command to increase the join duty cycle up to 100%. This setting is persistent and takes effect immediately if the device is searching for network.
@@ -236,7 +236,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     #      - 16: RC_ACCESS_DENIED
     #      - 18: RC_ERASE_FAIL
     # 
-    Tuple_dn_setParameter_eventMask = collections.namedtuple("Tuple_dn_setParameter_eventMask", ['RC'])
+    Tuple_dn_setParameter_eventMask = LazyNamedTuple.namedtuple("Tuple_dn_setParameter_eventMask", ['RC'])
 
     ##
     # The setParameter<eventMask> command allows the microprocessor to selectively subscribe to event notifications. The default value of eventMask at mote reset is all 1s - all events are enabled. This setting is not persistent.
@@ -275,7 +275,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     #      - 16: RC_ACCESS_DENIED
     #      - 18: RC_ERASE_FAIL
     # 
-    Tuple_dn_setParameter_OTAPLockout = collections.namedtuple("Tuple_dn_setParameter_OTAPLockout", ['RC'])
+    Tuple_dn_setParameter_OTAPLockout = LazyNamedTuple.namedtuple("Tuple_dn_setParameter_OTAPLockout", ['RC'])
 
     ##
     # This command allows the microprocessor to control whether Over-The-Air Programming (OTAP) of motes is allowed. This setting is persistent and takes effect immediately.
@@ -312,7 +312,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     #      - 16: RC_ACCESS_DENIED
     #      - 18: RC_ERASE_FAIL
     # 
-    Tuple_dn_setParameter_routingMode = collections.namedtuple("Tuple_dn_setParameter_routingMode", ['RC'])
+    Tuple_dn_setParameter_routingMode = LazyNamedTuple.namedtuple("Tuple_dn_setParameter_routingMode", ['RC'])
 
     ##
     # This command allows the microprocessor to control whether the mote will become a router once joined the network. If disabled, the manager will keep the mote a leaf node.
@@ -349,7 +349,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     #      - 16: RC_ACCESS_DENIED
     #      - 18: RC_ERASE_FAIL
     # 
-    Tuple_dn_setParameter_powerSrcInfo = collections.namedtuple("Tuple_dn_setParameter_powerSrcInfo", ['RC'])
+    Tuple_dn_setParameter_powerSrcInfo = LazyNamedTuple.namedtuple("Tuple_dn_setParameter_powerSrcInfo", ['RC'])
 
     ##
     # This command allows the microprocessor to configure power source information on the device. This setting is persistent and is used at network join time.
@@ -406,7 +406,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     #      - 16: RC_ACCESS_DENIED
     #      - 18: RC_ERASE_FAIL
     # 
-    Tuple_dn_setParameter_advKey = collections.namedtuple("Tuple_dn_setParameter_advKey", ['RC'])
+    Tuple_dn_setParameter_advKey = LazyNamedTuple.namedtuple("Tuple_dn_setParameter_advKey", ['RC'])
 
     ##
     # Sets the Advertisement MIC key - this key is used to authenticate advertisements, and can be set per vendor/installation to prevent unauthorized devices from being able to respond to advertisements. If changed, it must match that set on the corresponding AP (using mset on the manager CLI) in order for the mote to join. It can be reset to default via the clearNV command.
@@ -443,7 +443,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     #      - 16: RC_ACCESS_DENIED
     #      - 18: RC_ERASE_FAIL
     # 
-    Tuple_dn_setParameter_autoJoin = collections.namedtuple("Tuple_dn_setParameter_autoJoin", ['RC'])
+    Tuple_dn_setParameter_autoJoin = LazyNamedTuple.namedtuple("Tuple_dn_setParameter_autoJoin", ['RC'])
 
     ##
     # This command allows the microprocessor to change between automatic and manual joining by the mote's networking stack. In manual mode, an explicit join command from the application is required to initiate joining. This setting is persistent and takes effect after mote reset.
@@ -482,7 +482,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     #      - 16: RC_ACCESS_DENIED
     #      - 18: RC_ERASE_FAIL
     # 
-    Tuple_dn_setParameter_antGain = collections.namedtuple("Tuple_dn_setParameter_antGain", ['RC'])
+    Tuple_dn_setParameter_antGain = LazyNamedTuple.namedtuple("Tuple_dn_setParameter_antGain", ['RC'])
 
     ##
     # The setParameter<antGain> command sets the antenna gain of the system (to properly calculate radiated power). Defaults to 2 dBi if not set.
@@ -521,7 +521,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     #      - 16: RC_ACCESS_DENIED
     #      - 18: RC_ERASE_FAIL
     # 
-    Tuple_dn_setParameter_euCompliantMode = collections.namedtuple("Tuple_dn_setParameter_euCompliantMode", ['RC'])
+    Tuple_dn_setParameter_euCompliantMode = LazyNamedTuple.namedtuple("Tuple_dn_setParameter_euCompliantMode", ['RC'])
 
     ##
     # The setParameter<euCompliantMode> command may be used to set the EN 300 328 compliance mode that is used by the device. When enabled, the mote may skip some transmit opportunities to remain within average power limits. Motes below +10 dBm radiated power do not need to duty cycle to meet EN 300 328 requirements.
@@ -562,7 +562,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     # - <tt>macAddress</tt>: 8-byte field formatted as a hex.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getParameter_macAddress = collections.namedtuple("Tuple_dn_getParameter_macAddress", ['RC', 'macAddress'])
+    Tuple_dn_getParameter_macAddress = LazyNamedTuple.namedtuple("Tuple_dn_getParameter_macAddress", ['RC', 'macAddress'])
 
     ##
     # This command returns the user defined MAC address of the device. By default, the MAC address returned is 00's if not overwritten using the setParameter<macAddress> command. In mote versions prior to 1.4.1, it returned the factory MAC address.
@@ -600,7 +600,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     # - <tt>networkId</tt>: 2-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getParameter_networkId = collections.namedtuple("Tuple_dn_getParameter_networkId", ['RC', 'networkId'])
+    Tuple_dn_getParameter_networkId = LazyNamedTuple.namedtuple("Tuple_dn_getParameter_networkId", ['RC', 'networkId'])
 
     ##
     # This command returns the network id stored in mote's persistent storage.
@@ -638,7 +638,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     # - <tt>txPower</tt>: 1-byte field formatted as a ints.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getParameter_txPower = collections.namedtuple("Tuple_dn_getParameter_txPower", ['RC', 'txPower'])
+    Tuple_dn_getParameter_txPower = LazyNamedTuple.namedtuple("Tuple_dn_getParameter_txPower", ['RC', 'txPower'])
 
     ##
     # This command gets the radio output power in dBm, excluding any antenna gain. This value corresponds to the actual output power used by the radio driver and may not be the same as the input value entered with the setParameter<txPower>, which will set to nearest if the value entered is not supported by the hardware.
@@ -676,7 +676,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     # - <tt>joinDutyCycle</tt>: 1-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getParameter_joinDutyCycle = collections.namedtuple("Tuple_dn_getParameter_joinDutyCycle", ['RC', 'joinDutyCycle'])
+    Tuple_dn_getParameter_joinDutyCycle = LazyNamedTuple.namedtuple("Tuple_dn_getParameter_joinDutyCycle", ['RC', 'joinDutyCycle'])
 
     ##
     # This command allows user to retrieve current value of joinDutyCycle parameter.
@@ -714,7 +714,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     # - <tt>eventMask</tt>: 4-byte field formatted as a hex.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getParameter_eventMask = collections.namedtuple("Tuple_dn_getParameter_eventMask", ['RC', 'eventMask'])
+    Tuple_dn_getParameter_eventMask = LazyNamedTuple.namedtuple("Tuple_dn_getParameter_eventMask", ['RC', 'eventMask'])
 
     ##
     # getParameter<eventMask> allows the microprocessor to read the currently subscribed-to event types.
@@ -768,7 +768,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     # - <tt>bootSwVer</tt>: 1-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getParameter_moteInfo = collections.namedtuple("Tuple_dn_getParameter_moteInfo", ['RC', 'apiVersion', 'serialNumber', 'hwModel', 'hwRev', 'swVerMajor', 'swVerMinor', 'swVerPatch', 'swVerBuild', 'bootSwVer'])
+    Tuple_dn_getParameter_moteInfo = LazyNamedTuple.namedtuple("Tuple_dn_getParameter_moteInfo", ['RC', 'apiVersion', 'serialNumber', 'hwModel', 'hwRev', 'swVerMajor', 'swVerMinor', 'swVerPatch', 'swVerBuild', 'bootSwVer'])
 
     ##
     # The getParameter<moteInfo> command returns static information about the motes hardware and network stack software.
@@ -812,7 +812,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     # - <tt>slotSize</tt>: 2-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getParameter_netInfo = collections.namedtuple("Tuple_dn_getParameter_netInfo", ['RC', 'macAddress', 'moteId', 'networkId', 'slotSize'])
+    Tuple_dn_getParameter_netInfo = LazyNamedTuple.namedtuple("Tuple_dn_getParameter_netInfo", ['RC', 'macAddress', 'moteId', 'networkId', 'slotSize'])
 
     ##
     # The getParameter<networkInfo> command may be used to retrieve the mote's network-related parameters.
@@ -870,7 +870,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     # - <tt>reserved_2</tt>: 1-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getParameter_moteStatus = collections.namedtuple("Tuple_dn_getParameter_moteStatus", ['RC', 'state', 'reserved_0', 'reserved_1', 'numParents', 'alarms', 'reserved_2'])
+    Tuple_dn_getParameter_moteStatus = LazyNamedTuple.namedtuple("Tuple_dn_getParameter_moteStatus", ['RC', 'state', 'reserved_0', 'reserved_1', 'numParents', 'alarms', 'reserved_2'])
 
     ##
     # The getParameter<moteStatus> command is used to retrieve current mote state and other dynamic information.
@@ -916,7 +916,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     # - <tt>asnOffset</tt>: 2-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getParameter_time = collections.namedtuple("Tuple_dn_getParameter_time", ['RC', 'upTime', 'utcSecs', 'utcUsecs', 'asn', 'asnOffset'])
+    Tuple_dn_getParameter_time = LazyNamedTuple.namedtuple("Tuple_dn_getParameter_time", ['RC', 'upTime', 'utcSecs', 'utcUsecs', 'asn', 'asnOffset'])
 
     ##
     # The getParameter<time> command may be used to request the current time on the mote. The mote reports time at the moment it is processing the command, so the information includes variable delay. For more precise time information consider using TIMEn pin (see timeIndication).
@@ -960,7 +960,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     # - <tt>tempFrac</tt>: 1-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getParameter_charge = collections.namedtuple("Tuple_dn_getParameter_charge", ['RC', 'qTotal', 'upTime', 'tempInt', 'tempFrac'])
+    Tuple_dn_getParameter_charge = LazyNamedTuple.namedtuple("Tuple_dn_getParameter_charge", ['RC', 'qTotal', 'upTime', 'tempInt', 'tempFrac'])
 
     ##
     # The getParameter<charge> command retrieves the charge consumption of the mote since the last reset.
@@ -1000,7 +1000,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     # - <tt>rxFailed</tt>: 2-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getParameter_testRadioRxStats = collections.namedtuple("Tuple_dn_getParameter_testRadioRxStats", ['RC', 'rxOk', 'rxFailed'])
+    Tuple_dn_getParameter_testRadioRxStats = LazyNamedTuple.namedtuple("Tuple_dn_getParameter_testRadioRxStats", ['RC', 'rxOk', 'rxFailed'])
 
     ##
     # The getParameter<testRadioRxStats> command retrieves statistics for the latest radio test performed using the testRadioRx command. The statistics show the number of good and bad packets (CRC failures) received during the test
@@ -1038,7 +1038,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     # - <tt>mode</tt>: 1-byte field formatted as a bool.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getParameter_OTAPLockout = collections.namedtuple("Tuple_dn_getParameter_OTAPLockout", ['RC', 'mode'])
+    Tuple_dn_getParameter_OTAPLockout = LazyNamedTuple.namedtuple("Tuple_dn_getParameter_OTAPLockout", ['RC', 'mode'])
 
     ##
     # This command reads the current state of OTAP lockout, i.e. whether over-the-air upgrades of software are permitted on this mote.
@@ -1076,7 +1076,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     # - <tt>moteId</tt>: 2-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getParameter_moteId = collections.namedtuple("Tuple_dn_getParameter_moteId", ['RC', 'moteId'])
+    Tuple_dn_getParameter_moteId = LazyNamedTuple.namedtuple("Tuple_dn_getParameter_moteId", ['RC', 'moteId'])
 
     ##
     # This command retrieves the mote's Mote ID. If the mote is not in the network, value of 0 is returned.
@@ -1114,7 +1114,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     # - <tt>ipv6Address</tt>: 16-byte field formatted as a hex.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getParameter_ipv6Address = collections.namedtuple("Tuple_dn_getParameter_ipv6Address", ['RC', 'ipv6Address'])
+    Tuple_dn_getParameter_ipv6Address = LazyNamedTuple.namedtuple("Tuple_dn_getParameter_ipv6Address", ['RC', 'ipv6Address'])
 
     ##
     # This command allows the microprocessor to read IPV6 address assigned to the mote. Before the mote has an assigned address it will return all 0s.
@@ -1152,7 +1152,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     # - <tt>routingMode</tt>: 1-byte field formatted as a bool.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getParameter_routingMode = collections.namedtuple("Tuple_dn_getParameter_routingMode", ['RC', 'routingMode'])
+    Tuple_dn_getParameter_routingMode = LazyNamedTuple.namedtuple("Tuple_dn_getParameter_routingMode", ['RC', 'routingMode'])
 
     ##
     # This command allows the microprocessor to retrieve the current routing mode of the mote.
@@ -1194,7 +1194,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     # - <tt>appVer</tt>: 5-byte field formatted as a hex.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getParameter_appInfo = collections.namedtuple("Tuple_dn_getParameter_appInfo", ['RC', 'vendorId', 'appId', 'appVer'])
+    Tuple_dn_getParameter_appInfo = LazyNamedTuple.namedtuple("Tuple_dn_getParameter_appInfo", ['RC', 'vendorId', 'appId', 'appVer'])
 
     ##
     # Get the application (as opposed to the network stack) version information.
@@ -1252,7 +1252,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     # - <tt>rechargePeriod_2</tt>: 2-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getParameter_powerSrcInfo = collections.namedtuple("Tuple_dn_getParameter_powerSrcInfo", ['RC', 'maxStCurrent', 'minLifetime', 'currentLimit_0', 'dischargePeriod_0', 'rechargePeriod_0', 'currentLimit_1', 'dischargePeriod_1', 'rechargePeriod_1', 'currentLimit_2', 'dischargePeriod_2', 'rechargePeriod_2'])
+    Tuple_dn_getParameter_powerSrcInfo = LazyNamedTuple.namedtuple("Tuple_dn_getParameter_powerSrcInfo", ['RC', 'maxStCurrent', 'minLifetime', 'currentLimit_0', 'dischargePeriod_0', 'rechargePeriod_0', 'currentLimit_1', 'dischargePeriod_1', 'rechargePeriod_1', 'currentLimit_2', 'dischargePeriod_2', 'rechargePeriod_2'])
 
     ##
     # This command allows the microprocessor to read a mote's power source settings.
@@ -1290,7 +1290,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     # - <tt>autoJoin</tt>: 1-byte field formatted as a bool.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getParameter_autoJoin = collections.namedtuple("Tuple_dn_getParameter_autoJoin", ['RC', 'autoJoin'])
+    Tuple_dn_getParameter_autoJoin = LazyNamedTuple.namedtuple("Tuple_dn_getParameter_autoJoin", ['RC', 'autoJoin'])
 
     ##
     # This command allows the microprocessor to retrieve the current autoJoin setting.
@@ -1328,7 +1328,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     # - <tt>antGain</tt>: 1-byte field formatted as a ints.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getParameter_antGain = collections.namedtuple("Tuple_dn_getParameter_antGain", ['RC', 'antGain'])
+    Tuple_dn_getParameter_antGain = LazyNamedTuple.namedtuple("Tuple_dn_getParameter_antGain", ['RC', 'antGain'])
 
     ##
     # The getParameter<antGain> command retrieves the antenna gain used by the system (to properly calculate radiated power). Defaults to 2 dBi.
@@ -1368,7 +1368,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     # - <tt>compMode</tt>: 1-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getParameter_euCompliantMode = collections.namedtuple("Tuple_dn_getParameter_euCompliantMode", ['RC', 'compMode'])
+    Tuple_dn_getParameter_euCompliantMode = LazyNamedTuple.namedtuple("Tuple_dn_getParameter_euCompliantMode", ['RC', 'compMode'])
 
     ##
     # The getParameter<euCompliantMode> command may be used to retrieve the EN 300 328 compliance mode that is used by the device. When enabled, the mote may skip some transmit opportunities to remain within average power limits. Motes below +10 dBm radiated power do not need to duty cycle to meet EN 300 328 requirements.
@@ -1408,7 +1408,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     # - <tt>entropy</tt>: 16-byte field formatted as a hex.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getParameter_entropy = collections.namedtuple("Tuple_dn_getParameter_entropy", ['RC', 'entropy'])
+    Tuple_dn_getParameter_entropy = LazyNamedTuple.namedtuple("Tuple_dn_getParameter_entropy", ['RC', 'entropy'])
 
     ##
     # The getParameter<entropy> command may be used to retrieve a 16-byte block of random data. The data is obtained from thermal noise in the LTC5800 receive signal chain with the radio front-end disabled - as such, it can only be called when the mote is in the idle state. Thus while it is suitable for cryptographic operations, it is recommended to be used as a seed for a DRBG because of this limitation.
@@ -1446,7 +1446,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     #      - 16: RC_ACCESS_DENIED
     #      - 18: RC_ERASE_FAIL
     # 
-    Tuple_dn_join = collections.namedtuple("Tuple_dn_join", ['RC'])
+    Tuple_dn_join = LazyNamedTuple.namedtuple("Tuple_dn_join", ['RC'])
 
     ##
     # The join command requests that mote start searching for the network and attempt to join.The mote must be in the Idle state or the Promiscuous Listen state (see search) for this command to be valid. Note that the join time will be affected by the maximum current setting.
@@ -1482,7 +1482,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     #      - 16: RC_ACCESS_DENIED
     #      - 18: RC_ERASE_FAIL
     # 
-    Tuple_dn_disconnect = collections.namedtuple("Tuple_dn_disconnect", ['RC'])
+    Tuple_dn_disconnect = LazyNamedTuple.namedtuple("Tuple_dn_disconnect", ['RC'])
 
     ##
     # The disconnect command requests that the mote initiate disconnection from the network. After disconnection completes, the mote will generate a disconnected event, and proceed to reset. If the mote is not in the network, the disconnected event will be generated immediately. This command will return an error if the mote is not presently joining or joined to a network.
@@ -1518,7 +1518,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     #      - 16: RC_ACCESS_DENIED
     #      - 18: RC_ERASE_FAIL
     # 
-    Tuple_dn_reset = collections.namedtuple("Tuple_dn_reset", ['RC'])
+    Tuple_dn_reset = LazyNamedTuple.namedtuple("Tuple_dn_reset", ['RC'])
 
     ##
     # The reset command initiates a soft-reset of the device. The device will initiate the reset sequence shortly after sending out the response to this command. Resetting a mote directly can adversely impact its descendants; to disconnect gracefully from the network, use the disconnect command
@@ -1554,7 +1554,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     #      - 16: RC_ACCESS_DENIED
     #      - 18: RC_ERASE_FAIL
     # 
-    Tuple_dn_lowPowerSleep = collections.namedtuple("Tuple_dn_lowPowerSleep", ['RC'])
+    Tuple_dn_lowPowerSleep = LazyNamedTuple.namedtuple("Tuple_dn_lowPowerSleep", ['RC'])
 
     ##
     # The lowPowerSleep command shuts down all peripherals and places the mote into deep sleep mode. The command executes after the mote sends its response. The mote enters deep sleep within two seconds after the command executes. The command may be issued at any time and will cause the mote to interrupt all in-progress network operation. To achieve a graceful disconnect, use the disconnect command before using the lowPowerSleep command. A hardware reset is required to bring a mote out of deep sleep mode.
@@ -1590,7 +1590,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     #      - 16: RC_ACCESS_DENIED
     #      - 18: RC_ERASE_FAIL
     # 
-    Tuple_dn_testRadioRx = collections.namedtuple("Tuple_dn_testRadioRx", ['RC'])
+    Tuple_dn_testRadioRx = LazyNamedTuple.namedtuple("Tuple_dn_testRadioRx", ['RC'])
 
     ##
     # The testRadioRx command clears all previously collected statistics and initiates a test of radio reception for the specified channel and duration. During the test, the mote keeps statistics about the number of packets received (with and without error). The test results may be retrieved using the getParameter<testRadioRxStats> command. The testRadioRx command may only be issued in Idle mode. The mote must be reset (either hardware or software reset) after radio tests are complete and prior to joining.
@@ -1637,7 +1637,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     #      - 16: RC_ACCESS_DENIED
     #      - 18: RC_ERASE_FAIL
     # 
-    Tuple_dn_clearNV = collections.namedtuple("Tuple_dn_clearNV", ['RC'])
+    Tuple_dn_clearNV = LazyNamedTuple.namedtuple("Tuple_dn_clearNV", ['RC'])
 
     ##
     # The clearNV command resets the motes non-volatile memory (NV) to its factory-default state. See User Guide for detailed information about the default values. Since many parameters are read by the mote only at power-up, this command should be followed up by mote reset.
@@ -1673,7 +1673,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     #      - 16: RC_ACCESS_DENIED
     #      - 18: RC_ERASE_FAIL
     # 
-    Tuple_dn_requestService = collections.namedtuple("Tuple_dn_requestService", ['RC'])
+    Tuple_dn_requestService = LazyNamedTuple.namedtuple("Tuple_dn_requestService", ['RC'])
 
     ##
     # The requestService command may be used to request a new or changed service level to a destination device in the mesh. This command may only be used to update the service to a device with an existing connection (session).
@@ -1728,7 +1728,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     # - <tt>value</tt>: 4-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_getServiceInfo = collections.namedtuple("Tuple_dn_getServiceInfo", ['RC', 'destAddr', 'type', 'state', 'value'])
+    Tuple_dn_getServiceInfo = LazyNamedTuple.namedtuple("Tuple_dn_getServiceInfo", ['RC', 'destAddr', 'type', 'state', 'value'])
 
     ##
     # The getServiceInfo command returns information about the service currently allocated to the mote.
@@ -1770,7 +1770,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     # - <tt>socketId</tt>: 1-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_openSocket = collections.namedtuple("Tuple_dn_openSocket", ['RC', 'socketId'])
+    Tuple_dn_openSocket = LazyNamedTuple.namedtuple("Tuple_dn_openSocket", ['RC', 'socketId'])
 
     ##
     # The openSocket command creates an endpoint for IP communication and returns an ID for the socket.
@@ -1808,7 +1808,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     #      - 16: RC_ACCESS_DENIED
     #      - 18: RC_ERASE_FAIL
     # 
-    Tuple_dn_closeSocket = collections.namedtuple("Tuple_dn_closeSocket", ['RC'])
+    Tuple_dn_closeSocket = LazyNamedTuple.namedtuple("Tuple_dn_closeSocket", ['RC'])
 
     ##
     # Close the previously open socket.
@@ -1845,7 +1845,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     #      - 16: RC_ACCESS_DENIED
     #      - 18: RC_ERASE_FAIL
     # 
-    Tuple_dn_bindSocket = collections.namedtuple("Tuple_dn_bindSocket", ['RC'])
+    Tuple_dn_bindSocket = LazyNamedTuple.namedtuple("Tuple_dn_bindSocket", ['RC'])
 
     ##
     # Bind a previously opened socket to a port. When a socket is created, it is only given a protocol family, but not assigned a port. This association must be performed before the socket can accept connections from other hosts.
@@ -1884,7 +1884,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     #      - 16: RC_ACCESS_DENIED
     #      - 18: RC_ERASE_FAIL
     # 
-    Tuple_dn_sendTo = collections.namedtuple("Tuple_dn_sendTo", ['RC'])
+    Tuple_dn_sendTo = LazyNamedTuple.namedtuple("Tuple_dn_sendTo", ['RC'])
 
     ##
     # Send a packet into the network. If the command returns RC_OK, the mote has accepted the packet and has queued it up for transmission. A txDone notification will be issued when the packet has been sent, if and only if the packet ID passed in this command is different from 0xffff. You can set the packet ID to any value. The notification will contain the packet ID of the packet just sent, allowing association of the notification with a particular packet. The destination port should be in the range 0xF0B8-F0BF (61624-61631) to maximize payload.
@@ -1937,7 +1937,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     #      - 16: RC_ACCESS_DENIED
     #      - 18: RC_ERASE_FAIL
     # 
-    Tuple_dn_search = collections.namedtuple("Tuple_dn_search", ['RC'])
+    Tuple_dn_search = LazyNamedTuple.namedtuple("Tuple_dn_search", ['RC'])
 
     ##
     # The search command requests that mote start listening for advertisements and report those heard from any network without attempting to join. This is called the Promiscuous Listen state. The mote must be in the Idle state for this command to be valid. The search state can be exited by issuing the join command or the reset command.
@@ -1973,7 +1973,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     #      - 16: RC_ACCESS_DENIED
     #      - 18: RC_ERASE_FAIL
     # 
-    Tuple_dn_testRadioTxExt = collections.namedtuple("Tuple_dn_testRadioTxExt", ['RC'])
+    Tuple_dn_testRadioTxExt = LazyNamedTuple.namedtuple("Tuple_dn_testRadioTxExt", ['RC'])
 
     ##
     # The testRadioTxExt command allows the microprocessor to initiate a radio transmission test. This command may only be issued prior to the mote joining the network. Three types of transmission tests are supported:
@@ -2093,7 +2093,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     #      - 16: RC_ACCESS_DENIED
     #      - 18: RC_ERASE_FAIL
     # 
-    Tuple_dn_zeroize = collections.namedtuple("Tuple_dn_zeroize", ['RC'])
+    Tuple_dn_zeroize = LazyNamedTuple.namedtuple("Tuple_dn_zeroize", ['RC'])
 
     ##
     # Zeroize (zeroise) command erases flash area that is used to store configuration parameters, such as join keys. This command is intended to satisfy zeroization requirement of FIPS-140 standard. After the command executes, the mote should be reset. Available in mote >= 1.4.x
@@ -2142,7 +2142,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     # - <tt>port</tt>: 2-byte field formatted as a int.<br/>
     #     There is no restriction on the value of this field.
     # 
-    Tuple_dn_socketInfo = collections.namedtuple("Tuple_dn_socketInfo", ['RC', 'index', 'socketId', 'protocol', 'bindState', 'port'])
+    Tuple_dn_socketInfo = LazyNamedTuple.namedtuple("Tuple_dn_socketInfo", ['RC', 'index', 'socketId', 'protocol', 'bindState', 'port'])
 
     ##
     # Retrieve information about a socket. Available in IP Mote 1.4.0 or later.
@@ -2179,7 +2179,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     #      - 16: RC_ACCESS_DENIED
     #      - 18: RC_ERASE_FAIL
     # 
-    Tuple_dn_blink = collections.namedtuple("Tuple_dn_blink", ['RC'])
+    Tuple_dn_blink = LazyNamedTuple.namedtuple("Tuple_dn_blink", ['RC'])
 
     ##
     # Send a packet into the network without joining. The mote searches for a network and sends the packet. Optionally, the list of neighbors discovered during the search process is also sent, up to a maximum of four neighbors. If the discovered neighbor list is not included, the payload maximum size is 73B, and if the discovered neighbors are included, the maximum size is 58B.
@@ -2226,7 +2226,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     #      - 16: RC_ACCESS_DENIED
     #      - 18: RC_ERASE_FAIL
     # 
-    Tuple_dn_stopSearch = collections.namedtuple("Tuple_dn_stopSearch", ['RC'])
+    Tuple_dn_stopSearch = LazyNamedTuple.namedtuple("Tuple_dn_stopSearch", ['RC'])
 
     ##
     # The stopSearch command stops the search that was started either by the join or the search command. The mote must be in either Promiscuous Listen or Search state for this command to be valid. The mote goes back to Idle state when this command is received in a valid state. Available in Mote 1.4.0 or later.
@@ -2262,7 +2262,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     #      - 16: RC_ACCESS_DENIED
     #      - 18: RC_ERASE_FAIL
     # 
-    Tuple_dn_testRadioRxPER = collections.namedtuple("Tuple_dn_testRadioRxPER", ['RC'])
+    Tuple_dn_testRadioRxPER = LazyNamedTuple.namedtuple("Tuple_dn_testRadioRxPER", ['RC'])
 
     ##
     # The testRadioRxPER command initiates Packet Error Rate (PER) test in rx mode. This command may be issued only when mote is in Idle state.
@@ -2300,7 +2300,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     #      - 16: RC_ACCESS_DENIED
     #      - 18: RC_ERASE_FAIL
     # 
-    Tuple_dn_testRadioTxPER = collections.namedtuple("Tuple_dn_testRadioTxPER", ['RC'])
+    Tuple_dn_testRadioTxPER = LazyNamedTuple.namedtuple("Tuple_dn_testRadioTxPER", ['RC'])
 
     ##
     # The testRadioTxPER command initiates Packet Error Rate (PER) test in tx mode. This command may be issued only when mote is in Idle state.
@@ -2327,7 +2327,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     ##
     # Dictionary of all notification tuples.
     #
-    notifTupleTable = {}
+    notifTupleTable = LazyNamedTuple.TupleTable()
     
     ##
     # \brief TIMEINDICATION notification.
@@ -2351,7 +2351,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     TIMEINDICATION = "timeIndication"
-    notifTupleTable[TIMEINDICATION] = Tuple_timeIndication = collections.namedtuple("Tuple_timeIndication", ['uptime', 'utcSecs', 'utcUsecs', 'asn', 'asnOffset', 'asnSubOffset'])
+    notifTupleTable[TIMEINDICATION] = Tuple_timeIndication = LazyNamedTuple.namedtuple("Tuple_timeIndication", ['uptime', 'utcSecs', 'utcUsecs', 'asn', 'asnOffset', 'asnSubOffset'])
 
     ##
     # \brief EVENTS notification.
@@ -2385,7 +2385,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     EVENTS = "events"
-    notifTupleTable[EVENTS] = Tuple_events = collections.namedtuple("Tuple_events", ['events', 'state', 'alarmsList'])
+    notifTupleTable[EVENTS] = Tuple_events = LazyNamedTuple.namedtuple("Tuple_events", ['events', 'state', 'alarmsList'])
 
     ##
     # \brief RECEIVE notification.
@@ -2403,7 +2403,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     RECEIVE = "receive"
-    notifTupleTable[RECEIVE] = Tuple_receive = collections.namedtuple("Tuple_receive", ['socketId', 'srcAddr', 'srcPort', 'payload'])
+    notifTupleTable[RECEIVE] = Tuple_receive = LazyNamedTuple.namedtuple("Tuple_receive", ['socketId', 'srcAddr', 'srcPort', 'payload'])
 
     ##
     # \brief MACRX notification.
@@ -2415,7 +2415,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     MACRX = "macRx"
-    notifTupleTable[MACRX] = Tuple_macRx = collections.namedtuple("Tuple_macRx", ['payload'])
+    notifTupleTable[MACRX] = Tuple_macRx = LazyNamedTuple.namedtuple("Tuple_macRx", ['payload'])
 
     ##
     # \brief TXDONE notification.
@@ -2431,7 +2431,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     #      - 1: fail    
     # 
     TXDONE = "txDone"
-    notifTupleTable[TXDONE] = Tuple_txDone = collections.namedtuple("Tuple_txDone", ['packetId', 'status'])
+    notifTupleTable[TXDONE] = Tuple_txDone = LazyNamedTuple.namedtuple("Tuple_txDone", ['packetId', 'status'])
 
     ##
     # \brief ADVRECEIVED notification.
@@ -2449,7 +2449,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     ADVRECEIVED = "advReceived"
-    notifTupleTable[ADVRECEIVED] = Tuple_advReceived = collections.namedtuple("Tuple_advReceived", ['netId', 'moteId', 'rssi', 'joinPri'])
+    notifTupleTable[ADVRECEIVED] = Tuple_advReceived = LazyNamedTuple.namedtuple("Tuple_advReceived", ['netId', 'moteId', 'rssi', 'joinPri'])
 
     ##
     # \brief TESTRADIOSTATSPER notification.
@@ -2473,7 +2473,7 @@ class IpMoteConnector(IpMoteConnectorInternal):
     #     There is no restriction on the value of this field.    
     # 
     TESTRADIOSTATSPER = "testRadioStatsPER"
-    notifTupleTable[TESTRADIOSTATSPER] = Tuple_testRadioStatsPER = collections.namedtuple("Tuple_testRadioStatsPER", ['numRxOK', 'numRxErr', 'numRxInv', 'numRxMiss', 'perInt', 'perFrac'])
+    notifTupleTable[TESTRADIOSTATSPER] = Tuple_testRadioStatsPER = LazyNamedTuple.namedtuple("Tuple_testRadioStatsPER", ['numRxOK', 'numRxErr', 'numRxInv', 'numRxMiss', 'perInt', 'perFrac'])
 
     ##
     # \brief Get a notification from the notification queue, and returns
@@ -2482,10 +2482,21 @@ class IpMoteConnector(IpMoteConnectorInternal):
     # \exception NotificationError if unknown notification.
     # 
     def getNotification(self, timeoutSec=-1) :
-        temp = self.getNotificationInternal(timeoutSec)
+        temp = self._getNotificationRecord(timeoutSec)
         if not temp:
             return temp
+        return self._formatNotification(temp)
+
+    ##
+    # \brief Format a notification, as queued, the way getNotification() and
+    #        getNotifications() return it.
+    #
+    # \exception NotificationError if unknown notification.
+    # 
+    def _formatNotification(self, temp) :
         (ids, param) = temp
+        if isinstance(param, tuple) :
+            return (ids[-1], param)     # already deserialized into its named tuple
         try :
             if  IpMoteConnector.notifTupleTable[ids[-1]] :
                 return (ids[-1], IpMoteConnector.notifTupleTable[ids[-1]](**param))
@@ -257,7 +257,7 @@ class IpMoteConnector(ApiConnector,threading.Thread):
             subCommandName   = None
         
         apiCommand = None
-        for c in IpMoteDefinition.IpMoteDefinition.commands:
+        for c in IpMoteDefinition.IpMoteDefinition.getTables().commands:
             if c['name']==commandName:
                 
                 if ('subCommands' in c) and subCommandName:
@@ -407,7 +407,7 @@ class IpMoteConnector(ApiConnector,threading.Thread):
         # find apiNotif
         apiNotifFields  = []
         nameArray       = []
-        for notif in IpMoteDefinition.IpMoteDefinition.notifications:
+        for notif in IpMoteDefinition.IpMoteDefinition.getTables().notifications:
             if notif['id']==cmdId:
                 nameArray += [notif['name']]
                 for f in notif['response']['FIELDS']:
@@ -0,0 +1,473 @@
+'''
+Filters of the notifications received by a connector.
+
+A NotifFilter selects notifications by type, MAC address and value of their
+fields, in the style of otap.FilterExpr. Set on a connector with
+ApiConnector.setNotifFilter(), it is compiled into the offsets of those
+fields in the payload of each type of notification, and the notifications
+filtered out are dropped before they are deserialized: a notification
+filtered out only costs the comparison of a few bytes of its header.
+
+>>> f = NotifFilter()
+>>> f.whitelist_notif('notifData')
+>>> f.whitelist_port(0xF0B9)            # OAP notifications only
+>>> f.blacklist_mac([0xA0, 0x11])       # MAC addresses ending in a0-11
+>>> connector.setNotifFilter(f)
+'''
+
+import binascii
+import logging
+
+import ApiException
+
+# Log initialization
+class NullHandler(logging.Handler):
+    def emit(self, record):
+        pass
+log = logging.getLogger('NotifFilter')
+log.setLevel(logging.ERROR)
+log.addHandler(NullHandler())
+
+def _toBytes(value):
+    '''
+    \brief The bytes of a MAC address or binary field, as a str.
+
+    \param value a list or tuple of ints, a str, a bytearray or a memoryview.
+    '''
+    if isinstance(value, str):
+        return value
+    if isinstance(value, memoryview):
+        return value.tobytes()
+    return str(bytearray(value))
+
+def _toComparable(value):
+    if isinstance(value, (int, long)):
+        return value
+    return _toBytes(value)
+
+def _toField(value, length):
+    '''
+    \brief The bytes of a field of length bytes holding value, as in a
+           payload: ints are big-endian.
+    '''
+    if isinstance(value, (int, long)):
+        value &= (1 << (8*length))-1    # signed ints, in two's complement
+        return binascii.unhexlify('{0:0{1}x}'.format(value, 2*length))
+    return _toBytes(value)
+
+def _getField(notifParams, name):
+    if isinstance(notifParams, dict):
+        return notifParams.get(name)
+    return getattr(notifParams, name, None)
+
+class NotifFilter(object):
+    '''
+    \ingroup ApiConnector
+
+    \brief Whitelists and blacklists of notification types, MAC addresses and
+           field values.
+
+    A notification matches the filter IF:
+    - its type, any name of its nameArray (e.g. 'notifData', or 'notifEvent'
+      and 'eventMoteJoin'), is whitelisted, when types are whitelisted, and
+      not blacklisted.
+    - its MAC address ends with a whitelisted one, when MAC addresses are
+      whitelisted, and with no blacklisted one. As in FilterExpr, a MAC
+      address can be given as its last bytes only.
+    - it matches any whitelisted field value, when field values are
+      whitelisted, and no blacklisted one.
+
+    Unlike FilterExpr, a notification is not filtered out on a field it does
+    not have: whitelisting MAC addresses keeps out the notifications about
+    other motes, not eventNetworkTime, and whitelisting a UDP port only
+    applies to notifData.
+
+    The connectors only compare the fields of the fixed-layout header of a
+    notification, before its first variable-length field: the macAddress and
+    UDP ports of a notifData, not its data. The other fields are compared by
+    filter(), on deserialized notifications.
+    '''
+
+    MAC_FIELD      = 'macAddress'
+    DST_PORT_FIELD = 'dstPort'
+
+    def __init__(self):
+        self.mac_whitelist    = []
+        self.mac_blacklist    = []
+
+        self.notif_whitelist  = []
+        self.notif_blacklist  = []
+
+        self.attrib_whitelist = {}
+        self.attrib_blacklist = {}
+
+    #======================== public ==========================================
+
+    def whitelist_mac(self, mac):
+        'Append the mac to the whitelist'
+        self.mac_whitelist += [_toBytes(mac)]
+
+    def blacklist_mac(self, mac):
+        'Append the mac to the blacklist'
+        self.mac_blacklist += [_toBytes(mac)]
+
+    def whitelist_notif(self, notifName):
+        'Append a notification type, e.g. notifData or eventMoteJoin, to the whitelist'
+        self.notif_whitelist += [notifName]
+
+    def blacklist_notif(self, notifName):
+        'Append a notification type to the blacklist'
+        self.notif_blacklist += [notifName]
+
+    def whitelist_attrib(self, attrib, val):
+        'Append a whitelist value to an arbitrary field'
+        self.attrib_whitelist.setdefault(attrib, []).append(val)
+
+    def blacklist_attrib(self, attrib, val):
+        'Append a blacklist value to an arbitrary field'
+        self.attrib_blacklist.setdefault(attrib, []).append(val)
+
+    def whitelist_port(self, port):
+        'Append a destination UDP port of notifData to the whitelist'
+        self.whitelist_attrib(self.DST_PORT_FIELD, port)
+
+    def blacklist_port(self, port):
+        'Append a destination UDP port of notifData to the blacklist'
+        self.blacklist_attrib(self.DST_PORT_FIELD, port)
+
+    def filter(self, notifName, notifParams, notifTypes = ()):
+        '''
+        \brief Return whether or not a deserialized notification matches the
+               filter.
+
+        \param notifName   The name of the notification, e.g. eventMoteJoin.
+        \param notifParams Its fields, as a dictionary or a named tuple.
+        \param notifTypes  The other names of its nameArray, e.g. notifEvent.
+        '''
+        if not self._isNotifMatch((notifName,)+tuple(notifTypes)):
+            return False
+        mac = _getField(notifParams, self.MAC_FIELD)
+        if mac is not None and not self._isMacMatch(_toBytes(mac)):
+            return False
+        return self._isAttribMatch(notifParams)
+
+    def compile(self, apiDef):
+        '''
+        \brief Compile the filter into the offsets of the fields compared, in
+               the payload of the notifications of an API definition.
+
+        \returns A RawNotifFilter, see RawNotifFilter.accept().
+        '''
+        return RawNotifFilter(apiDef, self._compileLeaf)
+
+    #======================== private =========================================
+
+    def _isNotifMatch(self, names):
+        if self.notif_whitelist and not [n for n in names if n in self.notif_whitelist]:
+            return False
+        if [n for n in names if n in self.notif_blacklist]:
+            return False
+        return True
+
+    def _isMacMatch(self, mac):
+        # str.endswith() is given all the MAC addresses at once
+        if self.mac_whitelist and not mac.endswith(tuple(self.mac_whitelist)):
+            return False
+        return not mac.endswith(tuple(self.mac_blacklist))
+
+    def _isAttribMatch(self, notifParams):
+        isWhitelisted = None
+        for (attrib, valary) in self.attrib_whitelist.items():
+            value = _getField(notifParams, attrib)
+            if value is not None:
+                isWhitelisted = isWhitelisted or _toComparable(value) in [_toComparable(v) for v in valary]
+        if isWhitelisted is False:
+            return False
+        for (attrib, valary) in self.attrib_blacklist.items():
+            value = _getField(notifParams, attrib)
+            if value is not None and _toComparable(value) in [_toComparable(v) for v in valary]:
+                return False
+        return True
+
+    def _compileLeaf(self, nameArray, fields):
+        '''
+        \brief Compile the filter for one type of notification.
+
+        \param nameArray The nameArray of the notifications.
+        \param fields    The (offset, length) of the fields of their header,
+                         by name, None for the fields after it.
+
+        \returns True or False when all the notifications of that type match
+                 or not. Otherwise a tuple (headerLength, check), check
+                 returning whether a notification matches, from the first
+                 headerLength bytes of its payload, as a str.
+        '''
+        if not self._isNotifMatch(nameArray):
+            return False
+
+        checks       = []
+        headerLength = 0
+
+        if fields.get(self.MAC_FIELD) and (self.mac_whitelist or self.mac_blacklist):
+            (macStart, macLength) = fields[self.MAC_FIELD]
+            macEnd       = macStart+macLength
+            macWhitelist = tuple(self.mac_whitelist)
+            macBlacklist = tuple(self.mac_blacklist)
+            def _checkMac(head):
+                mac = head[macStart:macEnd]
+                return (not macWhitelist or mac.endswith(macWhitelist)) and not mac.endswith(macBlacklist)
+            checks      += [_checkMac]
+            headerLength = max(headerLength, macEnd)
+
+        for (attribs, isWhitelist) in [(self.attrib_whitelist, True), (self.attrib_blacklist, False)]:
+            # (start, end, values) of the fields of the header filtered on
+            slices = []
+            for (attrib, valary) in attribs.items():
+                if isWhitelist and attrib in fields and fields[attrib] is None:
+                    # a field past the header may match, whatever the header
+                    slices = []
+                    break
+                if fields.get(attrib):
+                    (start, length) = fields[attrib]
+                    slices      += [(start, start+length, frozenset([_toField(v, length) for v in valary]))]
+                    headerLength = max(headerLength, start+length)
+            if not slices:
+                continue
+            if isWhitelist:
+                def _checkAttribs(head, slices = slices):
+                    for (start, end, values) in slices:
+                        if head[start:end] in values:
+                            return True
+                    return False
+            else:
+                def _checkAttribs(head, slices = slices):
+                    for (start, end, values) in slices:
+                        if head[start:end] in values:
+                            return False
+                    return True
+            checks      += [_checkAttribs]
+
+        if not checks:
+            return True
+        if len(checks) == 1:
+            return (headerLength, checks[0])
+        def _checkAll(head):
+            for check in checks:
+                if not check(head):
+                    return False
+            return True
+        return (headerLength, _checkAll)
+
+class NotifFilterSet(object):
+    '''
+    \ingroup ApiConnector
+
+    \brief The NotifFilters of several subscriptions, by notification type.
+
+    A notification matches the set if it matches any filter added for its
+    type, or if no filter was added for its type. Adding None for a type
+    matches all the notifications of that type. The filters added for the
+    most specific name of the nameArray of a notification apply, e.g. those
+    added for eventMoteJoin rather than those added for notifEvent.
+    '''
+
+    def __init__(self):
+        self.filters = {}   # notification type: list of NotifFilter or None
+
+    #======================== public ==========================================
+
+    def add(self, notifType, notifFilter):
+        '''
+        \brief Add the filter of a subscription to a type of notification,
+               None if the subscription is not filtered.
+        '''
+        self.filters.setdefault(notifType, []).append(notifFilter)
+
+    def isFiltering(self):
+        '''
+        \brief Whether any notification may not match.
+        '''
+        for filters in self.filters.values():
+            if None not in filters:
+                return True
+        return False
+
+    def filter(self, notifName, notifParams, notifTypes = ()):
+        '''
+        \brief Return whether or not a deserialized notification matches any
+               filter of its type, see NotifFilter.filter().
+        '''
+        for name in (notifName,)+tuple(notifTypes):
+            if name in self.filters:
+                for notifFilter in self.filters[name]:
+                    if notifFilter is None or notifFilter.filter(notifName, notifParams, notifTypes):
+                        return True
+                return False
+        return True
+
+    def compile(self, apiDef):
+        '''
+        \brief Compile the filters, see NotifFilter.compile().
+        '''
+        return RawNotifFilter(apiDef, self._compileLeaf)
+
+    #======================== private =========================================
+
+    def _compileLeaf(self, nameArray, fields):
+        filters = None
+        for name in reversed(nameArray):
+            if name in self.filters:
+                filters = self.filters[name]
+                break
+        if filters is None:
+            return True
+
+        leaves = []
+        for notifFilter in filters:
+            leaf = True if notifFilter is None else notifFilter._compileLeaf(nameArray, fields)
+            if leaf is True:
+                return True
+            if leaf is not False:
+                leaves += [leaf]
+        if not leaves:
+            return False
+        if len(leaves) == 1:
+            return leaves[0]
+        headerLength = max([length for (length, _) in leaves])
+        checks       = [check for (_, check) in leaves]
+        def _checkAny(head):
+            for check in checks:
+                if check(head):
+                    return True
+            return False
+        return (headerLength, _checkAny)
+
+class _Branch(object):
+    '''
+    \brief Notifications with subcommands: the offset of the subcommand ID in
+           the payload, and what to do for each ID.
+    '''
+    __slots__ = ['offset', 'children']
+
+    def __init__(self, offset, children):
+        self.offset   = offset
+        self.children = children
+
+class RawNotifFilter(object):
+    '''
+    \ingroup ApiConnector
+
+    \brief A NotifFilter or NotifFilterSet, compiled for the payload of the
+           notifications of an API definition, as returned by their
+           compile() method.
+
+    The type of a notification is looked up from its command ID and the
+    subcommand IDs in its payload, then the fields filtered on are compared
+    as bytes, at their offset in the payload. accept() is called by the
+    thread receiving the notifications of a connector.
+    '''
+
+    def __init__(self, apiDef, compileLeaf):
+        '''
+        \param compileLeaf Function compiling the filter for one type of
+                           notification, see NotifFilter._compileLeaf().
+        '''
+        self.numAccepted = 0
+        self.numFiltered = 0
+        self.nodes       = {}
+        for cmdId in apiDef.getIds(apiDef.NOTIFICATION):
+            nameArray    = [apiDef.idToName(apiDef.NOTIFICATION, cmdId)]
+            self.nodes[cmdId] = self._compileNode(apiDef, nameArray, 0, {}, compileLeaf)
+
+    #======================== public ==========================================
+
+    def accept(self, cmdId, payload):
+        '''
+        \brief Whether a notification received matches the filter.
+
+        \param cmdId   The command ID of the notification.
+        \param payload Its payload, as passed to deserialize(): a list or
+                       tuple of ints, a str, a bytearray or a memoryview.
+
+        \returns True also for the notifications not defined, or too short
+                 to be filtered, for the deserializer to report them.
+        '''
+        node = self.nodes.get(cmdId, True)
+        try:
+            while isinstance(node, _Branch):
+                node = node.children.get(payload[node.offset], True)
+            if node is True or node is False:
+                isMatch = node
+            else:
+                (headerLength, check) = node
+                if   isinstance(payload, str):
+                    head = payload
+                elif isinstance(payload, memoryview):
+                    head = payload[:headerLength].tobytes()
+                else:
+                    head = str(bytearray(payload[:headerLength]))
+                isMatch = len(head) < headerLength or check(head)
+        except IndexError:
+            isMatch = True
+        if isMatch:
+            self.numAccepted += 1
+        else:
+            self.numFiltered += 1
+        return isMatch
+
+    def getStats(self):
+        '''
+        \brief Get the number of notifications accepted and filtered out.
+
+        \returns A dictionary with the following keys:
+            - 'numAccepted': number of notifications accepted
+            - 'numFiltered': number of notifications filtered out
+        '''
+        return {
+            'numAccepted': self.numAccepted,
+            'numFiltered': self.numFiltered,
+        }
+
+    #======================== private =========================================
+
+    def _compileNode(self, apiDef, nameArray, offset, fields, compileLeaf):
+        '''
+        \param offset Where the fields of nameArray start in the payload.
+        \param fields The (offset, length) of the fields of the parent
+                      commands, by name, None for the fields past the
+                      header.
+        '''
+        fields        = dict(fields)
+        subIdOffset   = None
+        isFixed       = True
+        try:
+            levelFields = apiDef.getResponseFields(apiDef.NOTIFICATION, nameArray)
+        except ApiException.CommandError:
+            levelFields = []
+        for field in levelFields:
+            if not field.length:
+                isFixed = False     # the header ends at the first variable-length field
+            if not isFixed:
+                if field.name not in apiDef.RESERVED:
+                    fields[field.name] = None
+                continue
+            if field.name in apiDef.RESERVED:
+                subIdOffset = offset
+            else:
+                fields[field.name] = (offset, field.length)
+            offset   += field.length
+
+        if not apiDef.hasSubcommands(apiDef.NOTIFICATION, nameArray):
+            return compileLeaf(nameArray, fields)
+        if subIdOffset is None or not isFixed:
+            log.warning("subcommand ID of {0} not in its header, not filtered".format(nameArray))
+            return True
+
+        # the payload is indexed as is: the children are found by int, and by
+        # character for str and memoryview payloads
+        children      = {}
+        for subcommand in apiDef.getSubcommands(apiDef.NOTIFICATION, nameArray):
+            child     = self._compileNode(apiDef, nameArray+[subcommand['name']], offset, fields, compileLeaf)
+            children[subcommand['id']]      = child
+            children[chr(subcommand['id'])] = child
+        return _Branch(subIdOffset, children)
@@ -1,5 +1,12 @@
 #!/usr/bin/python
 
+'''
+FCS-16 (RFC1662) used by the HDLC framing of the serial APIs, and by OTAP to
+check firmware images.
+'''
+
+import struct
+
 from SmartMeshSDK.utils import FormatUtils
 
 import logging
@@ -10,56 +17,161 @@ log = logging.getLogger('Crc')
 log.setLevel(logging.WARNING)
 log.addHandler(NullHandler())
 
+FCS16_INIT    = 0xffff # initial value of the FCS register
+FCS16_GOOD    = 0xf0b8 # register value after a frame and its (valid) FCS
+
+FCS16_TABLE = [
+    0x0000, 0x1189, 0x2312, 0x329b, 0x4624, 0x57ad, 0x6536, 0x74bf,
+    0x8c48, 0x9dc1, 0xaf5a, 0xbed3, 0xca6c, 0xdbe5, 0xe97e, 0xf8f7,
+    0x1081, 0x0108, 0x3393, 0x221a, 0x56a5, 0x472c, 0x75b7, 0x643e,
+    0x9cc9, 0x8d40, 0xbfdb, 0xae52, 0xdaed, 0xcb64, 0xf9ff, 0xe876,
+    0x2102, 0x308b, 0x0210, 0x1399, 0x6726, 0x76af, 0x4434, 0x55bd,
+    0xad4a, 0xbcc3, 0x8e58, 0x9fd1, 0xeb6e, 0xfae7, 0xc87c, 0xd9f5,
+    0x3183, 0x200a, 0x1291, 0x0318, 0x77a7, 0x662e, 0x54b5, 0x453c,
+    0xbdcb, 0xac42, 0x9ed9, 0x8f50, 0xfbef, 0xea66, 0xd8fd, 0xc974,
+    0x4204, 0x538d, 0x6116, 0x709f, 0x0420, 0x15a9, 0x2732, 0x36bb,
+    0xce4c, 0xdfc5, 0xed5e, 0xfcd7, 0x8868, 0x99e1, 0xab7a, 0xbaf3,
+    0x5285, 0x430c, 0x7197, 0x601e, 0x14a1, 0x0528, 0x37b3, 0x263a,
+    0xdecd, 0xcf44, 0xfddf, 0xec56, 0x98e9, 0x8960, 0xbbfb, 0xaa72,
+    0x6306, 0x728f, 0x4014, 0x519d, 0x2522, 0x34ab, 0x0630, 0x17b9,
+    0xef4e, 0xfec7, 0xcc5c, 0xddd5, 0xa96a, 0xb8e3, 0x8a78, 0x9bf1,
+    0x7387, 0x620e, 0x5095, 0x411c, 0x35a3, 0x242a, 0x16b1, 0x0738,
+    0xffcf, 0xee46, 0xdcdd, 0xcd54, 0xb9eb, 0xa862, 0x9af9, 0x8b70,
+    0x8408, 0x9581, 0xa71a, 0xb693, 0xc22c, 0xd3a5, 0xe13e, 0xf0b7,
+    0x0840, 0x19c9, 0x2b52, 0x3adb, 0x4e64, 0x5fed, 0x6d76, 0x7cff,
+    0x9489, 0x8500, 0xb79b, 0xa612, 0xd2ad, 0xc324, 0xf1bf, 0xe036,
+    0x18c1, 0x0948, 0x3bd3, 0x2a5a, 0x5ee5, 0x4f6c, 0x7df7, 0x6c7e,
+    0xa50a, 0xb483, 0x8618, 0x9791, 0xe32e, 0xf2a7, 0xc03c, 0xd1b5,
+    0x2942, 0x38cb, 0x0a50, 0x1bd9, 0x6f66, 0x7eef, 0x4c74, 0x5dfd,
+    0xb58b, 0xa402, 0x9699, 0x8710, 0xf3af, 0xe226, 0xd0bd, 0xc134,
+    0x39c3, 0x284a, 0x1ad1, 0x0b58, 0x7fe7, 0x6e6e, 0x5cf5, 0x4d7c,
+    0xc60c, 0xd785, 0xe51e, 0xf497, 0x8028, 0x91a1, 0xa33a, 0xb2b3,
+    0x4a44, 0x5bcd, 0x6956, 0x78df, 0x0c60, 0x1de9, 0x2f72, 0x3efb,
+    0xd68d, 0xc704, 0xf59f, 0xe416, 0x90a9, 0x8120, 0xb3bb, 0xa232,
+    0x5ac5, 0x4b4c, 0x79d7, 0x685e, 0x1ce1, 0x0d68, 0x3ff3, 0x2e7a,
+    0xe70e, 0xf687, 0xc41c, 0xd595, 0xa12a, 0xb0a3, 0x8238, 0x93b1,
+    0x6b46, 0x7acf, 0x4854, 0x59dd, 0x2d62, 0x3ceb, 0x0e70, 0x1ff9,
+    0xf78f, 0xe606, 0xd49d, 0xc514, 0xb1ab, 0xa022, 0x92b9, 0x8330,
+    0x7bc7, 0x6a4e, 0x58d5, 0x495c, 0x3de3, 0x2c6a, 0x1ef1, 0x0f78
+    ]
+
+_fcstab16     = None   # 2-byte lookup table, built on first use
+
+_WORD_MIN_LEN = 16     # below this length, the byte-wise loop is faster
+
+#============================ helpers =========================================
+
+def _buildTable16():
+    '''
+    \brief Build the lookup table which processes 2 bytes per iteration.
+    
+    Entry x is the value of the FCS register after processing 2 bytes, when the
+    register XOR'ed with the (little-endian) 2 bytes is x.
+    '''
+    table  = []
+    for x in xrange(0x10000):
+        t  = FCS16_TABLE[x & 0xff]
+        table.append((t >> 8) ^ FCS16_TABLE[((x >> 8) ^ t) & 0xff])
+    return table
+
+#============================ public ==========================================
+
+def fcs16(data,fcs=FCS16_INIT):
+    '''
+    \brief Run the FCS register over some data.
+    
+    Calling this function on consecutive chunks of a message, passing the
+    previous return value as fcs, gives the same result as a single call over
+    the whole message.
+    
+    \param data The data, a str, bytearray, memoryview or list of ints.
+    \param fcs  The value of the FCS register before processing data.
+    
+    \returns The value of the FCS register after processing data, an int.
+    '''
+    global _fcstab16
+    
+    # lists and bytearrays are iterated as ints, everything else is converted
+    dataType      = type(data)
+    if dataType is not list and dataType is not bytearray:
+        data      = bytearray(data)
+    
+    if len(data)>=_WORD_MIN_LEN:
+        if _fcstab16 is None:
+            _fcstab16 = _buildTable16()
+        tab16     = _fcstab16
+        if dataType is list:
+            data  = bytearray(data)
+        for word in struct.unpack_from('<{0}H'.format(len(data)>>1),data):
+            fcs   = tab16[fcs ^ word]
+        if len(data) & 1:
+            fcs   = (fcs >> 8) ^ FCS16_TABLE[(fcs ^ data[-1]) & 0xff]
+    else:
+        tab       = FCS16_TABLE
+        for byte in data:
+            fcs   = (fcs >> 8) ^ tab[(fcs ^ byte) & 0xff]
+    
+    return fcs
+
+def calculate(data):
+    '''
+    \brief Calculate the FCS of a message.
+    
+    \param data The message, a str, bytearray, memoryview or list of ints.
+    
+    \returns The FCS, an int.
+    '''
+    return fcs16(data) ^ 0xffff
+
+def verify(frame):
+    '''
+    \brief Check the FCS of a received frame, without splitting it.
+    
+    \param frame The frame, i.e. the message followed by its 2-byte FCS.
+    
+    \returns True if the FCS is valid, False otherwise.
+    '''
+    return fcs16(frame)==FCS16_GOOD
+
 class Crc():
     
-    _fcstab = [
-        0x0000, 0x1189, 0x2312, 0x329b, 0x4624, 0x57ad, 0x6536, 0x74bf,
-        0x8c48, 0x9dc1, 0xaf5a, 0xbed3, 0xca6c, 0xdbe5, 0xe97e, 0xf8f7,
-        0x1081, 0x0108, 0x3393, 0x221a, 0x56a5, 0x472c, 0x75b7, 0x643e,
-        0x9cc9, 0x8d40, 0xbfdb, 0xae52, 0xdaed, 0xcb64, 0xf9ff, 0xe876,
-        0x2102, 0x308b, 0x0210, 0x1399, 0x6726, 0x76af, 0x4434, 0x55bd,
-        0xad4a, 0xbcc3, 0x8e58, 0x9fd1, 0xeb6e, 0xfae7, 0xc87c, 0xd9f5,
-        0x3183, 0x200a, 0x1291, 0x0318, 0x77a7, 0x662e, 0x54b5, 0x453c,
-        0xbdcb, 0xac42, 0x9ed9, 0x8f50, 0xfbef, 0xea66, 0xd8fd, 0xc974,
-        0x4204, 0x538d, 0x6116, 0x709f, 0x0420, 0x15a9, 0x2732, 0x36bb,
-        0xce4c, 0xdfc5, 0xed5e, 0xfcd7, 0x8868, 0x99e1, 0xab7a, 0xbaf3,
-        0x5285, 0x430c, 0x7197, 0x601e, 0x14a1, 0x0528, 0x37b3, 0x263a,
-        0xdecd, 0xcf44, 0xfddf, 0xec56, 0x98e9, 0x8960, 0xbbfb, 0xaa72,
-        0x6306, 0x728f, 0x4014, 0x519d, 0x2522, 0x34ab, 0x0630, 0x17b9,
-        0xef4e, 0xfec7, 0xcc5c, 0xddd5, 0xa96a, 0xb8e3, 0x8a78, 0x9bf1,
-        0x7387, 0x620e, 0x5095, 0x411c, 0x35a3, 0x242a, 0x16b1, 0x0738,
-        0xffcf, 0xee46, 0xdcdd, 0xcd54, 0xb9eb, 0xa862, 0x9af9, 0x8b70,
-        0x8408, 0x9581, 0xa71a, 0xb693, 0xc22c, 0xd3a5, 0xe13e, 0xf0b7,
-        0x0840, 0x19c9, 0x2b52, 0x3adb, 0x4e64, 0x5fed, 0x6d76, 0x7cff,
-        0x9489, 0x8500, 0xb79b, 0xa612, 0xd2ad, 0xc324, 0xf1bf, 0xe036,
-        0x18c1, 0x0948, 0x3bd3, 0x2a5a, 0x5ee5, 0x4f6c, 0x7df7, 0x6c7e,
-        0xa50a, 0xb483, 0x8618, 0x9791, 0xe32e, 0xf2a7, 0xc03c, 0xd1b5,
-        0x2942, 0x38cb, 0x0a50, 0x1bd9, 0x6f66, 0x7eef, 0x4c74, 0x5dfd,
-        0xb58b, 0xa402, 0x9699, 0x8710, 0xf3af, 0xe226, 0xd0bd, 0xc134,
-        0x39c3, 0x284a, 0x1ad1, 0x0b58, 0x7fe7, 0x6e6e, 0x5cf5, 0x4d7c,
-        0xc60c, 0xd785, 0xe51e, 0xf497, 0x8028, 0x91a1, 0xa33a, 0xb2b3,
-        0x4a44, 0x5bcd, 0x6956, 0x78df, 0x0c60, 0x1de9, 0x2f72, 0x3efb,
-        0xd68d, 0xc704, 0xf59f, 0xe416, 0x90a9, 0x8120, 0xb3bb, 0xa232,
-        0x5ac5, 0x4b4c, 0x79d7, 0x685e, 0x1ce1, 0x0d68, 0x3ff3, 0x2e7a,
-        0xe70e, 0xf687, 0xc41c, 0xd595, 0xa12a, 0xb0a3, 0x8238, 0x93b1,
-        0x6b46, 0x7acf, 0x4854, 0x59dd, 0x2d62, 0x3ceb, 0x0e70, 0x1ff9,
-        0xf78f, 0xe606, 0xd49d, 0xc514, 0xb1ab, 0xa022, 0x92b9, 0x8330,
-        0x7bc7, 0x6a4e, 0x58d5, 0x495c, 0x3de3, 0x2c6a, 0x1ef1, 0x0f78
-    ]
+    _fcstab = FCS16_TABLE
+    
+    def __init__(self):
+        self.reset()
     
     #======================== public ==========================================
     
+    def reset(self):
+        '''
+        \brief Restart an incremental calculation.
+        '''
+        self.fcs = FCS16_INIT
+    
+    def update(self,data):
+        '''
+        \brief Add a chunk of data to an incremental calculation.
+        
+        \param data The data, a str, bytearray, memoryview or list of ints.
+        '''
+        self.fcs = fcs16(data,self.fcs)
+    
+    def digest(self):
+        '''
+        \brief Get the FCS of the data passed to update() since the last
+               reset().
+        
+        \returns The FCS, as a list of 2 ints (least significant byte first).
+        '''
+        fcs = self.fcs ^ 0xffff
+        return [(fcs>>0) & 0xff, (fcs>>8) & 0xff]
+    
     def calculate(self,data):
         
         if log.isEnabledFor(logging.DEBUG):
             log.debug('calculating for data={0}'.format(FormatUtils.formatBuffer(data)))
         
-        ptr = 0
-        tempfcs = 0xffff
-        while ptr<len(data):
-            tempfcs = (tempfcs >> 8) ^ self._fcstab[(tempfcs ^ data[ptr]) & 0xff];
-            ptr += 1
-        tempfcs ^= 0xffff
+        tempfcs = calculate(data)
         fcs  = []
         fcs.append( (tempfcs>>0) & 0xff )
         fcs.append( (tempfcs>>8) & 0xff )
@@ -69,4 +181,5 @@ class Crc():
         
         return fcs
     
-    #======================== private =========================================
\ No newline at end of file
+    def verify(self,frame):
+        return verify(frame)
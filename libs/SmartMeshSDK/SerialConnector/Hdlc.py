@@ -35,10 +35,19 @@ class Hdlc(threading.Thread):
     _HDLC_FLAG     = 0x7e   # the HDLC flag at the beginning/end of a frame
     _HDLC_ESCAPE   = 0x7d   # escape character when the HDLC flag in payload
     _HDLC_MASK     = 0x20   # mask used to recover from escape characters
+    _HDLC_FLAG_CHAR   = chr(_HDLC_FLAG)
+    _HDLC_ESCAPE_CHAR = chr(_HDLC_ESCAPE)
+    _HDLC_FLAG_SEQ    = chr(_HDLC_ESCAPE)+chr(_HDLC_FLAG^_HDLC_MASK)
+    _HDLC_ESCAPE_SEQ  = chr(_HDLC_ESCAPE)+chr(_HDLC_ESCAPE^_HDLC_MASK)
     
     _FCS_LENGTH    = 2      # number of bytes in the FCS field
     
-    def __init__(self,rxcallback,connectcallback):
+    _RX_CHUNK_SIZE = 4096   # maximum number of bytes read at once in chunk mode
+    
+    RXMODE_BYTE    = 'byte' # read the serial port one byte at a time
+    RXMODE_CHUNK   = 'chunk'# read everything available on the serial port at once
+    
+    def __init__(self,rxcallback,connectcallback,rxMode=RXMODE_BYTE):
         
         # log
         log.info('Creating object')
@@ -46,6 +55,9 @@ class Hdlc(threading.Thread):
         # store params
         self.rxcallback           = rxcallback
         self.connectcallback      = connectcallback
+        if rxMode not in [self.RXMODE_BYTE,self.RXMODE_CHUNK]:
+            raise ValueError('unsupported rxMode {0}'.format(rxMode))
+        self.rxMode               = rxMode
         
         # initialize parent class
         threading.Thread.__init__(self)
@@ -60,6 +72,8 @@ class Hdlc(threading.Thread):
         self.busySending          = threading.Lock()
         self.busyReceiving        = False
         self.lastRxByte           = self._HDLC_FLAG
+        self.rxBuffer             = bytearray()
+        self.reactor              = None
         
         # initialize state
         self._restart()
@@ -74,89 +88,10 @@ class Hdlc(threading.Thread):
             while self.connected==True:
                 try:
                     
-                    # received a byte
-                    try:
-                        rxByte = self.pyserialHandler.read(1)
-                    except Exception as err:
-                        # work-around for bug in pyserial
-                        # https://sourceforge.net/tracker/?func=detail&aid=3591432&group_id=46487&atid=446302
-                        raise serial.SerialException(str(err))
-                    if not len(rxByte):
-                        raise serial.SerialException()
-                    
-                    # convert the received byte from a character to an int
-                    rxByte = ord(rxByte)
-                    if      (
-                                (not self.busyReceiving)             and
-                                self.lastRxByte==self._HDLC_FLAG     and
-                                rxByte!=self._HDLC_FLAG
-                            ):
-                        # start of frame
-                        
-                        self.busyReceiving            = True
-                        self.receivedFrame            = {}
-                        self.receivedFrame['payload'] = [rxByte]
-                    
-                    elif    (
-                                self.busyReceiving                   and
-                                rxByte!=self._HDLC_FLAG
-                            ):
-                        # middle of frame
-                        
-                        if rxByte==self._HDLC_ESCAPE:
-                            self._escape = True
-                            # do not add this byte to the payload
-                        else:
-                            if self._escape == True:
-                                self.receivedFrame['payload'].append(rxByte^self._HDLC_MASK)
-                                self._escape = False
-                            else:
-                                self.receivedFrame['payload'].append(rxByte)
-                    
-                    elif    (
-                                self.busyReceiving                   and
-                                rxByte==self._HDLC_FLAG
-                            ):
-                        # end of frame
-                        
-                        self.busyReceiving       = False
-                        
-                        # split payload and fcs
-                        if len(self.receivedFrame['payload'])>self._FCS_LENGTH:
-                            temp_payload                   = self.receivedFrame['payload']
-                            self.receivedFrame['payload']  = temp_payload[:-2]
-                            self.receivedFrame['fcs']      = temp_payload[-2:]
-                            
-                            # check fcs, write 'valid' field
-                            recalculatedCrc                = self.crc.calculate(self.receivedFrame['payload'])
-                            if recalculatedCrc==self.receivedFrame['fcs']:
-                                self.receivedFrame['valid'] = True
-                            else:
-                                self.receivedFrame['valid'] = False
-                            
-                            # log
-                            if log.isEnabledFor(logging.DEBUG):
-                                output     = []
-                                output    += ['\nreceivedFrame:']
-                                output    += self._formatFrame(self.receivedFrame)
-                                log.debug('\n'.join(output))
-                            
-                            # callback
-                            if self.receivedFrame['valid']==True:
-                                try:
-                                    self.rxcallback(self.receivedFrame['payload'])
-                                except (ConnectionError,CommandError) as err:
-                                    output = "@Hdlc: {0}".format(err)
-                                    log.error(output)
-                                    print output
-                        else:
-                            output = "@Hdlc: received hdlc frame too short"
-                            log.error(output)
-                            print output
-                        self._restart()
-                    
-                    # remember the last byte I received
-                    self.lastRxByte = rxByte
+                    if self.rxMode==self.RXMODE_CHUNK:
+                        self._rxChunk()
+                    else:
+                        self._rxByte()
                     
                 except serial.SerialException:
                     self.connected = False
@@ -173,19 +108,30 @@ class Hdlc(threading.Thread):
             log.critical(output)
             raise
         
-        del self.crc
-        del self.pyserialHandler
-        self.connectcallback(self.connected)
+        self._terminate()
         
         # log
         log.info('thread ended')
     
     #======================== public ==========================================
     
-    def connect(self,comPort,baudrate=_BAUDRATE):
+    def connect(self,comPort,baudrate=_BAUDRATE,reactor=None):
+        '''
+        \brief Open the serial port and start receiving.
+        
+        \param comPort  The serial port to open.
+        \param baudrate The baudrate of the serial port.
+        \param reactor  An HdlcReactor to service this serial port, instead of
+                        the thread of this module. The received bytes are then
+                        always processed in chunks, whatever the rxMode.
+        '''
         self.comPort         = comPort
         try:
-            self.pyserialHandler = serial.Serial(self.comPort,baudrate=baudrate)
+            if reactor:
+                # the reactor only reads what is available
+                self.pyserialHandler = serial.Serial(self.comPort,baudrate=baudrate,timeout=0)
+            else:
+                self.pyserialHandler = serial.Serial(self.comPort,baudrate=baudrate)
             self.pyserialHandler.setRTS(False)
             self.pyserialHandler.setDTR(True)
         except serial.serialutil.SerialException as err:
@@ -194,71 +140,164 @@ class Hdlc(threading.Thread):
             raise ConnectionError(output)
         else:
             log.info("opened port {0}@{1}baud".format(self.comPort,baudrate))
-            self._restart()
-            self.connected = True
-            self.connectcallback(self.connected)
-            self.name      = '{0}_HDLC'.format(self.comPort)
+            self.attach(self.pyserialHandler,self.comPort,reactor)
+        return self
+    
+    def attach(self,serialHandler,comPort,reactor=None):
+        '''
+        \brief Start receiving from an already opened port.
+        
+        \param serialHandler An object with the read(), write(), in_waiting
+                             and close() members of a pyserial port, e.g. a
+                             wrapper around the master side of a pty.
+        \param comPort       The name of the port.
+        \param reactor       An HdlcReactor to service this port, see
+                             connect(). serialHandler then also needs a
+                             fileno() member.
+        '''
+        self.comPort         = comPort
+        self.pyserialHandler = serialHandler
+        self._restart()
+        self.connected       = True
+        self.connectcallback(self.connected)
+        self.name            = '{0}_HDLC'.format(self.comPort)
+        if reactor:
+            self.reactor     = reactor
+            try:
+                self.reactor.add(self)
+            except ConnectionError:
+                # the reactor is stopped
+                self.reactor   = None
+                self.connected = False
+                self.pyserialHandler.close()
+                raise
+        else:
             self.start()
         return self
     
     def send(self,message):
+        '''
+        \brief Frame a message and write it to the serial port.
         
-        if not self.connected:
-            output = 'not connected'
-            log.error(output)
-            raise ConnectionError(output)
+        \param message The bytes to send, a list of ints, a str or a bytearray.
+        '''
+        self.sendFrame(self.encode(message))
+    
+    def encode(self,message):
+        '''
+        \brief Build the HDLC frame (FCS, escape characters and flags) of a
+               message.
         
-        # calculate fcs
-        packetToSend              = {}
-        packetToSend['payload']   = message
-        packetToSend['fcs']       = self.crc.calculate(packetToSend['payload'])
-        packetToSend['valid']     = True
+        The returned frame can be kept and passed to sendFrame() as many
+        times as needed, e.g. for messages which are sent repeatedly.
         
-        # assemble packet
-        packetBytes               = packetToSend['payload']+packetToSend['fcs']
+        \param message The bytes to send, a list of ints, a str or a bytearray.
         
-        # add HDLC escape characters
-        index = 0
-        while index<len(packetBytes):
-            if packetBytes[index]==self._HDLC_FLAG or packetBytes[index]==self._HDLC_ESCAPE:
-                packetBytes.insert(index,self._HDLC_ESCAPE)
-                index += 1
-                packetBytes[index] = packetBytes[index]^self._HDLC_MASK
-            index += 1
+        \returns The framed message, a str.
+        '''
         
-        # add HDLC flags
-        packetBytes.insert(0,self._HDLC_FLAG)
-        packetBytes.insert(len(packetBytes),self._HDLC_FLAG)
+        # calculate fcs
+        packetBytes               = bytearray(message)
+        fcs                       = self.crc.calculate(packetBytes)
         
         # log
         if log.isEnabledFor(logging.DEBUG):
-            output           = []
-            output          += ['\npacketToSend:']
-            output          += self._formatFrame(packetToSend)
+            packetToSend          = {}
+            packetToSend['payload']   = list(packetBytes)
+            packetToSend['fcs']       = fcs
+            packetToSend['valid']     = True
+            output                = []
+            output               += ['\npacketToSend:']
+            output               += self._formatFrame(packetToSend)
             log.debug('\n'.join(output))
         
-        # reconstitute byteArray
-        byteArray            = ''.join([chr(byte) for byte in packetBytes])
+        # assemble packet
+        packetBytes              += bytearray(fcs)
+        
+        # add HDLC escape characters (escape character first)
+        packetBytes               = bytes(packetBytes).replace(
+            self._HDLC_ESCAPE_CHAR,
+            self._HDLC_ESCAPE_SEQ,
+        ).replace(
+            self._HDLC_FLAG_CHAR,
+            self._HDLC_FLAG_SEQ,
+        )
+        
+        # add HDLC flags
+        return self._HDLC_FLAG_CHAR+packetBytes+self._HDLC_FLAG_CHAR
+    
+    def sendFrame(self,frame):
+        '''
+        \brief Write an already framed message to the serial port.
+        
+        \param frame A frame, as returned by encode().
+        '''
+        
+        if not self.connected:
+            output = 'not connected'
+            log.error(output)
+            raise ConnectionError(output)
         
         # send over serial port
         try:        
             with self.busySending:
-                numWritten   = self.pyserialHandler.write(byteArray)
+                numWritten   = self.pyserialHandler.write(frame)
         except IOError, e:
             raise ConnectionError(str(e))
 
-        if numWritten!=len(packetBytes):
-            output = 'wrote '+str(numWritten)+' bytes, expected '+str(len(packetBytes))
+        if numWritten!=len(frame):
+            output = 'wrote '+str(numWritten)+' bytes, expected '+str(len(frame))
             log.error(output)
             raise ConnectionError(output)
     
     def disconnect(self):
         log.info("disconnect")
         if self.connected==True:
-            self.pyserialHandler.close()
+            if self.reactor:
+                # the reactor closes the serial port once it stops servicing it
+                self.reactor.remove(self)
+            else:
+                self.pyserialHandler.close()
         self.comPort         = ''
         self.name            = 'HDLC'
     
+    #======================== reactor =========================================
+    
+    def fileno(self):
+        '''
+        \brief The file descriptor of the serial port, watched by the reactor.
+        '''
+        return self.pyserialHandler.fileno()
+    
+    def rxReady(self):
+        '''
+        \brief Called by the reactor when the serial port is readable.
+        
+        \returns False if the serial port was lost, True otherwise.
+        '''
+        try:
+            numWaiting = self.pyserialHandler.in_waiting
+            rxBytes    = self._read(min(max(numWaiting,1),self._RX_CHUNK_SIZE))
+        except serial.SerialException as err:
+            # a readable port returning no data was disconnected
+            log.warning('lost {0}: {1}'.format(self.comPort,err))
+            self.connected = False
+            return False
+        
+        self._parseChunk(rxBytes)
+        return True
+    
+    def detached(self):
+        '''
+        \brief Called by the reactor once it stopped servicing the serial port.
+        '''
+        try:
+            self.pyserialHandler.close()
+        except Exception as err:
+            log.warning('error closing serial port: {0}'.format(err))
+        self.connected = False
+        self._terminate()
+    
     #======================== support methods for Python "with" statement =====
     
     def __enter__(self):
@@ -269,10 +308,155 @@ class Hdlc(threading.Thread):
 
     #======================== private =========================================
     
+    def _read(self,numBytes):
+        try:
+            rxBytes = self.pyserialHandler.read(numBytes)
+        except Exception as err:
+            # work-around for bug in pyserial
+            # https://sourceforge.net/tracker/?func=detail&aid=3591432&group_id=46487&atid=446302
+            raise serial.SerialException(str(err))
+        if not len(rxBytes):
+            raise serial.SerialException()
+        return rxBytes
+    
+    def _rxByte(self):
+        
+        # received a byte
+        rxByte = self._read(1)
+        
+        # convert the received byte from a character to an int
+        rxByte = ord(rxByte)
+        if      (
+                    (not self.busyReceiving)             and
+                    self.lastRxByte==self._HDLC_FLAG     and
+                    rxByte!=self._HDLC_FLAG
+                ):
+            # start of frame
+            
+            self.busyReceiving            = True
+            self.receivedFrame            = {}
+            if rxByte==self._HDLC_ESCAPE:
+                self.receivedFrame['payload'] = []
+                self._escape                  = True
+            else:
+                self.receivedFrame['payload'] = [rxByte]
+        
+        elif    (
+                    self.busyReceiving                   and
+                    rxByte!=self._HDLC_FLAG
+                ):
+            # middle of frame
+            
+            if rxByte==self._HDLC_ESCAPE:
+                self._escape = True
+                # do not add this byte to the payload
+            else:
+                if self._escape == True:
+                    self.receivedFrame['payload'].append(rxByte^self._HDLC_MASK)
+                    self._escape = False
+                else:
+                    self.receivedFrame['payload'].append(rxByte)
+        
+        elif    (
+                    self.busyReceiving                   and
+                    rxByte==self._HDLC_FLAG
+                ):
+            # end of frame
+            
+            self.busyReceiving       = False
+            self._processFrame(self.receivedFrame['payload'])
+            self._restart()
+        
+        # remember the last byte I received
+        self.lastRxByte = rxByte
+    
+    def _rxChunk(self):
+        
+        # block until at least one byte is available, then drain the OS buffer
+        rxBytes    = self._read(1)
+        numWaiting = self.pyserialHandler.in_waiting
+        if numWaiting:
+            rxBytes += self._read(min(numWaiting,self._RX_CHUNK_SIZE))
+        
+        self._parseChunk(rxBytes)
+    
+    def _parseChunk(self,rxBytes):
+        '''
+        \brief Split the bytes received into frames, and process every complete
+               frame.
+        
+        Bytes after the last flag are kept in rxBuffer, waiting for the
+        remainder of the frame.
+        '''
+        
+        buf        = self.rxBuffer
+        buf       += rxBytes
+        
+        start      = 0
+        while True:
+            end    = buf.find(self._HDLC_FLAG_CHAR,start)
+            if end<0:
+                break
+            if end>start:
+                self._processFrame(self._unescape(buf[start:end]))
+            start  = end+1
+        
+        if start:
+            del buf[:start]
+    
+    def _unescape(self,frame):
+        if frame.find(self._HDLC_ESCAPE_CHAR)<0:
+            return frame
+        
+        pieces     = frame.split(self._HDLC_ESCAPE_CHAR)
+        frame      = pieces[0]
+        for piece in pieces[1:]:
+            if piece:
+                frame.append(piece[0]^self._HDLC_MASK)
+                frame += piece[1:]
+        return frame
+    
+    def _processFrame(self,frameBytes):
+        
+        # split payload and fcs
+        if len(frameBytes)>self._FCS_LENGTH:
+            self.receivedFrame             = {}
+            self.receivedFrame['payload']  = list(frameBytes[:-2])
+            self.receivedFrame['fcs']      = list(frameBytes[-2:])
+            
+            # check fcs, write 'valid' field
+            self.receivedFrame['valid']    = self.crc.verify(frameBytes)
+            
+            # log
+            if log.isEnabledFor(logging.DEBUG):
+                output     = []
+                output    += ['\nreceivedFrame:']
+                output    += self._formatFrame(self.receivedFrame)
+                log.debug('\n'.join(output))
+            
+            # callback
+            if self.receivedFrame['valid']==True:
+                try:
+                    self.rxcallback(self.receivedFrame['payload'])
+                except (ConnectionError,CommandError) as err:
+                    output = "@Hdlc: {0}".format(err)
+                    log.error(output)
+                    print output
+        else:
+            output = "@Hdlc: received hdlc frame too short"
+            log.error(output)
+            print output
+    
+    def _terminate(self):
+        del self.crc
+        del self.pyserialHandler
+        self.connectcallback(self.connected)
+    
     def _restart(self):
         self._escape         = False
         self.busyReceiving   = False
         self.lastRxByte      = self._HDLC_FLAG
+        del self.rxBuffer[:]
     
     def _formatFrame(self,frame):
         returnVal  = []
@@ -0,0 +1,305 @@
+#!/usr/bin/python
+
+import errno
+import fcntl
+import os
+import select
+import threading
+import traceback
+
+from SmartMeshSDK.ApiException import ConnectionError
+
+import logging
+class NullHandler(logging.Handler):
+    def emit(self, record):
+        pass
+log = logging.getLogger('HdlcReactor')
+log.setLevel(logging.ERROR)
+log.addHandler(NullHandler())
+
+class HdlcReactor(threading.Thread):
+    '''
+    \ingroup ApiConnector
+
+    \brief A single thread servicing the serial ports of many Hdlc modules.
+
+    Pass the reactor to Hdlc.connect() (or as the 'reactor' connection
+    parameter of a SerialConnector) to have the serial port serviced by this
+    thread instead of a thread per port. The frames received are passed to
+    the rxcallback of their Hdlc module, from this thread.
+
+    \note Uses epoll where available, select otherwise. Serial ports can only
+          be watched this way on POSIX systems.
+
+    \note The callbacks of all serial ports run on this thread; a callback
+          which blocks delays all the other ports. Use the 'rxWorker'
+          connection parameter of SerialConnector to decode the packets
+          outside of the reactor.
+
+    An object serviced can also have the reactor call its txReady() method
+    when its file descriptor is writable, see watchWrite(), to write without
+    blocking the reactor.
+    '''
+
+    _WAKEUP_READ_SIZE = 4096 # maximum number of wake-up bytes drained at once
+
+    # changes posted to the reactor thread
+    _ADD              = 'add'
+    _REMOVE           = 'remove'
+    _WATCH_WRITE      = 'watchWrite'
+    _UNWATCH_WRITE    = 'unwatchWrite'
+
+    def __init__(self):
+
+        # log
+        log.info('Creating object')
+
+        # initialize parent class
+        threading.Thread.__init__(self)
+        self.name                 = 'HdlcReactor'
+        self.daemon               = True
+
+        # local variables
+        self.dataLock             = threading.Lock()
+        self.goOn                 = True
+        self.isStopped            = False  # the wake-up pipe is closed, set under dataLock
+        self.pending              = []     # (action,hdlc) changes to apply from the reactor thread
+        self.hdlcs                = {}     # the Hdlc modules serviced, indexed by file descriptor
+        self.writers              = set()  # file descriptors watched for writing
+        self.stats                = {
+            'numWakeups':         0,
+            'numReads':           0,
+            'numWrites':          0,
+            'numPortsLost':       0,
+        }
+        (self.wakeupRd,self.wakeupWr) = os.pipe()
+        # a full pipe already wakes the reactor up, never block writing to it
+        flags                     = fcntl.fcntl(self.wakeupWr,fcntl.F_GETFL)
+        fcntl.fcntl(self.wakeupWr,fcntl.F_SETFL,flags|os.O_NONBLOCK)
+        if hasattr(select,'epoll'):
+            self.epoll            = select.epoll()
+            self.epoll.register(self.wakeupRd,select.EPOLLIN)
+        else:
+            self.epoll            = None
+
+        # start the thread
+        self.start()
+
+    def run(self):
+
+        # log
+        log.info('thread started')
+
+        try:
+
+            while self.goOn:
+                for (fd,isReadable,isWritable) in self._poll():
+                    if fd==self.wakeupRd:
+                        os.read(self.wakeupRd,self._WAKEUP_READ_SIZE)
+                        self._applyPending()
+                        continue
+                    if isWritable and fd in self.hdlcs:
+                        self._serviceWrite(self.hdlcs[fd])
+                    if isReadable and fd in self.hdlcs:
+                        self._service(self.hdlcs[fd])
+
+        except Exception as err:
+            output  = []
+            output += ['===== crash in thread {0} ====='.format(self.name)]
+            output += ['\nerror:\n']
+            output += [str(err)]
+            output += ['\ncall stack:\n']
+            output += [traceback.format_exc()]
+            output  = '\n'.join(output)
+            print output # critical error
+            log.critical(output)
+            raise
+
+        finally:
+            # no wake-up byte is written once the pipe is closed, and the
+            # ports added but not serviced yet are detached with the others
+            with self.dataLock:
+                self.isStopped    = True
+                (pending,self.pending) = (self.pending,[])
+            for hdlc in self.hdlcs.values():
+                self._detach(hdlc)
+            for (action,hdlc) in pending:
+                if action==self._ADD:
+                    self._detach(hdlc)
+            if self.epoll:
+                self.epoll.close()
+            os.close(self.wakeupRd)
+            os.close(self.wakeupWr)
+
+        # log
+        log.info('thread ended')
+
+    #======================== public ==========================================
+
+    def add(self,hdlc):
+        '''
+        \brief Start servicing the serial port of an Hdlc module.
+
+        Called by Hdlc.connect().
+
+        \exception ConnectionError The reactor is stopped.
+        '''
+        if not self._post((self._ADD,hdlc)):
+            raise ConnectionError('{0} is stopped'.format(self.name))
+
+    def remove(self,hdlc):
+        '''
+        \brief Stop servicing the serial port of an Hdlc module.
+
+        Returns immediately. The reactor thread then closes the serial port
+        and calls the connectcallback of the Hdlc module.
+        '''
+        self._post((self._REMOVE,hdlc))
+
+    def watchWrite(self,hdlc,enable):
+        '''
+        \brief Start or stop calling the txReady() method of an object
+               serviced whenever its file descriptor is writable.
+
+        txReady() returns False if the connection is lost. Applied at once
+        when called from the reactor thread, e.g. from txReady(), posted to
+        it otherwise.
+        '''
+        if threading.current_thread() is self:
+            self._setWriteWatch(hdlc,enable)
+        else:
+            self._post((self._WATCH_WRITE if enable else self._UNWATCH_WRITE,hdlc))
+
+    def close(self):
+        '''
+        \brief Stop the reactor, disconnecting all the serial ports.
+        '''
+        self.goOn = False
+        self._wakeup()
+
+    def getStats(self):
+        '''
+        \brief Get statistics about the reactor.
+
+        \returns A dictionary with the following keys:
+            - 'numPorts': number of serial ports serviced
+            - 'numWakeups': number of times the reactor was woken up
+            - 'numReads': number of reads from the serial ports
+            - 'numWrites': number of calls to txReady()
+            - 'numPortsLost': number of serial ports lost while being serviced
+        '''
+        returnVal                 = dict(self.stats)
+        returnVal['numPorts']     = len(self.hdlcs)
+        return returnVal
+
+    #======================== private =========================================
+
+    def _post(self,change):
+        '''
+        \returns False if the reactor is stopped, and the change ignored.
+        '''
+        with self.dataLock:
+            if self.isStopped:
+                return False
+            self.pending         += [change]
+            self._wakeupLocked()
+        return True
+
+    def _wakeup(self):
+        with self.dataLock:
+            if not self.isStopped:
+                self._wakeupLocked()
+
+    def _wakeupLocked(self):
+        # called with dataLock held, so that the pipe is not closed meanwhile
+        try:
+            os.write(self.wakeupWr,'x')
+        except OSError as err:
+            if err.errno!=errno.EAGAIN:
+                raise
+
+    def _poll(self):
+        '''
+        \returns A list of (fd,isReadable,isWritable) tuples.
+        '''
+        try:
+            if self.epoll:
+                ready    = [
+                    (fd,bool(events&~select.EPOLLOUT),bool(events&select.EPOLLOUT))
+                    for (fd,events) in self.epoll.poll()
+                ]
+            else:
+                (readable,writable,_) = select.select([self.wakeupRd]+self.hdlcs.keys(),list(self.writers),[])
+                ready    = [(fd,True,fd in writable) for fd in readable]
+                ready   += [(fd,False,True) for fd in writable if fd not in readable]
+        except (IOError,select.error) as err:
+            if err.args[0]==errno.EINTR:
+                return []
+            raise
+        self.stats['numWakeups'] += 1
+        return ready
+
+    def _applyPending(self):
+        with self.dataLock:
+            (pending,self.pending) = (self.pending,[])
+        for (action,hdlc) in pending:
+            if action==self._ADD:
+                try:
+                    fd            = hdlc.fileno()
+                    if self.epoll:
+                        self.epoll.register(fd,select.EPOLLIN)
+                except Exception as err:
+                    log.error('cannot service {0}: {1}'.format(hdlc.comPort,err))
+                    self._detach(hdlc)
+                    continue
+                self.hdlcs[fd]    = hdlc
+                log.info('servicing {0}'.format(hdlc.comPort))
+            elif action==self._REMOVE:
+                if hdlc in self.hdlcs.values():
+                    self._detach(hdlc)
+            else:
+                self._setWriteWatch(hdlc,action==self._WATCH_WRITE)
+
+    def _setWriteWatch(self,hdlc,enable):
+        for (fd,h) in self.hdlcs.items():
+            if h is hdlc and enable!=(fd in self.writers):
+                if enable:
+                    self.writers.add(fd)
+                else:
+                    self.writers.discard(fd)
+                if self.epoll:
+                    self.epoll.modify(fd,select.EPOLLIN|(select.EPOLLOUT if enable else 0))
+
+    def _service(self,hdlc):
+        self.stats['numReads']   += 1
+        try:
+            portAlive             = hdlc.rxReady()
+        except Exception as err:
+            log.error('error servicing {0}: {1}\n{2}'.format(hdlc.comPort,err,traceback.format_exc()))
+            portAlive             = False
+        if not portAlive:
+            self.stats['numPortsLost'] += 1
+            self._detach(hdlc)
+
+    def _serviceWrite(self,hdlc):
+        self.stats['numWrites']  += 1
+        try:
+            portAlive             = hdlc.txReady()
+        except Exception as err:
+            log.error('error writing to {0}: {1}\n{2}'.format(hdlc.comPort,err,traceback.format_exc()))
+            portAlive             = False
+        if not portAlive:
+            self.stats['numPortsLost'] += 1
+            self._detach(hdlc)
+
+    def _detach(self,hdlc):
+        for (fd,h) in self.hdlcs.items():
+            if h is hdlc:
+                del self.hdlcs[fd]
+                self.writers.discard(fd)
+                if self.epoll:
+                    self.epoll.unregister(fd)
+        try:
+            hdlc.detached()
+        except Exception as err:
+            log.error('error detaching {0}: {1}\n{2}'.format(hdlc.comPort,err,traceback.format_exc()))
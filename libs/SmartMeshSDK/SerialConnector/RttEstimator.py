@@ -0,0 +1,89 @@
+#!/usr/bin/python
+
+import threading
+
+class RttEstimator(object):
+    '''
+    \ingroup ApiConnector
+
+    \brief Round-trip time estimator, computing the retransmission timeout
+           (RTO) from the smoothed RTT and its variance (RFC6298).
+    '''
+
+    ALPHA          = 1.0/8  # gain of the smoothed RTT
+    BETA           = 1.0/4  # gain of the RTT variance
+    K              = 4      # weight of the RTT variance in the RTO
+
+    def __init__(self,initialRto,minRto,maxRto):
+
+        # store params
+        self.initialRto      = initialRto
+        self.minRto          = minRto
+        self.maxRto          = maxRto
+
+        # local variables
+        self.dataLock        = threading.Lock()
+        self.srtt            = None
+        self.rttvar          = None
+        self.rto             = initialRto
+        self.numSamples      = 0
+        self.lastRtt         = None
+
+    #======================== public ==========================================
+
+    def update(self,rtt):
+        '''
+        \brief Add an RTT measurement.
+
+        \note Only pass RTTs of requests which were answered without being
+              retransmitted (Karn's algorithm).
+
+        \param rtt The round-trip time, in seconds.
+        '''
+        with self.dataLock:
+            if self.srtt is None:
+                self.srtt    = rtt
+                self.rttvar  = rtt/2.0
+            else:
+                self.rttvar  = (1-self.BETA)*self.rttvar+self.BETA*abs(self.srtt-rtt)
+                self.srtt    = (1-self.ALPHA)*self.srtt+self.ALPHA*rtt
+            self.rto         = self._bound(self.srtt+self.K*self.rttvar)
+            self.numSamples += 1
+            self.lastRtt     = rtt
+
+    def getRto(self):
+        '''
+        \brief Get the current retransmission timeout, in seconds.
+        '''
+        return self.rto
+
+    def backoff(self,rto):
+        '''
+        \brief Get the timeout to use after a retransmission.
+
+        \param rto The timeout used for the previous transmission, in seconds.
+
+        \returns The doubled timeout, bounded by maxRto.
+        '''
+        return self._bound(2*rto)
+
+    def getStats(self):
+        '''
+        \brief Get the state of the estimator.
+
+        \returns A dictionary with keys 'rto', 'srtt', 'rttvar', 'lastRtt'
+                 (all in seconds) and 'numSamples'.
+        '''
+        with self.dataLock:
+            return {
+                'rto':           self.rto,
+                'srtt':          self.srtt,
+                'rttvar':        self.rttvar,
+                'lastRtt':       self.lastRtt,
+                'numSamples':    self.numSamples,
+            }
+
+    #======================== private =========================================
+
+    def _bound(self,rto):
+        return min(max(rto,self.minRto),self.maxRto)
@@ -7,8 +7,11 @@ import threading
 import socket
 import select
 import time
+import traceback
+import Queue
 
 import Hdlc
+import RttEstimator
 
 from   SmartMeshSDK.ApiException  import ConnectionError, \
                                          APIError,        \
@@ -34,6 +37,9 @@ class SerialConnector(ApiConnector):
     
     MAX_NUM_RETRY = 5
     RX_TIMEOUT    = 0.500 # in seconds
+    RX_HANDOFF_SIZE = 100 # max number of received packets waiting to be decoded
+    MIN_RTO       = 0.050 # in seconds, lower bound of the adaptive timeout
+    MAX_RTO       = 4.000 # in seconds, upper bound of the adaptive timeout
     
     def __init__(self, api_def, maxQSize=100) :
         
@@ -58,6 +64,18 @@ class SerialConnector(ApiConnector):
         self.requestSendLock = threading.Lock()       ##< lock to prevent concurrent requests to be sent
         self.tsDataSent      = 0                      ##< timestamp when sent data
         self.tsDataReceived  = 0                      ##< timestamp when received data
+        self.tsRespReceived  = 0                      ##< timestamp when received the last response
+        self.rttEstimator    = None                   ##< RTT estimator for the connector, None if fixed RX_TIMEOUT
+        self.rttPerCommand   = False                  ##< True iff an RTT estimator is also kept per command ID
+        self.rttEstimators   = {}                     ##< RTT estimators, indexed by command ID
+        self.retryStats      = {}                     ##< statistics about retransmissions
+        self._resetRetryStats()
+        self.rxHandoff       = None                   ##< packets passed by the HDLC thread to the RX worker, None if no RX worker
+        self.rxWorker        = None                   ##< thread decoding received packets
+        self.isRxStopped     = False                  ##< True once disconnecting, received packets are dropped
+        self.rxStats         = {}                     ##< statistics about the RX pipeline
+        self.ackFrames       = {}                     ##< HDLC-framed ACKs, indexed by (cmdId,packetId)
+        self._resetRxStats()
         
     #======================== public ==========================================
     
@@ -67,20 +85,62 @@ class SerialConnector(ApiConnector):
             log.error(output)
             raise ValueError(output)
         
+        if 'adaptiveRto' in connectParams and connectParams['adaptiveRto']:
+            self.rttEstimator    = self._createRttEstimator()
+            self.rttPerCommand   = ('rtoPerCommand' in connectParams and connectParams['rtoPerCommand'])
+        else:
+            self.rttEstimator    = None
+            self.rttPerCommand   = False
+        self.rttEstimators       = {}
+        self._resetRetryStats()
+        
+        if 'binaryFields' in connectParams:
+            self.setBinaryFields(connectParams['binaryFields'])
+        
+        if connectParams.get('notifLog'):
+            self.openNotifLog(connectParams['notifLog'])
+        
+        if 'notifOverflow' in connectParams:
+            self.setNotifOverflow(connectParams['notifOverflow'])
+        
+        if 'notifFilter' in connectParams:
+            self.setNotifFilter(connectParams['notifFilter'])
+        
+        if 'rxMode' in connectParams:
+            rxMode               = connectParams['rxMode']
+        else:
+            rxMode               = Hdlc.Hdlc.RXMODE_BYTE
+        
         with self.hdlcLock:
+            self.isRxStopped     = False
+            # create and start the RX worker, if requested
+            if 'rxWorker' in connectParams and connectParams['rxWorker']:
+                self._resetRxStats()
+                self.rxHandoff   = Queue.Queue(self.RX_HANDOFF_SIZE)
+                self.rxWorker    = threading.Thread(target=self._rxWorker,
+                                                    args=(self.rxHandoff,))
+                self.rxWorker.name   = '{0}_RX'.format(connectParams['port'])
+                self.rxWorker.daemon = True
+                self.rxWorker.start()
             # create and start HDLC module (includes CRC)
             self.hdlc            = Hdlc.Hdlc(self._hdlcRxCb,
-                                             self._hdlcConnectCb)
-            # connect HDLC module to serial Port
+                                             self._hdlcConnectCb,
+                                             rxMode=rxMode)
+            # connect HDLC module to serial Port, serviced by its own thread
+            # or by a shared HdlcReactor
+            hdlcParams           = {}
             if 'baudrate' in connectParams:
-                self.hdlc.connect(connectParams['port'],baudrate=connectParams['baudrate'])
-            else:
-                self.hdlc.connect(connectParams['port'])
+                hdlcParams['baudrate'] = connectParams['baudrate']
+            if 'reactor' in connectParams:
+                hdlcParams['reactor']  = connectParams['reactor']
+            self.hdlc.connect(connectParams['port'],**hdlcParams)
             # connect the parent class
             ApiConnector.connect(self)
     
     def disconnect(self, reason=""):
         with self.hdlcLock:
+            # stop accepting packets, the HDLC thread may still be receiving
+            self.isRxStopped = True
             # disconnect the parent class
             ApiConnector.disconnect(self, reason)
             # disconnect hdlc module
@@ -88,6 +148,14 @@ class SerialConnector(ApiConnector):
                 self.hdlc.disconnect()
             # delete the hdlc module
             self.hdlc = None
+            (rxHandoff,self.rxHandoff) = (self.rxHandoff,None)
+            (rxWorker,self.rxWorker)   = (self.rxWorker,None)
+        # stop the RX worker, after it has decoded the pending packets. Not
+        # holding hdlcLock, the worker may need it to drain the handoff queue.
+        # When disconnecting from the worker itself, it stops once the queue
+        # is empty.
+        if rxHandoff and rxWorker is not threading.current_thread():
+            rxHandoff.put(None)
     
     def send(self,commandArray,fields):
         if not self.isConnected:
@@ -96,10 +164,67 @@ class SerialConnector(ApiConnector):
             raise ConnectionError(output)
         
         # serialize the fields
-        cmdId, serializedFields = self.api_def.serialize(commandArray,fields)
+        cmdId, serializedFields = self.api_def.serialize(commandArray,fields,self.isTrustedCall())
         
         return self._sendInternal(cmdId,False,serializedFields)
 
+    def getRxStats(self):
+        '''
+        \brief Get statistics about the stages of the RX pipeline.
+        
+        \returns A dictionary with the following keys:
+            - 'rxWorker': whether packets are decoded by a separate RX worker
+            - 'numPackets': number of packets passed to the decoding stage
+            - 'handoffDepth': number of packets waiting for the RX worker
+            - 'handoffMaxDepth': highest handoffDepth since connecting
+            - 'handoffSize': maximum number of packets waiting for the RX worker
+            - 'notifQueueDepth': number of notifications waiting to be read
+            - 'notifQueueMaxDepth': highest notifQueueDepth since connecting
+            - 'notifDropped': number of notifications dropped by the overflow
+              policy of the notification queue since connecting, see
+              getNotifQueueStats()
+        '''
+        returnVal                       = dict(self.rxStats)
+        rxHandoff                       = self.rxHandoff
+        returnVal['rxWorker']           = rxHandoff is not None
+        if rxHandoff:
+            returnVal['handoffDepth']   = rxHandoff.qsize()
+        returnVal['handoffSize']        = self.RX_HANDOFF_SIZE
+        notifQueueStats                 = self.queue.getStats()
+        returnVal['notifQueueDepth']    = notifQueueStats['depth']
+        returnVal['notifQueueMaxDepth'] = notifQueueStats['maxDepth']
+        returnVal['notifDropped']       = notifQueueStats['numDropped']
+        return returnVal
+    
+    def getRtoStats(self):
+        '''
+        \brief Get the retransmission timeout and retry statistics.
+        
+        \returns A dictionary with the following keys:
+            - 'adaptive': whether the timeout adapts to the measured RTT
+            - 'rto': timeout of the first transmission of a command, in seconds
+            - 'numCommands': number of commands sent
+            - 'numRetries': number of retransmissions
+            - 'numFailures': number of commands abandoned after MAX_NUM_RETRY
+            - 'estimator': state of the connector's RTT estimator (see
+              RttEstimator.getStats()), only if adaptive
+            - 'perCommand': state of the RTT estimator of each command ID,
+              only if adaptive per command
+        '''
+        returnVal                    = dict(self.retryStats)
+        rttEstimator                 = self.rttEstimator
+        returnVal['adaptive']        = rttEstimator is not None
+        if rttEstimator:
+            returnVal['rto']         = rttEstimator.getRto()
+            returnVal['estimator']   = rttEstimator.getStats()
+            if self.rttPerCommand:
+                returnVal['perCommand'] = dict(
+                    [(cmdId,e.getStats()) for (cmdId,e) in self.rttEstimators.items()]
+                )
+        else:
+            returnVal['rto']         = self.RX_TIMEOUT
+        return returnVal
+    
     #======================== virtual methods =================================
 
     def isValidPacketId(self, cmdId, isResponse, packetId):
@@ -119,6 +244,13 @@ class SerialConnector(ApiConnector):
         \brief Send an ACK if needed.
         '''
         raise NotImplementedError() # to be implemented by child class
+    
+    def _buildAckPacket(self,cmdId,packetId):
+        '''
+        \brief Build the complete packet (header and payload) acknowledging
+               the request with the given command and packet IDs.
+        '''
+        raise NotImplementedError() # to be implemented by child class
 
     def isHelloResponse(self, cmdId):
         return False
@@ -128,6 +260,9 @@ class SerialConnector(ApiConnector):
     def _parseRxHeader(self,frameRx):
         raise NotImplementedError("virtual method")
     
+    def _getApiDefinition(self):
+        return self.api_def
+    
     def _sendInternal(self,cmdId,isResponse,serializedFields):
         
         try:
@@ -141,6 +276,15 @@ class SerialConnector(ApiConnector):
 
             retry = 0
             
+            # timeout of the first transmission
+            if not isResponse:
+                self.retryStats['numCommands'] += 1
+                rttEstimators = self._getRttEstimators(cmdId)
+                if rttEstimators:
+                    timeout = rttEstimators[-1].getRto()
+                else:
+                    timeout = self.RX_TIMEOUT
+            
             # Prepare for reliable send
             if not isResponse:
                 self.waitForResp = True
@@ -159,7 +303,7 @@ class SerialConnector(ApiConnector):
                 if not isResponse:
                     if log.isEnabledFor(logging.DEBUG):
                         log.debug("---------- pcToMote DATA ({0}) ---------->".format(self.TxPacketId))
-                        self.tsDataSent = time.time()
+                    self.tsDataSent = time.time()
                 
                 # send packet through HDLC module
                 with self.hdlcLock:
@@ -173,17 +317,27 @@ class SerialConnector(ApiConnector):
                     return None
                 
                 # wait for response. semaphore released by _hdlcRxCb()
-                if self.waitForRespEvent.wait(self.RX_TIMEOUT) :
+                if self.waitForRespEvent.wait(timeout) :
+                    # only measure the RTT of commands sent once (Karn's algorithm)
+                    if rttEstimators and retry==0:
+                        for rttEstimator in rttEstimators:
+                            rttEstimator.update(self.tsRespReceived-self.tsDataSent)
                     break
                 
                 log.info("retry {0}".format(retry))
                 
                 # Timeout error
                 if retry >= self.MAX_NUM_RETRY :
+                    self.retryStats['numFailures'] += 1
                     output = "retried {0} times, max allowed is {1}".format(retry,self.MAX_NUM_RETRY)
                     log.error(output)
                     raise ConnectionError(output)
                 retry = retry + 1
+                self.retryStats['numRetries'] += 1
+                
+                # exponential backoff
+                if rttEstimators:
+                    timeout = rttEstimators[-1].backoff(timeout)
                     
             if isinstance(self.responseBuf,Exception):
                 log.error("responseBuf contains exception {0}".format(self.responseBuf))
@@ -226,6 +380,74 @@ class SerialConnector(ApiConnector):
             if not isResponse:
                 self.requestSendLock.release()
     
+    def _sendAck(self,cmdId):
+        '''
+        \brief Acknowledge the request just received.
+        
+        The ACK only depends on the command ID and on the packet ID, so it is
+        framed once and reused. This bypasses _sendInternal() and its locks.
+        
+        \note Only call from the HDLC thread, right after RxPacketId has been
+              updated.
+        '''
+        
+        hdlc     = self.hdlc
+        if not hdlc:
+            output = "no HDLC module, did I just disconnect?"
+            log.error(output)
+            raise ConnectionError(output)
+        
+        key      = (cmdId,self.RxPacketId)
+        try:
+            frame = self.ackFrames[key]
+        except KeyError:
+            frame = hdlc.encode(self._buildAckPacket(*key))
+            self.ackFrames[key] = frame
+        
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("_sendAck cmdId={0} packetId={1}".format(*key))
+        
+        hdlc.sendFrame(frame)
+    
+    def _createRttEstimator(self):
+        return RttEstimator.RttEstimator(
+            initialRto = self.RX_TIMEOUT,
+            minRto     = self.MIN_RTO,
+            maxRto     = self.MAX_RTO,
+        )
+    
+    def _getRttEstimators(self,cmdId):
+        '''
+        \brief Get the RTT estimators to update for a command, the one whose
+               timeout is used last.
+        '''
+        rttEstimator = self.rttEstimator
+        if not rttEstimator:
+            return []
+        if not self.rttPerCommand:
+            return [rttEstimator]
+        if cmdId not in self.rttEstimators:
+            self.rttEstimators[cmdId] = self._createRttEstimator()
+        cmdRttEstimator = self.rttEstimators[cmdId]
+        if not cmdRttEstimator.numSamples:
+            # no measurement for this command yet, use the connector's timeout
+            return [cmdRttEstimator,rttEstimator]
+        return [rttEstimator,cmdRttEstimator]
+    
+    def _resetRetryStats(self):
+        self.retryStats = {
+            'numCommands':           0,
+            'numRetries':            0,
+            'numFailures':           0,
+        }
+    
+    def _resetRxStats(self):
+        self.rxStats = {
+            'numPackets':            0,
+            'handoffDepth':          0,
+            'handoffMaxDepth':       0,
+        }
+    
     def _resetPacketIds(self):
         self.TxPacketId=0
         self.RxPacketId=0
@@ -262,6 +484,9 @@ class SerialConnector(ApiConnector):
         
         cmdId,length,isResponse,packetId,payload = self._parseRxHeader(frameRx)
         
+        if isResponse or self.isHelloResponse(cmdId):
+            self.tsRespReceived = time.time()
+        
         # log
         if log.isEnabledFor(logging.DEBUG):
             log.debug("cmdId={0} length={1} isResponse={2} packetId={3} payload={4}".format(
@@ -316,6 +541,87 @@ class SerialConnector(ApiConnector):
             else:
                 log.debug("no ack needed")
         
+        # drop the notifications filtered out, before handing them off
+        notifFilter = self.notifFilter
+        if notifFilter and not (isResponse or self.isHelloResponse(cmdId)):
+            if not notifFilter.accept(cmdId,payload):
+                return
+        
+        # drop the packets received while disconnecting
+        if self.isRxStopped:
+            return
+        
+        # decode the packet, in the RX worker if there is one
+        self.rxStats['numPackets'] += 1
+        rxHandoff = self.rxHandoff
+        if rxHandoff:
+            # blocks if the RX worker falls behind
+            rxHandoff.put((cmdId,isResponse,isRepeatId,payload))
+            depth = rxHandoff.qsize()
+            if depth>self.rxStats['handoffMaxDepth']:
+                self.rxStats['handoffMaxDepth'] = depth
+        else:
+            self._processRxPacket(cmdId,isResponse,isRepeatId,payload)
+    
+    #======================== RX pipeline =====================================
+    
+    def _rxWorker(self,rxHandoff):
+        '''
+        \brief Decode the packets received by the HDLC thread, in order.
+        
+        \param rxHandoff The queue the packets are received from. A None item
+            stops the worker.
+        '''
+        
+        log.info('RX worker started')
+        
+        while True:
+            item = rxHandoff.get()
+            if item is None:
+                # decode the packets handed off while disconnecting
+                self._drainRxHandoff(rxHandoff)
+                break
+            self._decodeRxItem(item)
+            if self.rxHandoff is not rxHandoff and rxHandoff.empty():
+                # retired by a disconnect() called while decoding
+                break
+        
+        log.info('RX worker ended')
+    
+    def _drainRxHandoff(self,rxHandoff):
+        '''
+        \brief Decode the packets left in the handoff queue, without blocking.
+        '''
+        
+        while True:
+            try:
+                item = rxHandoff.get_nowait()
+            except Queue.Empty:
+                return
+            if item is not None:
+                self._decodeRxItem(item)
+    
+    def _decodeRxItem(self,item):
+        try:
+            self._processRxPacket(*item)
+        except (ConnectionError,CommandError) as err:
+            output = "@RxWorker: {0}".format(err)
+            log.error(output)
+            print output
+        except Exception as err:
+            # keep decoding, a dead worker would block the HDLC thread
+            output = "@RxWorker: {0}\n{1}".format(err,traceback.format_exc())
+            log.critical(output)
+            print output
+    
+    def _processRxPacket(self,cmdId,isResponse,isRepeatId,payload):
+        '''
+        \brief Deserialize a received packet, and pass it to the waiting
+               request or to the notification queue.
+        '''
+        
+        payload = self._toBinaryFields(payload)
+        
         if isResponse or self.isHelloResponse(cmdId):
             
             # deserialize received packet
@@ -342,11 +648,19 @@ class SerialConnector(ApiConnector):
         else:
             if not isRepeatId :
                 
-                # deserialize received packet
-                nameArray, fields = self.api_def.deserialize(
-                                        ApiDefinition.ApiDefinition.NOTIFICATION,
-                                        cmdId,
-                                        payload)
+                # deserialize received packet, into a named tuple if the
+                # connector has one for this notification
+                if self.notifTupleTable:
+                    nameArray, fields = self.api_def.deserializeRecord(
+                                            ApiDefinition.ApiDefinition.NOTIFICATION,
+                                            cmdId,
+                                            payload,
+                                            self.notifTupleTable)
+                else:
+                    nameArray, fields = self.api_def.deserialize(
+                                            ApiDefinition.ApiDefinition.NOTIFICATION,
+                                            cmdId,
+                                            payload)
                 
                 # put received packet in notification buffer
                 self.putNotification((nameArray, fields))
@@ -10,6 +10,8 @@ log.addHandler(NullHandler())
 
 import struct
 
+from   SmartMeshSDK.utils import NumpyUtils
+
 class HrParser(object):
     
     HR_ID_DEVICE                  = 0x80
@@ -82,6 +84,8 @@ class HrParser(object):
         '''
         \brief parse a byte list representing a received HR.
         
+        The HR can also be passed as a str or a memoryview.
+        
         \returns The parsed HR, of the following format:
         {
             'Device': {
@@ -112,6 +116,9 @@ class HrParser(object):
         '''
         returnVal = {}
         
+        if not isinstance(hr,(list,tuple)):
+            hr = bytearray(hr)  # str or memoryview
+        
         while hr:
             if len(hr)<2:
                 raise ValueError("Less than 2 bytes in HR")
@@ -136,6 +143,79 @@ class HrParser(object):
         
         return returnVal
     
+    def parseHrBatch(self,hrs):
+        '''
+        \brief parse many HRs at once with NumPy, into columns.
+        
+        The HRs are split into their device, neighbors and discovered
+        neighbors blocks, then the fields of all the blocks of each kind are
+        decoded in one NumPy call. Extended HRs are skipped.
+        
+        \param hrs The HRs, each a byte list, a str or a memoryview.
+        
+        \exception ImportError NumPy is not installed.
+        \returns The parsed HRs, of the following format:
+        {
+            'Device': {
+                <fieldName>: <array>,
+                ...,
+                'hrIndex':   <array>,
+            }
+            'Neighbors': {
+                <fieldName>: <array>,
+                ...,
+                'hrIndex':   <array>,
+            }
+            'Discovered': {
+                <fieldName>: <array>,
+                ...,
+                'hrIndex':   <array>,
+            }
+        }
+        where the Neighbors and Discovered arrays have one element per
+        neighbor, and hrIndex is the index in hrs of the HR each element
+        comes from.
+        '''
+        numpy = NumpyUtils.importNumpy()
+        
+        # split the HRs into blocks, (desc,blocks,hrIndex) per kind
+        kinds = {
+            'Device':     (self.HR_DESC_DEVICE,         [], []),
+            'Neighbors':  (self.HR_DESC_NEIGHBOR_DATA,  [], []),
+            'Discovered': (self.HR_DESC_DISCOVERED_DATA,[], []),
+        }
+        for (hrIndex,hr) in enumerate(hrs):
+            if not isinstance(hr,str):
+                hr = str(bytearray(hr))
+            while hr:
+                if len(hr)<2:
+                    raise ValueError("Less than 2 bytes in HR")
+                id         = ord(hr[0])
+                length     = ord(hr[1])
+                payload    = hr[2:2+length]
+                
+                if   id==self.HR_ID_DEVICE:
+                    self._addBlocks(kinds['Device'],hrIndex,payload,0,None)
+                elif id==self.HR_ID_NEIGHBORS:
+                    self._addBlocks(kinds['Neighbors'],hrIndex,payload,1,0)
+                elif id==self.HR_ID_DISCOVERED:
+                    self._addBlocks(kinds['Discovered'],hrIndex,payload,2,1)
+                elif id!=self.HR_ID_EXTENDED:
+                    raise ValueError("unknown HR id {0}".format(id))
+                
+                # remove current HR
+                hr = hr[2+length:]
+        
+        # decode the blocks of each kind at once
+        returnVal = {}
+        for (name,(desc,blocks,hrIndexes)) in kinds.items():
+            dtype                 = numpy.dtype([(d[0],'>'+d[1]) for d in desc])
+            records               = numpy.frombuffer(''.join(blocks),dtype)
+            returnVal[name]       = NumpyUtils.toColumns(records)
+            returnVal[name]['hrIndex'] = numpy.array(hrIndexes,dtype=numpy.intp)
+        
+        return returnVal
+    
     def formatHr(self,hr):
         return self._formatHr_recursive(hr,0)
     
@@ -256,6 +336,27 @@ class HrParser(object):
     
     #======================== helpers =========================================
     
+    def _addBlocks(self,kind,hrIndex,payload,headerLength,numItemsIndex):
+        '''
+        \brief Add the items of an HR block, a str, to the blocks to decode.
+        
+        \param numItemsIndex Position of the numItems field in the header,
+                             None if the block is a single item.
+        '''
+        (desc,blocks,hrIndexes) = kind
+        if len(payload)<headerLength:
+            raise ValueError("not enough bytes for HR")
+        if numItemsIndex is None:
+            numItems         = 1
+        else:
+            numItems         = ord(payload[numItemsIndex])
+        itemLength           = struct.calcsize('>'+''.join([d[1] for d in desc]))
+        items                = payload[headerLength:headerLength+numItems*itemLength]
+        if len(items)!=numItems*itemLength:
+            raise ValueError("not enough bytes for HR")
+        blocks              += [items]
+        hrIndexes           += [hrIndex]*numItems
+    
     def _parseAs(self,desc,payload):
         
         returnVal            = {}
@@ -277,7 +378,7 @@ class HrParser(object):
             raise ValueError("not enough bytes for HR")
         
         # separate string to parse from remainder
-        hrstring             = ''.join([chr(b) for b in payload[:numBytes]])
+        hrstring             = str(bytearray(payload[:numBytes]))
         remainder            = payload[numBytes:]
         
         # apply the format string
@@ -96,7 +96,10 @@ class OAPDispatcher(object):
         if data_notif.dstPort != OAPMessage.OAP_PORT:
             return
     
-        payload = array('B', data_notif.data)
+        payload = data_notif.data
+        if isinstance(payload, memoryview):
+            payload = payload.tobytes()
+        payload = array('B', payload)   # from a list of ints or a str
         # first two bytes are transport header
         trans = OAPMessage.extract_oap_header(payload)
         # third byte is OAP command type
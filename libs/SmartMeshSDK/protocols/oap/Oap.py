@@ -39,7 +39,7 @@ class Oap(object):
         if mac not in self.clients:
             self.clients[mac] = OAPClient.OAPClient(
                 mac,
-                self.connector.dn_sendData,
+                self.connector.dn_sendData_trusted,
                 self.oap_dispatch
             )
     
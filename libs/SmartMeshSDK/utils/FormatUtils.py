@@ -4,17 +4,42 @@ import urllib
 
 LOG_FORMAT_TIMESTAMP = '%Y/%m/%d %H:%M:%S'
 
+def _toInts(buf):
+    # binary fields can be delivered as str or memoryview, see ApiConnector
+    if isinstance(buf,(str,memoryview)):
+        return bytearray(buf)
+    return buf
+
+def _isPrintable(string):
+    for c in string:
+        if not ' '<=c<='~':
+            return False
+    return True
+
+def toByteString(buf):
+    '''
+    example: [0x11,0x22,0x33] -> "\x11\x22\x33"
+    
+    Also accepts a tuple, a str, a bytearray or a memoryview.
+    '''
+    if isinstance(buf,str):
+        return buf
+    if isinstance(buf,memoryview):
+        return buf.tobytes()
+    return str(bytearray(buf))
+
 def formatBuffer(buf):
     '''
     example: [0x11,0x22,0x33,0x44,0x55,0x66,0x77,0x88] -> "11-22-33-44-55-66-77-88"
     '''
-    return '-'.join(["%.2x"%i for i in buf])
+    return '-'.join(["%.2x"%i for i in _toInts(buf)])
     
 def formatMacString(mac,upper=False):
     '''
     example: 0x1122334455667788 -> "11-22-33-44-55-66-77-88"
     '''
     
+    mac = _toInts(mac)
     if upper:
         res = '-'.join(["%.2X"%i for i in mac])
     else:
@@ -26,6 +51,7 @@ def formatIpString(ip):
     '''
     example: [254,128,0,0,0,0,0,0,0,23,13,0,0,48,93,57] -> "fe80:0000:0000:0000:0017:0d00:0030:5d39"
     '''
+    ip             = _toInts(ip)
     ipString       = []
     for i in range(8):
         ipString  += [''.join(["%.2x"%i for i in ip[i*2:i*2+2]])]
@@ -37,17 +63,19 @@ def formatShortMac(mac):
     '''
     example: 0x1122334455667788 -> "77-88"
     '''
-    return '-'.join(["%.2x"%i for i in mac[6:]])
+    return '-'.join(["%.2x"%i for i in _toInts(mac)[6:]])
 
 def formatNamedTuple(tup):
     output         = []
     output        += ['{0}:'.format(tup.__class__.__name__)]
     for k in tup._fields:
         v          = getattr(tup, k)
-        try:
-            v      = formatBuffer(v)
-        except TypeError:
-            pass
+        # text is printed as is, binary fields (also delivered as str) in hex
+        if not (isinstance(v,str) and _isPrintable(v)):
+            try:
+                v  = formatBuffer(v)
+            except TypeError:
+                pass
         output    += ['{0:>20}: {1}'.format(k,v)]
     output         = '\n'.join(output)
     return output
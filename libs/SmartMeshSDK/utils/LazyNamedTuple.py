@@ -0,0 +1,94 @@
+'''
+\brief Named tuples created on first use.
+
+The connectors define a named tuple per command and per notification, several
+hundreds of them. Creating a named tuple compiles its source code, so creating
+them all when the connector module is imported would dominate the time it
+takes to import it.
+'''
+
+import collections
+import sys
+import threading
+
+#============================ defines =========================================
+
+_createLock = threading.Lock()
+
+#============================ public ==========================================
+
+class LazyNamedTuple(object):
+    '''
+    \brief Placeholder for a named tuple, in the body of a class.
+
+    The named tuple is created the first time the attribute is accessed, and
+    replaces the placeholder in the class which defines it.
+    '''
+
+    def __init__(self,typename,field_names,module=None):
+        self.typename        = typename
+        self.field_names     = field_names
+        self.module          = module
+        self.tupleClass      = None
+
+    def __get__(self,instance,owner):
+        tupleClass           = self.resolve()
+        for klass in owner.__mro__:
+            if klass.__dict__.get(self.typename) is self:
+                setattr(klass,self.typename,tupleClass)
+                break
+        return tupleClass
+
+    def resolve(self):
+        '''
+        \brief Create the named tuple, if not done yet.
+
+        \returns The named tuple.
+        '''
+        if self.tupleClass is None:
+            with _createLock:
+                if self.tupleClass is None:
+                    tupleClass = collections.namedtuple(self.typename,self.field_names)
+                    if self.module:
+                        tupleClass.__module__ = self.module
+                    self.tupleClass = tupleClass
+        return self.tupleClass
+
+class TupleTable(dict):
+    '''
+    \brief Dictionary of named tuples, some of which are LazyNamedTuple
+           placeholders, created when looked up.
+    '''
+
+    def __getitem__(self,key):
+        value = dict.__getitem__(self,key)
+        if isinstance(value,LazyNamedTuple):
+            value = value.resolve()
+            dict.__setitem__(self,key,value)
+        return value
+
+    def get(self,key,default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def values(self):
+        return [self[key] for key in self.keys()]
+
+    def items(self):
+        return [(key,self[key]) for key in self.keys()]
+
+    def itervalues(self):
+        return iter(self.values())
+
+    def iteritems(self):
+        return iter(self.items())
+
+def namedtuple(typename,field_names):
+    '''
+    \brief Drop-in replacement for collections.namedtuple() in the body of a
+           class, returning a LazyNamedTuple.
+    '''
+    # the module of the caller, as collections.namedtuple() does
+    return LazyNamedTuple(typename,field_names,sys._getframe(1).f_globals.get('__name__'))
@@ -0,0 +1,57 @@
+'''
+\brief Helpers for decoding batches of records with NumPy.
+
+NumPy is optional: it is only imported when a batch is decoded, so that
+importing the SDK does not pay for it, and does not require it.
+'''
+
+#============================ public ==========================================
+
+def importNumpy():
+    '''
+    \brief Import NumPy.
+
+    \exception ImportError NumPy is not installed.
+    \returns The numpy module.
+    '''
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("batch decoding requires NumPy, install it with 'pip install numpy'")
+    return numpy
+
+def joinRecords(payloads,itemsize):
+    '''
+    \brief Concatenate the first itemsize bytes of each payload.
+
+    \param payloads The payloads, each a list of bytes, a str, a bytearray or
+                    a memoryview. Bytes past itemsize are ignored. A single
+                    str, bytearray or memoryview is taken as the records
+                    already concatenated.
+    \param itemsize The length of a record.
+
+    \exception ValueError A payload is shorter than itemsize.
+    \returns A buffer holding the records, one after the other.
+    '''
+    if isinstance(payloads,(str,bytearray,memoryview)):
+        if len(payloads)%itemsize:
+            raise ValueError("{0} bytes is not a whole number of {1}-byte records".format(len(payloads),itemsize))
+        return payloads
+
+    records                  = []
+    for (index,payload) in enumerate(payloads):
+        if not isinstance(payload,str):
+            payload          = str(bytearray(payload))
+        if len(payload)<itemsize:
+            raise ValueError("payload {0} has {1} bytes, less than the {2} of a record".format(index,len(payload),itemsize))
+        records             += [payload[:itemsize]]
+    return ''.join(records)
+
+def toColumns(records):
+    '''
+    \brief Split a structured array into one array per field.
+
+    \returns A dictionary of arrays, indexed by field name. The arrays are
+             views into records, not copies.
+    '''
+    return dict([(name,records[name]) for name in records.dtype.names])
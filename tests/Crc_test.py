@@ -0,0 +1,100 @@
+#!/usr/bin/python
+'''
+Unit tests for the FCS-16 of the Crc module, checked against the byte-wise
+loop HDLC used before it.
+'''
+
+#============================ adjust path =====================================
+
+import sys
+import os
+here = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(here, '..', 'libs'))
+
+#============================ imports =========================================
+
+import random
+import unittest
+
+from   SmartMeshSDK.SerialConnector import Crc
+
+#============================ helpers =========================================
+
+def _legacyTable():
+    '''
+    \brief The FCS-16 table, computed bit by bit from the (reversed)
+           polynomial of RFC1662.
+    '''
+    table = []
+    for b in range(256):
+        v = b
+        for _ in range(8):
+            v = (v >> 1) ^ 0x8408 if v & 1 else v >> 1
+        table.append(v)
+    return table
+
+LEGACY_TABLE = _legacyTable()
+
+def legacyCalculate(data):
+    '''
+    \brief Crc.calculate() before the shared Crc module.
+    '''
+    ptr = 0
+    tempfcs = 0xffff
+    while ptr<len(data):
+        tempfcs = (tempfcs >> 8) ^ LEGACY_TABLE[(tempfcs ^ data[ptr]) & 0xff]
+        ptr += 1
+    tempfcs ^= 0xffff
+    return [(tempfcs>>0) & 0xff, (tempfcs>>8) & 0xff]
+
+#============================ tests ===========================================
+
+class CrcTestCase(unittest.TestCase):
+
+    def setUp(self):
+        rnd = random.Random(0)
+        # below, at and above the length the 2-byte table is used from, odd
+        # and even
+        self.messages = [[rnd.randint(0, 255) for _ in range(length)] for length in range(70)]
+        self.messages += [[0x00]*40, [0xff]*41, [0x7e, 0x7d]*20]
+
+    def testTable(self):
+        self.assertEqual(Crc.FCS16_TABLE, LEGACY_TABLE)
+
+    def testCheckValue(self):
+        # FCS-16 (CRC-16/X-25) check value
+        self.assertEqual(Crc.calculate('123456789'), 0x906e)
+
+    def testLegacy(self):
+        crc = Crc.Crc()
+        for message in self.messages:
+            expected = legacyCalculate(message)
+            fcs      = expected[0] | (expected[1] << 8)
+            for data in [message, bytearray(message), str(bytearray(message)), memoryview(str(bytearray(message)))]:
+                self.assertEqual(crc.calculate(data), expected)
+                self.assertEqual(Crc.calculate(data), fcs)
+
+    def testIncremental(self):
+        crc = Crc.Crc()
+        for message in self.messages:
+            for split in sorted(set([0, 1, len(message)/2, len(message)-1])):
+                crc.reset()
+                crc.update(message[:split])
+                crc.update(bytearray(message[split:]))
+                self.assertEqual(crc.digest(), legacyCalculate(message))
+                fcs = Crc.fcs16(message[split:], Crc.fcs16(message[:split]))
+                self.assertEqual(fcs, Crc.fcs16(message))
+
+    def testVerify(self):
+        crc = Crc.Crc()
+        for message in self.messages:
+            frame = message + legacyCalculate(message)
+            self.assertTrue(Crc.verify(frame))
+            self.assertTrue(crc.verify(str(bytearray(frame))))
+            frame[0] ^= 0x01
+            self.assertFalse(Crc.verify(frame))
+            self.assertFalse(crc.verify(bytearray(frame)))
+
+if __name__ == '__main__':
+    # Run the tests from the command line
+    unittest.main()
@@ -0,0 +1,167 @@
+#!/usr/bin/python
+'''
+Unit tests for DurableNotifQueue: replay after a restart, recovery from an
+interrupted write, and the overflow policies at maxBytes.
+'''
+
+#============================ adjust path =====================================
+
+import sys
+import os
+here = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(here, '..', 'libs'))
+
+#============================ imports =========================================
+
+import shutil
+import tempfile
+import unittest
+
+from   SmartMeshSDK.DurableNotifQueue import DurableNotifQueue
+from   SmartMeshSDK.ApiException      import ConnectionError
+
+#============================ helpers =========================================
+
+def _notif(value):
+    return (['notifData', 'notifHealthReport'], {'macAddress': [0, 1], 'value': value})
+
+def _values(items):
+    return [item[1]['value'] for item in items]
+
+#============================ tests ===========================================
+
+class DurableNotifQueueTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.queues = []
+
+    def tearDown(self):
+        for q in self.queues:
+            q.close()
+        shutil.rmtree(self.path)
+
+    def _open(self, **kwargs):
+        q = DurableNotifQueue(self.path, **kwargs)
+        self.queues.append(q)
+        return q
+
+    def _reopen(self, q, **kwargs):
+        q.close()
+        return self._open(**kwargs)
+
+    def _recordSize(self):
+        q = DurableNotifQueue(tempfile.mkdtemp())
+        try:
+            q.put(_notif(0))
+            return q.getStats()['diskBytes']
+        finally:
+            q.close()
+            shutil.rmtree(q.path)
+
+    def testReopenAtAckedOffset(self):
+        q = self._open()
+        for value in range(10):
+            q.put(_notif(value))
+        self.assertEqual(_values(q.getBatch(4)), [0, 1, 2, 3])
+        q.ack()
+        # read, but not acknowledged: replayed
+        self.assertEqual(_values(q.getBatch(2)), [4, 5])
+        q = self._reopen(q)
+        stats = q.getStats()
+        self.assertEqual(stats['ackedOffset'], 4)
+        self.assertEqual(stats['readOffset'], 4)
+        self.assertEqual(stats['nextOffset'], 10)
+        self.assertEqual(q.qsize(), 6)
+        self.assertEqual(_values(q.getBatch(10, timeout=0)), range(4, 10))
+
+    def testReopenAtOffset(self):
+        q = self._open(autoAck=True)
+        for value in range(5):
+            q.put(_notif(value))
+        q.getBatch(3)
+        q.ack(1)    # already acknowledged as read
+        q = self._reopen(q, autoAck=True)
+        self.assertEqual(_values(q.getBatch(10, timeout=0)), [3, 4])
+        q.put(_notif(5))
+        q = self._reopen(q)
+        self.assertEqual(_values(q.getBatch(10, timeout=0)), [5])
+
+    def testReadFromDisk(self):
+        q = self._open(memSize=2, segmentSize=3 * self._recordSize())
+        for value in range(10):
+            q.put(_notif(value))
+        self.assertEqual(_values(q.getBatch(10)), range(10))
+        stats = q.getStats()
+        self.assertEqual(stats['numDiskReads'], 8)
+        self.assertEqual(stats['numSegments'], 4)
+        # the segment files holding only acknowledged notifications are deleted
+        q.ack()
+        self.assertEqual(q.getStats()['numSegments'], 1)
+
+    def testTruncatedLastSegment(self):
+        q = self._open()
+        for value in range(5):
+            q.put(_notif(value))
+        q.close()
+        # an interrupted write leaves a partial record at the end of the log
+        (segmentFile,) = [name for name in os.listdir(self.path) if name.endswith(q.SEGMENT_SUFFIX)]
+        segmentPath = os.path.join(self.path, segmentFile)
+        with open(segmentPath, 'r+b') as f:
+            f.truncate(os.path.getsize(segmentPath) - 3)
+        q = self._open()
+        self.assertEqual(q.getStats()['nextOffset'], 4)
+        self.assertEqual(os.path.getsize(segmentPath), 4 * self._recordSize())
+        # writing continues after the last complete record
+        q.put(_notif(5))
+        q = self._reopen(q)
+        self.assertEqual(_values(q.getBatch(10, timeout=0)), [0, 1, 2, 3, 5])
+
+    def testMaxBytesDisconnect(self):
+        q = self._open(maxBytes=3 * self._recordSize())
+        for value in range(3):
+            q.put(_notif(value))
+        self.assertRaises(ConnectionError, q.put, _notif(3))
+        stats = q.getStats()
+        self.assertEqual(stats['numDropped'], 1)
+        self.assertEqual(stats['droppedPerType'], {'notifHealthReport': 1})
+        self.assertEqual(_values(q.getBatch(10)), [0, 1, 2])
+
+    def testMaxBytesDropNewest(self):
+        q = self._open(maxBytes=3 * self._recordSize(),
+                       overflow=DurableNotifQueue.OVERFLOW_DROP_NEWEST)
+        for value in range(3):
+            self.assertTrue(q.put(_notif(value)))
+        self.assertFalse(q.put(_notif(3)))
+        self.assertEqual(_values(q.getBatch(10)), [0, 1, 2])
+
+    def testMaxBytesDropOldest(self):
+        recordSize = self._recordSize()
+        q = self._open(maxBytes=3 * recordSize, segmentSize=recordSize,
+                       overflow=DurableNotifQueue.OVERFLOW_DROP_OLDEST)
+        for value in range(5):
+            self.assertTrue(q.put(_notif(value)))
+        stats = q.getStats()
+        self.assertEqual(stats['numDropped'], 2)
+        self.assertEqual(stats['droppedPerType'], {None: 2})
+        self.assertEqual(stats['diskBytes'], 3 * recordSize)
+        self.assertEqual(stats['ackedOffset'], 2)
+        self.assertEqual(_values(q.getBatch(10)), [2, 3, 4])
+        # the notifications dropped are not replayed either
+        q = self._reopen(q)
+        self.assertEqual(_values(q.getBatch(10, timeout=0)), [2, 3, 4])
+
+    def testOverflowPolicies(self):
+        q = self._open()
+        for overflow in [DurableNotifQueue.OVERFLOW_BLOCK, DurableNotifQueue.OVERFLOW_COALESCE]:
+            self.assertRaises(ValueError, q.setOverflow, overflow)
+
+    def testClosed(self):
+        q = self._open()
+        q.close()
+        self.assertRaises(ConnectionError, q.put, _notif(0))
+        self.assertEqual(q.get(), None)
+
+if __name__ == '__main__':
+    # Run the tests from the command line
+    unittest.main()
@@ -0,0 +1,62 @@
+#!/usr/bin/python
+'''
+Unit tests for FormatUtils: the binary fields of notifications print the same
+whether they are delivered as lists, str or memoryviews.
+'''
+
+#============================ adjust path =====================================
+
+import sys
+import os
+here = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(here, '..', 'libs'))
+
+#============================ imports =========================================
+
+import collections
+import unittest
+
+from   SmartMeshSDK.utils             import FormatUtils
+from   SmartMeshSDK.IpMgrConnectorMux import IpMgrConnectorMux
+
+#============================ helpers =========================================
+
+MAC  = [0x00, 0x17, 0x0d, 0x00, 0x00, 0x38, 0x00, 0x01]
+DATA = [0x05, 0x00, 0xff, 0x7e]
+
+def _notifData(toBinary):
+    return IpMgrConnectorMux.IpMgrConnectorMux.Tuple_notifData(
+        utcSecs    = 1,
+        utcUsecs   = 2,
+        macAddress = toBinary(MAC),
+        srcPort    = 0xF0B9,
+        dstPort    = 0xF0B9,
+        data       = toBinary(DATA),
+    )
+
+#============================ tests ===========================================
+
+class FormatNamedTupleTestCase(unittest.TestCase):
+
+    def testListMode(self):
+        output = FormatUtils.formatNamedTuple(_notifData(list))
+        self.assertTrue('macAddress: 00-17-0d-00-00-38-00-01' in output)
+        self.assertTrue('data: 05-00-ff-7e' in output)
+        self.assertTrue('srcPort: 61625' in output)
+
+    def testBytesMode(self):
+        expected = FormatUtils.formatNamedTuple(_notifData(list))
+        bytesNotif = _notifData(lambda buf: str(bytearray(buf)))
+        self.assertEqual(FormatUtils.formatNamedTuple(bytesNotif), expected)
+        memoryviewNotif = _notifData(lambda buf: memoryview(str(bytearray(buf))))
+        self.assertEqual(FormatUtils.formatNamedTuple(memoryviewNotif), expected)
+
+    def testText(self):
+        Tuple_text = collections.namedtuple('Tuple_text', ['name', 'empty'])
+        output = FormatUtils.formatNamedTuple(Tuple_text(name='mote 1 ~ok', empty=''))
+        self.assertTrue('name: mote 1 ~ok' in output)
+        self.assertTrue(output.endswith('empty: '))
+
+if __name__ == '__main__':
+    # Run the tests from the command line
+    unittest.main()
@@ -0,0 +1,165 @@
+#!/usr/bin/python
+'''
+Unit tests for NotifFilter: the filters compiled for the raw payloads never
+drop a notification that filter() keeps.
+'''
+
+#============================ adjust path =====================================
+
+import sys
+import os
+here = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(here, '..', 'libs'))
+
+#============================ imports =========================================
+
+import random
+import unittest
+
+from   SmartMeshSDK                   import NotifFilter
+from   SmartMeshSDK.ApiDefinition     import IpMgrDefinition,    \
+                                             IpMoteDefinition,   \
+                                             HartMoteDefinition
+
+#============================ helpers =========================================
+
+MACS  = [[0x00, 0x17, 0x0d, 0x00, 0x00, 0x38, 0x00, i] for i in [1, 2, 3]]
+PORTS = [0xF0B9, 0xF0BA]
+
+def _filter(*calls):
+    notifFilter = NotifFilter.NotifFilter()
+    for (method, args) in calls:
+        getattr(notifFilter, method)(*args)
+    return notifFilter
+
+FILTERS = [
+    _filter(('whitelist_mac',    (MACS[0],))),
+    _filter(('whitelist_mac',    (MACS[0][-2:],)),
+            ('whitelist_mac',    (MACS[1],))),
+    _filter(('blacklist_mac',    (MACS[1],))),
+    _filter(('whitelist_notif',  ('notifData',))),
+    _filter(('whitelist_notif',  ('eventMoteJoin',))),
+    _filter(('blacklist_notif',  ('notifEvent',))),
+    _filter(('whitelist_port',   (PORTS[0],))),
+    _filter(('blacklist_port',   (PORTS[0],))),
+    _filter(('whitelist_port',   (12345,)),
+            ('whitelist_mac',    (MACS[2],))),
+    _filter(('whitelist_attrib', ('srcPort', PORTS[0])),
+            ('blacklist_mac',    (MACS[0],)),
+            ('whitelist_notif',  ('notifHealthReport',)),
+            ('whitelist_notif',  ('notifData',))),
+    # whitelisted fields past the header of the notifications
+    _filter(('whitelist_attrib', ('srcPort', PORTS[0])),
+            ('whitelist_attrib', ('data', [1, 2, 3]))),
+    _filter(('whitelist_port',   (PORTS[0],)),
+            ('whitelist_attrib', ('payload', [1, 2, 3]))),
+]
+
+def _filterSet():
+    filterSet = NotifFilter.NotifFilterSet()
+    filterSet.add('notifData',  FILTERS[0])
+    filterSet.add('notifData',  FILTERS[2])
+    filterSet.add('notifEvent', FILTERS[4])
+    filterSet.add('notifLog',   None)
+    return filterSet
+
+def _leaves(apiDef, nameArray):
+    if not apiDef.hasSubcommands(apiDef.NOTIFICATION, nameArray):
+        return [nameArray]
+    returnVal = []
+    for subcommand in apiDef.getSubcommands(apiDef.NOTIFICATION, nameArray):
+        returnVal += _leaves(apiDef, nameArray+[subcommand['name']])
+    return returnVal
+
+def _buildPayload(apiDef, nameArray, rnd):
+    '''
+    \brief A random payload of a notification, with its MAC address and UDP
+           ports taken from MACS and PORTS.
+    '''
+    payload = []
+    for i in range(len(nameArray)):
+        for field in apiDef.getResponseFields(apiDef.NOTIFICATION, nameArray[:i+1]):
+            if field.name in apiDef.RESERVED:
+                payload += [subcommand['id'] for subcommand in apiDef.getSubcommands(apiDef.NOTIFICATION, nameArray[:i+1])
+                                             if subcommand['name'] == nameArray[i+1]]
+            elif not field.length:
+                payload += [rnd.choice([1, 2, 3]) for _ in range(rnd.randint(0, 4))]
+            elif field.name == 'macAddress' and field.length == 8:
+                payload += rnd.choice(MACS)
+            elif field.options.validOptions or field.name in ['srcPort', 'dstPort']:
+                value    = rnd.choice(field.options.validOptions or PORTS)
+                payload += [(value >> (8*j)) & 0xff for j in reversed(range(field.length))]
+            else:
+                payload += [rnd.randint(0, 255) for _ in range(field.length)]
+    return payload
+
+#============================ tests ===========================================
+
+class RawNotifFilterTestCase(unittest.TestCase):
+
+    NUM_PAYLOADS = 20   # per type of notification
+
+    def _checkDefinition(self, apiDef):
+        rnd    = random.Random(0)
+        notifs = []
+        for cmdId in apiDef.getIds(apiDef.NOTIFICATION):
+            for nameArray in _leaves(apiDef, [apiDef.idToName(apiDef.NOTIFICATION, cmdId)]):
+                for _ in range(self.NUM_PAYLOADS):
+                    payload = _buildPayload(apiDef, nameArray, rnd)
+                    (names, fields) = apiDef.deserialize(apiDef.NOTIFICATION, cmdId, payload)
+                    notifs += [(cmdId, payload, names, fields)]
+        for notifFilter in FILTERS+[_filterSet()]:
+            rawFilter = notifFilter.compile(apiDef)
+            for (cmdId, payload, names, fields) in notifs:
+                if not notifFilter.filter(names[-1], fields, names[:-1]):
+                    continue
+                for rawPayload in [payload, str(bytearray(payload)), memoryview(str(bytearray(payload)))]:
+                    self.assertTrue(rawFilter.accept(cmdId, rawPayload),
+                                    '{0} {1} dropped'.format(names, payload))
+        return notifs
+
+    def testIpMgr(self):
+        self._checkDefinition(IpMgrDefinition.IpMgrDefinition())
+
+    def testIpMote(self):
+        self._checkDefinition(IpMoteDefinition.IpMoteDefinition())
+
+    def testHartMote(self):
+        self._checkDefinition(HartMoteDefinition.HartMoteDefinition())
+
+    def testHeaderFiltered(self):
+        # the notifications filtered on their header are all dropped raw
+        apiDef = IpMgrDefinition.IpMgrDefinition()
+        notifs = self._checkDefinition(apiDef)
+        for notifFilter in FILTERS[:10]:
+            rawFilter = notifFilter.compile(apiDef)
+            for (cmdId, payload, names, fields) in notifs:
+                self.assertEqual(rawFilter.accept(cmdId, payload),
+                                 notifFilter.filter(names[-1], fields, names[:-1]))
+        stats = rawFilter.getStats()
+        self.assertEqual(stats['numAccepted']+stats['numFiltered'], len(notifs))
+        self.assertTrue(stats['numFiltered'])
+
+    def testWhitelistPastHeader(self):
+        apiDef      = IpMgrDefinition.IpMgrDefinition()
+        cmdId       = apiDef.nameToId(apiDef.NOTIFICATION, ['notification'])
+        payload     = _buildPayload(apiDef, ['notification', 'notifData'], random.Random(0))
+        payload[21:23] = [0xF0, 0xBA]     # srcPort, not whitelisted
+        payload[25:]   = [1, 2, 3]        # data, whitelisted
+        rawFilter   = FILTERS[10].compile(apiDef)
+        self.assertTrue(rawFilter.accept(cmdId, payload))
+
+    def testUnknownOrShort(self):
+        # left to the deserializer to report
+        apiDef      = IpMgrDefinition.IpMgrDefinition()
+        cmdId       = apiDef.nameToId(apiDef.NOTIFICATION, ['notification'])
+        payload     = _buildPayload(apiDef, ['notification', 'notifData'], random.Random(0))
+        rawFilter   = FILTERS[0].compile(apiDef)
+        self.assertTrue(rawFilter.accept(0xff, [1, 2, 3]))
+        self.assertTrue(rawFilter.accept(cmdId, []))
+        for length in range(1, 21):
+            self.assertTrue(rawFilter.accept(cmdId, payload[:length]))
+
+if __name__ == '__main__':
+    # Run the tests from the command line
+    unittest.main()
@@ -0,0 +1,176 @@
+#!/usr/bin/python
+'''
+Unit tests for the overflow policies of NotifQueue.
+'''
+
+#============================ adjust path =====================================
+
+import sys
+import os
+here = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(here, '..', 'libs'))
+
+#============================ imports =========================================
+
+import threading
+import time
+import unittest
+
+from   SmartMeshSDK.ApiConnector import NotifQueue
+from   SmartMeshSDK.ApiException import ConnectionError
+
+#============================ helpers =========================================
+
+def _notif(value, mac=1, name='notifHealthReport'):
+    return (['notifData', name], {'macAddress': [0, mac], 'value': value})
+
+def _values(items):
+    return [item[1]['value'] for item in items]
+
+#============================ tests ===========================================
+
+class NotifQueueOverflowTestCase(unittest.TestCase):
+
+    def _fill(self, q, values):
+        for value in values:
+            self.assertTrue(q.put(_notif(value, mac=value)))
+
+    def _drain(self, q):
+        return _values(q.getBatch(q.maxQSize, timeout=0))
+
+    def testDisconnect(self):
+        q = NotifQueue(3)
+        self._fill(q, [0, 1, 2])
+        self.assertRaises(ConnectionError, q.put, _notif(3))
+        self.assertEqual(self._drain(q), [0, 1, 2])
+        stats = q.getStats()
+        self.assertEqual(stats['numDropped'], 1)
+        self.assertEqual(stats['droppedPerType'], {'notifHealthReport': 1})
+
+    def testDropOldest(self):
+        q = NotifQueue(3, NotifQueue.OVERFLOW_DROP_OLDEST)
+        self._fill(q, range(5))
+        self.assertEqual(self._drain(q), [2, 3, 4])
+        self.assertEqual(q.getStats()['numDropped'], 2)
+
+    def testDropNewest(self):
+        q = NotifQueue(3, NotifQueue.OVERFLOW_DROP_NEWEST)
+        self._fill(q, [0, 1, 2])
+        self.assertFalse(q.put(_notif(3)))
+        self.assertEqual(self._drain(q), [0, 1, 2])
+        self.assertEqual(q.getStats()['numDropped'], 1)
+
+    def testBlockTimeout(self):
+        q = NotifQueue(2, NotifQueue.OVERFLOW_BLOCK, blockTimeout=0.05)
+        self._fill(q, [0, 1])
+        self.assertFalse(q.put(_notif(2)))
+        self.assertEqual(self._drain(q), [0, 1])
+        stats = q.getStats()
+        self.assertEqual(stats['numBlocked'], 1)
+        self.assertEqual(stats['numDropped'], 1)
+
+    def testBlockUntilRead(self):
+        q = NotifQueue(2, NotifQueue.OVERFLOW_BLOCK)
+        self._fill(q, [0, 1])
+        results = []
+        putter = threading.Thread(target=lambda: results.append(q.put(_notif(2))))
+        putter.daemon = True
+        putter.start()
+        time.sleep(0.05)
+        self.assertEqual(results, [])
+        self.assertEqual(_values([q.get()]), [0])
+        putter.join(1)
+        self.assertEqual(results, [True])
+        self.assertEqual(self._drain(q), [1, 2])
+
+    def testBlockDisconnected(self):
+        q = NotifQueue(1, NotifQueue.OVERFLOW_BLOCK)
+        self._fill(q, [0])
+        results = []
+        putter = threading.Thread(target=lambda: results.append(q.put(_notif(1))))
+        putter.daemon = True
+        putter.start()
+        time.sleep(0.05)
+        q.putDisconnectNotification('test')
+        putter.join(1)
+        self.assertEqual(results, [False])
+        self.assertEqual(self._drain(q), [0])
+        self.assertEqual(q.get(), None)     # the disconnection kicks get()
+
+    def testCoalesce(self):
+        q = NotifQueue(3, NotifQueue.OVERFLOW_COALESCE)
+        q.put(_notif(0, mac=1))
+        q.put(_notif(1, mac=2))
+        q.put(_notif(2, mac=3))
+        # replaces the notification of mac 2, keeping its place
+        self.assertTrue(q.put(_notif(3, mac=2)))
+        # no queued notification of mac 4: the oldest is dropped
+        self.assertTrue(q.put(_notif(4, mac=4)))
+        self.assertEqual(self._drain(q), [3, 2, 4])
+        stats = q.getStats()
+        self.assertEqual(stats['numCoalesced'], 1)
+        self.assertEqual(stats['numDropped'], 2)
+
+    def testCoalesceKeysBounded(self):
+        q = NotifQueue(4, NotifQueue.OVERFLOW_COALESCE)
+        for value in range(1000):
+            q.put(_notif(value, mac=value))
+            q.get(timeout=0)
+        self.assertTrue(len(q.keySeqs) <= 2 * q.maxQSize)
+        # the keys kept still coalesce
+        self._fill(q, [1, 2, 3, 4])
+        q.put(_notif(5, mac=2))
+        self.assertEqual(self._drain(q), [1, 5, 3, 4])
+
+    def testSetOverflow(self):
+        q = NotifQueue(2)
+        self._fill(q, [0, 1])
+        q.setOverflow(NotifQueue.OVERFLOW_COALESCE)
+        self.assertTrue(q.put(_notif(2, mac=1)))
+        self.assertEqual(self._drain(q), [0, 2])
+        self.assertRaises(ValueError, q.setOverflow, 'unknown')
+
+class NotifQueueBatchTestCase(unittest.TestCase):
+
+    def testWrapAround(self):
+        q = NotifQueue(4)
+        for value in range(3):
+            q.put(_notif(value))
+        self.assertEqual(_values([q.get(), q.get()]), [0, 1])
+        # slots 2, 3, 0, 1 hold the notifications 2 to 5
+        for value in range(3, 6):
+            q.put(_notif(value))
+        self.assertEqual(q.head, 2)
+        self.assertEqual(_values(q.getBatch(3)), [2, 3, 4])
+        self.assertEqual(_values(q.getBatch(10)), [5])
+        self.assertEqual(q.slots, [None] * 4)
+        self.assertTrue(q.empty())
+
+    def testWrapAroundCoalesce(self):
+        q = NotifQueue(4, NotifQueue.OVERFLOW_COALESCE)
+        for value in range(3):
+            q.put(_notif(value, mac=value))
+        q.getBatch(2)
+        for value in range(3, 6):
+            q.put(_notif(value, mac=value))
+        # the notification of mac 4 is in slot 0, past the end of the ring
+        q.put(_notif(6, mac=4))
+        self.assertEqual(_values(q.getBatch(4)), [2, 3, 6, 5])
+
+    def testTimeout(self):
+        q = NotifQueue(4)
+        self.assertEqual(q.getBatch(4, timeout=0), [])
+        startTime = time.time()
+        self.assertEqual(q.getBatch(4, timeout=0.05), [])
+        self.assertTrue(time.time() - startTime >= 0.04)
+
+    def testWaitFirst(self):
+        q = NotifQueue(4)
+        putter = threading.Timer(0.05, q.put, [_notif(0)])
+        putter.start()
+        self.assertEqual(_values(q.getBatch(4, timeout=1)), [0])
+        putter.join()
+
+if __name__ == '__main__':
+    # Run the tests from the command line
+    unittest.main()